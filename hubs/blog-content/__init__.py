@@ -34,15 +34,21 @@ USAGE:
     })
     
     print(result.terminal_state)  # EMITTED / QUEUED / DROPPED
+
+    # Many articles, stages overlapped (process pool + bounded queues)
+    results = await get_spoke().run_concurrent(payloads, StagedPipelineConfig(cpu_workers=4))
 """
 
 from .blog_node_spoke import run, get_spoke, BlogNodeSpoke, PipelineResult
+from .staged_pipeline import StagedPipelineConfig, StagedPipelineRunner
 
 __all__ = [
     'run',
     'get_spoke',
     'BlogNodeSpoke',
     'PipelineResult',
+    'StagedPipelineConfig',
+    'StagedPipelineRunner',
 ]
 
 __version__ = '1.0.0'
@@ -28,24 +28,37 @@ PIPELINE ORDER (Non-Negotiable):
   6. Validate Signal
   7. Emit BIT Signal
 
+BACKLOG MODE:
+  run_backlog() runs stages 1-2 per article, Stage 3 once for the whole
+  backlog (extract_entities_batch, nlp.pipe), then stages 4-7 per article.
+
+CONCURRENT MODE:
+  run_concurrent() overlaps stages across articles: stages 1-4 in a process
+  pool, 5-7 as asyncio workers, bounded queues in between
+  (staged_pipeline.py). get_stats() reports per-stage latency histograms.
+
 ═══════════════════════════════════════════════════════════════════════════
 """
 
 import os
 import time
 import asyncio
+import functools
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 import logging
 
 # Pipeline stage imports
-from .imo.input.ingest_article import ingest_article, ArticlePayload
-from .imo.middle.parse_content import parse_content
-from .imo.middle.extract_entities import extract_entities
-from .imo.middle.classify_event import classify_event, EventType
-from .imo.middle.match_company import match_company
-from .imo.middle.validate_signal import validate_signal
+from .imo.input.ingest_article import ArticlePayload
+from .imo.middle.extract_entities import (
+    extract_entities_batch,
+    DEFAULT_NER_BATCH_SIZE,
+    DEFAULT_NER_PROCESSES
+)
+from .imo.middle.classify_event import ClassifiedEvent, EventType
+from .imo.middle.match_company import match_company, MatchedEvent
+from .imo.middle.validate_signal import validate_signal, ValidatedSignal
 from .imo.output.emit_bit_signal import (
     emit_bit_signal,
     log_queued_article,
@@ -54,6 +67,18 @@ from .imo.output.emit_bit_signal import (
     EmissionResult
 )
 
+from .staged_pipeline import (
+    PIPELINE_STAGES,
+    ArticleContext,
+    StageFailure,
+    LatencyHistogram,
+    StagedPipelineConfig,
+    StagedPipelineRunner,
+    ingest_and_parse,
+    classify_extracted,
+    run_cpu_stages
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,6 +182,8 @@ class BlogNodeSpoke:
             'total_cost': 0.0,
             'kill_switch_blocks': 0,
         }
+        self.stage_latency = {stage: LatencyHistogram() for stage in PIPELINE_STAGES}
+        self._staged_runner: Optional[StagedPipelineRunner] = None
     
     async def run(self, article_payload: Dict[str, Any]) -> PipelineResult:
         """
@@ -173,17 +200,144 @@ class BlogNodeSpoke:
             - FAIL CLOSED on any stage failure
             - Always return terminal state
         """
-        start_time = time.time()
-        correlation_id = article_payload.get('correlation_id', 'unknown')
-        article_id = None
-        source = article_payload.get('source', 'unknown')
-        source_url = article_payload.get('source_url', '')
+        ctx, blocked = self._begin(article_payload)
+        if blocked:
+            return blocked
+        
+        try:
+            # ─────────────────────────────────────────────────────────────────
+            # Stages 1-4: Ingest, Parse, Extract, Classify
+            # ─────────────────────────────────────────────────────────────────
+            ctx, classified, elapsed_ms = run_cpu_stages(ctx, article_payload)
+            self.stage_latency['cpu'].observe(elapsed_ms)
+            
+            if isinstance(classified, StageFailure):
+                return await self._fail(ctx, classified)
+            
+            return await self._finish(ctx, classified)
+            
+        except Exception as e:
+            return await self._handle_exception(ctx, e)
+    
+    async def run_concurrent(
+        self,
+        article_payloads: Iterable[Dict[str, Any]],
+        config: Optional[StagedPipelineConfig] = None
+    ) -> List[PipelineResult]:
+        """
+        Execute the pipeline for many articles with overlapping stages.
+        
+        Ingest→Classify runs in a process pool while earlier articles are
+        in Match/Validate/Emit; bounded queues between stages apply
+        backpressure (see staged_pipeline.py). The spoke keeps the runner
+        (and its warm pool) between calls until the config changes or
+        close() is called.
+        
+        Args:
+            article_payloads: Raw article data from any source
+            config: Per-stage concurrency and queue bounds (default: the
+                current runner's, else StagedPipelineConfig())
+            
+        Returns:
+            One PipelineResult per payload, in input order
+        """
+        runner = self._staged_runner
+        if runner is None or (config is not None and config != runner.config):
+            if runner is not None:
+                runner.close()
+            runner = self._staged_runner = StagedPipelineRunner(self, config)
+        return await runner.run(article_payloads)
+    
+    def close(self) -> None:
+        """Shut down the run_concurrent() process pool"""
+        if self._staged_runner is not None:
+            self._staged_runner.close()
+            self._staged_runner = None
+    
+    async def run_backlog(
+        self,
+        article_payloads: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_NER_BATCH_SIZE,
+        n_process: int = DEFAULT_NER_PROCESSES
+    ) -> List[PipelineResult]:
+        """
+        Execute the pipeline for an ingest backlog.
+        
+        Same stages and terminal states per article as run(), but Stage 3
+        extracts the whole backlog in one nlp.pipe stream
+        (extract_entities_batch), so the spaCy model is driven in batches
+        and duplicate content is parsed once.
+        
+        Args:
+            article_payloads: Raw article data from any source
+            batch_size: Texts per nlp.pipe batch
+            n_process: spaCy worker processes (1 = in-process)
+            
+        Returns:
+            One PipelineResult per payload, in input order
+        """
+        results: List[Optional[PipelineResult]] = [None] * len(article_payloads)
+        pending = []  # (index, ctx, parsed)
+        
+        for index, article_payload in enumerate(article_payloads):
+            ctx, blocked = self._begin(article_payload)
+            if blocked:
+                results[index] = blocked
+                continue
+            try:
+                parsed = ingest_and_parse(ctx, article_payload)
+                if isinstance(parsed, StageFailure):
+                    results[index] = await self._fail(ctx, parsed)
+                else:
+                    pending.append((index, ctx, parsed))
+            except Exception as e:
+                results[index] = await self._handle_exception(ctx, e)
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # Stage 3: Extract Entities (one batch, off the event loop)
+        # ─────────────────────────────────────────────────────────────────────
+        try:
+            extract_results = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    extract_entities_batch,
+                    [parsed for _, _, parsed in pending],
+                    batch_size=batch_size,
+                    n_process=n_process
+                )
+            )
+        except Exception as e:
+            for index, ctx, _ in pending:
+                results[index] = await self._handle_exception(ctx, e)
+            return results
+        
+        for (index, ctx, _), extract_result in zip(pending, extract_results):
+            try:
+                classified = classify_extracted(extract_result)
+                if isinstance(classified, StageFailure):
+                    results[index] = await self._fail(ctx, classified)
+                else:
+                    results[index] = await self._finish(ctx, classified)
+            except Exception as e:
+                results[index] = await self._handle_exception(ctx, e)
+        
+        return results
+    
+    def _begin(self, article_payload: Dict[str, Any]) -> Tuple[ArticleContext, Optional[PipelineResult]]:
+        """Start an article: stats, log, global kill switch."""
+        ctx = ArticleContext(
+            correlation_id=article_payload.get('correlation_id', 'unknown'),
+            article_id=None,
+            source=article_payload.get('source', 'unknown'),
+            source_url=article_payload.get('source_url', ''),
+            start_time=time.time()
+        )
         
         logger.info(
             "Blog pipeline started",
             extra={
-                'correlation_id': correlation_id,
-                'source': source
+                'correlation_id': ctx.correlation_id,
+                'source': ctx.source
             }
         )
         
@@ -197,11 +351,11 @@ class BlogNodeSpoke:
             self.stats['kill_switch_blocks'] += 1
             logger.warning(
                 f"Pipeline killed by switch: {active_switch}",
-                extra={'correlation_id': correlation_id}
+                extra={'correlation_id': ctx.correlation_id}
             )
             
-            return PipelineResult(
-                correlation_id=correlation_id,
+            return ctx, PipelineResult(
+                correlation_id=ctx.correlation_id,
                 article_id=None,
                 terminal_state=TerminalState.DROPPED,
                 fail_code="BLOG-000",
@@ -209,294 +363,299 @@ class BlogNodeSpoke:
                 failed_stage="kill_switch"
             )
         
-        try:
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 1: Ingest Article
-            # ─────────────────────────────────────────────────────────────────
-            ingest_result = ingest_article(article_payload)
-            
-            if not ingest_result.success:
-                return await self._handle_failure(
-                    correlation_id=correlation_id,
-                    article_id=None,
-                    stage="ingest",
-                    fail_code=ingest_result.fail_code,
-                    fail_reason=ingest_result.fail_reason,
-                    source=source,
-                    source_url=source_url,
-                    start_time=start_time
-                )
-            
-            payload = ingest_result.payload
-            article_id = payload.article_id
-            correlation_id = payload.correlation_id
-            
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 2: Parse Content
-            # ─────────────────────────────────────────────────────────────────
-            parse_result = parse_content(payload)
-            
-            if not parse_result.success:
-                return await self._handle_failure(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    stage="parse",
-                    fail_code=parse_result.fail_code,
-                    fail_reason=parse_result.fail_reason,
-                    source=source,
-                    source_url=source_url,
-                    start_time=start_time
-                )
-            
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 3: Extract Entities
-            # ─────────────────────────────────────────────────────────────────
-            extract_result = extract_entities(parse_result.parsed)
-            
-            if not extract_result.success:
-                return await self._handle_failure(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    stage="extract",
-                    fail_code=extract_result.fail_code,
-                    fail_reason=extract_result.fail_reason,
-                    source=source,
-                    source_url=source_url,
-                    start_time=start_time
-                )
+        return ctx, None
+    
+    async def _fail(self, ctx: ArticleContext, failure: StageFailure) -> PipelineResult:
+        """Log and count a failure from the CPU stages (1-4)"""
+        return await self._handle_failure(
+            correlation_id=ctx.correlation_id,
+            article_id=ctx.article_id,
+            stage=failure.stage,
+            fail_code=failure.fail_code,
+            fail_reason=failure.fail_reason,
+            source=ctx.source,
+            source_url=ctx.source_url,
+            start_time=ctx.start_time
+        )
+    
+    async def _handle_exception(self, ctx: ArticleContext, e: Exception) -> PipelineResult:
+        """FAIL CLOSED on an unhandled exception in any stage"""
+        logger.error(
+            f"Pipeline exception: {e}",
+            extra={
+                'correlation_id': ctx.correlation_id,
+                'article_id': ctx.article_id,
+                'error': str(e)
+            }
+        )
+        
+        return await self._handle_failure(
+            correlation_id=ctx.correlation_id,
+            article_id=ctx.article_id,
+            stage="exception",
+            fail_code="BLOG-999",
+            fail_reason=f"Unhandled exception: {e}",
+            source=ctx.source,
+            source_url=ctx.source_url,
+            start_time=ctx.start_time
+        )
+    
+    async def _finish(self, ctx: ArticleContext, classified: ClassifiedEvent) -> PipelineResult:
+        """Event kill switches and stages 5-7 for a classified article"""
+        classified = await self._after_classify(ctx, classified)
+        if isinstance(classified, PipelineResult):
+            return classified
+        
+        matched = await self._match(ctx, classified)
+        if isinstance(matched, PipelineResult):
+            return matched
+        
+        validated = await self._validate(ctx, matched)
+        if isinstance(validated, PipelineResult):
+            return validated
+        
+        return await self._emit(ctx, classified, matched, validated)
+    
+    async def _after_classify(
+        self,
+        ctx: ArticleContext,
+        classified: ClassifiedEvent
+    ) -> Union[ClassifiedEvent, PipelineResult]:
+        """Event type kill switch and no-event drop; the event itself if it goes on"""
+        correlation_id = ctx.correlation_id
+        article_id = ctx.article_id
+        
+        # Check if event type is killed
+        if _check_event_kill_switch(classified.event_type):
+            self.stats['kill_switch_blocks'] += 1
+            logger.warning(
+                f"Event type killed: {classified.event_type.name_str}",
+                extra={'correlation_id': correlation_id}
+            )
             
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 4: Classify Event
-            # ─────────────────────────────────────────────────────────────────
-            classify_result = classify_event(extract_result.entities)
+            return await self._handle_failure(
+                correlation_id=correlation_id,
+                article_id=article_id,
+                stage="classify",
+                fail_code="BLOG-000",
+                fail_reason=f"Event type killed: {classified.event_type.name_str}",
+                source=ctx.source,
+                source_url=ctx.source_url,
+                start_time=ctx.start_time
+            )
+        
+        # Skip if no event detected
+        if classified.event_type == EventType.UNKNOWN:
+            processing_time_ms = int((time.time() - ctx.start_time) * 1000)
             
-            if not classify_result.success:
-                return await self._handle_failure(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    stage="classify",
-                    fail_code=classify_result.fail_code,
-                    fail_reason=classify_result.fail_reason,
-                    source=source,
-                    source_url=source_url,
-                    start_time=start_time
-                )
+            logger.info(
+                "No event detected - pipeline complete (no signal)",
+                extra={
+                    'correlation_id': correlation_id,
+                    'article_id': article_id,
+                    'processing_time_ms': processing_time_ms
+                }
+            )
             
-            classified = classify_result.classified
+            self.stats['dropped'] += 1
             
-            # Check if event type is killed
-            if _check_event_kill_switch(classified.event_type):
-                self.stats['kill_switch_blocks'] += 1
-                logger.warning(
-                    f"Event type killed: {classified.event_type.name_str}",
-                    extra={'correlation_id': correlation_id}
-                )
-                
-                return await self._handle_failure(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    stage="classify",
-                    fail_code="BLOG-000",
-                    fail_reason=f"Event type killed: {classified.event_type.name_str}",
-                    source=source,
-                    source_url=source_url,
-                    start_time=start_time
-                )
+            air_event_id = await log_dropped_article(
+                correlation_id=correlation_id,
+                article_id=article_id,
+                fail_code="BLOG-003",
+                fail_reason="No event detected",
+                source=ctx.source,
+                source_url=ctx.source_url,
+                processing_time_ms=processing_time_ms
+            )
             
-            # Skip if no event detected
-            if classified.event_type == EventType.UNKNOWN:
-                processing_time_ms = int((time.time() - start_time) * 1000)
-                
-                logger.info(
-                    "No event detected - pipeline complete (no signal)",
-                    extra={
-                        'correlation_id': correlation_id,
-                        'article_id': article_id,
-                        'processing_time_ms': processing_time_ms
-                    }
-                )
+            return PipelineResult(
+                correlation_id=correlation_id,
+                article_id=article_id,
+                terminal_state=TerminalState.DROPPED,
+                event_type="UNKNOWN",
+                confidence=0.0,
+                processing_time_ms=processing_time_ms,
+                air_event_id=air_event_id,
+                fail_code="BLOG-003",
+                fail_reason="No event detected",
+                failed_stage="classify"
+            )
+        
+        return classified
+    
+    async def _match(
+        self,
+        ctx: ArticleContext,
+        classified: ClassifiedEvent
+    ) -> Union[MatchedEvent, PipelineResult]:
+        """Stage 5; the matched event, or the terminal result (queued / dropped)"""
+        correlation_id = ctx.correlation_id
+        article_id = ctx.article_id
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Stage 5: Match Company
+        # ─────────────────────────────────────────────────────────────────
+        started = time.perf_counter()
+        match_result = await match_company(classified)
+        self.stage_latency['match'].observe((time.perf_counter() - started) * 1000)
+        
+        if not match_result.success:
+            if match_result.queued_for_resolution:
+                # Queue for identity resolution
+                processing_time_ms = int((time.time() - ctx.start_time) * 1000)
                 
-                self.stats['dropped'] += 1
+                self.stats['queued'] += 1
                 
-                air_event_id = await log_dropped_article(
+                air_event_id = await log_queued_article(
                     correlation_id=correlation_id,
                     article_id=article_id,
-                    fail_code="BLOG-003",
-                    fail_reason="No event detected",
-                    source=source,
-                    source_url=source_url,
+                    queue_payload=match_result.queue_payload,
+                    source=ctx.source,
+                    source_url=ctx.source_url,
                     processing_time_ms=processing_time_ms
                 )
                 
                 return PipelineResult(
                     correlation_id=correlation_id,
                     article_id=article_id,
-                    terminal_state=TerminalState.DROPPED,
-                    event_type="UNKNOWN",
-                    confidence=0.0,
+                    terminal_state=TerminalState.QUEUED,
+                    event_type=classified.event_type.name_str,
+                    confidence=classified.confidence,
                     processing_time_ms=processing_time_ms,
                     air_event_id=air_event_id,
-                    fail_code="BLOG-003",
-                    fail_reason="No event detected",
-                    failed_stage="classify"
-                )
-            
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 5: Match Company
-            # ─────────────────────────────────────────────────────────────────
-            match_result = await match_company(classified)
-            
-            if not match_result.success:
-                if match_result.queued_for_resolution:
-                    # Queue for identity resolution
-                    processing_time_ms = int((time.time() - start_time) * 1000)
-                    
-                    self.stats['queued'] += 1
-                    
-                    air_event_id = await log_queued_article(
-                        correlation_id=correlation_id,
-                        article_id=article_id,
-                        queue_payload=match_result.queue_payload,
-                        source=source,
-                        source_url=source_url,
-                        processing_time_ms=processing_time_ms
-                    )
-                    
-                    return PipelineResult(
-                        correlation_id=correlation_id,
-                        article_id=article_id,
-                        terminal_state=TerminalState.QUEUED,
-                        event_type=classified.event_type.name_str,
-                        confidence=classified.confidence,
-                        processing_time_ms=processing_time_ms,
-                        air_event_id=air_event_id,
-                        fail_code=match_result.fail_code,
-                        fail_reason=match_result.fail_reason,
-                        failed_stage="match"
-                    )
-                else:
-                    return await self._handle_failure(
-                        correlation_id=correlation_id,
-                        article_id=article_id,
-                        stage="match",
-                        fail_code=match_result.fail_code,
-                        fail_reason=match_result.fail_reason,
-                        source=source,
-                        source_url=source_url,
-                        start_time=start_time
-                    )
-            
-            matched = match_result.matched
-            
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 6: Validate Signal
-            # ─────────────────────────────────────────────────────────────────
-            validate_result = await validate_signal(matched)
-            
-            if not validate_result.success:
-                return await self._handle_failure(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    stage="validate",
-                    fail_code=validate_result.fail_code,
-                    fail_reason=validate_result.fail_reason,
-                    source=source,
-                    source_url=source_url,
-                    company_sov_id=matched.company_sov_id,
-                    start_time=start_time
+                    fail_code=match_result.fail_code,
+                    fail_reason=match_result.fail_reason,
+                    failed_stage="match"
                 )
-            
-            # ─────────────────────────────────────────────────────────────────
-            # Kill Switch Check (Emission)
-            # ─────────────────────────────────────────────────────────────────
-            if os.environ.get('KILL_BLOG_SIGNALS', 'false').lower() == 'true':
-                self.stats['kill_switch_blocks'] += 1
+            else:
                 return await self._handle_failure(
                     correlation_id=correlation_id,
                     article_id=article_id,
-                    stage="emit",
-                    fail_code="BLOG-000",
-                    fail_reason="Signal emission killed by switch",
-                    source=source,
-                    source_url=source_url,
-                    company_sov_id=matched.company_sov_id,
-                    start_time=start_time
+                    stage="match",
+                    fail_code=match_result.fail_code,
+                    fail_reason=match_result.fail_reason,
+                    source=ctx.source,
+                    source_url=ctx.source_url,
+                    start_time=ctx.start_time
                 )
-            
-            # ─────────────────────────────────────────────────────────────────
-            # Stage 7: Emit BIT Signal
-            # ─────────────────────────────────────────────────────────────────
-            processing_time_ms = int((time.time() - start_time) * 1000)
-            
-            emit_result = await emit_bit_signal(
-                validate_result.validated,
-                processing_time_ms=processing_time_ms
+        
+        return match_result.matched
+    
+    async def _validate(
+        self,
+        ctx: ArticleContext,
+        matched: MatchedEvent
+    ) -> Union[ValidatedSignal, PipelineResult]:
+        """Stage 6; the validated signal, or the dropped result"""
+        correlation_id = ctx.correlation_id
+        article_id = ctx.article_id
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Stage 6: Validate Signal
+        # ─────────────────────────────────────────────────────────────────
+        started = time.perf_counter()
+        validate_result = await validate_signal(matched)
+        self.stage_latency['validate'].observe((time.perf_counter() - started) * 1000)
+        
+        if not validate_result.success:
+            return await self._handle_failure(
+                correlation_id=correlation_id,
+                article_id=article_id,
+                stage="validate",
+                fail_code=validate_result.fail_code,
+                fail_reason=validate_result.fail_reason,
+                source=ctx.source,
+                source_url=ctx.source_url,
+                company_sov_id=matched.company_sov_id,
+                start_time=ctx.start_time
+            )
+        
+        return validate_result.validated
+    
+    async def _emit(
+        self,
+        ctx: ArticleContext,
+        classified: ClassifiedEvent,
+        matched: MatchedEvent,
+        validated: ValidatedSignal
+    ) -> PipelineResult:
+        """Emission kill switch and Stage 7"""
+        correlation_id = ctx.correlation_id
+        article_id = ctx.article_id
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Kill Switch Check (Emission)
+        # ─────────────────────────────────────────────────────────────────
+        if os.environ.get('KILL_BLOG_SIGNALS', 'false').lower() == 'true':
+            self.stats['kill_switch_blocks'] += 1
+            return await self._handle_failure(
+                correlation_id=correlation_id,
+                article_id=article_id,
+                stage="emit",
+                fail_code="BLOG-000",
+                fail_reason="Signal emission killed by switch",
+                source=ctx.source,
+                source_url=ctx.source_url,
+                company_sov_id=matched.company_sov_id,
+                start_time=ctx.start_time
             )
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Stage 7: Emit BIT Signal
+        # ─────────────────────────────────────────────────────────────────
+        processing_time_ms = int((time.time() - ctx.start_time) * 1000)
+        
+        started = time.perf_counter()
+        emit_result = await emit_bit_signal(
+            validated,
+            processing_time_ms=processing_time_ms
+        )
+        self.stage_latency['emit'].observe((time.perf_counter() - started) * 1000)
+        
+        if emit_result.success:
+            self.stats['emitted'] += 1
+            self.stats['total_cost'] += emit_result.total_cost
             
-            if emit_result.success:
-                self.stats['emitted'] += 1
-                self.stats['total_cost'] += emit_result.total_cost
-                
-                logger.info(
-                    "Blog pipeline complete - EMITTED",
-                    extra={
-                        'correlation_id': correlation_id,
-                        'article_id': article_id,
-                        'company_sov_id': matched.company_sov_id,
-                        'event_type': classified.event_type.name_str,
-                        'bit_impact': classified.bit_impact,
-                        'processing_time_ms': processing_time_ms
-                    }
-                )
-                
-                return PipelineResult(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    terminal_state=TerminalState.EMITTED,
-                    company_sov_id=matched.company_sov_id,
-                    event_type=classified.event_type.name_str,
-                    confidence=classified.confidence,
-                    processing_time_ms=processing_time_ms,
-                    total_cost=emit_result.total_cost,
-                    air_event_id=emit_result.air_event_id
-                )
-            else:
-                self.stats['dropped'] += 1
-                
-                return PipelineResult(
-                    correlation_id=correlation_id,
-                    article_id=article_id,
-                    terminal_state=TerminalState.DROPPED,
-                    company_sov_id=matched.company_sov_id,
-                    event_type=classified.event_type.name_str,
-                    confidence=classified.confidence,
-                    processing_time_ms=processing_time_ms,
-                    total_cost=emit_result.total_cost,
-                    air_event_id=emit_result.air_event_id,
-                    fail_code=emit_result.fail_code,
-                    fail_reason=emit_result.fail_reason,
-                    failed_stage="emit"
-                )
-                
-        except Exception as e:
-            logger.error(
-                f"Pipeline exception: {e}",
+            logger.info(
+                "Blog pipeline complete - EMITTED",
                 extra={
                     'correlation_id': correlation_id,
                     'article_id': article_id,
-                    'error': str(e)
+                    'company_sov_id': matched.company_sov_id,
+                    'event_type': classified.event_type.name_str,
+                    'bit_impact': classified.bit_impact,
+                    'processing_time_ms': processing_time_ms
                 }
             )
             
-            return await self._handle_failure(
+            return PipelineResult(
                 correlation_id=correlation_id,
                 article_id=article_id,
-                stage="exception",
-                fail_code="BLOG-999",
-                fail_reason=f"Unhandled exception: {e}",
-                source=source,
-                source_url=source_url,
-                start_time=start_time
+                terminal_state=TerminalState.EMITTED,
+                company_sov_id=matched.company_sov_id,
+                event_type=classified.event_type.name_str,
+                confidence=classified.confidence,
+                processing_time_ms=processing_time_ms,
+                total_cost=emit_result.total_cost,
+                air_event_id=emit_result.air_event_id
+            )
+        else:
+            self.stats['dropped'] += 1
+            
+            return PipelineResult(
+                correlation_id=correlation_id,
+                article_id=article_id,
+                terminal_state=TerminalState.DROPPED,
+                company_sov_id=matched.company_sov_id,
+                event_type=classified.event_type.name_str,
+                confidence=classified.confidence,
+                processing_time_ms=processing_time_ms,
+                total_cost=emit_result.total_cost,
+                air_event_id=emit_result.air_event_id,
+                fail_code=emit_result.fail_code,
+                fail_reason=emit_result.fail_reason,
+                failed_stage="emit"
             )
     
     async def _handle_failure(
@@ -563,6 +722,9 @@ class BlogNodeSpoke:
             'drop_rate': f"{self.stats['dropped'] / max(total, 1) * 100:.1f}%",
             'total_cost': self.stats['total_cost'],
             'kill_switch_blocks': self.stats['kill_switch_blocks'],
+            'stage_latency_ms': {
+                stage: histogram.snapshot() for stage, histogram in self.stage_latency.items()
+            },
         }
 
 
@@ -6,15 +6,17 @@ Core processing pipeline stages.
 
 Modules:
     - parse_content: Content cleaning and normalization
-    - extract_entities: NER and entity extraction
+    - extract_entities: NER and entity extraction (single article or nlp.pipe batch)
     - classify_event: Event classification (deterministic + LLM)
+    - keyword_classifier: Compiled multi-pattern keyword matching
     - match_company: Company matching (FAIL CLOSED)
     - validate_signal: Signal validation gate
 """
 
 from .parse_content import parse_content, ParsedContent, ParseResult
-from .extract_entities import extract_entities, ExtractedEntities, ExtractionResult
+from .extract_entities import extract_entities, extract_entities_batch, ExtractedEntities, ExtractionResult
 from .classify_event import classify_event, ClassifiedEvent, ClassificationResult, EventType
+from .keyword_classifier import KeywordClassifier
 from .match_company import match_company, MatchedEvent, MatchResult
 from .validate_signal import validate_signal, ValidatedSignal, ValidationResult
 from .hub_status import (
@@ -33,6 +35,7 @@ __all__ = [
     'ParseResult',
     # Extract
     'extract_entities',
+    'extract_entities_batch',
     'ExtractedEntities',
     'ExtractionResult',
     # Classify
@@ -40,6 +43,7 @@ __all__ = [
     'ClassifiedEvent',
     'ClassificationResult',
     'EventType',
+    'KeywordClassifier',
     # Match
     'match_company',
     'MatchedEvent',
@@ -29,13 +29,13 @@ EVENT TYPES (Locked):
 ═══════════════════════════════════════════════════════════════════════════
 """
 
-import re
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from enum import Enum
 import logging
 
 from .extract_entities import ExtractedEntities, MonetaryValue
+from .keyword_classifier import KeywordClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -244,16 +244,17 @@ def _check_sec_8k_rules(entities: ExtractedEntities) -> Optional[ClassificationC
     return None
 
 
-def _match_keywords(text: str, patterns: List[str]) -> List[str]:
-    """Match keyword patterns against text, return matches"""
-    matches = []
-    text_lower = text.lower()
-    
-    for pattern in patterns:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            matches.append(pattern)
-    
-    return matches
+# All event type keyword sets, compiled once (one anchor scan per article)
+_KEYWORD_CLASSIFIER = KeywordClassifier({
+    EventType.FUNDING_EVENT: FUNDING_KEYWORDS,
+    EventType.ACQUISITION: ACQUISITION_KEYWORDS,
+    EventType.LEADERSHIP_CHANGE: LEADERSHIP_KEYWORDS,
+    EventType.EXPANSION: EXPANSION_KEYWORDS,
+    EventType.PRODUCT_LAUNCH: PRODUCT_LAUNCH_KEYWORDS,
+    EventType.PARTNERSHIP: PARTNERSHIP_KEYWORDS,
+    EventType.LAYOFF: LAYOFF_KEYWORDS,
+    EventType.NEGATIVE_NEWS: NEGATIVE_NEWS_KEYWORDS,
+})
 
 
 def _classify_by_keywords(text: str) -> List[ClassificationCandidate]:
@@ -263,20 +264,10 @@ def _classify_by_keywords(text: str) -> List[ClassificationCandidate]:
     Returns all candidates with confidence based on keyword density.
     """
     candidates = []
+    matched = _KEYWORD_CLASSIFIER.match(text)
     
-    keyword_sets = [
-        (FUNDING_KEYWORDS, EventType.FUNDING_EVENT),
-        (ACQUISITION_KEYWORDS, EventType.ACQUISITION),
-        (LEADERSHIP_KEYWORDS, EventType.LEADERSHIP_CHANGE),
-        (EXPANSION_KEYWORDS, EventType.EXPANSION),
-        (PRODUCT_LAUNCH_KEYWORDS, EventType.PRODUCT_LAUNCH),
-        (PARTNERSHIP_KEYWORDS, EventType.PARTNERSHIP),
-        (LAYOFF_KEYWORDS, EventType.LAYOFF),
-        (NEGATIVE_NEWS_KEYWORDS, EventType.NEGATIVE_NEWS),
-    ]
-    
-    for patterns, event_type in keyword_sets:
-        matches = _match_keywords(text, patterns)
+    for event_type in _KEYWORD_CLASSIFIER.labels:
+        matches = matched.get(event_type)
         
         if matches:
             # Confidence based on number of matches
@@ -24,6 +24,8 @@ SIGNALS:
 CLASSIFICATION:
     Keyword matching adapted from classify_event.py patterns.
     Hard rules first (deterministic). Confidence = min(0.90, 0.60 + matches * 0.10).
+    Patterns are precompiled into one KeywordClassifier (keyword_classifier.py):
+    a single anchor scan per document instead of one re.search per pattern.
     Threshold: emit if confidence >= 0.60. No LLM in v1.
     Multiple signals can fire for the same company in the same month.
 
@@ -47,7 +49,6 @@ EXIT CODES:
 
 import os
 import sys
-import re
 import uuid
 import argparse
 import logging
@@ -59,6 +60,15 @@ if sys.platform == "win32":
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.extensions
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+from src.sys.db.connection_pool import get_pool
+
+try:
+    from .keyword_classifier import KeywordClassifier
+except ImportError:
+    from keyword_classifier import KeywordClassifier
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -195,6 +205,11 @@ KEYWORD_PATTERNS: Dict[str, List[str]] = {
 # Classifier
 # ---------------------------------------------------------------------------
 
+# All B-xx patterns compiled once: one anchor scan per document, then a
+# regex confirm only for patterns whose literal anchor occurs in it
+_CLASSIFIER = KeywordClassifier(KEYWORD_PATTERNS)
+
+
 def classify_text(text: str) -> List[Tuple[str, float, List[str]]]:
     """
     Classify a context_summary text against all B-xx signal patterns.
@@ -205,14 +220,10 @@ def classify_text(text: str) -> List[Tuple[str, float, List[str]]]:
         return []
 
     results = []
-    text_lower = text.lower()
-
-    for signal_code, patterns in KEYWORD_PATTERNS.items():
-        matches = []
-        for pattern in patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                matches.append(pattern)
+    matched = _CLASSIFIER.match(text)
 
+    for signal_code in KEYWORD_PATTERNS:
+        matches = matched.get(signal_code)
         if not matches:
             continue
 
@@ -227,13 +238,15 @@ def classify_text(text: str) -> List[Tuple[str, float, List[str]]]:
 # DB connection
 # ---------------------------------------------------------------------------
 def get_connection():
-    return psycopg2.connect(
+    """Pooled Neon connection; close() returns it to the shared pool."""
+    dsn = psycopg2.extensions.make_dsn(
         host=os.environ["NEON_HOST"],
         dbname=os.environ["NEON_DATABASE"],
         user=os.environ["NEON_USER"],
         password=os.environ["NEON_PASSWORD"],
         sslmode="require",
     )
+    return get_pool(dsn).getconn()
 
 
 # ---------------------------------------------------------------------------
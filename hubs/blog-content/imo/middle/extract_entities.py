@@ -21,34 +21,69 @@ TOOLS:
   - spaCy (en_core_web_lg) - PRIMARY
   - Regex patterns - FALLBACK
 
+BATCH EXTRACTION:
+  extract_entities_batch() streams a backlog through nlp.pipe
+  (batch_size / n_process). Only tok2vec + ner are loaded, since only
+  doc.ents is read. BLOG_SPACY_MODEL=en_core_web_sm opts into the lighter
+  model. NER output is cached by content hash, so syndicated duplicates
+  are parsed once.
+
 ═══════════════════════════════════════════════════════════════════════════
 """
 
+import os
 import re
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import logging
 
 from .parse_content import ParsedContent
 
 logger = logging.getLogger(__name__)
 
-# Lazy load spaCy to avoid import errors if not installed
-_nlp = None
+# spaCy models: full by default, BLOG_SPACY_MODEL=en_core_web_sm opts into the light one
+SPACY_MODEL = "en_core_web_lg"
+SPACY_LIGHT_MODEL = "en_core_web_sm"
+
+# Components kept at load; everything else (tagger, parser, lemmatizer, ...)
+# is excluded because only doc.ents is read
+NER_PIPES = ("tok2vec", "ner")
+
+# Limit text length for performance
+MAX_NER_CHARS = 100000
+
+# nlp.pipe defaults for extract_entities_batch
+DEFAULT_NER_BATCH_SIZE = 64
+DEFAULT_NER_PROCESSES = 1
+
+# Content hashes whose NER output is kept (per process)
+NER_CACHE_SIZE = 10000
 
+# Lazy load spaCy to avoid import errors if not installed; one warm model per name
+_nlp_models: Dict[str, object] = {}
 
-def _get_nlp():
+
+def _model_name(model: Optional[str] = None) -> str:
+    return model or os.environ.get("BLOG_SPACY_MODEL", SPACY_MODEL)
+
+
+def _get_nlp(model: Optional[str] = None):
     """Lazy load spaCy model"""
-    global _nlp
-    if _nlp is None:
+    name = _model_name(model)
+    if name not in _nlp_models:
         try:
             import spacy
-            _nlp = spacy.load("en_core_web_lg")
-            logger.info("spaCy model loaded: en_core_web_lg")
+            nlp = spacy.load(name)
+            nlp.select_pipes(enable=[p for p in nlp.pipe_names if p in NER_PIPES])
+            _nlp_models[name] = nlp
+            logger.info(f"spaCy model loaded: {name} (pipes: {', '.join(nlp.pipe_names)})")
         except Exception as e:
             logger.warning(f"spaCy model not available: {e}. Using regex fallback.")
-            _nlp = "FALLBACK"
-    return _nlp
+            _nlp_models[name] = "FALLBACK"
+    return _nlp_models[name]
 
 
 @dataclass
@@ -137,19 +172,69 @@ EXECUTIVE_TITLES = [
 # Extraction Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _extract_with_spacy(text: str) -> Tuple[List[ExtractedEntity], List[ExtractedEntity], List[ExtractedEntity]]:
-    """
-    Extract entities using spaCy NER.
-    
-    Returns: (companies, persons, locations)
-    """
-    nlp = _get_nlp()
-    
-    if nlp == "FALLBACK":
-        return [], [], []
-    
-    doc = nlp(text[:100000])  # Limit text length for performance
-    
+SpacyEntities = Tuple[List[ExtractedEntity], List[ExtractedEntity], List[ExtractedEntity]]
+
+
+class _NERCache:
+    """LRU of spaCy output keyed by model + content hash."""
+
+    def __init__(self, max_size: int = NER_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, SpacyEntities]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, model: str) -> str:
+        return hashlib.sha256(f"{model}|{text[:MAX_NER_CHARS]}".encode()).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: str) -> Optional[SpacyEntities]:
+        with self._lock:
+            entities = self._entries.get(key)
+            if entities is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return tuple(list(group) for group in entities)
+
+    def put(self, key: str, entities: SpacyEntities) -> None:
+        with self._lock:
+            self._entries[key] = entities
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_ner_cache = _NERCache()
+
+
+def get_ner_cache_stats() -> Dict[str, int]:
+    """Size and hit/miss counts of the content-hash NER cache"""
+    return _ner_cache.stats()
+
+
+def warm_nlp_model(model: Optional[str] = None) -> bool:
+    """Load the spaCy model now (e.g. in a worker initializer); False on regex fallback"""
+    return _get_nlp(model) != "FALLBACK"
+
+
+def _doc_entities(doc) -> SpacyEntities:
+    """Split doc.ents into (companies, persons, locations)"""
     companies = []
     persons = []
     locations = []
@@ -173,6 +258,65 @@ def _extract_with_spacy(text: str) -> Tuple[List[ExtractedEntity], List[Extracte
     return companies, persons, locations
 
 
+def _extract_with_spacy(text: str, model: Optional[str] = None) -> SpacyEntities:
+    """
+    Extract entities using spaCy NER.
+    
+    Returns: (companies, persons, locations)
+    """
+    nlp = _get_nlp(model)
+    
+    if nlp == "FALLBACK":
+        return [], [], []
+    
+    key = _NERCache.key(text, _model_name(model))
+    cached = _ner_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    entities = _doc_entities(nlp(text[:MAX_NER_CHARS]))
+    _ner_cache.put(key, entities)
+    return tuple(list(group) for group in entities)
+
+
+def _pipe_with_spacy(
+    texts: Sequence[str],
+    model: Optional[str],
+    batch_size: int,
+    n_process: int
+) -> Dict[str, SpacyEntities]:
+    """
+    Run every uncached distinct text through nlp.pipe once.
+    
+    Returns: {cache key: (companies, persons, locations)} for the texts parsed.
+    A failing pipe returns what it finished; the rest go through
+    _extract_with_spacy one article at a time.
+    """
+    nlp = _get_nlp(model)
+    if nlp == "FALLBACK":
+        return {}
+    
+    name = _model_name(model)
+    todo: Dict[str, str] = {}
+    for text in texts:
+        key = _NERCache.key(text, name)
+        if key not in todo and key not in _ner_cache:
+            todo[key] = text[:MAX_NER_CHARS]
+    if not todo:
+        return {}
+    
+    parsed: Dict[str, SpacyEntities] = {}
+    try:
+        docs = nlp.pipe(todo.values(), batch_size=batch_size, n_process=n_process)
+        for key, doc in zip(todo, docs):
+            parsed[key] = _doc_entities(doc)
+            _ner_cache.put(key, parsed[key])
+    except Exception as e:
+        logger.warning(f"nlp.pipe failed after {len(parsed)}/{len(todo)} texts: {e}")
+    
+    return parsed
+
+
 def _extract_companies_regex(text: str) -> List[ExtractedEntity]:
     """Extract company names using regex patterns"""
     companies = []
@@ -255,7 +399,7 @@ def _deduplicate_entities(entities: List[ExtractedEntity]) -> List[ExtractedEnti
 # Main Extraction Function
 # ─────────────────────────────────────────────────────────────────────────────
 
-def extract_entities(parsed: ParsedContent) -> ExtractionResult:
+def extract_entities(parsed: ParsedContent, model: Optional[str] = None) -> ExtractionResult:
     """
     Extract named entities from parsed content.
     
@@ -263,6 +407,7 @@ def extract_entities(parsed: ParsedContent) -> ExtractionResult:
     
     Args:
         parsed: ParsedContent from parsing stage
+        model: spaCy model name (default: BLOG_SPACY_MODEL or en_core_web_lg)
         
     Returns:
         ExtractionResult with ExtractedEntities or failure info
@@ -272,6 +417,47 @@ def extract_entities(parsed: ParsedContent) -> ExtractionResult:
         - Regex fallback/enhancement
         - FAIL CLOSED on extraction errors
     """
+    return _extract_entities(parsed, lambda text: _extract_with_spacy(text, model))
+
+
+def extract_entities_batch(
+    parsed_items: Sequence[ParsedContent],
+    batch_size: int = DEFAULT_NER_BATCH_SIZE,
+    n_process: int = DEFAULT_NER_PROCESSES,
+    model: Optional[str] = None
+) -> List[ExtractionResult]:
+    """
+    Extract named entities from a backlog of parsed articles.
+    
+    Same result per article as extract_entities(), in input order, but the
+    spaCy work is one nlp.pipe stream over the distinct uncached texts.
+    
+    Args:
+        parsed_items: ParsedContent from parsing stage
+        batch_size: Texts per nlp.pipe batch
+        n_process: spaCy worker processes (1 = in-process)
+        model: spaCy model name (default: BLOG_SPACY_MODEL or en_core_web_lg)
+        
+    Returns:
+        One ExtractionResult per input article
+    """
+    name = _model_name(model)
+    parsed_now = _pipe_with_spacy([p.clean_text for p in parsed_items], model, batch_size, n_process)
+    
+    def spacy_entities(text: str) -> SpacyEntities:
+        entities = parsed_now.get(_NERCache.key(text, name))
+        if entities is None:
+            return _extract_with_spacy(text, model)
+        return tuple(list(group) for group in entities)
+    
+    return [_extract_entities(parsed, spacy_entities) for parsed in parsed_items]
+
+
+def _extract_entities(
+    parsed: ParsedContent,
+    spacy_entities: Callable[[str], SpacyEntities]
+) -> ExtractionResult:
+    """Stage 3 body shared by extract_entities and extract_entities_batch"""
     logger.info(
         "Entity extraction started",
         extra={
@@ -287,7 +473,7 @@ def extract_entities(parsed: ParsedContent) -> ExtractionResult:
         # ─────────────────────────────────────────────────────────────────────
         # Step 1: Extract with spaCy (if available)
         # ─────────────────────────────────────────────────────────────────────
-        spacy_companies, spacy_persons, spacy_locations = _extract_with_spacy(text)
+        spacy_companies, spacy_persons, spacy_locations = spacy_entities(text)
         
         if not spacy_companies and not spacy_persons:
             extraction_method = "regex"
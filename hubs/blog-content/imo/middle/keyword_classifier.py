@@ -0,0 +1,180 @@
+"""
+Blog Sub-Hub — Compiled Keyword Classifier
+═══════════════════════════════════════════════════════════════════════════
+
+Doctrine: /hubs/blog-content/PRD.md
+Altitude: 6,000 ft (Event detection support)
+
+Matches every keyword pattern of every event type / B-xx signal against a
+document in ONE prefilter scan instead of one re.search per pattern:
+
+  1. Each pattern's literal anchor is the word after its leading word
+     boundary, e.g. "acquisition" for "acquisition of". A match can only
+     start at a word, so an anchor is present iff some word of the text
+     starts with it.
+  2. One word scan of the lower-cased text yields its words; each distinct
+     word is looked up by prefix in the anchor table ("merger" finds the
+     anchors "merger" and "m"), memoized per word. Non-ASCII words go
+     through an alternation of the anchors instead, so IGNORECASE folding
+     stays exact.
+  3. Only patterns whose anchor is present are confirmed with their own
+     compiled regex. Patterns without a usable anchor are always confirmed.
+
+Results are identical to:
+    [p for p in patterns if re.search(p, text.lower(), re.IGNORECASE)]
+per pattern set, in pattern order.
+
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+import re
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+# Characters an anchor literal is built from (after the leading \b)
+_ANCHOR_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+# Words of a document: anchored patterns can only start where one does
+_WORD_RE = re.compile(r"\w+")
+
+# Distinct words remembered per classifier before the memo is reset
+WORD_CACHE_SIZE = 200_000
+
+# Quantifiers that make the preceding character optional
+_OPTIONAL_QUANTIFIERS = ("?", "*", "{")
+
+
+def literal_anchor(pattern: str) -> Optional[str]:
+    """
+    Return the literal word every match of pattern must start with, or None.
+
+    Only patterns of the form r'\\b<literal>...' with no top-level alternation
+    have an anchor. A final literal character made optional by ?, * or {
+    is dropped (r'\\bhires?' -> 'hire').
+    """
+    if not pattern.startswith(r"\b") or _has_top_level_alternation(pattern):
+        return None
+
+    literal = []
+    for i in range(2, len(pattern)):
+        ch = pattern[i].lower()
+        if ch not in _ANCHOR_CHARS:
+            if pattern[i] in _OPTIONAL_QUANTIFIERS and literal:
+                literal.pop()
+            break
+        literal.append(ch)
+
+    return "".join(literal) or None
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+    return False
+
+
+class KeywordClassifier:
+    """
+    Precompiled matcher for labelled keyword pattern sets.
+
+    Usage:
+        classifier = KeywordClassifier({"B-01": [...], "B-03": [...]})
+        classifier.match(text)   # {"B-03": [r'\\bacquired\\b', ...]}
+    """
+
+    def __init__(self, pattern_sets: Mapping[Hashable, Sequence[str]]):
+        self.labels: List[Hashable] = list(pattern_sets)
+        # (label, pattern, compiled) in label order, then pattern order
+        self._patterns: List[Tuple[Hashable, str, "re.Pattern"]] = []
+        anchor_patterns: Dict[str, List[int]] = {}
+        self._always: List[int] = []
+
+        for label, patterns in pattern_sets.items():
+            for pattern in patterns:
+                index = len(self._patterns)
+                self._patterns.append((label, pattern, re.compile(pattern, re.IGNORECASE)))
+                anchor = literal_anchor(pattern)
+                if anchor is None:
+                    self._always.append(index)
+                else:
+                    anchor_patterns.setdefault(anchor, []).append(index)
+
+        self._anchor_patterns = {a: tuple(i) for a, i in anchor_patterns.items()}
+        self._max_anchor = max(map(len, anchor_patterns), default=0)
+
+        # Fallback for non-ASCII words: longest anchor first, one named group each
+        anchors = sorted(anchor_patterns, key=lambda a: (-len(a), a))
+        self._group_anchor = {f"a{i}": anchor for i, anchor in enumerate(anchors)}
+        self._anchor_re = re.compile(
+            "|".join(f"(?P<a{i}>{re.escape(a)})" for i, a in enumerate(anchors)),
+            re.IGNORECASE,
+        ) if anchors else None
+
+        # word -> candidate pattern indices; corpus vocabulary repeats heavily
+        self._word_cache: Dict[str, Tuple[int, ...]] = {}
+
+    def _word_candidates(self, word: str) -> Tuple[int, ...]:
+        """Patterns whose anchor is a prefix of word."""
+        if word.isascii():
+            table = self._anchor_patterns
+            prefixes = (word[:end] for end in range(1, min(len(word), self._max_anchor) + 1))
+        else:
+            found = self._anchor_re.match(word)
+            if not found:
+                return ()
+            # The longest anchor matched; every anchor that is a prefix of it too
+            longest = self._group_anchor[found.lastgroup]
+            table = self._anchor_patterns
+            prefixes = (longest[:end] for end in range(1, len(longest) + 1))
+
+        indices = []
+        for prefix in prefixes:
+            indices.extend(table.get(prefix, ()))
+        return tuple(indices)
+
+    def match(self, text: str) -> Dict[Hashable, List[str]]:
+        """Return {label: matched patterns in pattern order} for labels with a match."""
+        if not text:
+            return {}
+
+        text_lower = text.lower()
+        candidates = set(self._always)
+        if self._anchor_re is not None:
+            cache = self._word_cache
+            for word in set(_WORD_RE.findall(text_lower)):
+                indices = cache.get(word)
+                if indices is None:
+                    if len(cache) >= WORD_CACHE_SIZE:
+                        cache.clear()
+                    indices = cache[word] = self._word_candidates(word)
+                if indices:
+                    candidates.update(indices)
+
+        matches: Dict[Hashable, List[str]] = {}
+        patterns = self._patterns
+        for index in sorted(candidates):
+            label, pattern, compiled = patterns[index]
+            if compiled.search(text_lower):
+                matches.setdefault(label, []).append(pattern)
+        return matches
+
+
+__all__ = [
+    'KeywordClassifier',
+    'literal_anchor',
+]
@@ -0,0 +1,410 @@
+"""
+Blog Node Spoke — Staged Concurrent Pipeline
+═══════════════════════════════════════════════════════════════════════════
+
+Doctrine: /hubs/blog-content/PRD.md
+Altitude: 10,000 → 5,000 ft (Pipeline orchestration)
+
+Runs many articles through the BlogNodeSpoke stages at once instead of one
+article end-to-end at a time:
+
+  source ─▶ [cpu] ─▶ [match] ─▶ [validate] ─▶ [emit] ─▶ PipelineResult
+            ingest    company    signal        BIT signal
+            parse     lookup     gates         + AIR log
+            extract
+            classify
+
+  - cpu: pure CPU work (no I/O), run in a process pool so it overlaps
+    with the I/O stages. The pool belongs to the runner and outlives
+    run(); each worker loads its spaCy model once, when it starts
+  - match / validate / emit: asyncio workers on the event loop
+  - Every hop is a bounded asyncio.Queue: a slow stage blocks the stage
+    before it (backpressure) instead of buffering the whole backlog
+  - Per-stage concurrency via StagedPipelineConfig
+  - Per-stage latency histograms (service time, ms) on the spoke
+
+Terminal states are decided by the same BlogNodeSpoke step methods as
+run(): every article ends EMITTED, QUEUED or DROPPED, FAIL CLOSED (even
+if logging the failure itself raises).
+
+═══════════════════════════════════════════════════════════════════════════
+"""
+
+import os
+import math
+import time
+import asyncio
+import logging
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .imo.input.ingest_article import ingest_article
+from .imo.middle.parse_content import parse_content, ParsedContent
+from .imo.middle.extract_entities import extract_entities, warm_nlp_model, ExtractionResult
+from .imo.middle.classify_event import classify_event, ClassifiedEvent
+
+logger = logging.getLogger(__name__)
+
+# Stages with their own queue, workers and latency histogram
+PIPELINE_STAGES = ("cpu", "match", "validate", "emit")
+
+# CPU workers by default: each holds a full spaCy model in memory
+DEFAULT_CPU_WORKERS = min(2, os.cpu_count() or 1)
+
+# Histogram bucket upper bounds (ms); the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-Article State
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class ArticleContext:
+    """Per-article state carried between stages"""
+    correlation_id: str
+    article_id: Optional[str]
+    source: str
+    source_url: str
+    start_time: float
+
+
+@dataclass
+class StageFailure:
+    """A failed CPU stage, not yet logged (the spoke logs it to AIR)"""
+    stage: str
+    fail_code: str
+    fail_reason: str
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CPU Stages (no I/O - safe to run in a worker process)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def ingest_and_parse(ctx: ArticleContext, article_payload: Dict[str, Any]) -> Union[ParsedContent, StageFailure]:
+    """Stages 1-2. Updates ctx with the ingested article/correlation IDs."""
+    # ─────────────────────────────────────────────────────────────────────────
+    # Stage 1: Ingest Article
+    # ─────────────────────────────────────────────────────────────────────────
+    ingest_result = ingest_article(article_payload)
+
+    if not ingest_result.success:
+        return StageFailure("ingest", ingest_result.fail_code, ingest_result.fail_reason)
+
+    payload = ingest_result.payload
+    ctx.article_id = payload.article_id
+    ctx.correlation_id = payload.correlation_id
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Stage 2: Parse Content
+    # ─────────────────────────────────────────────────────────────────────────
+    parse_result = parse_content(payload)
+
+    if not parse_result.success:
+        return StageFailure("parse", parse_result.fail_code, parse_result.fail_reason)
+
+    return parse_result.parsed
+
+
+def classify_extracted(extract_result: ExtractionResult) -> Union[ClassifiedEvent, StageFailure]:
+    """Stage 3 result check + Stage 4"""
+    if not extract_result.success:
+        return StageFailure("extract", extract_result.fail_code, extract_result.fail_reason)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Stage 4: Classify Event
+    # ─────────────────────────────────────────────────────────────────────────
+    classify_result = classify_event(extract_result.entities)
+
+    if not classify_result.success:
+        return StageFailure("classify", classify_result.fail_code, classify_result.fail_reason)
+
+    return classify_result.classified
+
+
+def run_cpu_stages(
+    ctx: ArticleContext,
+    article_payload: Dict[str, Any]
+) -> Tuple[ArticleContext, Union[ClassifiedEvent, StageFailure], float]:
+    """
+    Stages 1-4 for one article.
+
+    Returns (ctx, classified event or failure, elapsed ms). ctx is returned
+    because a worker process updates its own copy.
+    """
+    started = time.perf_counter()
+    try:
+        parsed = ingest_and_parse(ctx, article_payload)
+        if isinstance(parsed, StageFailure):
+            outcome = parsed
+        else:
+            # ─────────────────────────────────────────────────────────────────
+            # Stage 3: Extract Entities
+            # ─────────────────────────────────────────────────────────────────
+            outcome = classify_extracted(extract_entities(parsed))
+    except Exception as e:
+        logger.error(
+            f"Pipeline exception: {e}",
+            extra={
+                'correlation_id': ctx.correlation_id,
+                'article_id': ctx.article_id,
+                'error': str(e)
+            }
+        )
+        outcome = StageFailure("exception", "BLOG-999", f"Unhandled exception: {e}")
+
+    return ctx, outcome, (time.perf_counter() - started) * 1000
+
+
+def warm_cpu_worker() -> None:
+    """Process pool initializer: load the spaCy model before the first article"""
+    warm_nlp_model()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Latency Histogram
+# ─────────────────────────────────────────────────────────────────────────────
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (ms)"""
+
+    def __init__(self, bounds_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(self.bounds_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (max for the last bucket)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bound, n in zip(self.bounds_ms, self.counts):
+            seen += n
+            if seen >= rank:
+                return float(min(bound, self.max_ms))
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={b}" for b in self.bounds_ms] + [f">{self.bounds_ms[-1]}"]
+        return {
+            'count': self.count,
+            'mean': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50': self.quantile(0.50),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'max': round(self.max_ms, 3),
+            'buckets': {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Staged Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class StagedPipelineConfig:
+    """Concurrency and queue bounds for StagedPipelineRunner"""
+    cpu_workers: int = DEFAULT_CPU_WORKERS
+    process_pool: bool = True       # False: CPU stages on the loop's default thread pool
+    match_concurrency: int = 8
+    validate_concurrency: int = 8
+    emit_concurrency: int = 4
+    queue_size: int = 32            # Max articles waiting in front of each stage
+
+
+class StagedPipelineRunner:
+    """
+    Runs articles through a BlogNodeSpoke with overlapping stages.
+
+    The process pool is created on the first run() and reused by later
+    runs; close() shuts it down.
+
+    Usage:
+        runner = StagedPipelineRunner(spoke, StagedPipelineConfig(cpu_workers=4))
+        results = await runner.run(article_payloads)
+        runner.close()
+    """
+
+    def __init__(self, spoke, config: Optional[StagedPipelineConfig] = None):
+        self.spoke = spoke
+        self.config = config or StagedPipelineConfig()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """The runner's process pool (None: CPU stages on the default thread pool)"""
+        if not self.config.process_pool:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.cpu_workers,
+                initializer=warm_cpu_worker
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the process pool (the next run() starts a new one)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _run_cpu_stages(
+        self,
+        ctx: ArticleContext,
+        article_payload: Dict[str, Any]
+    ) -> Tuple[ArticleContext, Union[ClassifiedEvent, StageFailure], float]:
+        """
+        run_cpu_stages() on the current pool.
+
+        If a worker dies (BrokenProcessPool) the pool is replaced and the
+        article is retried once on the new one before the error is raised.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in (1, 2):
+            executor = self._get_executor()
+            try:
+                return await loop.run_in_executor(executor, run_cpu_stages, ctx, article_payload)
+            except BrokenProcessPool:
+                if self._executor is executor:
+                    self._executor = None
+                    executor.shutdown(wait=False)
+                if attempt == 2:
+                    raise
+                logger.warning(
+                    "CPU worker died; retrying article on a fresh pool",
+                    extra={'correlation_id': ctx.correlation_id}
+                )
+
+    async def _fail_closed(self, ctx: ArticleContext, e: Exception) -> Any:
+        """spoke._handle_exception(), or a bare DROPPED result if that raises too"""
+        from .blog_node_spoke import PipelineResult, TerminalState
+
+        try:
+            return await self.spoke._handle_exception(ctx, e)
+        except Exception as handler_error:
+            logger.error(
+                f"Pipeline exception handler failed: {handler_error}",
+                extra={
+                    'correlation_id': ctx.correlation_id,
+                    'article_id': ctx.article_id,
+                    'error': str(handler_error)
+                }
+            )
+            return PipelineResult(
+                correlation_id=ctx.correlation_id,
+                article_id=ctx.article_id,
+                terminal_state=TerminalState.DROPPED,
+                processing_time_ms=int((time.time() - ctx.start_time) * 1000),
+                failed_stage="exception",
+                fail_code="BLOG-999",
+                fail_reason=f"Unhandled exception: {e}"
+            )
+
+    async def run(self, article_payloads: Iterable[Dict[str, Any]]) -> List[Any]:
+        """Returns one PipelineResult per payload, in input order."""
+        from .blog_node_spoke import PipelineResult  # blog_node_spoke imports this module
+
+        config = self.config
+        spoke = self.spoke
+        queues = {stage: asyncio.Queue(maxsize=config.queue_size) for stage in PIPELINE_STAGES}
+        results: Dict[int, Any] = {}
+
+        async def cpu(index, ctx, article_payload):
+            ctx, outcome, elapsed_ms = await self._run_cpu_stages(ctx, article_payload)
+            spoke.stage_latency['cpu'].observe(elapsed_ms)
+            if isinstance(outcome, StageFailure):
+                results[index] = await spoke._fail(ctx, outcome)
+                return
+            classified = await spoke._after_classify(ctx, outcome)
+            if isinstance(classified, PipelineResult):
+                results[index] = classified
+            else:
+                await queues['match'].put((index, ctx, classified))
+
+        async def match(index, ctx, classified):
+            matched = await spoke._match(ctx, classified)
+            if isinstance(matched, PipelineResult):
+                results[index] = matched
+            else:
+                await queues['validate'].put((index, ctx, classified, matched))
+
+        async def validate(index, ctx, classified, matched):
+            validated = await spoke._validate(ctx, matched)
+            if isinstance(validated, PipelineResult):
+                results[index] = validated
+            else:
+                await queues['emit'].put((index, ctx, classified, matched, validated))
+
+        async def emit(index, ctx, classified, matched, validated):
+            results[index] = await spoke._emit(ctx, classified, matched, validated)
+
+        handlers = {'cpu': cpu, 'match': match, 'validate': validate, 'emit': emit}
+        concurrency = {
+            'cpu': config.cpu_workers,
+            'match': config.match_concurrency,
+            'validate': config.validate_concurrency,
+            'emit': config.emit_concurrency,
+        }
+
+        async def worker(stage):
+            queue = queues[stage]
+            while True:
+                item = await queue.get()
+                try:
+                    await handlers[stage](*item)
+                except Exception as e:
+                    index, ctx = item[0], item[1]
+                    results[index] = await self._fail_closed(ctx, e)
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker(stage))
+            for stage in PIPELINE_STAGES
+            for _ in range(max(1, concurrency[stage]))
+        ]
+
+        try:
+            total = 0
+            for index, article_payload in enumerate(article_payloads):
+                total += 1
+                ctx, blocked = spoke._begin(article_payload)
+                if blocked:
+                    results[index] = blocked
+                else:
+                    await queues['cpu'].put((index, ctx, article_payload))
+
+            # A stage forwards before task_done(), so draining in order is complete
+            for stage in PIPELINE_STAGES:
+                await queues[stage].join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return [results[index] for index in range(total)]
+
+
+__all__ = [
+    'PIPELINE_STAGES',
+    'DEFAULT_CPU_WORKERS',
+    'LATENCY_BUCKETS_MS',
+    'ArticleContext',
+    'StageFailure',
+    'LatencyHistogram',
+    'StagedPipelineConfig',
+    'StagedPipelineRunner',
+    'run_cpu_stages',
+    'warm_cpu_worker',
+]
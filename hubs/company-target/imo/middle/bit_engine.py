@@ -30,10 +30,18 @@ Neon Integration:
     - Signals are persisted to outreach.bit_signal_log
     - Scores are persisted to outreach.company_target.bit_score
     - Signal deduplication via hash + timestamp constraints
+
+Query Indexes:
+    - Companies are bucketed by exact score and by hour of last_signal_at,
+      buckets kept in order; both move as each signal is processed
+    - Top-N, threshold, lifecycle-state and recent-mover queries walk a
+      range of buckets: O(log b + k) instead of a scan or sort of every company
 """
 
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from itertools import islice, takewhile
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 import logging
@@ -107,6 +115,9 @@ BIT_THRESHOLD_WARM = 25      # SUSPECT -> WARM
 BIT_THRESHOLD_HOT = 50       # WARM -> HOT
 BIT_THRESHOLD_BURNING = 75   # HOT -> BURNING
 
+# Width of the last_signal_at buckets in BITEngine's recency index
+RECENCY_BUCKET_SECONDS = 3600
+
 
 @dataclass
 class BITSignal:
@@ -172,6 +183,48 @@ class CompanyBITScore:
         }
 
 
+class _BucketIndex:
+    """
+    Company ids grouped into buckets by a numeric key, buckets in key order.
+
+    Moving a company between buckets that already exist is O(1); only a key
+    seen for the first time (or a bucket emptied) touches the ordered key list.
+    Within a bucket, ids keep the order they entered it.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[float, Dict[str, None]] = {}
+        self._keys: List[float] = []
+
+    def add(self, key: float, company_id: str) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+            insort(self._keys, key)
+        bucket[company_id] = None
+
+    def remove(self, key: float, company_id: str) -> None:
+        bucket = self._buckets[key]
+        del bucket[company_id]
+        if not bucket:
+            del self._buckets[key]
+            del self._keys[bisect_left(self._keys, key)]
+
+    def ascending(self, low: Optional[float] = None) -> Iterator[Tuple[float, str]]:
+        """(key, company_id) for keys >= low, lowest key first."""
+        start = 0 if low is None else bisect_left(self._keys, low)
+        for key in self._keys[start:]:
+            for company_id in self._buckets[key]:
+                yield key, company_id
+
+    def descending(self, high: Optional[float] = None) -> Iterator[Tuple[float, str]]:
+        """(key, company_id) for keys < high, highest key first."""
+        end = len(self._keys) if high is None else bisect_left(self._keys, high)
+        for key in reversed(self._keys[:end]):
+            for company_id in self._buckets[key]:
+                yield key, company_id
+
+
 class BITEngine:
     """
     Buyer Intent Tool - Core Metric Engine.
@@ -183,6 +236,13 @@ class BITEngine:
     - Set persist_to_neon=True to persist signals to database
     - Signals logged to funnel.bit_signal_log
     - Scores updated in marketing.company_master.bit_score
+
+    Indexes:
+    - _score_index: bucketed by score; equal scores keep the order in
+      which companies reached that score
+    - _recency_index: bucketed by hour of last_signal_at
+    Mutating a CompanyBITScore outside the engine must be followed by
+    _reindex(company_id).
     """
 
     def __init__(self, persist_to_neon: bool = False):
@@ -198,6 +258,11 @@ class BITEngine:
         self._aggregate_score: float = 0.0
         self.logger = logging.getLogger(__name__)
 
+        # Query indexes, maintained by _reindex
+        self._score_index = _BucketIndex()
+        self._recency_index = _BucketIndex()
+        self._index_keys: Dict[str, Tuple[float, Optional[int]]] = {}
+
         # Neon integration
         self.persist_to_neon = persist_to_neon
         self._neon_writer = None
@@ -209,6 +274,40 @@ class BITEngine:
             self._neon_writer = CompanyNeonWriter()
         return self._neon_writer
 
+    def _reindex(self, company_id: str) -> None:
+        """Move a company to its current score and recency buckets."""
+        company = self._scores[company_id]
+        score_key = company.score
+        recency_key = None
+        if company.last_signal_at is not None:
+            recency_key = int(company.last_signal_at.timestamp() // RECENCY_BUCKET_SECONDS)
+
+        old = self._index_keys.get(company_id)
+        if old == (score_key, recency_key):
+            return
+        if old is not None:
+            if old[0] != score_key:
+                self._score_index.remove(old[0], company_id)
+            if old[1] is not None and old[1] != recency_key:
+                self._recency_index.remove(old[1], company_id)
+
+        if old is None or old[0] != score_key:
+            self._score_index.add(score_key, company_id)
+        if recency_key is not None and (old is None or old[1] != recency_key):
+            self._recency_index.add(recency_key, company_id)
+        self._index_keys[company_id] = (score_key, recency_key)
+
+    def _scores_in_range(
+        self,
+        low: Optional[float] = None,
+        high: Optional[float] = None
+    ) -> List[CompanyBITScore]:
+        """Companies with low <= score < high (either bound optional), highest first."""
+        entries = self._score_index.descending(high)
+        if low is not None:
+            entries = takewhile(lambda entry: entry[0] >= low, entries)
+        return [self._scores[company_id] for _, company_id in entries]
+
     def process_signal(
         self,
         signal: BITSignal,
@@ -231,6 +330,7 @@ class BITEngine:
 
         # Add signal to company score
         self._scores[company_id].add_signal(signal)
+        self._reindex(company_id)
 
         # Update aggregates
         self._total_signals += 1
@@ -335,24 +435,23 @@ class BITEngine:
 
     def get_top_companies(self, limit: int = 10) -> List[CompanyBITScore]:
         """Get top companies by BIT score"""
-        sorted_scores = sorted(
-            self._scores.values(),
-            key=lambda x: x.score,
-            reverse=True
-        )
-        return sorted_scores[:limit]
+        return [self._scores[company_id] for _, company_id in islice(self._score_index.descending(), limit)]
 
     def get_companies_above_threshold(self, threshold: float) -> List[CompanyBITScore]:
-        """Get companies with BIT score above threshold"""
-        return [s for s in self._scores.values() if s.score >= threshold]
+        """Get companies with BIT score above threshold (highest first)"""
+        return self._scores_in_range(low=threshold)
 
     def get_recent_movers(self, hours: int = 24, min_signals: int = 3) -> List[CompanyBITScore]:
-        """Get companies with recent signal activity"""
+        """Get companies with recent signal activity (oldest activity first)"""
         cutoff = datetime.now().timestamp() - (hours * 3600)
+        recent = (
+            self._scores[company_id]
+            for _, company_id in self._recency_index.ascending(cutoff // RECENCY_BUCKET_SECONDS)
+        )
+        # The first bucket straddles the cutoff
         return [
-            s for s in self._scores.values()
-            if s.last_signal_at and s.last_signal_at.timestamp() > cutoff
-            and s.signal_count >= min_signals
+            s for s in recent
+            if s.signal_count >= min_signals and s.last_signal_at.timestamp() > cutoff
         ]
 
     def summary(self) -> Dict[str, Any]:
@@ -386,7 +485,7 @@ class BITEngine:
                 'last_signal_at': s.last_signal_at.isoformat() if s.last_signal_at else None,
                 'breakdown': s.breakdown()
             }
-            for s in sorted(self._scores.values(), key=lambda x: x.score, reverse=True)
+            for s in (self._scores[company_id] for _, company_id in self._score_index.descending())
         ]
 
     def load_scores_from_neon(self) -> int:
@@ -412,6 +511,7 @@ class BITEngine:
                     if company_id not in self._scores:
                         self._scores[company_id] = CompanyBITScore(company_id=company_id)
                     self._scores[company_id].score = bit_score
+                    self._reindex(company_id)
                     count += 1
 
             self.logger.info(f"Loaded BIT scores for {count} companies from Neon")
@@ -505,20 +605,18 @@ class BITEngine:
             state: SUSPECT, WARM, HOT, or BURNING
 
         Returns:
-            List of companies in that state
+            List of companies in that state (highest score first)
         """
         state = state.upper()
 
         if state == 'BURNING':
-            return [s for s in self._scores.values() if s.score >= BIT_THRESHOLD_BURNING]
+            return self._scores_in_range(low=BIT_THRESHOLD_BURNING)
         elif state == 'HOT':
-            return [s for s in self._scores.values()
-                    if BIT_THRESHOLD_HOT <= s.score < BIT_THRESHOLD_BURNING]
+            return self._scores_in_range(low=BIT_THRESHOLD_HOT, high=BIT_THRESHOLD_BURNING)
         elif state == 'WARM':
-            return [s for s in self._scores.values()
-                    if BIT_THRESHOLD_WARM <= s.score < BIT_THRESHOLD_HOT]
+            return self._scores_in_range(low=BIT_THRESHOLD_WARM, high=BIT_THRESHOLD_HOT)
         else:  # SUSPECT
-            return [s for s in self._scores.values() if s.score < BIT_THRESHOLD_WARM]
+            return self._scores_in_range(high=BIT_THRESHOLD_WARM)
 
     def get_state_summary(self) -> Dict[str, int]:
         """
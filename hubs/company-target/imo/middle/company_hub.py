@@ -28,6 +28,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
+import re
+import time
+
+from ops.caching import cached_normalizer
 
 # PHANTOM IMPORT - ctb.* module does not exist (commented out per doctrine)
 # from ctb.sys.enrichment.pipeline_engine.wheel.bicycle_wheel import Hub
@@ -38,6 +42,47 @@ Hub = object
 
 logger = logging.getLogger(__name__)
 
+# Seconds a Neon miss is remembered before the next lookup retries Neon
+DEFAULT_NEGATIVE_CACHE_TTL = 300.0
+
+
+@cached_normalizer("company_target.hub_company_name")
+def normalize_hub_company_name(name: str) -> str:
+    """
+    Normalize company name for matching.
+
+    Removes common suffixes, punctuation, and converts to lowercase.
+    Results are memoized in the shared normalization cache (ops.caching).
+    """
+    if not name:
+        return ""
+
+    normalized = name.lower().strip()
+
+    # Remove common suffixes
+    suffixes = [
+        ', inc.', ' inc.', ' inc', ', inc',
+        ', llc', ' llc', ', l.l.c.', ' l.l.c.',
+        ', ltd.', ' ltd.', ' ltd', ', ltd',
+        ', corp.', ' corp.', ' corp', ', corp',
+        ', co.', ' co.', ' co', ', co',
+        ', corporation', ' corporation',
+        ', company', ' company',
+        ', incorporated', ' incorporated',
+        ', limited', ' limited',
+    ]
+
+    for suffix in suffixes:
+        if normalized.endswith(suffix):
+            normalized = normalized[:-len(suffix)]
+            break
+
+    # Remove punctuation
+    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = re.sub(r'\s+', ' ', normalized).strip()
+
+    return normalized
+
 
 @dataclass
 class Slot:
@@ -158,10 +203,32 @@ class CompanyHub:
     - Outreach Execution Sub-Hub
     """
 
-    def __init__(self):
+    def __init__(self, negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL):
+        """
+        Initialize an empty hub.
+
+        Args:
+            negative_cache_ttl: Seconds a lookup that missed in memory AND in
+                Neon is answered None without querying Neon again (0 disables)
+        """
         self.name = "company_hub"
         self.entity_type = "company"
         self._companies: Dict[str, CompanyHubRecord] = {}
+
+        # Secondary indexes (key -> {company_id}), maintained by _index_company.
+        # Lookups return the earliest-added match, like the old linear scans.
+        self._domain_index: Dict[str, set] = {}      # domain.lower()
+        self._ein_index: Dict[str, set] = {}         # ein as stored
+        self._lower_name_index: Dict[str, set] = {}  # company_name.lower()
+        self._norm_name_index: Dict[str, set] = {}   # normalize_hub_company_name
+        self._index_keys: Dict[str, tuple] = {}      # company_id -> keys indexed
+        self._sequence: Dict[str, int] = {}          # company_id -> add order
+        self._next_sequence = 0
+
+        # Negative-result cache: (kind, key) -> expires_at (monotonic)
+        self.negative_cache_ttl = negative_cache_ttl
+        self._negative_cache: Dict[tuple, float] = {}
+        self._clock = time.monotonic
         self._hub = Hub(
             name="company_hub",
             entity_type="company",
@@ -181,6 +248,26 @@ class CompanyHub:
 
         HARD_FAIL: company_unique_id is REQUIRED per doctrine.
         """
+        if not self._add_company(company):
+            return False
+        self._update_hub_metrics()
+        return True
+
+    def add_companies(self, companies: List[CompanyHubRecord]) -> int:
+        """
+        Add many companies, recomputing hub metrics once (bootstrap path).
+
+        HARD_FAIL: company_unique_id is REQUIRED per doctrine.
+
+        Returns:
+            Number of companies added (duplicates are skipped)
+        """
+        added = sum(1 for company in companies if self._add_company(company))
+        self._update_hub_metrics()
+        return added
+
+    def _add_company(self, company: CompanyHubRecord) -> bool:
+        """Insert and index a company without recomputing hub metrics."""
         # HARD_FAIL guard per doctrine (DV-014)
         if not company.company_unique_id:
             raise ValueError(
@@ -193,8 +280,7 @@ class CompanyHub:
             self.logger.warning(f"Company {company.company_unique_id} already exists in hub")
             return False
 
-        self._companies[company.company_unique_id] = company
-        self._update_hub_metrics()
+        self._put_company(company)
         return True
 
     def get_company(self, company_id: str) -> Optional[CompanyHubRecord]:
@@ -206,10 +292,86 @@ class CompanyHub:
         if company.company_unique_id not in self._companies:
             return False
         company.updated_at = datetime.now()
-        self._companies[company.company_unique_id] = company
+        self._put_company(company)
         self._update_hub_metrics()
         return True
 
+    # =========================================================================
+    # SECONDARY INDEXES
+    # =========================================================================
+    # Records are indexed when they enter the hub (add_company, update_company,
+    # bootstrap_from_neon, Neon lookups). Mutating domain/ein/company_name on
+    # a record in place must be followed by update_company() to reindex it.
+
+    def _put_company(self, company: CompanyHubRecord) -> None:
+        """Store a company (new or replacement) and refresh its index entries."""
+        company_id = company.company_unique_id
+        self._unindex_company(company_id)
+        if company_id not in self._sequence:
+            self._sequence[company_id] = self._next_sequence
+            self._next_sequence += 1
+        self._companies[company_id] = company
+        self._index_company(company)
+
+    def _index_company(self, company: CompanyHubRecord) -> None:
+        company_id = company.company_unique_id
+        name = company.company_name if isinstance(company.company_name, str) else None
+        keys = (
+            company.domain.lower() if company.domain else None,
+            company.ein or None,
+            name.lower() if name is not None else None,
+            normalize_hub_company_name(name) if name is not None else None,
+        )
+        for index, key in zip(self._indexes(), keys):
+            if key is not None:
+                index.setdefault(key, set()).add(company_id)
+        self._index_keys[company_id] = keys
+
+        # A company now answers these keys - forget cached misses for them
+        if self._negative_cache:
+            for kind, key in (('domain', keys[0]), ('ein', keys[1]), ('name', keys[2])):
+                self._negative_cache.pop((kind, key), None)
+
+    def _unindex_company(self, company_id: str) -> None:
+        keys = self._index_keys.pop(company_id, None)
+        if not keys:
+            return
+        for index, key in zip(self._indexes(), keys):
+            ids = index.get(key) if key is not None else None
+            if ids:
+                ids.discard(company_id)
+                if not ids:
+                    del index[key]
+
+    def _indexes(self) -> tuple:
+        return (self._domain_index, self._ein_index,
+                self._lower_name_index, self._norm_name_index)
+
+    def _first_indexed(self, index: Dict[str, set], key: str) -> Optional[CompanyHubRecord]:
+        """Earliest-added company under key (same result as a linear scan)."""
+        ids = index.get(key)
+        if not ids:
+            return None
+        company_id = min(ids, key=self._sequence.__getitem__) if len(ids) > 1 else next(iter(ids))
+        return self._companies[company_id]
+
+    def _is_known_miss(self, kind: str, key: str) -> bool:
+        expires_at = self._negative_cache.get((kind, key))
+        if expires_at is None:
+            return False
+        if self._clock() < expires_at:
+            return True
+        del self._negative_cache[(kind, key)]
+        return False
+
+    def _remember_miss(self, kind: str, key: str) -> None:
+        if self.negative_cache_ttl > 0:
+            self._negative_cache[(kind, key)] = self._clock() + self.negative_cache_ttl
+
+    def clear_negative_cache(self) -> None:
+        """Forget all cached Neon misses."""
+        self._negative_cache.clear()
+
     def get_spoke_ready_companies(self) -> List[CompanyHubRecord]:
         """Get all companies ready for spoke processing"""
         return [c for c in self._companies.values() if c.is_spoke_ready]
@@ -455,18 +617,25 @@ class CompanyHub:
         """
         Find company by domain (GOLD match - Tool 1).
 
-        Checks in-memory first, then Neon if not found.
+        Checks the in-memory domain index first, then Neon if not found.
+        Neon misses are cached for negative_cache_ttl seconds; a failed
+        Neon query returns None without caching a miss.
         """
+        key = domain.lower()
+
         # Check in-memory
-        for company in self._companies.values():
-            if company.domain and company.domain.lower() == domain.lower():
-                return company
+        company = self._first_indexed(self._domain_index, key)
+        if company:
+            return company
+        if self._is_known_miss('domain', key):
+            return None
 
         # Check Neon
-        from ..output.neon_writer import CompanyNeonWriter
-        writer = CompanyNeonWriter()
-        result = writer.find_company_by_domain(domain)
-        writer.close()
+        try:
+            result = self._query_neon('find_company_by_domain', domain)
+        except Exception as e:
+            self.logger.warning(f"Neon domain lookup failed for {key}, miss not cached: {e}")
+            return None
 
         if result:
             # Add to in-memory cache
@@ -476,9 +645,10 @@ class CompanyHub:
                 domain=result.get('domain'),
                 email_pattern=result.get('email_pattern'),
             )
-            self._companies[record.company_unique_id] = record
+            self._put_company(record)
             return record
 
+        self._remember_miss('domain', key)
         return None
 
     def find_company_by_ein(self, ein: str) -> Optional[CompanyHubRecord]:
@@ -491,15 +661,18 @@ class CompanyHub:
         normalized = ''.join(c for c in ein if c.isdigit())
 
         # Check in-memory
-        for company in self._companies.values():
-            if company.ein and company.ein == normalized:
-                return company
+        company = self._first_indexed(self._ein_index, normalized)
+        if company:
+            return company
+        if self._is_known_miss('ein', normalized):
+            return None
 
         # Check Neon
-        from ..output.neon_writer import CompanyNeonWriter
-        writer = CompanyNeonWriter()
-        result = writer.find_company_by_ein(normalized)
-        writer.close()
+        try:
+            result = self._query_neon('find_company_by_ein', normalized)
+        except Exception as e:
+            self.logger.warning(f"Neon EIN lookup failed for {normalized}, miss not cached: {e}")
+            return None
 
         if result:
             record = CompanyHubRecord(
@@ -509,9 +682,10 @@ class CompanyHub:
                 email_pattern=result.get('email_pattern'),
                 ein=result.get('ein'),
             )
-            self._companies[record.company_unique_id] = record
+            self._put_company(record)
             return record
 
+        self._remember_miss('ein', normalized)
         return None
 
     def find_company_by_name(
@@ -539,77 +713,70 @@ class CompanyHub:
 
         # Normalize input
         normalized_input = self._normalize_company_name(company_name)
+        lower_name = company_name.lower()
 
         # Strategy 1: Exact match (case-insensitive)
-        for company in self._companies.values():
-            if company.company_name.lower() == company_name.lower():
-                return company
+        company = self._first_indexed(self._lower_name_index, lower_name)
+        if company:
+            return company
 
         # Strategy 2: Normalized match
-        for company in self._companies.values():
-            normalized_company = self._normalize_company_name(company.company_name)
-            if normalized_company == normalized_input:
-                return company
+        company = self._first_indexed(self._norm_name_index, normalized_input)
+        if company:
+            return company
+        # Keyed like the Neon match below: a miss for "Acme, Inc." says
+        # nothing about "Acme Inc"
+        if self._is_known_miss('name', lower_name):
+            return None
 
         # Strategy 3: Fuzzy matching REMOVED per doctrine
         # Per CL Parent-Child Doctrine: No fuzzy matching for identity resolution
 
         # Strategy 4: Check Neon
-        from ..output.neon_writer import CompanyNeonWriter
-        writer = CompanyNeonWriter()
-        results = writer.find_companies_by_name(company_name)
-        writer.close()
+        try:
+            results = self._query_neon('find_companies_by_name', company_name)
+        except Exception as e:
+            self.logger.warning(f"Neon name lookup failed for {company_name!r}, miss not cached: {e}")
+            return None
 
         if results:
             # Return first exact match
             for result in results:
-                if result['company_name'].lower() == company_name.lower():
+                if result['company_name'].lower() == lower_name:
                     record = CompanyHubRecord(
                         company_unique_id=result['company_unique_id'],
                         company_name=result['company_name'],
                         domain=result.get('domain'),
                         email_pattern=result.get('email_pattern'),
                     )
-                    self._companies[record.company_unique_id] = record
+                    self._put_company(record)
                     return record
 
+        self._remember_miss('name', lower_name)
         return None
 
+    def _query_neon(self, lookup: str, value: str) -> Any:
+        """
+        Run one CompanyNeonWriter lookup.
+
+        Raises if the query itself failed, so callers only cache a miss
+        when Neon answered with no row.
+        """
+        from ..output.neon_writer import CompanyNeonWriter
+        writer = CompanyNeonWriter()
+        try:
+            return getattr(writer, lookup)(value, raise_errors=True)
+        finally:
+            writer.close()
+
     def _normalize_company_name(self, name: str) -> str:
         """
         Normalize company name for matching.
 
         Removes common suffixes, punctuation, and converts to lowercase.
+        Memoized in the shared normalization cache (ops.caching).
         """
-        if not name:
-            return ""
-
-        normalized = name.lower().strip()
-
-        # Remove common suffixes
-        suffixes = [
-            ', inc.', ' inc.', ' inc', ', inc',
-            ', llc', ' llc', ', l.l.c.', ' l.l.c.',
-            ', ltd.', ' ltd.', ' ltd', ', ltd',
-            ', corp.', ' corp.', ' corp', ', corp',
-            ', co.', ' co.', ' co', ', co',
-            ', corporation', ' corporation',
-            ', company', ' company',
-            ', incorporated', ' incorporated',
-            ', limited', ' limited',
-        ]
-
-        for suffix in suffixes:
-            if normalized.endswith(suffix):
-                normalized = normalized[:-len(suffix)]
-                break
-
-        # Remove punctuation
-        import re
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-
-        return normalized
+        return normalize_hub_company_name(name)
 
     def get_company_count(self) -> int:
         """Get total number of companies in hub."""
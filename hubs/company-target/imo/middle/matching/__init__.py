@@ -21,6 +21,13 @@ from .fuzzy import (
     apply_city_guardrail,
     resolve_multi_candidate,
     rank_candidates_by_score,
+    jaro_batch,
+    jaro_winkler_batch,
+    levenshtein_distance_batch,
+    levenshtein_similarity_batch,
+    token_sort_ratio_batch,
+    token_set_ratio_batch,
+    fuzzy_match_scores,
 )
 
 from .fuzzy_arbitration import (
@@ -32,6 +39,8 @@ from .fuzzy_arbitration import (
     arbitrate_collision,
 )
 
+from .candidate_index import CompanyCandidateIndex
+
 from .normalization import (
     normalize_company_name,
     normalize_domain,
@@ -63,6 +72,13 @@ __all__ = [
     "apply_city_guardrail",
     "resolve_multi_candidate",
     "rank_candidates_by_score",
+    "jaro_batch",
+    "jaro_winkler_batch",
+    "levenshtein_distance_batch",
+    "levenshtein_similarity_batch",
+    "token_sort_ratio_batch",
+    "token_set_ratio_batch",
+    "fuzzy_match_scores",
     # fuzzy_arbitration
     "ArbitrationResult",
     "CollisionCandidate",
@@ -70,6 +86,8 @@ __all__ = [
     "AbacusFuzzyArbitrator",
     "create_arbitrator",
     "arbitrate_collision",
+    # candidate_index
+    "CompanyCandidateIndex",
     # normalization
     "normalize_company_name",
     "normalize_domain",
@@ -0,0 +1,168 @@
+"""
+Candidate Blocking Index
+========================
+Prebuilt shortlist index for the BRONZE fuzzy tier.
+
+apply_city_guardrail() scores every company in the master with Jaro-Winkler.
+This index is built once per company master and returns only the candidates
+that can still pass the guardrail, so the exact scorer runs on a shortlist.
+
+Blocking is lossless for the doctrine thresholds:
+- Character postings give the multiset overlap c between query and candidate.
+  Jaro matches m <= c, so Jaro <= (c/|a| + c/|b| + 1) / 3 and
+  Jaro-Winkler <= Jaro + 4 * 0.1 * (1 - Jaro).
+- Candidates whose bound is below high_threshold can only match through the
+  city guardrail, so they are kept only when they sit in the query city block.
+
+Candidates are returned in master order, so the stable sort inside
+apply_city_guardrail() breaks ties exactly as the full scan does.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+# Jaro-Winkler prefix bonus ceiling: max prefix length 4, prefix weight 0.1
+MAX_PREFIX_BONUS = 4 * 0.1
+
+# Float slack so the bound never prunes a candidate that scores exactly at threshold
+BOUND_EPSILON = 1e-9
+
+
+class CompanyCandidateIndex:
+    """
+    Blocking index over company master candidates.
+
+    Candidates are the same dicts apply_city_guardrail() consumes
+    (id, name, city, state). Scoring stays in apply_city_guardrail();
+    this class only decides which candidates are worth scoring.
+    """
+
+    def __init__(self, candidates: List[Dict[str, Any]],
+                 name_threshold: float = 0.85,
+                 high_threshold: float = 0.92):
+        """
+        Build the index.
+
+        Args:
+            candidates: Candidate dicts in company master order
+            name_threshold: Guardrail minimum score (fuzzy_low_threshold)
+            high_threshold: Guardrail location-free score (fuzzy_high_threshold)
+        """
+        self.candidates = candidates
+        self.name_threshold = name_threshold
+        self.high_threshold = high_threshold
+
+        size = len(candidates)
+        self._lengths = np.zeros(size, dtype=np.float64)
+
+        # Candidates the bound cannot reason about (non-string names) are
+        # always scored so the guardrail sees them exactly as before
+        always = []
+
+        postings: Dict[str, List[List[int]]] = {}
+        city_blocks: Dict[str, List[int]] = {}
+        unblocked_city = []
+
+        for position, candidate in enumerate(candidates):
+            name = candidate.get('name', '')
+            if isinstance(name, str):
+                self._lengths[position] = len(name)
+                for char, count in Counter(name).items():
+                    posting = postings.setdefault(char, [[], []])
+                    posting[0].append(position)
+                    posting[1].append(count)
+            else:
+                always.append(position)
+
+            city = candidate.get('city', '')
+            if isinstance(city, str):
+                if city:
+                    city_blocks.setdefault(city.lower(), []).append(position)
+            else:
+                unblocked_city.append(position)
+
+        self._postings = {
+            char: (np.asarray(ids, dtype=np.int64), np.asarray(counts, dtype=np.int32))
+            for char, (ids, counts) in postings.items()
+        }
+        self._city_blocks = {
+            city: np.asarray(ids, dtype=np.int64) for city, ids in city_blocks.items()
+        }
+        self._always = np.asarray(always, dtype=np.int64)
+        self._unblocked_city = np.asarray(unblocked_city, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def upper_bounds(self, query_name: str) -> np.ndarray:
+        """
+        Jaro-Winkler upper bound of query_name against every candidate.
+
+        Args:
+            query_name: Query string exactly as passed to the scorer
+
+        Returns:
+            Array of bounds aligned with self.candidates
+        """
+        size = len(self.candidates)
+        if not query_name or size == 0:
+            return np.zeros(size, dtype=np.float64)
+
+        overlap = np.zeros(size, dtype=np.float64)
+        for char, query_count in Counter(query_name).items():
+            posting = self._postings.get(char)
+            if posting is None:
+                continue
+            ids, counts = posting
+            overlap[ids] += np.minimum(counts, query_count)
+
+        query_len = float(len(query_name))
+        lengths = self._lengths
+        with np.errstate(divide='ignore', invalid='ignore'):
+            jaro = (overlap / query_len + np.where(lengths > 0, overlap / lengths, 0.0) + 1.0) / 3.0
+        jaro = np.where(overlap > 0, np.minimum(jaro, 1.0), 0.0)
+
+        return jaro + MAX_PREFIX_BONUS * (1.0 - jaro)
+
+    def shortlist(self, query_name: str, query_city: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return candidates that can still pass apply_city_guardrail().
+
+        Args:
+            query_name: Normalized company name being matched
+            query_city: Normalized city for the guardrail (optional)
+
+        Returns:
+            Candidate dicts in company master order
+        """
+        if not query_name or not self.candidates:
+            return []
+
+        bounds = self.upper_bounds(query_name)
+
+        keep = bounds >= self.high_threshold - BOUND_EPSILON
+
+        # 0.85-0.92 band only matches inside the same city block
+        if query_city:
+            medium = bounds >= self.name_threshold - BOUND_EPSILON
+            in_city = np.zeros(len(self.candidates), dtype=bool)
+            block = self._city_blocks.get(query_city.lower())
+            if block is not None:
+                in_city[block] = True
+            in_city[self._unblocked_city] = True
+            keep |= medium & in_city
+
+        keep[self._always] = True
+
+        return [self.candidates[position] for position in np.flatnonzero(keep)]
+
+    def stats(self) -> Dict[str, int]:
+        """Index size summary for logging."""
+        return {
+            'candidates': len(self.candidates),
+            'characters': len(self._postings),
+            'city_blocks': len(self._city_blocks),
+        }
@@ -3,12 +3,18 @@ Fuzzy Matching Utilities
 ========================
 String similarity and fuzzy matching functions.
 Implements Jaro-Winkler with doctrine-compliant thresholds and guardrails.
+
+Scalar functions (jaro_similarity, levenshtein_distance, ...) are the
+reference implementation; *_batch functions score one query against a
+whole candidate array and must return identical scores.
 """
 
 from typing import Optional, List, Tuple, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 
 class MatchTier(Enum):
     """Match confidence tiers per doctrine."""
@@ -266,11 +272,11 @@ def find_best_match(query: str, candidates: List[str],
     best_match = None
     best_score = 0.0
 
-    for candidate in candidates:
-        score = fuzzy_match_score(query, candidate, method)
-        if score > best_score:
-            best_score = score
-            best_match = candidate
+    scores = fuzzy_match_scores(query, candidates, method, threshold)
+    best = int(scores.argmax())
+    if scores[best] > best_score:
+        best_score = float(scores[best])
+        best_match = candidates[best]
 
     if best_score >= threshold:
         return (best_match, best_score)
@@ -300,10 +306,9 @@ def find_all_matches(query: str, candidates: List[str],
 
     matches = []
 
-    for candidate in candidates:
-        score = fuzzy_match_score(query, candidate, method)
-        if score >= threshold:
-            matches.append((candidate, score))
+    scores = fuzzy_match_scores(query, candidates, method, threshold)
+    for position in np.flatnonzero(scores >= threshold):
+        matches.append((candidates[position], float(scores[position])))
 
     # Sort by score descending
     matches.sort(key=lambda x: x[1], reverse=True)
@@ -383,6 +388,381 @@ def token_set_ratio(s1: str, s2: str) -> float:
     return max(scores)
 
 
+# =============================================================================
+# BATCH SCORING (one query vs many candidates)
+# =============================================================================
+# The scalar functions above are the reference implementation. The batch
+# functions below score a whole candidate array per call on NumPy-encoded
+# code points and return bit-identical scores for every candidate that can
+# reach `threshold`. Candidates whose length-ratio (or match-count) upper
+# bound is below `threshold` are never fully scored; every score below
+# `threshold` is reported as 0.0.
+
+# Candidates are scored in length-sorted chunks to bound padding and memory
+BATCH_CHUNK_SIZE = 4096
+
+# Float slack so pruning never drops a candidate that scores exactly at threshold
+PRUNE_EPSILON = 1e-9
+
+
+def _as_text(value: Any) -> str:
+    """Coerce a candidate value to str (non-strings score as empty)."""
+    return value if isinstance(value, str) else ""
+
+
+def _cut(scores: np.ndarray, threshold: float) -> np.ndarray:
+    """Report every score below threshold as 0.0."""
+    if threshold > 0.0:
+        scores[scores < threshold] = 0.0
+    return scores
+
+
+def _encode(strings: List[str], pad: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode strings as a padded code-point matrix.
+
+    Args:
+        strings: Strings to encode
+        pad: Padding value (must not be a valid code point)
+
+    Returns:
+        Tuple of (codes[n, max_len], lengths[n])
+    """
+    lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+    width = int(lengths.max()) if len(strings) else 0
+    codes = np.full((len(strings), max(width, 1)), pad, dtype=np.int64)
+    if width:
+        flat = np.frombuffer(''.join(strings).encode('utf-32-le'), dtype='<u4')
+        codes[np.arange(codes.shape[1]) < lengths[:, None]] = flat
+    return codes, lengths
+
+
+def _jaro_winkler_pairs(left: List[str], right: List[str],
+                        threshold: float = 0.0,
+                        prefix_weight: float = 0.1,
+                        winkler: bool = True) -> np.ndarray:
+    """
+    Jaro / Jaro-Winkler for aligned (left[i], right[i]) pairs.
+
+    Mirrors jaro_similarity() and jaro_winkler_similarity() step for step so
+    scores are bit-identical to the scalar reference.
+    """
+    count = len(left)
+    scores = np.zeros(count, dtype=np.float64)
+    if count == 0:
+        return scores
+
+    len1 = np.fromiter((len(s) for s in left), dtype=np.int64, count=count)
+    len2 = np.fromiter((len(s) for s in right), dtype=np.int64, count=count)
+    identical = np.fromiter((a == b for a, b in zip(left, right)), dtype=bool, count=count)
+
+    prefix_weight = min(prefix_weight, 0.25)
+    max_bonus = 4 * prefix_weight if winkler else 0.0
+
+    # Length-ratio pruning: matches <= min(len1, len2)
+    live = (len1 > 0) & (len2 > 0) & ~identical
+    shortest = np.minimum(len1, len2).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        jaro_max = (shortest / len1 + shortest / len2 + 1.0) / 3.0
+    bound = jaro_max + max_bonus * (1.0 - jaro_max)
+    live &= bound >= threshold - PRUNE_EPSILON
+
+    scores[identical & (len1 > 0)] = 1.0
+
+    rows = np.flatnonzero(live)
+    if len(rows) == 0:
+        return scores
+
+    # Length-sorted chunks keep padding small
+    rows = rows[np.argsort(len2[rows], kind='stable')]
+    for start in range(0, len(rows), BATCH_CHUNK_SIZE):
+        chunk = rows[start:start + BATCH_CHUNK_SIZE]
+        scores[chunk] = _jaro_winkler_chunk(
+            [left[r] for r in chunk], [right[r] for r in chunk],
+            len1[chunk], len2[chunk], threshold, prefix_weight, max_bonus, winkler
+        )
+
+    return scores
+
+
+def _jaro_winkler_chunk(left: List[str], right: List[str],
+                        len1: np.ndarray, len2: np.ndarray,
+                        threshold: float, prefix_weight: float,
+                        max_bonus: float, winkler: bool) -> np.ndarray:
+    """Score one chunk of non-empty, non-identical pairs."""
+    size = len(left)
+    codes1, _ = _encode(left, pad=-1)
+    codes2, _ = _encode(right, pad=-2)
+    width1, width2 = codes1.shape[1], codes2.shape[1]
+    row_ids = np.arange(size)
+    columns = np.arange(width2)
+
+    match_distance = np.maximum(np.maximum(len1, len2) // 2 - 1, 0)
+
+    matched1 = np.zeros((size, width1), dtype=bool)
+    matched2 = np.zeros((size, width2), dtype=bool)
+
+    # Greedy left-to-right matching, vectorized across pairs
+    for i in range(width1):
+        active = i < len1
+        lo = i - match_distance
+        hi = np.minimum(i + match_distance + 1, len2)
+        window = (columns >= lo[:, None]) & (columns < hi[:, None])
+        hit = window & ~matched2 & (codes2 == codes1[:, i:i + 1]) & active[:, None]
+        first = hit.argmax(axis=1)
+        found = hit[row_ids, first]
+        matched1[:, i] = found
+        matched2[row_ids[found], first[found]] = True
+
+    matches = matched1.sum(axis=1)
+    scores = np.zeros(size, dtype=np.float64)
+
+    # Threshold cutoff before counting transpositions (transpositions >= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        jaro_max = (matches / len1 + matches / len2 + 1.0) / 3.0
+    keep = (matches > 0) & (jaro_max + max_bonus * (1.0 - jaro_max) >= threshold - PRUNE_EPSILON)
+    if not keep.any():
+        return scores
+
+    # Transpositions: compare k-th matched char of each side
+    order1 = np.argsort(~matched1, axis=1, kind='stable')
+    order2 = np.argsort(~matched2, axis=1, kind='stable')
+    seq1 = np.take_along_axis(codes1, order1, axis=1)
+    seq2 = np.take_along_axis(codes2, order2, axis=1)
+    depth = min(width1, width2)
+    in_match = np.arange(depth) < matches[:, None]
+    transpositions = ((seq1[:, :depth] != seq2[:, :depth]) & in_match).sum(axis=1) // 2
+
+    m = matches[keep].astype(np.float64)
+    t = transpositions[keep]
+    jaro = (m / len1[keep] + m / len2[keep] + (m - t) / m) / 3.0
+
+    if winkler:
+        max_prefix = np.minimum(4, np.minimum(len1[keep], len2[keep]))
+        prefix_len = np.zeros(len(m), dtype=np.int64)
+        still = np.ones(len(m), dtype=bool)
+        kept1, kept2 = codes1[keep], codes2[keep]
+        for i in range(min(4, depth)):
+            still &= (i < max_prefix) & (kept1[:, i] == kept2[:, i])
+            prefix_len += still
+        jaro = jaro + (prefix_len * prefix_weight * (1 - jaro))
+
+    scores[keep] = jaro
+    return scores
+
+
+def jaro_winkler_batch(query: str, candidates: List[str],
+                       threshold: float = 0.0,
+                       prefix_weight: float = 0.1) -> np.ndarray:
+    """
+    Jaro-Winkler similarity of one query against many candidates.
+
+    Batch equivalent of jaro_winkler_similarity(query, candidate).
+
+    Args:
+        query: String to match (first argument of the scalar function)
+        candidates: Candidate strings
+        threshold: Candidates that cannot reach this score report 0.0
+        prefix_weight: Weight for common prefix (default 0.1, max 0.25)
+
+    Returns:
+        Array of scores aligned with candidates
+    """
+    query = _as_text(query)
+    candidates = [_as_text(c) for c in candidates]
+    scores = _jaro_winkler_pairs([query] * len(candidates), candidates,
+                                 threshold=threshold, prefix_weight=prefix_weight)
+    return _cut(scores, threshold)
+
+
+def jaro_batch(query: str, candidates: List[str], threshold: float = 0.0) -> np.ndarray:
+    """
+    Jaro similarity of one query against many candidates.
+
+    Batch equivalent of jaro_similarity(query, candidate).
+    """
+    query = _as_text(query)
+    candidates = [_as_text(c) for c in candidates]
+    scores = _jaro_winkler_pairs([query] * len(candidates), candidates,
+                                 threshold=threshold, winkler=False)
+    return _cut(scores, threshold)
+
+
+def levenshtein_distance_batch(query: str, candidates: List[str],
+                               max_distance: Optional[int] = None) -> np.ndarray:
+    """
+    Levenshtein distance of one query against many candidates.
+
+    Batch equivalent of levenshtein_distance(query, candidate). The DP runs
+    row by row across all candidates at once.
+
+    Args:
+        query: String to match
+        candidates: Candidate strings
+        max_distance: Candidates whose length difference already exceeds
+            this are not scored and report max_distance + 1
+
+    Returns:
+        Integer array of distances aligned with candidates
+    """
+    query = _as_text(query)
+    candidates = [_as_text(c) for c in candidates]
+    count = len(candidates)
+    len1 = len(query)
+    len2 = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=count)
+
+    if len1 == 0 or count == 0:
+        return len2.copy()
+
+    distances = np.where(len2 == 0, len1, 0).astype(np.int64)
+    live = len2 > 0
+    if max_distance is not None:
+        too_far = live & (np.abs(len2 - len1) > max_distance)
+        distances[too_far] = max_distance + 1
+        live &= ~too_far
+
+    rows = np.flatnonzero(live)
+    rows = rows[np.argsort(len2[rows], kind='stable')]
+    query_codes, _ = _encode([query], pad=-1)
+    query_codes = query_codes[0]
+
+    for start in range(0, len(rows), BATCH_CHUNK_SIZE):
+        chunk = rows[start:start + BATCH_CHUNK_SIZE]
+        codes2, lengths = _encode([candidates[r] for r in chunk], pad=-2)
+        width2 = codes2.shape[1]
+
+        previous = np.broadcast_to(np.arange(width2 + 1), (len(chunk), width2 + 1)).copy()
+        for i in range(1, len1 + 1):
+            current = np.empty_like(previous)
+            current[:, 0] = i
+            cost = (codes2 != query_codes[i - 1]).astype(np.int64)
+            # Deletion and substitution are row-parallel; insertion is a scan
+            best = np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost)
+            for j in range(1, width2 + 1):
+                current[:, j] = np.minimum(best[:, j - 1], current[:, j - 1] + 1)
+            previous = current
+
+        distances[chunk] = previous[np.arange(len(chunk)), lengths]
+
+    return distances
+
+
+def levenshtein_similarity_batch(query: str, candidates: List[str],
+                                 threshold: float = 0.0) -> np.ndarray:
+    """
+    Levenshtein similarity of one query against many candidates.
+
+    Batch equivalent of levenshtein_similarity(query, candidate).
+
+    Args:
+        query: String to match
+        candidates: Candidate strings
+        threshold: Candidates that cannot reach this score report 0.0
+
+    Returns:
+        Array of scores aligned with candidates
+    """
+    query = _as_text(query)
+    candidates = [_as_text(c) for c in candidates]
+    count = len(candidates)
+    scores = np.zeros(count, dtype=np.float64)
+    if count == 0:
+        return scores
+
+    len1 = len(query)
+    len2 = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=count)
+    if len1 == 0:
+        scores[len2 == 0] = 1.0
+        return scores
+
+    max_len = np.maximum(len1, len2).astype(np.float64)
+    # Length-ratio pruning: distance >= |len1 - len2|
+    bound = 1.0 - np.abs(len2 - len1) / max_len
+    live = np.flatnonzero((len2 > 0) & (bound >= threshold - PRUNE_EPSILON))
+    if len(live) == 0:
+        return scores
+
+    distances = levenshtein_distance_batch(query, [candidates[r] for r in live])
+    scores[live] = 1.0 - (distances / max_len[live])
+    return _cut(scores, threshold)
+
+
+def token_sort_ratio_batch(query: str, candidates: List[str],
+                           threshold: float = 0.0) -> np.ndarray:
+    """Batch equivalent of token_sort_ratio(query, candidate)."""
+    query = _as_text(query)
+    candidates = [_as_text(c) for c in candidates]
+    if not query:
+        return np.zeros(len(candidates), dtype=np.float64)
+
+    sorted_query = ' '.join(sorted(query.lower().split()))
+    sorted_candidates = [' '.join(sorted(c.lower().split())) for c in candidates]
+    scores = _jaro_winkler_pairs([sorted_query] * len(candidates), sorted_candidates,
+                                 threshold=threshold)
+    # Scalar returns 0.0 for empty raw candidates even if both sort to ''
+    scores[[not c for c in candidates]] = 0.0
+    return _cut(scores, threshold)
+
+
+def token_set_ratio_batch(query: str, candidates: List[str],
+                          threshold: float = 0.0) -> np.ndarray:
+    """Batch equivalent of token_set_ratio(query, candidate)."""
+    query = _as_text(query)
+    candidates = [_as_text(c) for c in candidates]
+    scores = np.zeros(len(candidates), dtype=np.float64)
+    if not query:
+        return scores
+
+    tokens1 = set(query.lower().split())
+    rows, lefts, rights = [], [], []
+    for position, candidate in enumerate(candidates):
+        if not candidate:
+            continue
+        tokens2 = set(candidate.lower().split())
+        intersection = tokens1 & tokens2
+        if not intersection:
+            continue
+        sorted_intersection = ' '.join(sorted(intersection))
+        combined1 = ' '.join(sorted(intersection | (tokens1 - tokens2)))
+        combined2 = ' '.join(sorted(intersection | (tokens2 - tokens1)))
+        rows.extend([position] * 3)
+        lefts.extend([sorted_intersection, sorted_intersection, combined1])
+        rights.extend([combined1, combined2, combined2])
+
+    if rows:
+        pair_scores = _jaro_winkler_pairs(lefts, rights, threshold=threshold)
+        np.maximum.at(scores, np.asarray(rows), pair_scores)
+    return _cut(scores, threshold)
+
+
+def fuzzy_match_scores(query: str, candidates: List[str],
+                       method: str = "jaro_winkler",
+                       threshold: float = 0.0) -> np.ndarray:
+    """
+    Batch equivalent of fuzzy_match_score(query, candidate).
+
+    Args:
+        query: String to match
+        candidates: Candidate strings
+        method: Matching method to use
+        threshold: Candidates that cannot reach this score report 0.0
+
+    Returns:
+        Array of scores aligned with candidates
+    """
+    if not query:
+        return np.zeros(len(candidates), dtype=np.float64)
+
+    if method == "levenshtein":
+        return levenshtein_similarity_batch(query, candidates, threshold)
+    elif method == "token_sort":
+        return token_sort_ratio_batch(query, candidates, threshold)
+    elif method == "token_set":
+        return token_set_ratio_batch(query, candidates, threshold)
+    else:
+        return jaro_winkler_batch(query, candidates, threshold)
+
+
 def check_ambiguous_collision(candidates: List[MatchCandidate],
                               threshold: float = 0.03) -> Tuple[bool, Optional[str]]:
     """
@@ -437,15 +817,16 @@ def apply_city_guardrail(query_name: str, query_city: str, query_state: str,
     """
     results = []
 
-    for candidate in candidates:
-        cand_name = candidate.get('name', candidate.get('company_name', ''))
+    # Score all candidates in one batch; anything below both thresholds is 0.0
+    names = [candidate.get('name', candidate.get('company_name', '')) for candidate in candidates]
+    scores = jaro_winkler_batch(query_name, names,
+                                threshold=min(name_threshold, high_threshold))
+
+    for candidate, cand_name, score in zip(candidates, names, scores.tolist()):
         cand_city = candidate.get('city', candidate.get('address_city', ''))
         cand_state = candidate.get('state', candidate.get('address_state', ''))
         cand_id = candidate.get('id', candidate.get('company_unique_id', ''))
 
-        # Calculate similarity
-        score = jaro_winkler_similarity(query_name, cand_name)
-
         # Check city/state match
         city_match = (query_city and cand_city and
                       query_city.lower() == cand_city.lower())
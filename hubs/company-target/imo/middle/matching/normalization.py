@@ -3,6 +3,9 @@ Normalization Utilities
 =======================
 Text normalization functions for company names, domains, cities, and emails.
 Implements deterministic, repeatable normalization per doctrine.
+
+Company name, domain, city and state normalizers are memoized in the shared
+process-wide cache (ops.caching); size via NORMALIZATION_CACHE_SIZE.
 """
 
 import re
@@ -10,6 +13,8 @@ import unicodedata
 from typing import Optional
 from urllib.parse import urlparse
 
+from ops.caching import cached_normalizer
+
 
 # Company suffixes to remove for matching (order matters - longest first)
 COMPANY_SUFFIXES = [
@@ -49,6 +54,7 @@ STATE_ABBREVIATIONS = {
 }
 
 
+@cached_normalizer("company_target.company_name")
 def normalize_company_name(name: str, remove_suffixes: bool = True) -> str:
     """
     Normalize company name for matching per doctrine.
@@ -102,6 +108,7 @@ def normalize_company_name(name: str, remove_suffixes: bool = True) -> str:
     return result.strip()
 
 
+@cached_normalizer("company_target.domain")
 def normalize_domain(domain: str) -> str:
     """
     Normalize domain for comparison.
@@ -157,6 +164,7 @@ def normalize_domain(domain: str) -> str:
     return result
 
 
+@cached_normalizer("company_target.city")
 def normalize_city(city: str) -> str:
     """
     Normalize city name for matching.
@@ -207,6 +215,7 @@ def normalize_city(city: str) -> str:
     return result
 
 
+@cached_normalizer("company_target.state")
 def normalize_state(state: str) -> str:
     """
     Normalize state to 2-letter abbreviation.
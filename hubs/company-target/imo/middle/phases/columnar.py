@@ -0,0 +1,64 @@
+"""
+Columnar DataFrame Access
+=========================
+Shared helpers for the Company phases to walk DataFrames by column instead
+of iterrows(), which boxes every row into a Series.
+
+Rows are yielded as plain dicts restricted to the columns a phase reads.
+dict.get() has the same semantics as Series.get(): the default is returned
+only when the column is absent, never for NaN values.
+"""
+
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import pandas as pd
+
+
+def column_values(df: pd.DataFrame, name: str, default: Any = '') -> List[Any]:
+    """
+    Return a column as a Python list.
+
+    Args:
+        df: Source DataFrame
+        name: Column name
+        default: Value for every row when the column is absent
+
+    Returns:
+        List of values aligned with df rows
+    """
+    if name in df.columns:
+        return df[name].tolist()
+    return [default] * len(df)
+
+
+def iter_rows(df: pd.DataFrame,
+              columns: Sequence[str]) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Iterate rows as (index_label, {column: value}) over selected columns.
+
+    Drop-in replacement for df.iterrows() where the caller only uses
+    row.get(...) on a known set of columns.
+
+    Args:
+        df: Source DataFrame
+        columns: Columns the caller reads (absent columns are skipped)
+
+    Yields:
+        Tuple of (index label, row dict)
+    """
+    present = [name for name in columns if name in df.columns]
+    values = [df[name].tolist() for name in present]
+    for label, row in zip(df.index.tolist(), zip(*values) if values else ((),) * len(df)):
+        yield label, dict(zip(present, row))
+
+
+def first_truthy(*columns: List[Any]) -> List[Any]:
+    """
+    Element-wise `a or b or ...` across aligned column lists.
+
+    Mirrors `row.get('a', '') or row.get('b', '')` for every row.
+    """
+    result = list(columns[0])
+    for column in columns[1:]:
+        result = [left or right for left, right in zip(result, column)]
+    return result
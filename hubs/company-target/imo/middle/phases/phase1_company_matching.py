@@ -14,6 +14,7 @@ DOCTRINE ENFORCEMENT:
 """
 
 import time
+import multiprocessing
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
@@ -22,7 +23,9 @@ import pandas as pd
 # Doctrine enforcement imports
 from ops.enforcement.correlation_id import validate_correlation_id, CorrelationIDError
 
-from ..utils.normalization import (
+from ops.caching import get_normalization_cache, configure_normalization_cache
+
+from ..matching.normalization import (
     normalize_company_name,
     normalize_domain,
     normalize_city,
@@ -32,6 +35,8 @@ from ..utils.normalization import (
 # MatchTier, MatchCandidate, FuzzyMatchResult - no longer available
 # jaro_winkler_similarity, apply_city_guardrail, resolve_multi_candidate - no longer available
 # AbacusFuzzyArbitrator, CollisionCandidate, ArbitrationResult - no longer available
+from ..matching.candidate_index import CompanyCandidateIndex
+from .columnar import column_values, iter_rows, first_truthy
 
 from ..utils.logging import (
     PipelineLogger,
@@ -42,6 +47,18 @@ from ..utils.logging import (
 from ..utils.config import MatchingConfig
 
 
+# Columns _match_person reads from each people_df row
+PERSON_COLUMNS = (
+    'person_id', 'company_name', 'company_domain', 'domain',
+    'city', 'address_city', 'state', 'address_state'
+)
+
+# Fork-inherited worker state for parallel matching (see _run_parallel).
+# Set in the parent immediately before the pool forks so workers share the
+# read-only indices and DataFrames copy-on-write instead of receiving pickles.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
 class MatchType(Enum):
     """Type of company match achieved."""
     DOMAIN = "domain"       # GOLD - matched by domain
@@ -80,6 +97,9 @@ class Phase1Stats:
     collisions: int = 0
     unmatched: int = 0
     duration_seconds: float = 0.0
+    # Cache activity; the hit/miss split varies with workers (see run())
+    normalization_cache_hits: int = 0
+    normalization_cache_misses: int = 0
     correlation_id: str = ""  # Propagated unchanged
 
 
@@ -116,9 +136,20 @@ class Phase1CompanyMatching:
         self.fuzzy_low_threshold = matching_config.get('fuzzy_low_threshold', 0.85)
         self.collision_threshold = matching_config.get('collision_threshold', 0.03)
 
+        # Parallel execution (workers=1 keeps the single-process path)
+        self.workers = self.config.get('workers', 1)
+        self.chunk_size = self.config.get('chunk_size', 0)  # 0 = derive from workers
+
+        # Shared normalization cache size (None = keep process-wide setting)
+        cache_size = self.config.get('normalization_cache_size')
+        if cache_size is not None:
+            configure_normalization_cache(cache_size)
+
         # Build lookup indices (populated in run())
         self._domain_index: Dict[str, str] = {}  # domain -> company_id
         self._name_index: Dict[str, List[str]] = {}  # normalized_name -> [company_ids]
+        self._company_names: Dict[str, Any] = {}  # company_id -> company_name (first row wins)
+        self._candidate_index: Optional[CompanyCandidateIndex] = None  # fuzzy tier shortlist
 
         # Tool 3: Abacus.ai Fuzzy Arbitrator for collision resolution
         # Per doctrine: LLM is ONLY allowed for collision resolution when
@@ -127,7 +158,8 @@ class Phase1CompanyMatching:
 
     def run(self, people_df: pd.DataFrame,
             company_df: pd.DataFrame,
-            correlation_id: str) -> Tuple[pd.DataFrame, Phase1Stats]:
+            correlation_id: str,
+            workers: Optional[int] = None) -> Tuple[pd.DataFrame, Phase1Stats]:
         """
         Run company matching phase.
 
@@ -139,6 +171,11 @@ class Phase1CompanyMatching:
             company_df: Company master DataFrame with columns:
                 - company_unique_id, company_name, website_url, address_city, address_state
             correlation_id: MANDATORY - End-to-end trace ID (UUID v4)
+            workers: Worker processes (default from config, 1 = serial).
+                Output and match stats are identical to the serial run.
+                normalization_cache_hits/misses are not: each worker starts
+                from a fork-time copy of the cache, so the hit/miss split
+                depends on how rows fall into chunks.
 
         Returns:
             Tuple of (result_df with match results, Phase1Stats)
@@ -154,17 +191,26 @@ class Phase1CompanyMatching:
         stats = Phase1Stats(total_input=len(people_df), correlation_id=correlation_id)
 
         log_phase_start(self.logger, 1, "Company Matching", len(people_df))
+        cache_before = _normalization_cache_counts()
 
         # Build lookup indices
         self._build_indices(company_df)
 
-        # Process each person
-        results = []
-        for idx, row in people_df.iterrows():
-            result = self._match_person(row, company_df)
-            results.append(result)
+        # Process each person (in input order, serially or across workers)
+        workers = workers if workers is not None else self.workers
+        worker_cache_counts = (0, 0)
+        if workers and workers > 1 and len(people_df) > 1:
+            results, worker_cache_counts = self._run_parallel(people_df, company_df, workers)
+        else:
+            results = self._match_rows(people_df, company_df)
 
-            # Update stats
+        # Normalization cache activity (this process + forked workers)
+        cache_after = _normalization_cache_counts()
+        stats.normalization_cache_hits = cache_after[0] - cache_before[0] + worker_cache_counts[0]
+        stats.normalization_cache_misses = cache_after[1] - cache_before[1] + worker_cache_counts[1]
+
+        # Update stats from merged results (identical for serial and parallel)
+        for result in results:
             if result.match_type == MatchType.DOMAIN:
                 stats.domain_matches += 1
             elif result.match_type == MatchType.EXACT:
@@ -191,29 +237,92 @@ class Phase1CompanyMatching:
                 'exact_matches': stats.exact_matches,
                 'fuzzy_matches': stats.fuzzy_matches,
                 'collisions': stats.collisions,
-                'unmatched': stats.unmatched
+                'unmatched': stats.unmatched,
+                'normalization_cache_hits': stats.normalization_cache_hits,
+                'normalization_cache_misses': stats.normalization_cache_misses
             }
         )
 
         return result_df, stats
 
+    def _match_rows(self, people_df: pd.DataFrame,
+                    company_df: pd.DataFrame) -> List[CompanyMatchResult]:
+        """Match every row of people_df in order."""
+        return [
+            self._match_person(row, company_df, row_label=label)
+            for label, row in iter_rows(people_df, PERSON_COLUMNS)
+        ]
+
+    def _run_parallel(self, people_df: pd.DataFrame,
+                      company_df: pd.DataFrame,
+                      workers: int) -> Tuple[List[CompanyMatchResult], Tuple[int, int]]:
+        """
+        Match people_df across a fork-based process pool.
+
+        Indices are built once in the parent; workers inherit them (and both
+        DataFrames) through fork, so each task only carries a row range.
+        Chunks are returned in submission order, so the merged results are
+        in input order exactly as in the serial run.
+
+        Falls back to the serial path where fork is unavailable.
+
+        Returns:
+            Tuple of (results, (worker cache hits, worker cache misses))
+        """
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            return self._match_rows(people_df, company_df), (0, 0)
+
+        total = len(people_df)
+        chunk_size = self.chunk_size or max(1, -(-total // (workers * 4)))
+        ranges = [(start, min(start + chunk_size, total))
+                  for start in range(0, total, chunk_size)]
+
+        _WORKER_STATE.update(phase=self, people_df=people_df, company_df=company_df)
+        try:
+            context = multiprocessing.get_context('fork')
+            with context.Pool(processes=min(workers, len(ranges))) as pool:
+                chunks = pool.map(_match_chunk, ranges, chunksize=1)
+        finally:
+            _WORKER_STATE.clear()
+
+        results = [result for chunk, _ in chunks for result in chunk]
+        hits = sum(counts[0] for _, counts in chunks)
+        misses = sum(counts[1] for _, counts in chunks)
+        return results, (hits, misses)
+
     def _build_indices(self, company_df: pd.DataFrame) -> None:
-        """Build lookup indices for fast matching."""
+        """Build lookup indices for fast matching (column-wise, no iterrows)."""
         self._domain_index = {}
         self._name_index = {}
+        self._company_names = {}
+
+        company_ids = column_values(company_df, 'company_unique_id')
+        names = column_values(company_df, 'company_name')
+        cities = column_values(company_df, 'address_city')
+        states = column_values(company_df, 'address_state')
+        domains = first_truthy(
+            column_values(company_df, 'website_url'),
+            column_values(company_df, 'domain')
+        )
 
-        for idx, row in company_df.iterrows():
-            company_id = row.get('company_unique_id', '')
+        # Fuzzy candidates (same shape apply_city_guardrail consumes)
+        candidates = [
+            {'id': company_id, 'name': name, 'city': city, 'state': state}
+            for company_id, name, city, state in zip(company_ids, names, cities, states)
+        ]
+
+        for company_id, name, domain in zip(company_ids, names, domains):
+            # Company name lookup for domain/exact matches (skip NaN ids)
+            if company_id == company_id:
+                self._company_names.setdefault(company_id, name)
 
             # Domain index
-            domain = row.get('website_url', '') or row.get('domain', '')
             if domain:
                 normalized_domain = normalize_domain(domain)
                 if normalized_domain:
                     self._domain_index[normalized_domain] = company_id
 
             # Name index
-            name = row.get('company_name', '')
             if name:
                 normalized_name = normalize_company_name(name)
                 if normalized_name:
@@ -221,8 +330,15 @@ class Phase1CompanyMatching:
                         self._name_index[normalized_name] = []
                     self._name_index[normalized_name].append(company_id)
 
-    def _match_person(self, person_row: pd.Series,
-                      company_df: pd.DataFrame) -> CompanyMatchResult:
+        self._candidate_index = CompanyCandidateIndex(
+            candidates,
+            name_threshold=self.fuzzy_low_threshold,
+            high_threshold=self.fuzzy_high_threshold
+        )
+
+    def _match_person(self, person_row: Dict[str, Any],
+                      company_df: pd.DataFrame,
+                      row_label: Any = None) -> CompanyMatchResult:
         """
         Match a single person to company master.
 
@@ -230,8 +346,13 @@ class Phase1CompanyMatching:
         1. Domain match (GOLD)
         2. Exact name match (SILVER)
         3. Fuzzy match with guardrails (BRONZE)
+
+        Args:
+            person_row: Row mapping (see PERSON_COLUMNS)
+            company_df: Company master DataFrame
+            row_label: people_df index label (person_id fallback)
         """
-        person_id = str(person_row.get('person_id', person_row.name))
+        person_id = str(person_row.get('person_id', row_label))
         input_company_name = str(person_row.get('company_name', '') or '')
         input_domain = str(person_row.get('company_domain', '') or person_row.get('domain', '') or '')
         input_city = str(person_row.get('city', '') or person_row.get('address_city', '') or '')
@@ -339,14 +460,11 @@ class Phase1CompanyMatching:
         # Use index for fast lookup
         if domain in self._domain_index:
             company_id = self._domain_index[domain]
-            # Get company name from dataframe
-            company_row = company_df[
-                company_df['company_unique_id'] == company_id
-            ]
-            if len(company_row) > 0:
+            # Get company name from index (built with the domain index)
+            if company_id in self._company_names:
                 return {
                     'company_id': company_id,
-                    'company_name': company_row.iloc[0].get('company_name', ''),
+                    'company_name': self._company_names[company_id],
                     'score': self.domain_match_score,
                     'method': 'domain'
                 }
@@ -375,13 +493,10 @@ class Phase1CompanyMatching:
             # If multiple companies with same normalized name, check for collision
             if len(company_ids) == 1:
                 company_id = company_ids[0]
-                company_row = company_df[
-                    company_df['company_unique_id'] == company_id
-                ]
-                if len(company_row) > 0:
+                if company_id in self._company_names:
                     return {
                         'company_id': company_id,
-                        'company_name': company_row.iloc[0].get('company_name', ''),
+                        'company_name': self._company_names[company_id],
                         'score': self.exact_match_score,
                         'method': 'exact_name'
                     }
@@ -414,15 +529,11 @@ class Phase1CompanyMatching:
         if not normalized_name:
             return None
 
-        # Build candidates list from company_df
-        candidates = []
-        for idx, row in company_df.iterrows():
-            candidates.append({
-                'id': row.get('company_unique_id', ''),
-                'name': row.get('company_name', ''),
-                'city': row.get('address_city', ''),
-                'state': row.get('address_state', '')
-            })
+        # Shortlist candidates from the blocking index (built in _build_indices).
+        # Only companies that can still clear the guardrail are scored.
+        if self._candidate_index is None:
+            self._build_indices(company_df)
+        candidates = self._candidate_index.shortlist(normalized_name, city)
 
         # Apply city guardrail logic
         match_candidates = apply_city_guardrail(
@@ -512,24 +623,20 @@ class Phase1CompanyMatching:
     def _build_result_dataframe(self, people_df: pd.DataFrame,
                                 results: List[CompanyMatchResult]) -> pd.DataFrame:
         """Build output DataFrame with match results appended."""
-        # Create result columns
-        result_data = []
-        for result in results:
-            result_data.append({
-                'person_id': result.person_id,
-                'matched_company_id': result.matched_company_id,
-                'matched_company_name': result.matched_company_name,
-                'match_type': result.match_type.value if result.match_type else None,
-                'match_tier': result.match_tier.value if result.match_tier else None,
-                'match_score': result.match_score,
-                'confidence': result.confidence,
-                'is_collision': result.is_collision,
-                'collision_reason': result.collision_reason,
-                'city_match': result.city_match,
-                'state_match': result.state_match
-            })
-
-        result_df = pd.DataFrame(result_data)
+        # Build result columns directly (no per-row dicts)
+        result_df = pd.DataFrame({
+            'person_id': [r.person_id for r in results],
+            'matched_company_id': [r.matched_company_id for r in results],
+            'matched_company_name': [r.matched_company_name for r in results],
+            'match_type': [r.match_type.value if r.match_type else None for r in results],
+            'match_tier': [r.match_tier.value if r.match_tier else None for r in results],
+            'match_score': [r.match_score for r in results],
+            'confidence': [r.confidence for r in results],
+            'is_collision': [r.is_collision for r in results],
+            'collision_reason': [r.collision_reason for r in results],
+            'city_match': [r.city_match for r in results],
+            'state_match': [r.state_match for r in results]
+        })
 
         # Merge with original people_df
         # Ensure person_id column exists in people_df
@@ -547,6 +654,30 @@ class Phase1CompanyMatching:
         return output_df
 
 
+def _normalization_cache_counts() -> Tuple[int, int]:
+    """Current (hits, misses) of the shared normalization cache."""
+    cache_stats = get_normalization_cache().stats()
+    return cache_stats['hits'], cache_stats['misses']
+
+
+def _match_chunk(bounds: Tuple[int, int]) -> Tuple[List[CompanyMatchResult], Tuple[int, int]]:
+    """
+    Worker entry point: match one row range of the fork-inherited people_df.
+
+    Also returns this chunk's normalization cache (hits, misses); the worker's
+    cache is a fork copy, so the parent cannot observe it directly.
+    """
+    start, stop = bounds
+    phase = _WORKER_STATE['phase']
+    before = _normalization_cache_counts()
+    results = phase._match_rows(
+        _WORKER_STATE['people_df'].iloc[start:stop],
+        _WORKER_STATE['company_df']
+    )
+    after = _normalization_cache_counts()
+    return results, (after[0] - before[0], after[1] - before[1])
+
+
 def match_single_company(company_name: str, domain: str,
                          city: str, state: str,
                          company_df: pd.DataFrame,
@@ -568,12 +699,12 @@ def match_single_company(company_name: str, domain: str,
     phase1 = Phase1CompanyMatching(config=config)
     phase1._build_indices(company_df)
 
-    person_row = pd.Series({
+    person_row = {
         'person_id': 'single_lookup',
         'company_name': company_name,
         'company_domain': domain,
         'city': city,
         'state': state
-    })
+    }
 
     return phase1._match_person(person_row, company_df)
@@ -27,10 +27,13 @@ import pandas as pd
 from ops.enforcement.correlation_id import validate_correlation_id, CorrelationIDError
 
 from ..matching import normalize_domain
+from .columnar import column_values, iter_rows, first_truthy
 from ..verification import (
     verify_domain_health,
+    verify_domains_bulk,
     DomainHealthStatus,
     DomainHealth,
+    DNS_CONCURRENCY,
 )
 from ..logging_config import (
     PipelineLogger,
@@ -41,6 +44,10 @@ from ..logging_config import (
 )
 
 
+# Columns _resolve_domain reads from each matched_df row
+MATCHED_COLUMNS = ('person_id', 'matched_company_id', 'company_domain', 'domain', 'input_domain')
+
+
 class DomainSource(Enum):
     """Source of the domain resolution."""
     COMPANY_MASTER = "company_master"      # From matched company record
@@ -70,7 +77,7 @@ class DomainResult:
     status: DomainStatus = DomainStatus.MISSING
     has_mx: bool = False
     mx_records: List[str] = field(default_factory=list)
-    verification_details: Optional[DomainVerificationResult] = None
+    verification_details: Optional[DomainHealth] = None
     needs_enrichment: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
 
@@ -115,6 +122,7 @@ class Phase2DomainResolution:
                 - validate_dns: Whether to perform DNS validation (default: True)
                 - validate_mx: Whether to check MX records (default: True)
                 - dns_timeout: DNS lookup timeout in seconds (default: 5.0)
+                - dns_concurrency: Domains validated concurrently (default: 200)
                 - skip_validation_if_known: Skip validation for known-good domains
             logger: Pipeline logger instance
         """
@@ -125,10 +133,11 @@ class Phase2DomainResolution:
         self.validate_dns = self.config.get('validate_dns', True)
         self.validate_mx = self.config.get('validate_mx', True)
         self.dns_timeout = self.config.get('dns_timeout', 5.0)
+        self.dns_concurrency = self.config.get('dns_concurrency', DNS_CONCURRENCY)
         self.skip_validation_if_known = self.config.get('skip_validation_if_known', False)
 
         # Cache for validated domains (to avoid repeated lookups)
-        self._domain_cache: Dict[str, DomainVerificationResult] = {}
+        self._domain_cache: Dict[str, DomainHealth] = {}
 
     def run(self, matched_df: pd.DataFrame,
             correlation_id: str,
@@ -165,11 +174,19 @@ class Phase2DomainResolution:
         if company_df is not None:
             company_domains = self._build_company_domain_index(company_df)
 
-        # Process each matched person
-        results = []
-        for idx, row in matched_df.iterrows():
-            result = self._resolve_domain(row, company_domains)
-            results.append(result)
+        # Resolve each matched person's domain, then validate every unique
+        # domain in one concurrent batch instead of one lookup per row
+        results = [
+            self._resolve_domain(row, company_domains, row_label=label, validate=False)
+            for label, row in iter_rows(matched_df, MATCHED_COLUMNS)
+        ]
+        validations = self.validate_domain_batch(
+            [result.domain for result in results if result.domain]
+        )
+
+        for result in results:
+            if result.domain:
+                self._apply_validation(result, validations.get(result.domain))
 
             # Update stats
             if result.status == DomainStatus.VALID:
@@ -222,13 +239,17 @@ class Phase2DomainResolution:
         """
         index = {}
 
-        for idx, row in company_df.iterrows():
-            company_id = row.get('company_unique_id', '')
+        # Try website_url first, then domain field
+        company_ids = column_values(company_df, 'company_unique_id')
+        domains = first_truthy(
+            column_values(company_df, 'website_url'),
+            column_values(company_df, 'domain')
+        )
+
+        for company_id, domain in zip(company_ids, domains):
             if not company_id:
                 continue
 
-            # Try website_url first, then domain field
-            domain = row.get('website_url', '') or row.get('domain', '')
             if domain:
                 normalized = normalize_domain(domain)
                 if normalized:
@@ -241,8 +262,10 @@ class Phase2DomainResolution:
 
         return index
 
-    def _resolve_domain(self, row: pd.Series,
-                        company_domains: Dict[str, str]) -> DomainResult:
+    def _resolve_domain(self, row: Dict[str, Any],
+                        company_domains: Dict[str, str],
+                        row_label: Any = None,
+                        validate: bool = True) -> DomainResult:
         """
         Resolve domain for a single matched person/company.
 
@@ -253,13 +276,16 @@ class Phase2DomainResolution:
         4. Flag for enrichment if no valid domain
 
         Args:
-            row: DataFrame row with match results
+            row: Row mapping with match results (see MATCHED_COLUMNS)
             company_domains: Company ID -> domain lookup
+            row_label: matched_df index label (person_id fallback)
+            validate: Validate the domain now; when False the caller validates
+                in bulk and applies it with _apply_validation()
 
         Returns:
             DomainResult
         """
-        person_id = str(row.get('person_id', row.name))
+        person_id = str(row.get('person_id', row_label))
         company_id = str(row.get('matched_company_id', '') or '')
 
         result = DomainResult(
@@ -305,27 +331,8 @@ class Phase2DomainResolution:
             result.normalized_domain = domain
             result.source = source
 
-            # Validate domain
-            validation = self._validate_domain(domain)
-            result.verification_details = validation
-
-            if validation:
-                result.has_mx = validation.has_mx
-                result.mx_records = validation.mx_records
-
-                if validation.status == DomainHealthStatus.HEALTHY:
-                    result.status = DomainStatus.VALID
-                elif validation.status == DomainHealthStatus.NO_MX:
-                    result.status = DomainStatus.VALID_NO_MX
-                elif validation.status == DomainHealthStatus.PARKED:
-                    result.status = DomainStatus.PARKED
-                    result.needs_enrichment = True
-                else:
-                    result.status = DomainStatus.UNREACHABLE
-                    result.needs_enrichment = True
-            else:
-                # Validation failed or skipped
-                result.status = DomainStatus.VALID  # Assume valid if not validated
+            if validate:
+                self._apply_validation(result, self._validate_domain(domain))
 
         else:
             # No domain found
@@ -337,7 +344,36 @@ class Phase2DomainResolution:
 
         return result
 
-    def _validate_domain(self, domain: str) -> Optional[DomainVerificationResult]:
+    def _apply_validation(self, result: DomainResult,
+                          validation: Optional[DomainHealth]) -> None:
+        """
+        Set a resolved domain's status from its DNS/MX validation.
+
+        Args:
+            result: DomainResult with a domain
+            validation: DomainHealth, or None if validation was skipped
+        """
+        result.verification_details = validation
+
+        if validation:
+            result.has_mx = validation.has_mx
+            result.mx_records = validation.mx_records
+
+            if validation.status == DomainHealthStatus.VALID:
+                result.status = DomainStatus.VALID
+            elif validation.status == DomainHealthStatus.VALID_NO_MX:
+                result.status = DomainStatus.VALID_NO_MX
+            elif validation.status == DomainHealthStatus.PARKED:
+                result.status = DomainStatus.PARKED
+                result.needs_enrichment = True
+            else:
+                result.status = DomainStatus.UNREACHABLE
+                result.needs_enrichment = True
+        else:
+            # Validation failed or skipped
+            result.status = DomainStatus.VALID  # Assume valid if not validated
+
+    def _validate_domain(self, domain: str) -> Optional[DomainHealth]:
         """
         Validate domain via DNS/MX lookup.
 
@@ -345,7 +381,7 @@ class Phase2DomainResolution:
             domain: Domain to validate
 
         Returns:
-            DomainVerificationResult or None if validation skipped
+            DomainHealth or None if validation skipped
         """
         if not self.validate_dns:
             return None
@@ -358,23 +394,7 @@ class Phase2DomainResolution:
         try:
             verification = verify_domain_health(domain, timeout=self.dns_timeout)
             self._domain_cache[domain] = verification
-
-            # Log result
-            if verification.status == DomainHealthStatus.HEALTHY:
-                self.logger.log_event(
-                    EventType.DOMAIN_DNS_LOOKUP,
-                    f"Domain healthy: {domain} (MX: {verification.has_mx})",
-                    entity_type="domain",
-                    metadata={'domain': domain, 'has_mx': verification.has_mx}
-                )
-            elif verification.status == DomainHealthStatus.PARKED:
-                self.logger.log_event(
-                    EventType.DOMAIN_PARKED,
-                    f"Domain parked: {domain}",
-                    LogLevel.WARNING,
-                    entity_type="domain",
-                    metadata={'domain': domain}
-                )
+            self._log_validation(verification)
 
             return verification
 
@@ -390,19 +410,15 @@ class Phase2DomainResolution:
     def _build_result_dataframe(self, matched_df: pd.DataFrame,
                                 results: List[DomainResult]) -> pd.DataFrame:
         """Build output DataFrame with domain results appended."""
-        # Create result columns
-        result_data = []
-        for result in results:
-            result_data.append({
-                'person_id': result.person_id,
-                'resolved_domain': result.domain,
-                'domain_source': result.source.value if result.source else None,
-                'domain_status': result.status.value if result.status else None,
-                'domain_has_mx': result.has_mx,
-                'domain_needs_enrichment': result.needs_enrichment
-            })
-
-        result_df = pd.DataFrame(result_data)
+        # Build result columns directly (no per-row dicts)
+        result_df = pd.DataFrame({
+            'person_id': [r.person_id for r in results],
+            'resolved_domain': [r.domain for r in results],
+            'domain_source': [r.source.value if r.source else None for r in results],
+            'domain_status': [r.status.value if r.status else None for r in results],
+            'domain_has_mx': [r.has_mx for r in results],
+            'domain_needs_enrichment': [r.needs_enrichment for r in results]
+        })
 
         # Ensure person_id column exists in matched_df
         if 'person_id' not in matched_df.columns:
@@ -441,24 +457,62 @@ class Phase2DomainResolution:
 
         return queue_df
 
-    def validate_domain_batch(self, domains: List[str]) -> Dict[str, DomainVerificationResult]:
+    def _log_validation(self, verification: DomainHealth) -> None:
+        """Log a domain validation result."""
+        domain = verification.domain
+        if verification.status == DomainHealthStatus.VALID:
+            self.logger.log_event(
+                EventType.DOMAIN_DNS_LOOKUP,
+                f"Domain healthy: {domain} (MX: {verification.has_mx})",
+                entity_type="domain",
+                metadata={'domain': domain, 'has_mx': verification.has_mx}
+            )
+        elif verification.status == DomainHealthStatus.PARKED:
+            self.logger.log_event(
+                EventType.DOMAIN_PARKED,
+                f"Domain parked: {domain}",
+                LogLevel.WARNING,
+                entity_type="domain",
+                metadata={'domain': domain}
+            )
+
+    def validate_domain_batch(self, domains: List[str]) -> Dict[str, DomainHealth]:
         """
         Validate multiple domains.
 
+        Domains not already cached are verified concurrently on the asyncio
+        verifier (dns_concurrency in flight, dns_timeout per query); each
+        result is logged and cached as it finishes.
+
         Args:
             domains: List of domains to validate
 
         Returns:
-            Dict mapping domain to verification result
+            Dict mapping domain to verification result (None if validation skipped)
         """
-        results = {}
+        normalized_domains = []
         for domain in domains:
             if domain:
                 normalized = normalize_domain(domain)
                 if normalized:
-                    results[normalized] = self._validate_domain(normalized)
+                    normalized_domains.append(normalized)
+        unique_domains = list(dict.fromkeys(normalized_domains))
+
+        if not self.validate_dns:
+            return {domain: None for domain in unique_domains}
+
+        def record(verification: DomainHealth) -> None:
+            self._domain_cache[verification.domain] = verification
+            self._log_validation(verification)
+
+        verify_domains_bulk(
+            [domain for domain in unique_domains if domain not in self._domain_cache],
+            concurrency=self.dns_concurrency,
+            timeout=self.dns_timeout,
+            on_result=record
+        )
 
-        return results
+        return {domain: self._domain_cache.get(domain) for domain in unique_domains}
 
     def get_domain_statistics(self, result_df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -515,7 +569,7 @@ def resolve_domains(matched_df: pd.DataFrame,
     return phase2.run(matched_df, company_df)
 
 
-def validate_single_domain(domain: str, timeout: float = 5.0) -> DomainVerificationResult:
+def validate_single_domain(domain: str, timeout: float = 5.0) -> DomainHealth:
     """
     Validate a single domain.
 
@@ -524,7 +578,7 @@ def validate_single_domain(domain: str, timeout: float = 5.0) -> DomainVerificat
         timeout: DNS timeout
 
     Returns:
-        DomainVerificationResult
+        DomainHealth
     """
     normalized = normalize_domain(domain)
     if normalized:
@@ -31,6 +31,11 @@ import pandas as pd
 
 # Doctrine enforcement imports
 from ops.enforcement.correlation_id import validate_correlation_id, CorrelationIDError
+from ops.providers.async_waterfall import (
+    DEFAULT_DOMAIN_CONCURRENCY,
+    execute_waterfall_many,
+    run_waterfall_many,
+)
 
 # Context management (TRUTH SOURCE for cost safety)
 from ..context_manager import (
@@ -42,6 +47,7 @@ from ..context_manager import (
 )
 
 from ..matching import normalize_domain
+from .columnar import column_values, first_truthy
 from ..verification import (
     COMMON_PATTERNS,
     PatternMatch,
@@ -149,6 +155,8 @@ class Phase3EmailPatternWaterfall:
                 - enable_tier_0: Enable/disable Tier 0
                 - enable_tier_1: Enable/disable Tier 1
                 - enable_tier_2: Enable/disable Tier 2
+                - max_concurrent_domains: Domains run through Tier 0/1 at once
+                - provider_concurrency: In-flight request cap per provider name
             logger: Pipeline logger instance
         """
         self.config = config or {}
@@ -162,6 +170,8 @@ class Phase3EmailPatternWaterfall:
         self.enable_tier_0 = self.config.get('enable_tier_0', True)
         self.enable_tier_1 = self.config.get('enable_tier_1', True)
         self.enable_tier_2 = self.config.get('enable_tier_2', True)
+        self.max_concurrent_domains = self.config.get('max_concurrent_domains', DEFAULT_DOMAIN_CONCURRENCY)
+        self.provider_concurrency = self.config.get('provider_concurrency', {})
 
         # Initialize provider registry
         provider_config = self.config.get('providers', {})
@@ -234,6 +244,10 @@ class Phase3EmailPatternWaterfall:
         unique_domains = self._get_unique_domains(domain_df)
         stats.domains_processed = len(unique_domains)
 
+        # Tier 0/1 provider calls for all domains run concurrently up front;
+        # the per-domain walk below then only consumes their results
+        prefetched = self._prefetch_provider_results(unique_domains)
+
         # Process each unique domain
         domain_patterns: Dict[str, PatternResult] = {}
         for domain_info in unique_domains:
@@ -241,7 +255,8 @@ class Phase3EmailPatternWaterfall:
             company_id = domain_info['company_id']
             input_emails = domain_info.get('input_emails', [])
 
-            result = self._discover_pattern(domain, company_id, input_emails)
+            result = self._discover_pattern(domain, company_id, input_emails,
+                                            provider_results=prefetched.get(domain))
             domain_patterns[domain] = result
 
             # Update stats
@@ -296,38 +311,141 @@ class Phase3EmailPatternWaterfall:
             List of dicts with domain, company_id, and input_emails
         """
         unique_domains = {}
+        normalized_cache: Dict[Any, str] = {}
+
+        domains = first_truthy(column_values(df, 'resolved_domain'), column_values(df, 'domain'))
+        company_ids = column_values(df, 'matched_company_id')
+        emails = column_values(df, 'email')
+        first_names = column_values(df, 'first_name')
+        last_names = column_values(df, 'last_name')
 
-        for idx, row in df.iterrows():
-            domain = row.get('resolved_domain', '') or row.get('domain', '')
+        for domain, company_id, email, first_name, last_name in zip(
+                domains, company_ids, emails, first_names, last_names):
             if not domain:
                 continue
 
-            normalized = normalize_domain(domain)
+            # Rows share domains heavily; normalize each distinct value once
+            normalized = normalized_cache.get(domain)
+            if normalized is None:
+                normalized = normalized_cache[domain] = normalize_domain(domain)
             if not normalized:
                 continue
 
             if normalized not in unique_domains:
                 unique_domains[normalized] = {
                     'domain': normalized,
-                    'company_id': row.get('matched_company_id', ''),
+                    'company_id': company_id,
                     'input_emails': []
                 }
 
             # Collect any existing emails for pattern extraction
-            email = row.get('email', '')
             if email and '@' in email:
                 email_domain = email.split('@')[1].lower()
                 if email_domain == normalized:
                     unique_domains[normalized]['input_emails'].append({
                         'email': email,
-                        'first_name': row.get('first_name', ''),
-                        'last_name': row.get('last_name', '')
+                        'first_name': first_name,
+                        'last_name': last_name
                     })
 
         return list(unique_domains.values())
 
+    def _prefetch_provider_results(
+        self,
+        unique_domains: List[Dict[str, Any]]
+    ) -> Dict[str, List[ProviderResult]]:
+        """
+        Run the Tier 0/1 waterfall for every domain that needs providers, concurrently.
+
+        Domains answered by the cache or by input emails are skipped, and each
+        domain stops at the first result _discover_pattern_at_tier would accept,
+        so the provider calls (and credits) match the one-domain-at-a-time walk.
+        Tier 2 is left to try_tier_2() and its single-shot guard.
+
+        Safe to call from a running event loop (execute_waterfall_many() then
+        runs on a worker thread); async callers can await
+        prefetch_provider_results_async() instead.
+
+        Args:
+            unique_domains: Output of _get_unique_domains()
+
+        Returns:
+            Dict of domain -> ProviderResults (empty if providers can't run async)
+        """
+        tiers, pending = self._prefetch_plan(unique_domains)
+        if not pending:
+            return {}
+
+        return execute_waterfall_many(
+            self.provider_registry,
+            pending,
+            tiers=tiers,
+            accept=self._accepts_provider_result,
+            max_concurrent_domains=self.max_concurrent_domains,
+            provider_concurrency=self.provider_concurrency
+        )
+
+    async def prefetch_provider_results_async(
+        self,
+        unique_domains: List[Dict[str, Any]]
+    ) -> Dict[str, List[ProviderResult]]:
+        """
+        Awaitable _prefetch_provider_results() for callers on an event loop.
+
+        Args:
+            unique_domains: Output of _get_unique_domains()
+
+        Returns:
+            Dict of domain -> ProviderResults (empty if providers can't run async)
+        """
+        tiers, pending = self._prefetch_plan(unique_domains)
+        if not pending:
+            return {}
+
+        return await run_waterfall_many(
+            self.provider_registry,
+            pending,
+            tiers=tiers,
+            accept=self._accepts_provider_result,
+            max_concurrent_domains=self.max_concurrent_domains,
+            provider_concurrency=self.provider_concurrency
+        )
+
+    def _prefetch_plan(
+        self,
+        unique_domains: List[Dict[str, Any]]
+    ) -> Tuple[List[ProviderTier], List[str]]:
+        """Tiers to prefetch and the domains that still need providers."""
+        tiers = [tier for tier, enabled in ((ProviderTier.TIER_0, self.enable_tier_0),
+                                            (ProviderTier.TIER_1, self.enable_tier_1)) if enabled]
+        providers = [p for tier in tiers for p in self.provider_registry.get_providers_by_tier(tier)]
+        if not providers or not all(hasattr(p, 'discover_pattern_async') for p in providers):
+            return tiers, []
+
+        pending = [
+            info['domain'] for info in unique_domains
+            if info['domain'] not in self._pattern_cache
+            and not self._match_input_emails(info.get('input_emails', []), info['domain'])
+        ]
+        return tiers, pending
+
+    def _accepts_provider_result(self, pr: ProviderResult) -> bool:
+        """Whether a provider result resolves the domain."""
+        return bool(pr and pr.has_pattern() and pr.confidence >= self.min_confidence)
+
+    def _match_input_emails(self, input_emails: List[Dict[str, str]],
+                            domain: str) -> Optional[PatternMatch]:
+        """Pattern from input emails if confident enough, else None."""
+        if not (self.use_input_emails and input_emails):
+            return None
+        pattern_match = self._extract_from_input_emails(input_emails, domain)
+        if pattern_match and pattern_match.confidence >= self.min_confidence:
+            return pattern_match
+        return None
+
     def _discover_pattern(self, domain: str, company_id: str,
-                          input_emails: List[Dict[str, str]] = None) -> PatternResult:
+                          input_emails: List[Dict[str, str]] = None,
+                          provider_results: List[ProviderResult] = None) -> PatternResult:
         """
         Discover email pattern for a domain using tiered waterfall.
 
@@ -348,6 +466,7 @@ class Phase3EmailPatternWaterfall:
             domain: Domain to discover pattern for
             company_id: Associated company ID
             input_emails: Optional list of existing emails with name data
+            provider_results: Optional prefetched Tier 0/1 results for this domain
 
         Returns:
             PatternResult
@@ -368,8 +487,8 @@ class Phase3EmailPatternWaterfall:
 
         # 1. Try extracting from input emails (FREE - no logging needed)
         if self.use_input_emails and input_emails:
-            pattern_match = self._extract_from_input_emails(input_emails, domain)
-            if pattern_match and pattern_match.confidence >= self.min_confidence:
+            pattern_match = self._match_input_emails(input_emails, domain)
+            if pattern_match:
                 result.pattern = pattern_match.pattern
                 result.confidence = pattern_match.confidence
                 result.pattern_source = PatternSource.INPUT_DATA
@@ -396,7 +515,8 @@ class Phase3EmailPatternWaterfall:
                 tier=ProviderTier.TIER_0,
                 outreach_context_id=ctx_id,
                 company_sov_id=sov_id,
-                context_manager=ctx_mgr
+                context_manager=ctx_mgr,
+                provider_results=provider_results
             )
             if tier0_result and tier0_result.pattern_status == PatternStatus.FOUND:
                 result = tier0_result
@@ -411,7 +531,8 @@ class Phase3EmailPatternWaterfall:
                 tier=ProviderTier.TIER_1,
                 outreach_context_id=ctx_id,
                 company_sov_id=sov_id,
-                context_manager=ctx_mgr
+                context_manager=ctx_mgr,
+                provider_results=provider_results
             )
             if tier1_result and tier1_result.pattern_status == PatternStatus.FOUND:
                 result = tier1_result
@@ -512,38 +633,49 @@ class Phase3EmailPatternWaterfall:
     def _build_result_dataframe(self, domain_df: pd.DataFrame,
                                 domain_patterns: Dict[str, PatternResult]) -> pd.DataFrame:
         """Build output DataFrame with pattern results appended."""
-        # Create result columns
-        result_data = []
-
-        for idx, row in domain_df.iterrows():
-            domain = row.get('resolved_domain', '') or row.get('domain', '')
-            normalized = normalize_domain(domain) if domain else None
-
-            if normalized and normalized in domain_patterns:
-                pr = domain_patterns[normalized]
-                result_data.append({
-                    'person_id': row.get('person_id', idx),
-                    'email_pattern': pr.pattern,
-                    'pattern_source': pr.pattern_source.value if pr.pattern_source else None,
-                    'pattern_status': pr.pattern_status.value if pr.pattern_status else None,
-                    'pattern_confidence': pr.confidence,
-                    'pattern_tier': pr.tier_used,
-                    'pattern_provider': pr.provider_used,
-                    'pattern_needs_verification': pr.pattern_status == PatternStatus.SUGGESTED
-                })
-            else:
-                result_data.append({
-                    'person_id': row.get('person_id', idx),
-                    'email_pattern': None,
-                    'pattern_source': PatternSource.NONE.value,
-                    'pattern_status': PatternStatus.SKIPPED.value,
-                    'pattern_confidence': 0.0,
-                    'pattern_tier': None,
-                    'pattern_provider': None,
-                    'pattern_needs_verification': False
-                })
-
-        result_df = pd.DataFrame(result_data)
+        size = len(domain_df)
+        domains = first_truthy(
+            column_values(domain_df, 'resolved_domain'),
+            column_values(domain_df, 'domain')
+        )
+        # row.get('person_id', idx): fall back to the index label
+        if 'person_id' in domain_df.columns:
+            person_ids = domain_df['person_id'].tolist()
+        else:
+            person_ids = domain_df.index.tolist()
+
+        # Preallocated result columns, defaulted to the "no pattern" row
+        columns = {
+            'person_id': person_ids,
+            'email_pattern': [None] * size,
+            'pattern_source': [PatternSource.NONE.value] * size,
+            'pattern_status': [PatternStatus.SKIPPED.value] * size,
+            'pattern_confidence': [0.0] * size,
+            'pattern_tier': [None] * size,
+            'pattern_provider': [None] * size,
+            'pattern_needs_verification': [False] * size
+        }
+
+        normalized_cache: Dict[Any, Optional[str]] = {}
+        for position, domain in enumerate(domains):
+            if not domain:
+                continue
+            normalized = normalized_cache.get(domain)
+            if normalized is None:
+                normalized = normalized_cache[domain] = normalize_domain(domain)
+            if not normalized or normalized not in domain_patterns:
+                continue
+
+            pr = domain_patterns[normalized]
+            columns['email_pattern'][position] = pr.pattern
+            columns['pattern_source'][position] = pr.pattern_source.value if pr.pattern_source else None
+            columns['pattern_status'][position] = pr.pattern_status.value if pr.pattern_status else None
+            columns['pattern_confidence'][position] = pr.confidence
+            columns['pattern_tier'][position] = pr.tier_used
+            columns['pattern_provider'][position] = pr.provider_used
+            columns['pattern_needs_verification'][position] = pr.pattern_status == PatternStatus.SUGGESTED
+
+        result_df = pd.DataFrame(columns)
 
         # Merge with original domain_df
         if 'person_id' not in domain_df.columns:
@@ -676,7 +808,8 @@ class Phase3EmailPatternWaterfall:
         tier: ProviderTier,
         outreach_context_id: str = None,
         company_sov_id: str = None,
-        context_manager: OutreachContextManager = None
+        context_manager: OutreachContextManager = None,
+        provider_results: List[ProviderResult] = None
     ) -> Optional[PatternResult]:
         """
         Discover pattern using only a specific tier.
@@ -689,6 +822,7 @@ class Phase3EmailPatternWaterfall:
             outreach_context_id: Optional - for cost logging (required for Tier-2)
             company_sov_id: Optional - for cost logging (required for Tier-2)
             context_manager: Optional - for guard checks and logging
+            provider_results: Optional prefetched results (providers are not called again)
 
         Returns:
             PatternResult or None
@@ -698,10 +832,16 @@ class Phase3EmailPatternWaterfall:
             domain=domain
         )
 
-        providers = self.provider_registry.get_providers_by_tier(tier)
-        for provider in providers:
+        if provider_results is not None:
+            attempts = [(pr.provider_name, lambda pr=pr: pr)
+                        for pr in provider_results if pr.tier == tier]
+        else:
+            attempts = [(provider.name, lambda provider=provider: provider.discover_pattern(domain))
+                        for provider in self.provider_registry.get_providers_by_tier(tier)]
+
+        for provider_name, call in attempts:
             try:
-                pr = provider.get_email_pattern(domain)
+                pr = call()
                 result.api_calls_made += 1
                 cost = pr.cost_credits if pr else 0
                 result.cost_credits += cost
@@ -712,33 +852,31 @@ class Phase3EmailPatternWaterfall:
                     context_manager.log_tool_attempt(
                         outreach_context_id=outreach_context_id,
                         company_sov_id=company_sov_id,
-                        tool_name=provider.name,
+                        tool_name=provider_name,
                         tool_tier=tier.value,
                         cost_credits=cost,
                         success=success,
-                        result_summary=f"Pattern: {pr.pattern}" if pr and hasattr(pr, 'pattern') and pr.pattern else None,
+                        result_summary=f"Pattern: {pr.pattern}" if pr and pr.pattern else None,
                         error_message=None,
                         sub_hub="company-target"
                     )
 
-                if pr and pr.success and pr.patterns:
-                    best = max(pr.patterns, key=lambda p: p.get('confidence', 0))
-                    if best.get('confidence', 0) >= self.min_confidence:
-                        result.pattern = best.get('pattern')
-                        result.confidence = best.get('confidence', 0.8)
-                        result.tier_used = tier.value
-                        result.provider_used = provider.name
-                        result.sample_emails = best.get('sample_emails', [])[:3]
-                        result.pattern_status = PatternStatus.FOUND
-
-                        if tier == ProviderTier.TIER_0:
-                            result.pattern_source = PatternSource.TIER_0
-                        elif tier == ProviderTier.TIER_1:
-                            result.pattern_source = PatternSource.TIER_1
-                        else:
-                            result.pattern_source = PatternSource.TIER_2
-
-                        return result
+                if self._accepts_provider_result(pr):
+                    result.pattern = pr.pattern
+                    result.confidence = pr.confidence
+                    result.tier_used = tier.value
+                    result.provider_used = provider_name
+                    result.sample_emails = [sample.email for sample in pr.sample_emails[:3]]
+                    result.pattern_status = PatternStatus.FOUND
+
+                    if tier == ProviderTier.TIER_0:
+                        result.pattern_source = PatternSource.TIER_0
+                    elif tier == ProviderTier.TIER_1:
+                        result.pattern_source = PatternSource.TIER_1
+                    else:
+                        result.pattern_source = PatternSource.TIER_2
+
+                    return result
 
             except Exception as e:
                 # Log error attempt if context provided
@@ -746,7 +884,7 @@ class Phase3EmailPatternWaterfall:
                     context_manager.log_tool_attempt(
                         outreach_context_id=outreach_context_id,
                         company_sov_id=company_sov_id,
-                        tool_name=provider.name,
+                        tool_name=provider_name,
                         tool_tier=tier.value,
                         cost_credits=0,
                         success=False,
@@ -756,7 +894,7 @@ class Phase3EmailPatternWaterfall:
                     )
 
                 self.logger.error(
-                    f"Provider {provider.name} failed for {domain}",
+                    f"Provider {provider_name} failed for {domain}",
                     error=e,
                     metadata={'domain': domain, 'tier': tier.value}
                 )
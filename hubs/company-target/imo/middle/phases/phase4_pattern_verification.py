@@ -28,10 +28,12 @@ from ..verification import (
     apply_pattern,
     validate_pattern_format,
     verify_email_deliverable,
+    batch_verify_emails,
     check_mx_records,
     EmailVerificationResult,
     VerificationStatus as EmailVerificationStatus,
 )
+from .columnar import column_values, first_truthy
 from ..logging_config import (
     PipelineLogger,
     EventType,
@@ -141,6 +143,9 @@ class Phase4PatternVerification:
         # Cache for MX verification results
         self._mx_cache: Dict[str, bool] = {}
 
+        # SMTP verdicts for sample emails, prefetched in one batch by run()
+        self._smtp_cache: Dict[str, bool] = {}
+
     def run(self, pattern_df: pd.DataFrame,
             correlation_id: str) -> Tuple[pd.DataFrame, Phase4Stats]:
         """
@@ -172,6 +177,10 @@ class Phase4PatternVerification:
         # Group by domain to avoid duplicate verification
         domain_patterns = self._group_by_domain(pattern_df)
 
+        # SMTP-check every domain's sample email in one batch (sessions
+        # shared per MX host) before the per-domain verification
+        self._prefetch_smtp_results(domain_patterns)
+
         # Verify each unique domain/pattern combination
         verification_results: Dict[str, PatternVerificationResult] = {}
         confidence_scores = []
@@ -242,8 +251,15 @@ class Phase4PatternVerification:
         """
         domain_groups = {}
 
-        for idx, row in df.iterrows():
-            domain = row.get('resolved_domain', '') or row.get('domain', '')
+        domains = first_truthy(column_values(df, 'resolved_domain'), column_values(df, 'domain'))
+        patterns = column_values(df, 'email_pattern')
+        company_ids = column_values(df, 'matched_company_id')
+        needs_verification = column_values(df, 'pattern_needs_verification', default=True)
+        emails = column_values(df, 'email')
+        first_names = column_values(df, 'first_name')
+        last_names = column_values(df, 'last_name')
+
+        for position, domain in enumerate(domains):
             if not domain:
                 continue
 
@@ -252,16 +268,16 @@ class Phase4PatternVerification:
             if domain not in domain_groups:
                 domain_groups[domain] = {
                     'domain': domain,
-                    'pattern': row.get('email_pattern', ''),
-                    'company_id': row.get('matched_company_id', ''),
-                    'needs_verification': row.get('pattern_needs_verification', True),
+                    'pattern': patterns[position],
+                    'company_id': company_ids[position],
+                    'needs_verification': needs_verification[position],
                     'known_emails': []
                 }
 
             # Collect known emails for verification
-            email = row.get('email', '')
-            first_name = row.get('first_name', '')
-            last_name = row.get('last_name', '')
+            email = emails[position]
+            first_name = first_names[position]
+            last_name = last_names[position]
 
             if email and '@' in email and first_name and last_name:
                 email_domain = email.split('@')[1].lower()
@@ -368,13 +384,7 @@ class Phase4PatternVerification:
         # 3. SMTP verification (if enabled)
         if self.enable_smtp_check and known_emails:
             # Generate a sample email and verify
-            sample = known_emails[0]
-            generated_email = apply_pattern(
-                pattern,
-                sample['first_name'],
-                sample['last_name'],
-                domain
-            )
+            generated_email = self._sample_email(pattern, known_emails, domain)
 
             if generated_email:
                 smtp_result = self._smtp_verify(generated_email)
@@ -465,7 +475,7 @@ class Phase4PatternVerification:
             return self._mx_cache[domain]
 
         try:
-            mx_records = verify_mx_records(domain, timeout=5.0)
+            mx_records = check_mx_records(domain, timeout=5.0)
             has_mx = len(mx_records) > 0
             self._mx_cache[domain] = has_mx
             return has_mx
@@ -473,6 +483,61 @@ class Phase4PatternVerification:
             self._mx_cache[domain] = False
             return False
 
+    def _sample_email(self, pattern: str, known_emails: List[Dict[str, str]],
+                      domain: str) -> Optional[str]:
+        """Apply the pattern to the first known person (the SMTP sample)."""
+        sample = known_emails[0]
+        return apply_pattern(
+            pattern,
+            sample['first_name'],
+            sample['last_name'],
+            domain
+        )
+
+    def _prefetch_smtp_results(self, domain_patterns: Dict[str, Dict[str, Any]]) -> None:
+        """
+        SMTP-verify the sample email of every domain that will need it.
+
+        A domain needs it when its pattern is well-formed and still needs
+        verification, and its known emails do not already verify it.
+        Results land in _smtp_cache for _smtp_verify().
+
+        Args:
+            domain_patterns: Output of _group_by_domain()
+        """
+        if not self.enable_smtp_check:
+            return
+
+        samples = []
+        for domain, info in domain_patterns.items():
+            pattern = info['pattern']
+            known_emails = info.get('known_emails', [])
+            if not (pattern and known_emails and info.get('needs_verification', True)):
+                continue
+            if not validate_pattern_format(pattern):
+                continue
+            matches = self._test_pattern_against_known_emails(pattern, known_emails, domain)
+            if matches / len(known_emails) >= self.min_confidence:
+                continue
+            sample = self._sample_email(pattern, known_emails, domain)
+            if sample and sample not in self._smtp_cache:
+                samples.append(sample)
+
+        if not samples:
+            return
+
+        try:
+            results = batch_verify_emails(samples, check_smtp=True, smtp_timeout=self.smtp_timeout)
+        except Exception as e:
+            self.logger.debug(
+                f"Batch SMTP verification failed: {e}",
+                metadata={'samples': len(samples), 'error': str(e)}
+            )
+            return
+
+        for result in results:
+            self._smtp_cache[result.email] = result.is_valid
+
     def _smtp_verify(self, email: str) -> bool:
         """
         Verify email via SMTP check.
@@ -483,9 +548,13 @@ class Phase4PatternVerification:
         Returns:
             True if SMTP verification passes, False otherwise
         """
+        if email in self._smtp_cache:
+            return self._smtp_cache[email]
+
         try:
-            result = verify_email(email, check_smtp=True, smtp_timeout=self.smtp_timeout)
-            return result.is_valid and result.smtp_valid is not False
+            result = verify_email_deliverable(email, check_smtp=True, smtp_timeout=self.smtp_timeout)
+            self._smtp_cache[email] = result.is_valid
+            return result.is_valid
         except Exception as e:
             self.logger.debug(
                 f"SMTP verification failed for {email}: {e}",
@@ -511,39 +580,47 @@ class Phase4PatternVerification:
     def _build_result_dataframe(self, pattern_df: pd.DataFrame,
                                 verification_results: Dict[str, PatternVerificationResult]) -> pd.DataFrame:
         """Build output DataFrame with verification results appended."""
-        result_data = []
+        size = len(pattern_df)
+        domains = first_truthy(
+            column_values(pattern_df, 'resolved_domain'),
+            column_values(pattern_df, 'domain')
+        )
+        # row.get('person_id', idx): fall back to the index label
+        if 'person_id' in pattern_df.columns:
+            person_ids = pattern_df['person_id'].tolist()
+        else:
+            person_ids = pattern_df.index.tolist()
+
+        # Preallocated result columns, defaulted to the "skipped" row
+        default_fallback = self.fallback_patterns[0] if self.fallback_patterns else None
+        columns = {
+            'person_id': person_ids,
+            'pattern_verified': [False] * size,
+            'verification_status': [VerificationStatus.SKIPPED.value] * size,
+            'verification_method': [VerificationMethod.UNVERIFIED.value] * size,
+            'verification_confidence': [0.0] * size,
+            'mx_verified': [False] * size,
+            'fallback_required': [True] * size,
+            'fallback_pattern': [default_fallback] * size,
+            'final_pattern': [default_fallback] * size
+        }
 
-        for idx, row in pattern_df.iterrows():
-            domain = row.get('resolved_domain', '') or row.get('domain', '')
+        for position, domain in enumerate(domains):
             domain = domain.lower().strip() if domain else ''
+            if not domain or domain not in verification_results:
+                continue
 
-            if domain and domain in verification_results:
-                vr = verification_results[domain]
-                result_data.append({
-                    'person_id': row.get('person_id', idx),
-                    'pattern_verified': vr.verified,
-                    'verification_status': vr.verification_status.value,
-                    'verification_method': vr.verification_method.value,
-                    'verification_confidence': vr.confidence_score,
-                    'mx_verified': vr.mx_verified,
-                    'fallback_required': vr.fallback_required,
-                    'fallback_pattern': vr.fallback_pattern,
-                    'final_pattern': vr.fallback_pattern if vr.fallback_required else vr.pattern
-                })
-            else:
-                result_data.append({
-                    'person_id': row.get('person_id', idx),
-                    'pattern_verified': False,
-                    'verification_status': VerificationStatus.SKIPPED.value,
-                    'verification_method': VerificationMethod.UNVERIFIED.value,
-                    'verification_confidence': 0.0,
-                    'mx_verified': False,
-                    'fallback_required': True,
-                    'fallback_pattern': self.fallback_patterns[0] if self.fallback_patterns else None,
-                    'final_pattern': self.fallback_patterns[0] if self.fallback_patterns else None
-                })
-
-        result_df = pd.DataFrame(result_data)
+            vr = verification_results[domain]
+            columns['pattern_verified'][position] = vr.verified
+            columns['verification_status'][position] = vr.verification_status.value
+            columns['verification_method'][position] = vr.verification_method.value
+            columns['verification_confidence'][position] = vr.confidence_score
+            columns['mx_verified'][position] = vr.mx_verified
+            columns['fallback_required'][position] = vr.fallback_required
+            columns['fallback_pattern'][position] = vr.fallback_pattern
+            columns['final_pattern'][position] = vr.fallback_pattern if vr.fallback_required else vr.pattern
+
+        result_df = pd.DataFrame(columns)
 
         # Merge with original pattern_df
         if 'person_id' not in pattern_df.columns:
@@ -4,8 +4,9 @@ Provider Utilities - Hub Company Module
 Wrapper module that imports from the central provider implementation.
 
 This module re-exports all provider classes and utilities from
-ctb/sys/enrichment/pipeline_engine/utils/providers.py for use in
-the Company Hub pipeline phases.
+ctb/sys/enrichment/pipeline_engine/utils/providers.py (or, where that
+tree is absent, ops/providers/providers.py) for use in the Company Hub
+pipeline phases.
 
 Tools covered:
 - Tool 6: Pattern Discovery (provider waterfall)
@@ -60,10 +61,42 @@ try:
     )
     _PROVIDERS_AVAILABLE = True
 
-except ImportError as e:
-    logger.warning(f"Could not import from ctb.sys providers: {e}")
+except ImportError:
+    try:
+        from ops.providers.providers import (
+            # Enums
+            ProviderTier,
+            ProviderStatus,
+            # Data classes
+            EmailSample,
+            ProviderResult,
+            ProviderStats,
+            # Base class
+            ProviderBase,
+            # Tier 0 providers (Free)
+            FirecrawlProvider,
+            GooglePlacesProvider,
+            WebScraperProvider,
+            # Tier 1 providers (Low Cost)
+            HunterProvider,
+            ClearbitProvider,
+            ApolloProvider,
+            # Tier 2 providers (Premium)
+            ProspeoProvider,
+            SnovProvider,
+            ClayProvider,
+            # Registry and utilities
+            ProviderRegistry,
+            execute_tier_waterfall,
+            get_best_result,
+        )
+        _PROVIDERS_AVAILABLE = True
+    except ImportError:
+        _PROVIDERS_AVAILABLE = False
+
+if not _PROVIDERS_AVAILABLE:
+    logger.warning("Could not import provider implementations (ctb.sys, ops.providers)")
     logger.warning("Falling back to stub implementations")
-    _PROVIDERS_AVAILABLE = False
 
     # Provide stub implementations if import fails
     from enum import Enum
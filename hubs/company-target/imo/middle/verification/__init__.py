@@ -26,6 +26,17 @@ from .verification import (
     batch_verify_emails,
     check_mx_records,
     check_catch_all,
+    verify_domain_health_async,
+    stream_domain_health,
+    verify_domains_bulk,
+    DNS_CONCURRENCY,
+)
+
+from .smtp_probe import (
+    SMTPProbeEngine,
+    SMTPProbeResult,
+    configure_smtp_probe_engine,
+    get_smtp_probe_engine,
 )
 
 __all__ = [
@@ -49,4 +60,13 @@ __all__ = [
     "batch_verify_emails",
     "check_mx_records",
     "check_catch_all",
+    "verify_domain_health_async",
+    "stream_domain_health",
+    "verify_domains_bulk",
+    "DNS_CONCURRENCY",
+    # smtp_probe
+    "SMTPProbeEngine",
+    "SMTPProbeResult",
+    "configure_smtp_probe_engine",
+    "get_smtp_probe_engine",
 ]
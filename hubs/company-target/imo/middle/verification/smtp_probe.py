@@ -0,0 +1,509 @@
+"""
+SMTP Probe Engine
+=================
+Batched RCPT TO probing for email verification (Tool 8).
+
+The single-address check opens a connection, HELO and MAIL FROM for every
+address, plus a second session to test a random address for catch-all.
+The probe engine instead:
+- Groups addresses by MX host and reuses one session for up to
+  max_rcpt_per_session RCPT TO probes (one HELO / MAIL FROM per session)
+- Tests catch-all once per domain, in the same session, and caches the
+  answer for catch_all_ttl seconds
+- Caps concurrent sessions per MX host (max_sessions_per_mx), so a large
+  batch does not trip greylisting or connection limits
+
+Statuses are the same as the single-address check: 250 → DELIVERABLE (or
+CATCH_ALL when the domain accepts a random address), 55x → UNDELIVERABLE,
+45x → GREYLISTED.
+
+Usage:
+    from .smtp_probe import get_smtp_probe_engine
+
+    results = get_smtp_probe_engine().probe_many(["jane@acme.com", "john@acme.com"])
+    results["jane@acme.com"].status  # SMTPStatus.DELIVERABLE
+"""
+
+import socket
+import random
+import string
+import smtplib
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ops.caching import get_dns_cache
+
+from .verification import SMTPStatus, SMTP_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+SMTP_PORT = 25
+HELO_HOST = "verify.local"
+MAIL_FROM = "verify@verify.local"
+DEFAULT_SESSIONS_PER_MX = 2        # concurrent sessions per MX host
+DEFAULT_RCPT_PER_SESSION = 50      # RCPT TO probes before a new session (RFC 5321 minimum is 100)
+DEFAULT_PROBE_WORKERS = 16         # sessions in flight across all MX hosts
+DEFAULT_CATCH_ALL_TTL = 86400.0
+
+UNDELIVERABLE_CODES = (550, 551, 552, 553, 554)
+GREYLIST_CODES = (450, 451, 452)
+
+
+@dataclass
+class SMTPProbeResult:
+    """SMTP verdict for one address."""
+    email: str
+    status: SMTPStatus
+    response: Optional[str] = None
+    mx_host: Optional[str] = None
+
+
+@dataclass
+class SMTPProbeStats:
+    """Counters for one SMTPProbeEngine."""
+    sessions: int = 0
+    rcpt_probes: int = 0
+    catch_all_probes: int = 0
+    catch_all_cache_hits: int = 0
+    reconnects: int = 0
+    connect_failures: int = 0
+
+
+def _mx_hosts_from_dns(domain: str) -> List[str]:
+    """MX hosts by preference, through the shared DNS cache ([] if none)."""
+    try:
+        records = get_dns_cache().resolve(domain, 'MX')
+    except Exception:
+        return []
+    return [host for _, host in sorted(records, key=lambda x: x[0])]
+
+
+def _random_address(domain: str) -> str:
+    local = ''.join(random.choices(string.ascii_lowercase + string.digits, k=20))
+    return f"{local}@{domain}"
+
+
+def _decode(message: Any) -> str:
+    return message.decode(errors='replace') if isinstance(message, bytes) else str(message)
+
+
+_PENDING = object()     # catch-all verdict being probed by another session
+
+
+class _SessionRefused(Exception):
+    """HELO or MAIL FROM was rejected; every address in the session is BLOCKED."""
+
+
+class SMTPProbeEngine:
+    """
+    Thread-safe SMTP prober with per-MX session reuse and catch-all cache.
+
+    Usage:
+        engine = SMTPProbeEngine(max_sessions_per_mx=2)
+        results = engine.probe_many(emails)
+    """
+
+    def __init__(
+        self,
+        port: int = SMTP_PORT,
+        timeout: float = SMTP_TIMEOUT,
+        max_sessions_per_mx: int = DEFAULT_SESSIONS_PER_MX,
+        max_rcpt_per_session: int = DEFAULT_RCPT_PER_SESSION,
+        max_workers: int = DEFAULT_PROBE_WORKERS,
+        catch_all_ttl: float = DEFAULT_CATCH_ALL_TTL,
+        helo_host: str = HELO_HOST,
+        mail_from: str = MAIL_FROM,
+        mx_lookup: Callable[[str], List[str]] = None,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            port: SMTP port on the MX hosts
+            timeout: Default socket timeout per session
+            max_sessions_per_mx: Concurrent sessions allowed per MX host
+            max_rcpt_per_session: RCPT TO probes per session before reconnecting
+            max_workers: Sessions in flight across all hosts
+            catch_all_ttl: Seconds a domain's catch-all answer is reused
+            helo_host: HELO hostname
+            mail_from: MAIL FROM address
+            mx_lookup: domain -> MX hosts by preference (default: shared DNS cache)
+            smtp_factory: smtplib.SMTP-compatible constructor (accepts timeout=)
+            clock: Monotonic clock for the catch-all cache
+        """
+        self.port = port
+        self.timeout = timeout
+        self.max_sessions_per_mx = max(1, max_sessions_per_mx)
+        self.max_rcpt_per_session = max(1, max_rcpt_per_session)
+        self.max_workers = max(1, max_workers)
+        self.catch_all_ttl = catch_all_ttl
+        self.helo_host = helo_host
+        self.mail_from = mail_from
+        self._mx_lookup = mx_lookup or _mx_hosts_from_dns
+        self._smtp_factory = smtp_factory
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._catch_all: Dict[str, Tuple[bool, float]] = {}
+        self._catch_all_probing: set = set()
+        self._stats = SMTPProbeStats()
+
+    # -------------------------------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------------------------------
+
+    def probe(self, email: str, mx_host: str = None, timeout: float = None) -> SMTPProbeResult:
+        """
+        Probe one address (see probe_many).
+
+        Args:
+            email: Address to probe
+            mx_host: MX host to use (default: looked up)
+            timeout: Socket timeout (default: engine timeout)
+
+        Returns:
+            SMTPProbeResult
+        """
+        domain = email.strip().lower().rsplit('@', 1)[-1]
+        mx_hosts = {domain: mx_host} if mx_host else None
+        return self.probe_many([email], mx_hosts=mx_hosts, timeout=timeout)[email]
+
+    def probe_many(self, emails: Iterable[str], mx_hosts: Dict[str, str] = None,
+                   timeout: float = None) -> Dict[str, SMTPProbeResult]:
+        """
+        Probe many addresses, batching RCPT TO per MX host.
+
+        Args:
+            emails: Addresses to probe
+            mx_hosts: Optional domain -> MX host overrides (skips the MX lookup)
+            timeout: Socket timeout (default: engine timeout)
+
+        Returns:
+            Dict of email (as given) -> SMTPProbeResult
+        """
+        timeout = self.timeout if timeout is None else timeout
+        mx_hosts = dict(mx_hosts or {})
+        results: Dict[str, SMTPProbeResult] = {}
+        by_host: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+
+        for email in dict.fromkeys(emails):
+            address = email.strip().lower()
+            domain = address.rsplit('@', 1)[-1]
+            if domain not in mx_hosts:
+                hosts = self._mx_lookup(domain)
+                mx_hosts[domain] = hosts[0] if hosts else None
+            host = mx_hosts[domain]
+            if not host:
+                results[email] = SMTPProbeResult(email, SMTPStatus.ERROR, "No MX records")
+                continue
+            by_host[host].append((email, address, domain))
+
+        # Each host gets up to max_sessions_per_mx lanes; each lane works
+        # through that host's session-sized chunks one at a time
+        lanes = []
+        for host, items in by_host.items():
+            chunks = [items[i:i + self.max_rcpt_per_session]
+                      for i in range(0, len(items), self.max_rcpt_per_session)]
+            for lane in range(min(self.max_sessions_per_mx, len(chunks))):
+                lanes.append((host, chunks[lane::self.max_sessions_per_mx]))
+
+        if len(lanes) == 1:
+            results.update(self._run_lane(*lanes[0], timeout))
+        elif lanes:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(lanes))) as executor:
+                for lane_results in executor.map(lambda lane: self._run_lane(*lane, timeout), lanes):
+                    results.update(lane_results)
+
+        return results
+
+    def check_catch_all(self, domain: str, mx_host: str = None, timeout: float = None) -> bool:
+        """
+        Whether the domain's MX accepts any address (cached per domain).
+
+        Args:
+            domain: Domain to check
+            mx_host: MX host to use (default: looked up)
+            timeout: Socket timeout (default: engine timeout)
+
+        Returns:
+            True if the server accepted a random address; False if it
+            rejected it or could not be probed
+        """
+        domain = domain.strip().lower()
+        with self._lock:
+            cached = self._cached_catch_all_locked(domain)
+        if cached is not None:
+            return cached
+
+        if not mx_host:
+            hosts = self._mx_lookup(domain)
+            if not hosts:
+                return False
+            mx_host = hosts[0]
+
+        try:
+            with self._session(mx_host, self.timeout if timeout is None else timeout) as smtp:
+                return bool(self._catch_all_verdict(smtp, domain))
+        except Exception:
+            return False
+
+    def clear_catch_all_cache(self) -> None:
+        """Forget cached catch-all answers."""
+        with self._lock:
+            self._catch_all.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Engine counters as a dict."""
+        with self._lock:
+            data = asdict(self._stats)
+            data['catch_all_cached'] = len(self._catch_all)
+        return data
+
+    # -------------------------------------------------------------------------
+    # SESSIONS
+    # -------------------------------------------------------------------------
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.max_sessions_per_mx)
+            return slot
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + amount)
+
+    def _session(self, host: str, timeout: float) -> "_Session":
+        return _Session(self, host, timeout)
+
+    def _run_lane(self, host: str, chunks: List[List[Tuple[str, str, str]]],
+                  timeout: float) -> Dict[str, SMTPProbeResult]:
+        results = {}
+        for chunk in chunks:
+            results.update(self._probe_chunk(host, chunk, timeout))
+        return results
+
+    def _probe_chunk(self, host: str, chunk: List[Tuple[str, str, str]],
+                     timeout: float) -> Dict[str, SMTPProbeResult]:
+        """One session for a chunk; reconnect once if the server drops it mid-way."""
+        results: Dict[str, SMTPProbeResult] = {}
+        remaining = list(chunk)
+        reconnected = False
+
+        while remaining:
+            try:
+                with self._session(host, timeout) as smtp:
+                    # Addresses accepted while another session was testing their
+                    # domain for catch-all stay in remaining until resolved, so a
+                    # dropped session still fails or retries them
+                    index = 0
+                    while index < len(remaining):
+                        email, address, domain = remaining[index]
+                        result = self._probe_address(smtp, email, address, domain, host)
+                        if result is None:
+                            index += 1
+                        else:
+                            results[email] = result
+                            remaining.pop(index)
+                    # The pending catch-all answer is usually cached by now
+                    while remaining:
+                        email, _, domain = remaining[0]
+                        results[email] = self._accepted(email, host, self._catch_all_verdict(smtp, domain))
+                        remaining.pop(0)
+            except smtplib.SMTPServerDisconnected as e:
+                if reconnected or not results:
+                    self._fail(results, remaining, host, SMTPStatus.ERROR, str(e))
+                    break
+                reconnected = True
+                self._count('reconnects')
+            except _SessionRefused as e:
+                self._fail(results, remaining, host, SMTPStatus.BLOCKED, str(e))
+                break
+            except (smtplib.SMTPConnectError, ConnectionRefusedError):
+                self._count('connect_failures')
+                self._fail(results, remaining, host, SMTPStatus.BLOCKED, "Connection refused")
+                break
+            except socket.timeout:
+                self._fail(results, remaining, host, SMTPStatus.TIMEOUT, "Connection timed out")
+                break
+            except Exception as e:
+                logger.error(f"SMTP probe error on {host}: {e}")
+                self._fail(results, remaining, host, SMTPStatus.ERROR, str(e))
+                break
+
+        return results
+
+    @staticmethod
+    def _fail(results: Dict[str, SMTPProbeResult], remaining: List[Tuple[str, str, str]],
+              host: str, status: SMTPStatus, response: str) -> None:
+        for email, _, _ in remaining:
+            results[email] = SMTPProbeResult(email, status, response, host)
+        remaining.clear()
+
+    def _probe_address(self, smtp: smtplib.SMTP, email: str, address: str,
+                       domain: str, host: str) -> Optional[SMTPProbeResult]:
+        """RCPT TO one address; None if accepted but the catch-all verdict is pending."""
+        self._count('rcpt_probes')
+        code, msg = smtp.rcpt(address)
+        msg = _decode(msg)
+
+        if code == 250:
+            catch_all = self._catch_all_verdict(smtp, domain, wait=False)
+            if catch_all is _PENDING:
+                return None
+            return self._accepted(email, host, catch_all)
+        if code in UNDELIVERABLE_CODES:
+            return SMTPProbeResult(email, SMTPStatus.UNDELIVERABLE, f"RCPT TO rejected: {msg}", host)
+        if code in GREYLIST_CODES:
+            return SMTPProbeResult(email, SMTPStatus.GREYLISTED, f"Temporary rejection: {msg}", host)
+        return SMTPProbeResult(email, SMTPStatus.ERROR, f"Unexpected response {code}: {msg}", host)
+
+    @staticmethod
+    def _accepted(email: str, host: str, catch_all: Optional[bool]) -> SMTPProbeResult:
+        if catch_all:
+            return SMTPProbeResult(email, SMTPStatus.CATCH_ALL, "Server accepts all addresses", host)
+        if catch_all is None:
+            return SMTPProbeResult(email, SMTPStatus.DELIVERABLE, "Email likely valid", host)
+        return SMTPProbeResult(email, SMTPStatus.DELIVERABLE, "Email verified", host)
+
+    def _catch_all_verdict(self, smtp: smtplib.SMTP, domain: str, wait: bool = True) -> Any:
+        """
+        Cached catch-all answer for the domain, probing in this session if needed.
+
+        With wait=False, returns _PENDING instead of probing when another
+        session is already testing the domain.
+        """
+        with self._lock:
+            cached = self._cached_catch_all_locked(domain)
+            if cached is not None:
+                return cached
+            if domain in self._catch_all_probing and not wait:
+                return _PENDING
+            self._catch_all_probing.add(domain)
+        try:
+            return self._probe_catch_all(smtp, domain)
+        finally:
+            with self._lock:
+                self._catch_all_probing.discard(domain)
+
+    def _probe_catch_all(self, smtp: smtplib.SMTP, domain: str) -> Optional[bool]:
+        """RCPT TO a random address in the open session; None if inconclusive."""
+        self._count('catch_all_probes')
+        code, _ = smtp.rcpt(_random_address(domain))
+        if code == 250:
+            catch_all = True
+        elif code in UNDELIVERABLE_CODES:
+            catch_all = False
+        else:
+            return None
+        with self._lock:
+            self._catch_all[domain] = (catch_all, self._clock() + self.catch_all_ttl)
+        return catch_all
+
+    def _cached_catch_all_locked(self, domain: str) -> Optional[bool]:
+        cached = self._catch_all.get(domain)
+        if cached is None:
+            return None
+        if cached[1] <= self._clock():
+            del self._catch_all[domain]
+            return None
+        self._stats.catch_all_cache_hits += 1
+        return cached[0]
+
+
+class _Session:
+    """One SMTP session (HELO + MAIL FROM) holding a per-MX slot."""
+
+    def __init__(self, engine: SMTPProbeEngine, host: str, timeout: float):
+        self.engine = engine
+        self.host = host
+        self.timeout = timeout
+        self.smtp = None
+        self.slot = engine._host_slot(host)
+
+    def __enter__(self) -> smtplib.SMTP:
+        self.slot.acquire()
+        try:
+            engine = self.engine
+            engine._count('sessions')
+            self.smtp = engine._smtp_factory(timeout=self.timeout)
+            self.smtp.connect(self.host, engine.port)
+
+            code, msg = self.smtp.helo(engine.helo_host)
+            if code != 250:
+                raise _SessionRefused(f"HELO rejected: {_decode(msg)}")
+            code, msg = self.smtp.mail(engine.mail_from)
+            if code != 250:
+                raise _SessionRefused(f"MAIL FROM rejected: {_decode(msg)}")
+            return self.smtp
+        except BaseException:
+            self._close()
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        try:
+            if self.smtp is not None:
+                try:
+                    self.smtp.quit()
+                except Exception:
+                    self.smtp.close()
+        finally:
+            self.smtp = None
+            self.slot.release()
+
+
+# =============================================================================
+# PROCESS-WIDE ENGINE
+# =============================================================================
+
+_engine: Optional[SMTPProbeEngine] = None
+_engine_lock = threading.Lock()
+
+
+def configure_smtp_probe_engine(**options: Any) -> SMTPProbeEngine:
+    """
+    Replace the process-wide probe engine.
+
+    Args:
+        **options: SMTPProbeEngine keyword arguments
+
+    Returns:
+        The new engine
+    """
+    global _engine
+    with _engine_lock:
+        _engine = SMTPProbeEngine(**options)
+        return _engine
+
+
+def get_smtp_probe_engine() -> SMTPProbeEngine:
+    """Return the process-wide probe engine (created on first use)."""
+    global _engine
+    engine = _engine
+    if engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = SMTPProbeEngine()
+            engine = _engine
+    return engine
+
+
+__all__ = [
+    "SMTPProbeEngine",
+    "SMTPProbeResult",
+    "SMTPProbeStats",
+    "configure_smtp_probe_engine",
+    "get_smtp_probe_engine",
+]
@@ -11,16 +11,17 @@ NO LLM ALLOWED - All verification is deterministic.
 """
 
 import re
-import socket
-import smtplib
+import asyncio
 import dns.resolver
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterable, AsyncIterator, Callable
 from enum import Enum
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from ops.caching import get_dns_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,6 +130,7 @@ DISPOSABLE_DOMAINS = [
 
 # DNS timeout settings
 DNS_TIMEOUT = 5.0
+DNS_CONCURRENCY = 200      # domains in flight for bulk async verification
 SMTP_TIMEOUT = 10.0
 
 
@@ -151,17 +153,10 @@ def check_mx_records(domain: str, timeout: float = DNS_TIMEOUT) -> List[str]:
         return []
 
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = timeout
-        resolver.lifetime = timeout
-
-        answers = resolver.resolve(domain, 'MX')
+        answers = get_dns_cache().resolve(domain, 'MX', timeout=timeout)
 
         # Sort by priority (lower = higher priority)
-        mx_records = sorted(
-            [(r.preference, str(r.exchange).rstrip('.')) for r in answers],
-            key=lambda x: x[0]
-        )
+        mx_records = sorted(answers, key=lambda x: x[0])
 
         return [mx[1] for mx in mx_records]
 
@@ -201,14 +196,11 @@ def verify_domain_health(domain: str, timeout: float = DNS_TIMEOUT) -> DomainHea
         return result
 
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = timeout
-        resolver.lifetime = timeout
+        dns_cache = get_dns_cache()
 
         # Check A records
         try:
-            a_answers = resolver.resolve(domain, 'A')
-            result.a_records = [str(r) for r in a_answers]
+            result.a_records = dns_cache.resolve(domain, 'A', timeout=timeout)
             result.has_dns = True
         except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
             pass
@@ -220,29 +212,15 @@ def verify_domain_health(domain: str, timeout: float = DNS_TIMEOUT) -> DomainHea
 
         # Check MX records
         try:
-            mx_answers = resolver.resolve(domain, 'MX')
-            result.mx_records = sorted(
-                [str(r.exchange).rstrip('.') for r in mx_answers],
-                key=lambda x: next((r.preference for r in mx_answers if str(r.exchange).rstrip('.') == x), 99)
-            )
+            mx_answers = dns_cache.resolve(domain, 'MX', timeout=timeout)
+            result.mx_records = [host for _, host in sorted(mx_answers, key=lambda x: x[0])]
             result.has_mx = len(result.mx_records) > 0
         except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
             pass
         except dns.resolver.Timeout:
             pass
 
-        # Determine status
-        if not result.has_dns and not result.has_mx:
-            result.status = DomainHealthStatus.UNREACHABLE
-        elif result.has_mx:
-            result.status = DomainHealthStatus.VALID
-        else:
-            result.status = DomainHealthStatus.VALID_NO_MX
-
-        # Check for parked indicators (basic check)
-        result.is_parked = _check_parked_domain(domain, result.a_records)
-        if result.is_parked:
-            result.status = DomainHealthStatus.PARKED
+        _set_domain_health_status(result)
 
     except Exception as e:
         result.status = DomainHealthStatus.ERROR
@@ -253,10 +231,28 @@ def verify_domain_health(domain: str, timeout: float = DNS_TIMEOUT) -> DomainHea
     return result
 
 
+def _set_domain_health_status(result: DomainHealth) -> None:
+    """Set status (and parked flag) from the resolved A/MX records."""
+    # Determine status
+    if not result.has_dns and not result.has_mx:
+        result.status = DomainHealthStatus.UNREACHABLE
+    elif result.has_mx:
+        result.status = DomainHealthStatus.VALID
+    else:
+        result.status = DomainHealthStatus.VALID_NO_MX
+
+    # Check for parked indicators (basic check)
+    result.is_parked = _check_parked_domain(result.domain, result.a_records)
+    if result.is_parked:
+        result.status = DomainHealthStatus.PARKED
+
+
 def check_catch_all(domain: str, mx_host: str = None, timeout: float = SMTP_TIMEOUT) -> bool:
     """
     Check if a domain is a catch-all (accepts all email addresses).
 
+    The answer is cached per domain by the shared SMTP probe engine.
+
     Args:
         domain: Domain to check
         mx_host: Optional MX host to use
@@ -265,8 +261,7 @@ def check_catch_all(domain: str, mx_host: str = None, timeout: float = SMTP_TIME
     Returns:
         True if domain is catch-all
     """
-    import random
-    import string
+    from .smtp_probe import get_smtp_probe_engine
 
     if not mx_host:
         mx_records = check_mx_records(domain)
@@ -274,23 +269,156 @@ def check_catch_all(domain: str, mx_host: str = None, timeout: float = SMTP_TIME
             return False
         mx_host = mx_records[0]
 
-    # Generate random invalid address
-    random_local = ''.join(random.choices(string.ascii_lowercase + string.digits, k=20))
-    test_email = f"{random_local}@{domain}"
+    return get_smtp_probe_engine().check_catch_all(domain, mx_host, timeout)
+
+
+# =============================================================================
+# TOOL 5: BULK ASYNC DNS/MX VALIDATOR
+# =============================================================================
+
+async def verify_domain_health_async(domain: str, timeout: float = DNS_TIMEOUT,
+                                     dns_cache: Any = None) -> DomainHealth:
+    """
+    Tool 5 (async): verify_domain_health() with the A and MX queries in flight together.
+
+    Args:
+        domain: Domain to verify
+        timeout: DNS timeout per query in seconds
+        dns_cache: DNSCache to resolve through (default: process-wide cache)
 
+    Returns:
+        DomainHealth with full details (same statuses as verify_domain_health)
+    """
+    start_time = time.time()
+
+    result = DomainHealth(
+        domain=domain,
+        status=DomainHealthStatus.INVALID
+    )
+
+    if not domain or not _is_valid_domain_format(domain):
+        result.error_message = "Invalid domain format"
+        result.verification_time_ms = int((time.time() - start_time) * 1000)
+        return result
+
+    dns_cache = dns_cache or get_dns_cache()
     try:
-        smtp = smtplib.SMTP(timeout=timeout)
-        smtp.connect(mx_host, 25)
-        smtp.helo("verify.local")
-        smtp.mail("verify@verify.local")
+        a_answer, mx_answer = await asyncio.gather(
+            dns_cache.resolve_async(domain, 'A', timeout=timeout),
+            dns_cache.resolve_async(domain, 'MX', timeout=timeout),
+            return_exceptions=True
+        )
 
-        code, msg = smtp.rcpt(test_email)
-        smtp.quit()
+        if isinstance(a_answer, dns.resolver.Timeout):
+            result.status = DomainHealthStatus.TIMEOUT
+            result.error_message = "DNS A record timeout"
+            result.verification_time_ms = int((time.time() - start_time) * 1000)
+            return result
 
-        return code == 250  # Server accepts invalid address
+        for answer in (a_answer, mx_answer):
+            if isinstance(answer, BaseException) and not isinstance(
+                answer, (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout)
+            ):
+                raise answer
 
-    except Exception:
-        return False
+        if not isinstance(a_answer, BaseException):
+            result.a_records = a_answer
+            result.has_dns = True
+        if not isinstance(mx_answer, BaseException):
+            result.mx_records = [host for _, host in sorted(mx_answer, key=lambda x: x[0])]
+            result.has_mx = len(result.mx_records) > 0
+
+        _set_domain_health_status(result)
+
+    except Exception as e:
+        result.status = DomainHealthStatus.ERROR
+        result.error_message = str(e)
+        logger.error(f"Domain health check error for {domain}: {e}")
+
+    result.verification_time_ms = int((time.time() - start_time) * 1000)
+    return result
+
+
+async def stream_domain_health(
+    domains: Iterable[str],
+    concurrency: int = DNS_CONCURRENCY,
+    timeout: float = DNS_TIMEOUT,
+    dns_cache: Any = None
+) -> AsyncIterator[DomainHealth]:
+    """
+    Verify many domains concurrently, yielding each DomainHealth as it finishes.
+
+    Domains are pulled from the iterable as slots free up, so a generator of
+    200k domains is never materialised. Closing the iterator early cancels
+    the verifications still in flight.
+
+    Args:
+        domains: Domains to verify
+        concurrency: Domains in flight at once (each runs its A and MX queries together)
+        timeout: DNS timeout per query in seconds
+        dns_cache: DNSCache to resolve through (default: process-wide cache)
+
+    Yields:
+        DomainHealth in completion order
+    """
+    pending = iter(domains)
+    results: asyncio.Queue = asyncio.Queue(maxsize=max(1, concurrency))
+    finished = object()
+
+    async def worker() -> None:
+        for domain in pending:
+            await results.put(await verify_domain_health_async(domain, timeout, dns_cache))
+
+    async def run_workers() -> None:
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        finally:
+            await results.put(finished)
+
+    runner = asyncio.ensure_future(run_workers())
+    try:
+        while True:
+            item = await results.get()
+            if item is finished:
+                break
+            yield item
+        await runner   # surface worker errors
+    finally:
+        if not runner.done():
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+
+
+def verify_domains_bulk(
+    domains: Iterable[str],
+    concurrency: int = DNS_CONCURRENCY,
+    timeout: float = DNS_TIMEOUT,
+    on_result: Callable[[DomainHealth], None] = None
+) -> List[DomainHealth]:
+    """
+    Blocking entry point for stream_domain_health() (starts its own event loop).
+
+    Must not be called from a running event loop; iterate
+    stream_domain_health() there.
+
+    Args:
+        domains: Domains to verify
+        concurrency: Domains in flight at once
+        timeout: DNS timeout per query in seconds
+        on_result: Called with each DomainHealth as it finishes
+
+    Returns:
+        List of DomainHealth objects (in completion order)
+    """
+    async def run() -> List[DomainHealth]:
+        results = []
+        async for health in stream_domain_health(domains, concurrency, timeout):
+            if on_result is not None:
+                on_result(health)
+            results.append(health)
+        return results
+
+    return asyncio.run(run())
 
 
 # =============================================================================
@@ -321,6 +449,28 @@ def verify_email_deliverable(
     """
     start_time = time.time()
 
+    result, address = _verify_email_dns(email)
+    if address:
+        if check_smtp:
+            smtp_status, smtp_response = _smtp_check(address, result.mx_host, smtp_timeout)
+            _apply_smtp_status(result, smtp_status, smtp_response)
+        else:
+            # Without SMTP check, assume valid if MX exists
+            result.status = VerificationStatus.RISKY
+            result.is_valid = True
+
+    result.verification_time_ms = int((time.time() - start_time) * 1000)
+    return result
+
+
+def _verify_email_dns(email: str) -> Tuple[EmailVerificationResult, Optional[str]]:
+    """
+    Steps 1-3 of verify_email_deliverable (format, domain DNS, MX).
+
+    Returns:
+        (result, address): address is the normalized email when it is ready
+        for SMTP verification (result.mx_host set), None when result is final
+    """
     result = EmailVerificationResult(
         email=email,
         status=VerificationStatus.UNKNOWN
@@ -330,8 +480,7 @@ def verify_email_deliverable(
     if not _verify_email_format(email):
         result.status = VerificationStatus.INVALID
         result.error_message = "Invalid email format"
-        result.verification_time_ms = int((time.time() - start_time) * 1000)
-        return result
+        return result, None
 
     email = email.lower().strip()
     local_part, domain = email.split('@')
@@ -344,60 +493,52 @@ def verify_email_deliverable(
     if result.is_disposable:
         result.status = VerificationStatus.INVALID
         result.error_message = "Disposable email domain"
-        result.verification_time_ms = int((time.time() - start_time) * 1000)
-        return result
+        return result, None
 
     # Step 2: Domain DNS check
     domain_health = verify_domain_health(domain)
     if not domain_health.is_valid():
         result.status = VerificationStatus.INVALID
         result.error_message = "Domain does not resolve"
-        result.verification_time_ms = int((time.time() - start_time) * 1000)
-        return result
+        return result, None
 
-    # Step 3: MX record check
-    mx_records = check_mx_records(domain)
+    # Step 3: MX record check (already resolved by the health check)
+    mx_records = domain_health.mx_records
     if not mx_records:
         result.status = VerificationStatus.RISKY
         result.error_message = "No MX records (may use A record for mail)"
-        result.verification_time_ms = int((time.time() - start_time) * 1000)
-        return result
+        return result, None
 
     result.mx_host = mx_records[0]
+    return result, email
 
-    # Step 4: SMTP verification (if enabled)
-    if check_smtp:
-        smtp_status, smtp_response = _smtp_check(email, result.mx_host, smtp_timeout)
-        result.smtp_status = smtp_status
-        result.smtp_response = smtp_response
 
-        if smtp_status == SMTPStatus.DELIVERABLE:
-            result.status = VerificationStatus.VALID
-            result.is_valid = True
-            result.is_deliverable = True
-        elif smtp_status == SMTPStatus.CATCH_ALL:
-            result.status = VerificationStatus.RISKY
-            result.is_catch_all = True
-            result.is_deliverable = True  # Likely deliverable
-        elif smtp_status == SMTPStatus.UNDELIVERABLE:
-            result.status = VerificationStatus.INVALID
-            result.is_valid = False
-            result.is_deliverable = False
-        elif smtp_status == SMTPStatus.GREYLISTED:
-            result.status = VerificationStatus.RISKY
-            # Greylisting is temporary, email likely valid
-        elif smtp_status == SMTPStatus.TIMEOUT:
-            result.status = VerificationStatus.UNKNOWN
-            result.error_message = "SMTP timeout"
-        else:
-            result.status = VerificationStatus.UNKNOWN
-    else:
-        # Without SMTP check, assume valid if MX exists
-        result.status = VerificationStatus.RISKY
-        result.is_valid = True
+def _apply_smtp_status(result: EmailVerificationResult, smtp_status: SMTPStatus,
+                       smtp_response: Optional[str]) -> None:
+    """Step 4 of verify_email_deliverable: set the verdict from the SMTP check."""
+    result.smtp_status = smtp_status
+    result.smtp_response = smtp_response
 
-    result.verification_time_ms = int((time.time() - start_time) * 1000)
-    return result
+    if smtp_status == SMTPStatus.DELIVERABLE:
+        result.status = VerificationStatus.VALID
+        result.is_valid = True
+        result.is_deliverable = True
+    elif smtp_status == SMTPStatus.CATCH_ALL:
+        result.status = VerificationStatus.RISKY
+        result.is_catch_all = True
+        result.is_deliverable = True  # Likely deliverable
+    elif smtp_status == SMTPStatus.UNDELIVERABLE:
+        result.status = VerificationStatus.INVALID
+        result.is_valid = False
+        result.is_deliverable = False
+    elif smtp_status == SMTPStatus.GREYLISTED:
+        result.status = VerificationStatus.RISKY
+        # Greylisting is temporary, email likely valid
+    elif smtp_status == SMTPStatus.TIMEOUT:
+        result.status = VerificationStatus.UNKNOWN
+        result.error_message = "SMTP timeout"
+    else:
+        result.status = VerificationStatus.UNKNOWN
 
 
 def batch_verify_domains(
@@ -406,37 +547,20 @@ def batch_verify_domains(
     timeout: float = DNS_TIMEOUT
 ) -> List[DomainHealth]:
     """
-    Batch verify multiple domains.
+    Bulk verify multiple domains.
+
+    Runs on the asyncio verifier (verify_domains_bulk); must not be called
+    from a running event loop.
 
     Args:
         domains: List of domains to verify
         max_workers: Maximum concurrent verifications
-        timeout: DNS timeout per domain
+        timeout: DNS timeout per query
 
     Returns:
-        List of DomainHealth objects
+        List of DomainHealth objects (in completion order)
     """
-    results = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(verify_domain_health, domain, timeout): domain
-            for domain in domains
-        }
-
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                domain = futures[future]
-                results.append(DomainHealth(
-                    domain=domain,
-                    status=DomainHealthStatus.ERROR,
-                    error_message=str(e)
-                ))
-
-    return results
+    return verify_domains_bulk(domains, concurrency=max_workers, timeout=timeout)
 
 
 def batch_verify_emails(
@@ -448,34 +572,62 @@ def batch_verify_emails(
     """
     Bulk verify multiple email addresses.
 
+    DNS/MX checks run in a thread pool; SMTP checks then go through the
+    shared probe engine in one batch, so addresses on the same MX host share
+    sessions and each domain's catch-all test runs once.
+
     Args:
         emails: List of email addresses
         check_smtp: Whether to perform SMTP checks
-        max_workers: Maximum concurrent verifications
-        smtp_timeout: SMTP timeout per email
+        max_workers: Maximum concurrent DNS verifications
+        smtp_timeout: SMTP timeout per session
 
     Returns:
         List of EmailVerificationResult objects
     """
+    from .smtp_probe import get_smtp_probe_engine
+
+    start_time = time.time()
     results = []
+    ready: List[Tuple[EmailVerificationResult, str]] = []
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = {
-            executor.submit(verify_email_deliverable, email, check_smtp, smtp_timeout): email
+            executor.submit(_verify_email_dns, email): email
             for email in emails
         }
 
         for future in as_completed(futures):
             try:
-                result = future.result()
-                results.append(result)
+                result, address = future.result()
             except Exception as e:
                 email = futures[future]
-                results.append(EmailVerificationResult(
+                result, address = EmailVerificationResult(
                     email=email,
                     status=VerificationStatus.ERROR,
                     error_message=str(e)
-                ))
+                ), None
+
+            if address and check_smtp:
+                ready.append((result, address))
+                continue
+            if address:
+                result.status = VerificationStatus.RISKY
+                result.is_valid = True
+            result.verification_time_ms = int((time.time() - start_time) * 1000)
+            results.append(result)
+
+    if ready:
+        probes = get_smtp_probe_engine().probe_many(
+            [address for _, address in ready],
+            mx_hosts={address.split('@')[1]: result.mx_host for result, address in ready},
+            timeout=smtp_timeout
+        )
+        for result, address in ready:
+            probe = probes[address]
+            _apply_smtp_status(result, probe.status, probe.response)
+            result.verification_time_ms = int((time.time() - start_time) * 1000)
+            results.append(result)
 
     return results
 
@@ -534,84 +686,13 @@ def _smtp_check(
     """
     SMTP handshake verification.
 
-    Performs RCPT TO check without sending actual email.
-    """
-    try:
-        # Connect to SMTP server
-        smtp = smtplib.SMTP(timeout=timeout)
-        smtp.connect(mx_host, 25)
-
-        # Say hello
-        code, msg = smtp.helo("verify.local")
-        if code != 250:
-            smtp.quit()
-            return (SMTPStatus.BLOCKED, f"HELO rejected: {msg}")
-
-        # Set sender (use generic address)
-        code, msg = smtp.mail("verify@verify.local")
-        if code != 250:
-            smtp.quit()
-            return (SMTPStatus.BLOCKED, f"MAIL FROM rejected: {msg}")
-
-        # Check recipient
-        code, msg = smtp.rcpt(email)
-        smtp.quit()
-
-        if code == 250:
-            # Additional check: test invalid address to detect catch-all
-            return _detect_catch_all_smtp(email, mx_host, timeout)
-        elif code in [550, 551, 552, 553, 554]:
-            return (SMTPStatus.UNDELIVERABLE, f"RCPT TO rejected: {msg}")
-        elif code in [450, 451, 452]:
-            return (SMTPStatus.GREYLISTED, f"Temporary rejection: {msg}")
-        else:
-            return (SMTPStatus.ERROR, f"Unexpected response {code}: {msg}")
-
-    except smtplib.SMTPConnectError:
-        return (SMTPStatus.BLOCKED, "Connection refused")
-    except socket.timeout:
-        return (SMTPStatus.TIMEOUT, "Connection timed out")
-    except Exception as e:
-        logger.error(f"SMTP check error for {email}: {e}")
-        return (SMTPStatus.ERROR, str(e))
-
-
-def _detect_catch_all_smtp(
-    email: str,
-    mx_host: str,
-    timeout: float = SMTP_TIMEOUT
-) -> Tuple[SMTPStatus, Optional[str]]:
-    """
-    Detect if server is catch-all by testing invalid address.
+    Performs RCPT TO check without sending actual email, through the shared
+    probe engine (per-MX session limits, cached catch-all per domain).
     """
-    import random
-    import string
-
-    domain = email.split('@')[1]
-
-    # Generate random invalid address
-    random_local = ''.join(random.choices(string.ascii_lowercase + string.digits, k=20))
-    test_email = f"{random_local}@{domain}"
-
-    try:
-        smtp = smtplib.SMTP(timeout=timeout)
-        smtp.connect(mx_host, 25)
-        smtp.helo("verify.local")
-        smtp.mail("verify@verify.local")
-
-        code, msg = smtp.rcpt(test_email)
-        smtp.quit()
-
-        if code == 250:
-            # Server accepts invalid address - catch-all
-            return (SMTPStatus.CATCH_ALL, "Server accepts all addresses")
-        else:
-            # Server rejected invalid address - original email is deliverable
-            return (SMTPStatus.DELIVERABLE, "Email verified")
+    from .smtp_probe import get_smtp_probe_engine
 
-    except Exception:
-        # If detection fails, assume deliverable
-        return (SMTPStatus.DELIVERABLE, "Email likely valid")
+    probe = get_smtp_probe_engine().probe(email, mx_host, timeout)
+    return (probe.status, probe.response)
 
 
 # =============================================================================
@@ -630,6 +711,9 @@ __all__ = [
     "check_mx_records",
     "verify_domain_health",
     "check_catch_all",
+    "verify_domain_health_async",
+    "stream_domain_health",
+    "verify_domains_bulk",
     # Tool 8: Email Verifier Light
     "verify_email_deliverable",
     "batch_verify_domains",
@@ -18,11 +18,13 @@ Barton ID Format: 04.04.01.XX.XXXXX.XXX
 """
 
 import os
+import re
 import time
 import logging
 import hashlib
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -46,6 +48,9 @@ class NeonConfig:
     user: str = ""
     password: str = ""
     ssl_mode: str = "require"
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    pool_idle_timeout: float = 300.0
 
     @classmethod
     def from_env(cls) -> 'NeonConfig':
@@ -57,6 +62,9 @@ class NeonConfig:
             user=os.getenv("NEON_USER", ""),
             password=os.getenv("NEON_PASSWORD", ""),
             ssl_mode=os.getenv("NEON_SSL_MODE", "require"),
+            pool_min_size=int(os.getenv("NEON_POOL_MIN_SIZE", "1")),
+            pool_max_size=int(os.getenv("NEON_POOL_MAX_SIZE", "10")),
+            pool_idle_timeout=float(os.getenv("NEON_POOL_IDLE_TIMEOUT", "300")),
         )
 
     @property
@@ -73,6 +81,21 @@ class NeonConfig:
         """Check if configuration is valid."""
         return bool(self.host and self.database and self.user and self.password)
 
+    def get_pool(self):
+        """
+        Shared connection pool for this configuration.
+
+        One pool per connection string per process (src/sys/db/connection_pool),
+        so every writer and lookup reuses warm connections.
+        """
+        from src.sys.db.connection_pool import get_pool
+        return get_pool(
+            self.connection_string,
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            idle_timeout=self.pool_idle_timeout,
+        )
+
 
 # =============================================================================
 # WRITE RESULTS
@@ -103,6 +126,54 @@ class CompanyWriterStats:
     correlation_id: str = ""
 
 
+# =============================================================================
+# BULK UPSERT HELPERS
+# =============================================================================
+
+# Rows per multi-row INSERT statement in the batch writers
+DEFAULT_PAGE_SIZE = 1000
+
+_VALUES_CLAUSE = re.compile(r"VALUES\s*(\(.*\))\s*(?=ON CONFLICT)", re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _values_statement(upsert_sql: str) -> Tuple[str, str]:
+    """
+    Split a single-row UPSERT into an execute_values statement and template.
+
+    "INSERT ... VALUES (%(a)s, ...) ON CONFLICT ..." becomes
+    ("INSERT ... VALUES %s ON CONFLICT ...", "(%(a)s, ...)"), so the bulk
+    path always shares the single-row statement's conflict handling.
+    """
+    match = _VALUES_CLAUSE.search(upsert_sql)
+    if not match:
+        raise ValueError("UPSERT statement has no VALUES (...) ON CONFLICT clause")
+    bulk_sql = upsert_sql[:match.start(1)] + "%s " + upsert_sql[match.end(1):]
+    return bulk_sql, match.group(1)
+
+
+def _pages(rows: List[Dict[str, Any]], conflict_keys: Sequence[str],
+           page_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Split rows into pages of at most page_size rows.
+
+    Postgres rejects an INSERT ... ON CONFLICT DO UPDATE that touches the
+    same row twice, so a repeated conflict key starts a new page. Pages are
+    applied in order, matching the row-at-a-time result.
+    """
+    page: List[Dict[str, Any]] = []
+    seen = set()
+    for params in rows:
+        key = tuple(params.get(name) for name in conflict_keys)
+        if page and (len(page) >= page_size or key in seen):
+            yield page
+            page, seen = [], set()
+        page.append(params)
+        seen.add(key)
+    if page:
+        yield page
+
+
 # =============================================================================
 # COMPANY NEON WRITER
 # =============================================================================
@@ -257,17 +328,23 @@ class CompanyNeonWriter:
         LIMIT 10
     """
 
-    def __init__(self, config: NeonConfig = None):
-        """Initialize with Neon configuration."""
+    def __init__(self, config: NeonConfig = None, page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        Initialize with Neon configuration.
+
+        Args:
+            config: Neon connection configuration (default from env)
+            page_size: Rows per multi-row INSERT in the batch writers
+        """
         self.config = config or NeonConfig.from_env()
+        self.page_size = page_size
         self._connection = None
 
     def _get_connection(self):
-        """Get database connection (lazy initialization)."""
+        """Get database connection (lazy checkout from the shared pool)."""
         if self._connection is None or self._connection.closed:
             try:
-                import psycopg2
-                self._connection = psycopg2.connect(self.config.connection_string)
+                self._connection = self.config.get_pool().getconn()
                 self._connection.autocommit = False
             except ImportError:
                 logger.error("psycopg2 not installed. Run: pip install psycopg2-binary")
@@ -278,11 +355,67 @@ class CompanyNeonWriter:
         return self._connection
 
     def close(self):
-        """Close database connection."""
+        """Release database connection back to the pool."""
         if self._connection and not self._connection.closed:
             self._connection.close()
             self._connection = None
 
+    def _bulk_upsert(
+        self,
+        cursor,
+        upsert_sql: str,
+        rows: List[Dict[str, Any]],
+        conflict_keys: Sequence[str],
+        result: WriteResult,
+        page_size: Optional[int] = None
+    ) -> None:
+        """
+        Upsert rows one page per statement with per-row failure isolation.
+
+        Each page is sent as a single multi-row INSERT ... ON CONFLICT
+        (psycopg2 execute_values) inside a savepoint - one round trip per
+        page instead of per row. If a page fails it is rolled back to the
+        savepoint and replayed row by row, each row in its own savepoint,
+        so only the bad rows fail and the rest of the batch still commits.
+
+        Args:
+            cursor: Open cursor (caller commits)
+            upsert_sql: Single-row UPSERT statement
+            rows: Parameter dicts for upsert_sql
+            conflict_keys: Columns of the ON CONFLICT target
+            result: WriteResult to update (records_written/failed, errors)
+            page_size: Rows per statement (default self.page_size)
+        """
+        from psycopg2.extras import execute_values
+
+        bulk_sql, template = _values_statement(upsert_sql)
+
+        for page in _pages(rows, conflict_keys, max(1, page_size or self.page_size)):
+            cursor.execute("SAVEPOINT bulk_page")
+            try:
+                execute_values(cursor, bulk_sql, page, template=template, page_size=len(page))
+                cursor.execute("RELEASE SAVEPOINT bulk_page")
+                result.records_written += len(page)
+                continue
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT bulk_page")
+                logger.warning(f"Bulk page of {len(page)} rows failed, isolating rows: {e}")
+
+            for params in page:
+                cursor.execute("SAVEPOINT bulk_row")
+                try:
+                    cursor.execute(upsert_sql, params)
+                    cursor.execute("RELEASE SAVEPOINT bulk_row")
+                    result.records_written += 1
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT bulk_row")
+                    key = ", ".join(str(params.get(name)) for name in conflict_keys)
+                    logger.warning(f"Failed to write {result.table_name} row ({key}): {e}")
+                    result.records_failed += 1
+                    result.errors.append(f"({key}): {e}")
+
+            cursor.execute("RELEASE SAVEPOINT bulk_page")
+
     # -------------------------------------------------------------------------
     # WRITE OPERATIONS
     # -------------------------------------------------------------------------
@@ -349,19 +482,25 @@ class CompanyNeonWriter:
     def write_companies_batch(
         self,
         companies: List[Dict[str, Any]],
-        correlation_id: str
+        correlation_id: str,
+        page_size: Optional[int] = None
     ) -> WriteResult:
         """
         Batch upsert multiple companies to Neon.
 
+        Rows are sent page_size at a time in one statement; a failing row
+        only fails itself (see _bulk_upsert).
+
         Args:
             companies: List of company dictionaries
             correlation_id: MANDATORY - Pipeline trace ID
+            page_size: Rows per statement (default self.page_size)
 
         Returns:
             WriteResult with batch operation status
         """
-        validate_correlation_id(correlation_id)
+        process_id = "company.neon.write_companies_batch"
+        correlation_id = validate_correlation_id(correlation_id, process_id, "CompanyNeonWriter")
 
         start_time = time.time()
         result = WriteResult(success=False, table_name="marketing.company_master")
@@ -374,10 +513,11 @@ class CompanyNeonWriter:
             conn = self._get_connection()
             with conn.cursor() as cursor:
                 now = datetime.now()
+                rows = []
 
                 for company in companies:
                     try:
-                        params = {
+                        rows.append({
                             'company_unique_id': company.get('company_unique_id'),
                             'company_name': company.get('company_name'),
                             'domain': company.get('domain'),
@@ -390,14 +530,16 @@ class CompanyNeonWriter:
                             'data_quality_score': company.get('data_quality_score', 0.0),
                             'created_at': company.get('created_at', now),
                             'updated_at': now,
-                        }
-                        cursor.execute(self.UPSERT_COMPANY_SQL, params)
-                        result.records_written += 1
+                        })
                     except Exception as e:
-                        logger.warning(f"Failed to write company {company.get('company_unique_id')}: {e}")
+                        logger.warning(f"Failed to prepare company {company!r}: {e}")
                         result.records_failed += 1
                         result.errors.append(str(e))
 
+                self._bulk_upsert(
+                    cursor, self.UPSERT_COMPANY_SQL, rows,
+                    ('company_unique_id',), result, page_size
+                )
                 conn.commit()
                 result.success = result.records_failed == 0
 
@@ -608,8 +750,13 @@ class CompanyNeonWriter:
             logger.error(f"Failed to load company {company_id}: {e}")
         return None
 
-    def find_company_by_domain(self, domain: str) -> Optional[Dict[str, Any]]:
-        """Find company by domain (Tool 1: GOLD match)."""
+    def find_company_by_domain(self, domain: str,
+                               raise_errors: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find company by domain (Tool 1: GOLD match).
+
+        A failed query returns None like a miss unless raise_errors is set.
+        """
         try:
             conn = self._get_connection()
             with conn.cursor() as cursor:
@@ -622,10 +769,17 @@ class CompanyNeonWriter:
                     return dict(zip(columns, row))
         except Exception as e:
             logger.error(f"Failed to find company by domain: {e}")
+            if raise_errors:
+                raise
         return None
 
-    def find_company_by_ein(self, ein: str) -> Optional[Dict[str, Any]]:
-        """Find company by EIN (Tool 18: Exact EIN match)."""
+    def find_company_by_ein(self, ein: str,
+                            raise_errors: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find company by EIN (Tool 18: Exact EIN match).
+
+        A failed query returns None like a miss unless raise_errors is set.
+        """
         # Normalize EIN (remove hyphens, spaces)
         normalized_ein = ''.join(c for c in ein if c.isdigit())
 
@@ -641,10 +795,17 @@ class CompanyNeonWriter:
                     return dict(zip(columns, row))
         except Exception as e:
             logger.error(f"Failed to find company by EIN: {e}")
+            if raise_errors:
+                raise
         return None
 
-    def find_companies_by_name(self, company_name: str) -> List[Dict[str, Any]]:
-        """Find companies by name (for fuzzy matching candidates)."""
+    def find_companies_by_name(self, company_name: str,
+                               raise_errors: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find companies by name (for fuzzy matching candidates).
+
+        A failed query returns [] like a miss unless raise_errors is set.
+        """
         companies = []
         try:
             conn = self._get_connection()
@@ -657,6 +818,8 @@ class CompanyNeonWriter:
                     companies.append(dict(zip(columns, row)))
         except Exception as e:
             logger.error(f"Failed to find companies by name: {e}")
+            if raise_errors:
+                raise
         return companies
 
     # -------------------------------------------------------------------------
@@ -783,10 +946,12 @@ class CompanyNeonWriter:
     def write_slots_batch(
         self,
         slots: List[Dict[str, Any]],
-        correlation_id: str
+        correlation_id: str,
+        page_size: Optional[int] = None
     ) -> WriteResult:
-        """Batch upsert multiple slots to Neon."""
-        validate_correlation_id(correlation_id)
+        """Batch upsert multiple slots to Neon, page_size rows per statement."""
+        process_id = "company.neon.write_slots_batch"
+        correlation_id = validate_correlation_id(correlation_id, process_id, "CompanyNeonWriter")
 
         start_time = time.time()
         result = WriteResult(success=False, table_name="marketing.company_slot")
@@ -799,11 +964,12 @@ class CompanyNeonWriter:
             conn = self._get_connection()
             with conn.cursor() as cursor:
                 now = datetime.now()
+                rows = []
 
                 for slot in slots:
                     try:
                         is_filled = slot.get('is_filled', False)
-                        params = {
+                        rows.append({
                             'company_slot_unique_id': slot.get('company_slot_unique_id'),
                             'company_unique_id': slot.get('company_unique_id'),
                             'slot_type': slot.get('slot_type'),
@@ -813,14 +979,16 @@ class CompanyNeonWriter:
                             'last_refreshed_at': now,
                             'created_at': slot.get('created_at', now),
                             'updated_at': now,
-                        }
-                        cursor.execute(self.UPSERT_SLOT_SQL, params)
-                        result.records_written += 1
+                        })
                     except Exception as e:
-                        logger.warning(f"Failed to write slot: {e}")
+                        logger.warning(f"Failed to prepare slot: {e}")
                         result.records_failed += 1
                         result.errors.append(str(e))
 
+                self._bulk_upsert(
+                    cursor, self.UPSERT_SLOT_SQL, rows,
+                    ('company_unique_id', 'slot_type'), result, page_size
+                )
                 conn.commit()
                 result.success = result.records_failed == 0
 
@@ -1046,10 +1214,12 @@ class CompanyNeonWriter:
     def write_people_batch(
         self,
         people: List[Dict[str, Any]],
-        correlation_id: str
+        correlation_id: str,
+        page_size: Optional[int] = None
     ) -> WriteResult:
-        """Batch upsert multiple people to Neon."""
-        validate_correlation_id(correlation_id)
+        """Batch upsert multiple people to Neon, page_size rows per statement."""
+        process_id = "company.neon.write_people_batch"
+        correlation_id = validate_correlation_id(correlation_id, process_id, "CompanyNeonWriter")
 
         start_time = time.time()
         result = WriteResult(success=False, table_name="marketing.people_master")
@@ -1062,10 +1232,11 @@ class CompanyNeonWriter:
             conn = self._get_connection()
             with conn.cursor() as cursor:
                 now = datetime.now()
+                rows = []
 
                 for person in people:
                     try:
-                        params = {
+                        rows.append({
                             'person_unique_id': person.get('person_unique_id'),
                             'full_name': person.get('full_name'),
                             'first_name': person.get('first_name'),
@@ -1081,14 +1252,16 @@ class CompanyNeonWriter:
                             'data_quality_score': person.get('data_quality_score', 0.0),
                             'created_at': person.get('created_at', now),
                             'updated_at': now,
-                        }
-                        cursor.execute(self.UPSERT_PERSON_SQL, params)
-                        result.records_written += 1
+                        })
                     except Exception as e:
-                        logger.warning(f"Failed to write person: {e}")
+                        logger.warning(f"Failed to prepare person: {e}")
                         result.records_failed += 1
                         result.errors.append(str(e))
 
+                self._bulk_upsert(
+                    cursor, self.UPSERT_PERSON_SQL, rows,
+                    ('person_unique_id',), result, page_size
+                )
                 conn.commit()
                 result.success = result.records_failed == 0
 
@@ -1383,15 +1556,15 @@ def bootstrap_company_hub(hub) -> int:
     Returns:
         Number of companies loaded
     """
-    from .company_hub import CompanyHubRecord
+    from ..middle.company_hub import CompanyHubRecord
 
     writer = CompanyNeonWriter()
     companies = writer.load_all_companies()
     writer.close()
 
-    loaded = 0
+    records = []
     for company_data in companies:
-        record = CompanyHubRecord(
+        records.append(CompanyHubRecord(
             company_unique_id=company_data['company_unique_id'],
             company_name=company_data['company_name'],
             domain=company_data.get('domain'),
@@ -1404,9 +1577,10 @@ def bootstrap_company_hub(hub) -> int:
             data_quality_score=company_data.get('data_quality_score', 0.0),
             created_at=company_data.get('created_at'),
             updated_at=company_data.get('updated_at'),
-        )
-        if hub.add_company(record):
-            loaded += 1
+        ))
+
+    # Bulk add: index every record, recompute hub metrics once
+    loaded = hub.add_companies(records)
 
     logger.info(f"Bootstrapped CompanyHub with {loaded} companies from Neon")
     return loaded
@@ -51,6 +51,10 @@ if sys.platform == "win32":
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.extensions
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+from src.sys.db.connection_pool import get_pool
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -76,16 +80,18 @@ SIGNALS: Dict[str, Dict[str, Any]] = {
 }
 
 # ---------------------------------------------------------------------------
-# DB connection (identical to run_coverage.py:47-54)
+# DB connection (pooled - see src/sys/db/connection_pool.py)
 # ---------------------------------------------------------------------------
 def get_connection():
-    return psycopg2.connect(
+    """Pooled Neon connection; close() returns it to the shared pool."""
+    dsn = psycopg2.extensions.make_dsn(
         host=os.environ["NEON_HOST"],
         dbname=os.environ["NEON_DATABASE"],
         user=os.environ["NEON_USER"],
         password=os.environ["NEON_PASSWORD"],
         sslmode="require",
     )
+    return get_pool(dsn).getconn()
 
 
 # ---------------------------------------------------------------------------
@@ -16,12 +16,16 @@ Matching Strategy (per spec):
 """
 
 import os
+import sys
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import argparse
 import re
 from datetime import datetime, timezone
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+from ops.caching import cached_normalizer
+
 NEON_CONFIG = {
     'host': os.environ['NEON_HOST'],
     'port': 5432,
@@ -31,8 +35,9 @@ NEON_CONFIG = {
     'sslmode': 'require'
 }
 
+@cached_normalizer("dol.ein_matcher_v2.company_name")
 def normalize_company_name(name):
-    """Normalize company name for better matching."""
+    """Normalize company name for better matching (memoized, see ops.caching)."""
     if not name:
         return ''
     
@@ -6,6 +6,7 @@ Data importers for DOL filings.
 - import_5500.py: Import Form 5500 data
 - import_5500_sf.py: Import Form 5500-SF data
 - import_schedule_a.py: Import Schedule A data
+- copy_stream.py: Streaming COPY source shared by the CSV loaders
 """
 
 from .import_5500 import Import5500
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Streaming COPY Source for DOL Imports
+=====================================
+Feeds COPY ... FROM STDIN straight from a row iterator instead of an
+in-memory StringIO holding the whole CSV.
+
+CopyRowStream is a read-only file-like object: each read() formats just
+enough rows (DEFAULT_CHUNK_ROWS at a time) to answer it, so psycopg2 sends
+the first chunk while later rows are still being parsed and memory stays
+bounded by one chunk, whatever the file size.
+
+CopyRecordStream does the same for records that are already CSV text:
+passthrough_csv() hands over each record of a file as written, so quoting
+survives (with NULL '', an unquoted empty field loads as NULL and a quoted
+"" as the empty string, exactly as if the file were COPYed directly).
+
+Used by:
+  - import_dol_year.load_csv_to_table        (projected FOIA CSVs)
+  - import_schedules_cdhgi.load_csv_to_table (schedule CSVs, passed through)
+  - import_5500.load_to_neon                 (DataFrame rows)
+
+Usage:
+  rows = project_csv(csv_path, columns=[0, 3, 4], width=len(header), constants=["2024"])
+  count = copy_rows(cur, "COPY dol.form_5500 (ack_id, ...) FROM STDIN WITH (FORMAT csv, NULL '')", rows)
+
+  records = passthrough_csv(csv_path, width=len(header))
+  count = copy_records(cur, "COPY dol.schedule_c (ack_id, ...) FROM STDIN WITH (FORMAT csv, NULL '')", records)
+"""
+
+import csv
+from io import StringIO
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+# Rows formatted per refill of the stream buffer
+DEFAULT_CHUNK_ROWS = 5000
+
+# Bytes psycopg2 asks for per read() during copy_expert (its default is 8 KiB)
+COPY_READ_SIZE = 256 * 1024
+
+
+class CopyRowStream:
+    """
+    File-like COPY source that CSV-encodes rows on demand.
+
+    rows_sent counts the rows handed to COPY so far.
+    """
+
+    def __init__(self, rows: Iterable[Sequence], chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self._rows = iter(rows)
+        self._chunk_rows = chunk_rows
+        self._chunk = StringIO()
+        self._writer = csv.writer(self._chunk, lineterminator="\n")
+        self._pending = ""
+        self._pos = 0
+        self._exhausted = False
+        self.rows_sent = 0
+
+    def _refill(self) -> None:
+        """Append the next chunk of formatted rows to the unread buffer."""
+        self._chunk.seek(0)
+        self._chunk.truncate()
+        written = 0
+        for row in self._rows:
+            self._write(row)
+            written += 1
+            if written >= self._chunk_rows:
+                break
+        else:
+            self._exhausted = True
+        self.rows_sent += written
+        self._pending = self._pending[self._pos:] + self._chunk.getvalue()
+        self._pos = 0
+
+    def _write(self, row: Sequence) -> None:
+        self._writer.writerow(row)
+
+    def _available(self) -> int:
+        return len(self._pending) - self._pos
+
+    def read(self, size: int = -1) -> str:
+        if size is None or size < 0:
+            while not self._exhausted:
+                self._refill()
+            size = self._available()
+
+        while self._available() < size and not self._exhausted:
+            self._refill()
+        data = self._pending[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        while self._pending.find("\n", self._pos) < 0 and not self._exhausted:
+            self._refill()
+        newline = self._pending.find("\n", self._pos)
+        end = newline + 1 if newline >= 0 else len(self._pending)
+        if size is not None and 0 <= size < end - self._pos:
+            end = self._pos + size
+        data = self._pending[self._pos:end]
+        self._pos = end
+        return data
+
+
+class CopyRecordStream(CopyRowStream):
+    """CopyRowStream over records that are already CSV text (one per line)."""
+
+    def _write(self, record: str) -> None:
+        self._chunk.write(record)
+
+
+def _raw_records(f) -> Iterator[Tuple[List[str], str]]:
+    """Yield (parsed row, raw text) for each CSV record of f, terminator included."""
+    lines: List[str] = []
+
+    def consumed():
+        for line in f:
+            lines.append(line)
+            yield line
+
+    # csv.reader pulls lines only until the current record is complete
+    for row in csv.reader(consumed()):
+        raw = "".join(lines)
+        lines.clear()
+        yield row, raw
+
+
+def passthrough_csv(csv_path: Path, width: int) -> Iterator[str]:
+    """
+    Yield each data record of csv_path unchanged, as one COPY line.
+
+    The header record is skipped; records shorter than width get empty
+    fields appended (NULL under NULL ''). Quoted fields, including "",
+    are passed through as written.
+
+    Raises:
+        ValueError: If a record has more than width fields (COPY would
+            reject it as extra data; nothing is dropped silently)
+    """
+    with open(csv_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        records = _raw_records(f)
+        next(records, None)
+        record_no = 1
+        for row, raw in records:
+            record_no += 1
+            if len(row) > width:
+                raise ValueError(
+                    f"{csv_path.name}: record {record_no} has {len(row)} fields, expected {width}"
+                )
+            yield raw.rstrip("\r\n") + "," * (width - max(len(row), 1)) + "\n"
+
+
+def project_csv(
+    csv_path: Path,
+    columns: List[int],
+    width: int,
+    constants: Sequence[str] = ()
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield each data row of csv_path as (row[i] for i in columns) + constants.
+
+    The header line is skipped; rows shorter than width are padded with ''.
+    """
+    constants = tuple(constants)
+    if len(columns) == 1:
+        index = columns[0]
+        project = lambda row: (row[index],)
+    else:
+        project = itemgetter(*columns)
+    with open(csv_path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield project(row) + constants
+
+
+def copy_rows(
+    cur,
+    copy_sql: str,
+    rows: Iterable[Sequence],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> int:
+    """COPY rows through a CopyRowStream. Returns the number of rows sent."""
+    stream = CopyRowStream(rows, chunk_rows=chunk_rows)
+    cur.copy_expert(copy_sql, stream, size=COPY_READ_SIZE)
+    return stream.rows_sent
+
+
+def copy_records(
+    cur,
+    copy_sql: str,
+    records: Iterable[str],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> int:
+    """COPY CSV-text records through a CopyRecordStream. Returns the number sent."""
+    stream = CopyRecordStream(records, chunk_rows=chunk_rows)
+    cur.copy_expert(copy_sql, stream, size=COPY_READ_SIZE)
+    return stream.rows_sent
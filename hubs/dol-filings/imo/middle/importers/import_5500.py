@@ -21,6 +21,11 @@ from pathlib import Path
 from typing import Optional
 import logging
 
+try:
+    from .copy_stream import copy_rows
+except ImportError:  # run as a script from this directory
+    from copy_stream import copy_rows
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -45,7 +50,6 @@ def load_to_neon(df: pd.DataFrame, table_name: str = "form_5500_staging") -> boo
     try:
         import psycopg2
         from psycopg2 import sql
-        from io import StringIO
     except ImportError:
         logger.error("psycopg2 not installed. Run: pip install psycopg2-binary")
         return False
@@ -154,18 +158,18 @@ def load_to_neon(df: pd.DataFrame, table_name: str = "form_5500_staging") -> boo
         # Use COPY for efficient bulk insert
         logger.info(f"Loading {len(df):,} records to marketing.{table_name}...")
 
-        # Write DataFrame to in-memory buffer
-        buffer = StringIO()
-        df.to_csv(buffer, index=False, header=False)
-        buffer.seek(0)
-
         # Get column list
         columns = df.columns.tolist()
 
-        # COPY from buffer
-        cur.copy_expert(
+        # Stream rows into COPY chunk by chunk (NaN -> NULL, as to_csv wrote it)
+        rows = (
+            [None if pd.isna(value) else value for value in row]
+            for row in df.itertuples(index=False, name=None)
+        )
+        copy_rows(
+            cur,
             f"COPY marketing.{table_name} ({', '.join(columns)}) FROM STDIN WITH CSV",
-            buffer
+            rows
         )
         conn.commit()
 
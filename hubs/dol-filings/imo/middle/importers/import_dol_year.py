@@ -17,9 +17,15 @@ Usage:
   doppler run -- python import_dol_year.py --year 2024 --create-new-tables --load --verify
   doppler run -- python import_dol_year.py --year 2025 --load --verify
   doppler run -- python import_dol_year.py --year 2024 --load --table form_5500
+  doppler run -- python import_dol_year.py --year 2024 --load --workers 4
   doppler run -- python import_dol_year.py --year 2024 --verify
 
 Reusable for 2023, 2024, 2025, 2026 … just pass --year.
+
+CSVs are streamed into COPY (copy_stream.CopyRowStream): rows are projected
+and sent chunk by chunk, so memory stays flat for multi-GB files. With
+--workers N, up to N tables load at once, each in its own process on its
+own connection.
 """
 
 import os
@@ -28,8 +34,13 @@ import csv
 import time
 import argparse
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from io import StringIO
+
+try:
+    from .copy_stream import copy_rows, project_csv
+except ImportError:  # run as a script from this directory
+    from copy_stream import copy_rows, project_csv
 
 logging.basicConfig(
     level=logging.INFO,
@@ -201,6 +212,14 @@ def get_connection():
     return psycopg2.connect(conn_string)
 
 
+def start_import_session(conn):
+    """Disable read-only triggers for this connection (dol.import_mode)."""
+    cur = conn.cursor()
+    cur.execute("SET session \"dol.import_mode\" = 'active';")
+    conn.commit()
+    cur.close()
+
+
 def get_table_columns(conn, table_name: str) -> list[str]:
     """Return ordered list of column names for dol.{table_name}."""
     cur = conn.cursor()
@@ -246,7 +265,8 @@ def load_csv_to_table(conn, table_name: str, csv_path: Path, year: str) -> int:
     1. Read CSV header columns (uppercase in file)
     2. Get existing table columns from DB
     3. Find intersection (CSV cols that exist in table), lowercased
-    4. Stream CSV data with form_year=<year> appended via COPY
+    4. Stream projected rows (form_year=<year> appended) into COPY,
+       chunk by chunk, while the CSV is still being read
 
     For tables with existing data from other years, this APPENDS.
     For same-year re-runs, clear_year() is called first (idempotent).
@@ -312,42 +332,17 @@ def load_csv_to_table(conn, table_name: str, csv_path: Path, year: str) -> int:
     logger.info(f"    CSV cols: {len(csv_header_lower)}, DB cols: {len(table_cols)}, "
                 f"Matched: {len(load_map)}")
 
-    # 4. Stream data through StringIO
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    row_count = 0
+    # 4. Project rows: matched columns, duplicated aliases, then form_year
+    columns = [idx for idx, _ in load_map] + [src_idx for src_idx, _ in extra_dupe_cols]
+    constants = [year] if not csv_has_form_year and "form_year" in table_cols_set else []
+    rows = project_csv(csv_path, columns, width=len(csv_header_raw), constants=constants)
 
-    with open(csv_path, "r", encoding="utf-8", errors="replace") as f:
-        reader = csv.reader(f)
-        next(reader)  # skip header
-
-        for row in reader:
-            # Pad short rows
-            while len(row) < len(csv_header_raw):
-                row.append("")
-
-            # Extract only matched columns
-            out_row = [row[idx] for idx, _ in load_map]
-
-            # Append duplicated alias columns
-            for src_idx, _ in extra_dupe_cols:
-                out_row.append(row[src_idx])
-
-            # Append form_year if not in CSV
-            if not csv_has_form_year and "form_year" in table_cols_set:
-                out_row.append(year)
-
-            writer.writerow(out_row)
-            row_count += 1
-
-    buffer.seek(0)
-
-    # 5. COPY into table
+    # 5. COPY into table (parsing and sending overlap)
     copy_sql = (
         f"COPY dol.{table_name} ({col_list_sql}) "
         f"FROM STDIN WITH (FORMAT csv, NULL '', DELIMITER ',')"
     )
-    cur.copy_expert(copy_sql, buffer)
+    row_count = copy_rows(cur, copy_sql, rows)
     conn.commit()
 
     # 6. Verify count for this year
@@ -359,6 +354,78 @@ def load_csv_to_table(conn, table_name: str, csv_path: Path, year: str) -> int:
     return db_count
 
 
+def resolve_csv_path(data_dir: Path, subfolder: str, csv_file: str):
+    """Return the CSV path (case-insensitive filename match) or None."""
+    csv_path = data_dir / subfolder / csv_file
+    if csv_path.exists():
+        return csv_path
+    parent = data_dir / subfolder
+    if parent.exists():
+        for f in parent.iterdir():
+            if f.name.lower() == csv_file.lower():
+                return f
+    return None
+
+
+def load_table(conn, table_name: str, csv_path: Path, year: str) -> dict:
+    """Clear the year and load one CSV; returns its manifest entry."""
+    start = time.time()
+    try:
+        # Clear existing data for this year (idempotent re-run)
+        clear_year(conn, table_name, year)
+        count = load_csv_to_table(conn, table_name, csv_path, year)
+        return {
+            "status": "OK",
+            "file": csv_path.name,
+            "rows": count,
+            "seconds": round(time.time() - start, 1),
+        }
+    except Exception as e:
+        logger.error(f"  ✗ FAILED: dol.{table_name}: {e}")
+        conn.rollback()
+        return {"status": "FAILED", "file": csv_path.name, "error": str(e)}
+
+
+def _load_table_worker(table_name: str, csv_path: Path, year: str) -> dict:
+    """Process-pool entry point: one table on its own connection."""
+    try:
+        conn = get_connection()
+        start_import_session(conn)
+    except Exception as e:
+        logger.error(f"  ✗ FAILED: dol.{table_name}: could not connect: {e}")
+        return {"status": "FAILED", "file": csv_path.name, "error": str(e)}
+    try:
+        return load_table(conn, table_name, csv_path, year)
+    finally:
+        conn.close()
+
+
+def load_tables(conn, jobs: list, year: str, workers: int = 1) -> dict:
+    """
+    Load [(table_name, csv_path), ...]; returns {table_name: manifest entry}.
+
+    workers=1 loads in order on conn. workers>1 loads up to that many tables
+    at once, each in its own process with its own connection.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return {table_name: load_table(conn, table_name, csv_path, year) for table_name, csv_path in jobs}
+
+    manifest = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {
+            pool.submit(_load_table_worker, table_name, csv_path, year): (table_name, csv_path)
+            for table_name, csv_path in jobs
+        }
+        for future in as_completed(futures):
+            table_name, csv_path = futures[future]
+            try:
+                manifest[table_name] = future.result()
+            except Exception as e:
+                logger.error(f"  ✗ FAILED: dol.{table_name}: {e}")
+                manifest[table_name] = {"status": "FAILED", "file": csv_path.name, "error": str(e)}
+    return {table_name: manifest[table_name] for table_name, _ in jobs}
+
+
 def verify_year(conn, year: str, csv_map: dict):
     """Post-load verification for the given year."""
     cur = conn.cursor()
@@ -459,6 +526,10 @@ def main():
         "--table", type=str,
         help="Load only a specific table (e.g. form_5500, schedule_c)"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Tables to load in parallel, each on its own connection (default 1)"
+    )
     args = parser.parse_args()
 
     year = args.year
@@ -481,10 +552,7 @@ def main():
 
     conn = get_connection()
     # Disable read-only triggers for import
-    cur = conn.cursor()
-    cur.execute("SET session \"dol.import_mode\" = 'active';")
-    conn.commit()
-    cur.close()
+    start_import_session(conn)
     logger.info("Connected to Neon. Import mode: active")
 
     try:
@@ -507,45 +575,16 @@ def main():
                     sys.exit(1)
                 tables_to_load = [(args.table, csv_map[args.table])]
 
+            jobs = []
             for table_name, (subfolder, csv_file) in tables_to_load:
-                csv_path = data_dir / subfolder / csv_file
-
-                # Case-insensitive file search
-                if not csv_path.exists():
-                    found = None
-                    parent = data_dir / subfolder
-                    if parent.exists():
-                        for f in parent.iterdir():
-                            if f.name.lower() == csv_file.lower():
-                                found = f
-                                break
-                    if found:
-                        csv_path = found
-                    else:
-                        logger.warning(f"  ⊘ SKIPPED (no CSV): dol.{table_name} — {csv_file}")
-                        manifest[table_name] = {"status": "SKIPPED", "file": csv_file}
-                        continue
-
-                start = time.time()
-                try:
-                    # Clear existing data for this year (idempotent re-run)
-                    clear_year(conn, table_name, year)
-                    count = load_csv_to_table(conn, table_name, csv_path, year)
-                    elapsed = round(time.time() - start, 1)
-                    manifest[table_name] = {
-                        "status": "OK",
-                        "file": csv_file,
-                        "rows": count,
-                        "seconds": elapsed,
-                    }
-                except Exception as e:
-                    logger.error(f"  ✗ FAILED: dol.{table_name}: {e}")
-                    conn.rollback()
-                    manifest[table_name] = {
-                        "status": "FAILED",
-                        "file": csv_file,
-                        "error": str(e),
-                    }
+                csv_path = resolve_csv_path(data_dir, subfolder, csv_file)
+                if csv_path is None:
+                    logger.warning(f"  ⊘ SKIPPED (no CSV): dol.{table_name} — {csv_file}")
+                    manifest[table_name] = {"status": "SKIPPED", "file": csv_file}
+                    continue
+                jobs.append((table_name, csv_path))
+
+            manifest.update(load_tables(conn, jobs, year, workers=args.workers))
 
             total_elapsed = round(time.time() - start_all, 1)
             total_rows = sum(
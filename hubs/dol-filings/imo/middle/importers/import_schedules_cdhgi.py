@@ -44,7 +44,11 @@ import time
 import argparse
 import logging
 from pathlib import Path
-from io import StringIO
+
+try:
+    from .copy_stream import copy_records, passthrough_csv
+except ImportError:  # run as a script from this directory
+    from copy_stream import copy_records, passthrough_csv
 
 logging.basicConfig(
     level=logging.INFO,
@@ -757,6 +761,8 @@ def load_csv_to_table(conn, table_name: str, csv_path: Path) -> int:
     """
     Bulk-load a CSV into dol.{table_name} using COPY.
     Reads CSV header to build column list dynamically.
+    Records are streamed into COPY as written (short rows padded, rows with
+    extra columns rejected) via copy_stream.
     Returns row count loaded.
     """
     cur = conn.cursor()
@@ -769,15 +775,12 @@ def load_csv_to_table(conn, table_name: str, csv_path: Path) -> int:
     # Columns to load = CSV columns (original, lowered)
     col_list = ", ".join(header)
 
-    # Use COPY with StringIO for efficient bulk load
+    # Stream records into COPY chunk by chunk, quoting untouched
     logger.info(f"  Loading {csv_path.name} -> dol.{table_name} ({len(header)} cols)...")
 
-    with open(csv_path, 'r', encoding='utf-8', errors='replace') as f:
-        # Skip header
-        next(f)
-        # Use copy_expert for flexibility
-        copy_sql = f"COPY dol.{table_name} ({col_list}) FROM STDIN WITH (FORMAT csv, NULL '', DELIMITER ',')"
-        cur.copy_expert(copy_sql, f)
+    records = passthrough_csv(csv_path, width=len(header))
+    copy_sql = f"COPY dol.{table_name} ({col_list}) FROM STDIN WITH (FORMAT csv, NULL '', DELIMITER ',')"
+    copy_records(cur, copy_sql, records)
 
     conn.commit()
 
@@ -6,12 +6,14 @@ Core business logic for Outreach Execution Hub.
 Components:
     - outreach_hub.py: Core hub logic for campaign execution
     - marketing_safety_gate.py: HARD FAIL safety enforcement (MANDATORY)
+    - audit_sink.py: Buffered, write-ahead backed send attempt audit writer
 """
 
 from .outreach_hub import OutreachSpoke as OutreachHub
 from .marketing_safety_gate import (
     MarketingSafetyGate,
     MarketingEligibilityResult,
+    EligibilityBatchResult,
     SendAttemptAuditRecord,
     SendAttemptStatus,
     # HARD FAIL errors
@@ -21,12 +23,14 @@ from .marketing_safety_gate import (
     ActiveOverrideError,
     EligibilityCheckError,
 )
+from .audit_sink import SendAttemptAuditSink
 
 __all__ = [
     'OutreachHub',
     # Safety Gate (ENFORCEMENT - MANDATORY)
     'MarketingSafetyGate',
     'MarketingEligibilityResult',
+    'EligibilityBatchResult',
     'SendAttemptAuditRecord',
     'SendAttemptStatus',
     # HARD FAIL errors
@@ -35,4 +39,6 @@ __all__ = [
     'MarketingDisabledError',
     'ActiveOverrideError',
     'EligibilityCheckError',
+    # Audit
+    'SendAttemptAuditSink',
 ]
@@ -0,0 +1,467 @@
+"""
+Send Attempt Audit Sink — Buffered, Batched, Append-Only
+========================================================
+
+Doctrine: CL Parent-Child v1.1
+Hub ID: outreach-execution
+Purpose: Take outreach.send_attempt_audit commits off the send path
+
+MarketingSafetyGate writes one audit record per send attempt. Without a sink
+each record is an INSERT plus a commit on the caller's thread. With a sink:
+
+    1. append() writes the record to a local write-ahead file and fsyncs it
+       (the record is durable before the send proceeds)
+    2. A background thread flushes buffered records every flush_interval
+       seconds, or as soon as batch_size are waiting, with ONE multi-row
+       INSERT ... ON CONFLICT (audit_id) DO NOTHING and one commit
+    3. After the commit the flushed write-ahead segment is deleted
+
+On start, segments left behind by a crash are replayed. audit_id is the
+primary key, so a record committed just before the crash is not duplicated.
+Each open segment holds an advisory lock, so a sink sharing wal_dir with a
+live process never replays (or deletes) that process's segments.
+The table stays append-only: the sink never updates or deletes rows.
+
+If a batch is rejected because of its rows (bad value, constraint
+violation) it is bisected; the rows the database keeps rejecting go to
+dead-letter.jsonl in wal_dir and the rest are committed. Any other error
+(connection lost) keeps the batch for the next flush. At most max_pending
+records wait for a commit; beyond that append() blocks until a flush
+catches up.
+
+Usage:
+    sink = SendAttemptAuditSink(lambda: psycopg2.connect(dsn), wal_dir="/var/lib/outreach/audit")
+    sink.start()
+    gate = MarketingSafetyGate(db_connection, audit_sink=sink)
+    ...
+    sink.close()   # final flush
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:     # Windows: no advisory locks, one sink per wal_dir
+    fcntl = None
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+# Column order of every buffered row, write-ahead line and INSERT
+AUDIT_COLUMNS = (
+    'audit_id',
+    'company_unique_id',
+    'campaign_id',
+    'effective_tier',
+    'computed_tier',
+    'override_snapshot',
+    'status',
+    'failure_reason',
+    'correlation_id',
+    'created_at',
+)
+
+AUDIT_INSERT_SQL = f"""
+    INSERT INTO outreach.send_attempt_audit ({', '.join(AUDIT_COLUMNS)})
+    VALUES %s
+    ON CONFLICT (audit_id) DO NOTHING
+"""
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_PENDING = 100000
+
+WAL_SUFFIX = ".wal"
+DEAD_LETTER_FILE = "dead-letter.jsonl"
+
+# Errors caused by the rows themselves: retrying the same rows cannot succeed
+ROW_ERRORS = (psycopg2.DataError, psycopg2.IntegrityError)
+
+
+def audit_row(record) -> List[Any]:
+    """SendAttemptAuditRecord -> row in AUDIT_COLUMNS order (JSON-safe)."""
+    data = record.to_dict()
+    data['override_snapshot'] = json.dumps(data['override_snapshot'] or {})
+    data['created_at'] = data['created_at'].isoformat()
+    return [data[column] for column in AUDIT_COLUMNS]
+
+
+def _try_lock(handle) -> bool:
+    """Take an exclusive advisory lock on an open file without blocking."""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+class _Segment:
+    """A write-ahead file, its locked handle and the rows it holds."""
+
+    __slots__ = ('path', 'handle', 'rows')
+
+    def __init__(self, path: Path, handle, rows: Optional[List[List[Any]]] = None):
+        self.path = path
+        self.handle = handle
+        self.rows = rows if rows is not None else []
+
+    def release(self) -> None:
+        """Close the handle (drops the lock); the file stays for recovery."""
+        if not self.handle.closed:
+            self.handle.close()
+
+    def discard(self) -> None:
+        """Delete the file, then drop the lock."""
+        self.path.unlink(missing_ok=True)
+        self.release()
+
+
+class SendAttemptAuditSink:
+    """
+    Background writer for SendAttemptAuditRecord.
+
+    Thread-safe: any number of send threads may call append(). The sink owns
+    its database connection (opened with connection_factory) so background
+    commits never interleave with the caller's transaction.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], Any],
+        wal_dir: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        fsync: bool = True,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        """
+        Initialize audit sink.
+
+        Args:
+            connection_factory: Returns a new database connection
+            wal_dir: Directory for write-ahead segments (created if missing)
+            batch_size: Buffered records that trigger an early flush
+            flush_interval: Max seconds a record waits before being flushed
+            fsync: fsync the write-ahead file on every append (disable only
+                where losing the last few records on power loss is acceptable)
+            max_pending: Uncommitted records held in memory before append()
+                blocks (backpressure while the database is unavailable)
+        """
+        self._connection_factory = connection_factory
+        self._conn = None
+        self._wal_dir = Path(wal_dir)
+        self._wal_dir.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._fsync = fsync
+        self._max_pending = max(1, max_pending)
+
+        # _lock guards segments, buffer and stats; _flush_lock serializes flushes
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._drained = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._segment_seq = 0
+        self._segment: Optional[_Segment] = None
+        self._buffer: List[List[Any]] = []
+        # Sealed segments waiting for a successful commit, oldest first
+        self._sealed: List[_Segment] = []
+        self._pending = 0
+
+        self.stats = {
+            'appended': 0,
+            'flushed': 0,
+            'flushes': 0,
+            'failed_flushes': 0,
+            'replayed': 0,
+            'dead_lettered': 0,
+            'backpressure_waits': 0,
+        }
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self) -> "SendAttemptAuditSink":
+        """Replay leftover segments, open a new one and start the flush thread."""
+        self._recover()
+        with self._lock:
+            self._open_segment()
+        self._thread = threading.Thread(target=self._run, name="send-audit-sink", daemon=True)
+        self._thread.start()
+        if self._sealed:
+            self._wake.set()
+        return self
+
+    def close(self) -> None:
+        """Stop the flush thread and flush everything still buffered."""
+        with self._lock:
+            self._stopping = True
+            self._drained.notify_all()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._lock:
+            if self._segment is not None:
+                if not self._buffer and self._segment.path.stat().st_size == 0:
+                    self._segment.discard()
+                else:
+                    self._segment.release()
+                self._segment = None
+            # Unflushed segments stay on disk, unlocked, for the next start()
+            for segment in self._sealed:
+                segment.release()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "SendAttemptAuditSink":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # =========================================================================
+    # SEND PATH
+    # =========================================================================
+
+    def append(self, record) -> None:
+        """
+        Durably record one audit record; returns once it is on local disk.
+
+        DOCTRINE: the audit record exists BEFORE the send. The database
+        INSERT happens later, on the flush thread. Blocks while max_pending
+        records are already waiting for a commit.
+        """
+        row = audit_row(record)
+        line = json.dumps(row) + "\n"
+        with self._lock:
+            if self._segment is None:
+                raise RuntimeError("SendAttemptAuditSink.append() before start()")
+            if self._pending >= self._max_pending:
+                self.stats['backpressure_waits'] += 1
+                while self._pending >= self._max_pending and not self._stopping:
+                    self._wake.set()
+                    self._drained.wait(self._flush_interval)
+            handle = self._segment.handle
+            handle.write(line)
+            handle.flush()
+            if self._fsync:
+                os.fsync(handle.fileno())
+            self._buffer.append(row)
+            self._pending += 1
+            self.stats['appended'] += 1
+            full = len(self._buffer) >= self._batch_size
+        if full:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        """Records appended but not yet committed to the database."""
+        with self._lock:
+            return self._pending
+
+    # =========================================================================
+    # FLUSH
+    # =========================================================================
+
+    def flush(self) -> int:
+        """
+        Commit everything appended so far. Returns records committed.
+
+        On a database error the rows stay buffered (and on disk) and are
+        retried by the next flush. Rows the database rejects on their own
+        are moved to the dead-letter file instead.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._buffer:
+                    self._segment.rows = self._buffer
+                    self._sealed.append(self._segment)
+                    self._buffer = []
+                    self._open_segment()
+                sealed = list(self._sealed)
+
+            flushed = 0
+            for segment in sealed:
+                committed = self._commit_segment(segment)
+                if committed is None:
+                    break
+                segment.discard()
+                with self._lock:
+                    self._sealed.pop(0)
+                    self._pending -= len(segment.rows)
+                    self._drained.notify_all()
+                flushed += committed
+            return flushed
+
+    def _commit_segment(self, segment: _Segment) -> Optional[int]:
+        """Insert a segment's rows; None if it must be retried later."""
+        rows = segment.rows
+        if not rows:
+            return 0
+        error = self._insert(rows)
+        if error is None:
+            return len(rows)
+        if not isinstance(error, ROW_ERRORS):
+            logger.error(f"AUDIT_SINK: Flush of {len(rows)} records failed, will retry: {error}")
+            return None
+
+        logger.warning(f"AUDIT_SINK: Batch of {len(rows)} records rejected, isolating bad rows: {error}")
+        dead: List[Tuple[List[Any], str]] = []
+        if not self._isolate(rows, error, dead):
+            logger.error(f"AUDIT_SINK: Database unavailable while isolating bad rows in {segment.path.name}, will retry")
+            return None
+        self._dead_letter(dead)
+        return len(rows) - len(dead)
+
+    def _isolate(self, rows: List[List[Any]], error: Exception,
+                 dead: List[Tuple[List[Any], str]]) -> bool:
+        """
+        Bisect rows rejected with error, committing the good halves.
+
+        Rows that still fail alone are added to dead. Returns False if a
+        non-row error (connection lost) interrupts the search.
+        """
+        if len(rows) == 1:
+            dead.append((rows[0], str(error)))
+            return True
+        middle = len(rows) // 2
+        for half in (rows[:middle], rows[middle:]):
+            half_error = self._insert(half)
+            if half_error is None:
+                continue
+            if not isinstance(half_error, ROW_ERRORS):
+                return False
+            if not self._isolate(half, half_error, dead):
+                return False
+        return True
+
+    def _dead_letter(self, dead: List[Tuple[List[Any], str]]) -> None:
+        """Append rejected rows (with the database error) to the dead-letter file."""
+        if not dead:
+            return
+        rejected_at = datetime.utcnow().isoformat()
+        lines = "".join(
+            json.dumps({'row': row, 'error': error, 'rejected_at': rejected_at}) + "\n"
+            for row, error in dead
+        )
+        with open(self._wal_dir / DEAD_LETTER_FILE, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._count('dead_lettered', len(dead))
+        logger.error(
+            f"AUDIT_SINK: {len(dead)} audit records rejected by the database, "
+            f"moved to {self._wal_dir / DEAD_LETTER_FILE}"
+        )
+
+    def _insert(self, rows: List[List[Any]]) -> Optional[Exception]:
+        """One multi-row INSERT and one commit. Returns the error on failure."""
+        try:
+            if self._conn is None:
+                self._conn = self._connection_factory()
+            with self._conn.cursor() as cursor:
+                execute_values(cursor, AUDIT_INSERT_SQL, rows, page_size=len(rows))
+            self._conn.commit()
+        except Exception as e:
+            self._count('failed_flushes')
+            self._reset_connection()
+            return e
+
+        self._count('flushes')
+        self._count('flushed', len(rows))
+        logger.debug(f"AUDIT_SINK: Flushed {len(rows)} audit records")
+        return None
+
+    def _count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += n
+
+    def _reset_connection(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.rollback()
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            if not self._stopping:
+                self.flush()
+
+    # =========================================================================
+    # WRITE-AHEAD SEGMENTS
+    # =========================================================================
+
+    def _open_segment(self) -> None:
+        """Open and lock the next segment for appends (caller holds _lock)."""
+        while True:
+            self._segment_seq += 1
+            path = self._wal_dir / f"audit-{time.time_ns()}-{os.getpid()}-{self._segment_seq:06d}{WAL_SUFFIX}"
+            handle = open(path, "a", encoding="utf-8")
+            if _try_lock(handle):
+                self._segment = _Segment(path, handle)
+                return
+            # Another sink's recovery grabbed it between open and lock
+            handle.close()
+
+    def _recover(self) -> None:
+        """Queue rows from segments a previous process left behind."""
+        replayed = 0
+        for path in sorted(self._wal_dir.glob(f"*{WAL_SUFFIX}")):
+            try:
+                handle = open(path, encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            if not _try_lock(handle):
+                # Held by a live sink (this or another process): not ours to replay
+                handle.close()
+                continue
+            segment = _Segment(path, handle)
+            for line_no, line in enumerate(handle, 1):
+                try:
+                    segment.rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Only the last line of a crashed append can be torn
+                    logger.warning(f"AUDIT_SINK: Skipping torn line {line_no} in {path.name}")
+            with self._lock:
+                self._sealed.append(segment)
+                self._pending += len(segment.rows)
+                self.stats['replayed'] += len(segment.rows)
+            replayed += len(segment.rows)
+
+        if self._sealed:
+            logger.warning(
+                f"AUDIT_SINK: Replaying {replayed} audit records "
+                f"from {len(self._sealed)} write-ahead segments"
+            )
+
+
+__all__ = [
+    'SendAttemptAuditSink',
+    'AUDIT_COLUMNS',
+    'AUDIT_INSERT_SQL',
+    'audit_row',
+]
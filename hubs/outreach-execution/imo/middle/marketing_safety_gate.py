@@ -6,6 +6,9 @@
 # STATUS: FROZEN (v1.0 Operational Baseline)
 # FREEZE DATE: 2026-01-20
 # REFERENCE: docs/GO-LIVE_STATE_v1.0.md
+# CHANGES: check_eligibility_batch (batched view reads, same per-company
+#          HARD FAIL rules and audit records)
+#          audit_sink (buffered audit writes, durable before the send)
 #
 # This file contains AUTHORITATIVE safety gate logic that is FROZEN at v1.0.
 # Any modification requires:
@@ -36,17 +39,39 @@ DATA SOURCE:
 AUDIT LOGGING:
     Every send attempt MUST be logged to outreach.send_attempt_audit
     Append-only, no updates, no deletes
+
+BATCH CHECKS:
+    check_eligibility_batch reads the same authoritative view for a whole
+    campaign in chunked "= ANY(...)" queries and applies the same per-company
+    HARD FAIL rules and audit records as check_eligibility_or_fail.
+    An optional per-campaign snapshot (snapshot_ttl > 0) reuses view rows for
+    a few seconds; it is dropped when the override version changes or
+    invalidate_snapshots() is called.
+
+BUFFERED AUDIT:
+    With an audit_sink (audit_sink.SendAttemptAuditSink) each audit record is
+    fsynced to a local write-ahead file before the send proceeds, and
+    committed to outreach.send_attempt_audit in multi-row batches by a
+    background thread. Without one, every record is INSERTed and committed
+    inline.
 """
 
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterable
 from enum import Enum
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Company ids per "= ANY(...)" query in check_eligibility_batch
+ELIGIBILITY_BATCH_SIZE = 5000
+
+# Overrides that block marketing outright (mirrors the view's blocking_overrides)
+BLOCKING_OVERRIDE_TYPES = {'marketing_disabled', 'legal_hold', 'customer_requested', 'cooldown'}
+
 
 # =============================================================================
 # HARD FAIL ERROR TYPES
@@ -150,6 +175,30 @@ class MarketingEligibilityResult:
         }
 
 
+@dataclass
+class EligibilityBatchResult:
+    """
+    Outcome of check_eligibility_batch.
+
+    Every requested company lands in exactly one of the two maps. A company
+    in `blocked` carries the same error check_eligibility_or_fail would have
+    raised for it; it MUST NOT be sent to.
+    """
+    eligible: Dict[str, MarketingEligibilityResult] = field(default_factory=dict)
+    blocked: Dict[str, 'MarketingSafetyError'] = field(default_factory=dict)
+
+    def is_eligible(self, company_unique_id: str) -> bool:
+        return company_unique_id in self.eligible
+
+
+@dataclass
+class _EligibilitySnapshot:
+    """View rows for one campaign; only companies the view returned are kept."""
+    loaded_at: float
+    override_version: Any
+    rows: Dict[str, MarketingEligibilityResult] = field(default_factory=dict)
+
+
 # =============================================================================
 # SEND ATTEMPT AUDIT RECORD
 # =============================================================================
@@ -214,6 +263,11 @@ class MarketingSafetyGate:
 
         # After send, record result
         gate.record_send_result(company_id, campaign_id, success=True)
+
+        # Whole campaign: one view query per ELIGIBILITY_BATCH_SIZE companies
+        batch = gate.check_eligibility_batch(company_ids, campaign_id)
+        for company_id in batch.eligible:
+            ...
     """
 
     # =========================================================================
@@ -221,15 +275,36 @@ class MarketingSafetyGate:
     # =========================================================================
     AUTHORITATIVE_VIEW = "outreach.vw_marketing_eligibility_with_overrides"
 
-    def __init__(self, db_connection=None):
+    def __init__(
+        self,
+        db_connection=None,
+        snapshot_ttl: float = 0.0,
+        override_version: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        audit_sink=None
+    ):
         """
         Initialize safety gate.
 
         Args:
             db_connection: Database connection (required for production)
+            snapshot_ttl: Seconds check_eligibility_batch may reuse a campaign's
+                view rows (0 = always query the view)
+            override_version: Returns a value that changes whenever overrides
+                change (e.g. latest override audit timestamp); a change drops
+                every snapshot
+            clock: Time source for snapshot expiry
+            audit_sink: Started SendAttemptAuditSink; audit records go to it
+                instead of an inline INSERT + commit
         """
         self._conn = db_connection
         self._audit_buffer: List[SendAttemptAuditRecord] = []
+        self._audit_sink = audit_sink
+
+        self._snapshot_ttl = snapshot_ttl
+        self._override_version = override_version
+        self._clock = clock
+        self._snapshots: Dict[str, _EligibilitySnapshot] = {}
 
     def set_connection(self, conn):
         """Set database connection."""
@@ -271,6 +346,76 @@ class MarketingSafetyGate:
         # =====================================================================
         eligibility = self._query_eligibility_view(company_unique_id)
 
+        return self._enforce_eligibility(company_unique_id, campaign_id, eligibility, correlation_id)
+
+    def check_eligibility_batch(
+        self,
+        company_ids: Iterable[str],
+        campaign_id: str,
+        correlation_id: Optional[str] = None
+    ) -> EligibilityBatchResult:
+        """
+        Check marketing eligibility for many companies at once.
+
+        Same ENFORCEMENT POINTS, errors and audit records as
+        check_eligibility_or_fail, applied per company; the view is read in
+        chunks of ELIGIBILITY_BATCH_SIZE instead of once per company.
+        Nothing is raised: each blocked company's error is returned in
+        result.blocked and that company MUST NOT be sent to.
+
+        Args:
+            company_ids: Companies to check (duplicates are checked once)
+            campaign_id: Campaign ID for audit and snapshot key
+            correlation_id: Trace ID
+
+        Returns:
+            EligibilityBatchResult
+        """
+        company_ids = list(dict.fromkeys(company_ids))
+        rows = self._eligibility_rows(company_ids, campaign_id)
+
+        result = EligibilityBatchResult()
+        for company_unique_id in company_ids:
+            try:
+                result.eligible[company_unique_id] = self._enforce_eligibility(
+                    company_unique_id, campaign_id, rows.get(company_unique_id), correlation_id
+                )
+            except MarketingSafetyError as e:
+                result.blocked[company_unique_id] = e
+
+        logger.info(
+            f"SAFETY_GATE_BATCH: campaign {campaign_id}: {len(result.eligible)} eligible, "
+            f"{len(result.blocked)} blocked of {len(company_ids)}"
+        )
+        return result
+
+    def invalidate_snapshots(self, campaign_id: Optional[str] = None) -> None:
+        """
+        Drop cached eligibility snapshots (all campaigns if campaign_id is None).
+
+        Anything that creates, expires or deactivates an override must call
+        this unless override_version already reflects the change.
+        """
+        if campaign_id is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(campaign_id, None)
+
+    def _enforce_eligibility(
+        self,
+        company_unique_id: str,
+        campaign_id: str,
+        eligibility: Optional[MarketingEligibilityResult],
+        correlation_id: Optional[str] = None
+    ) -> MarketingEligibilityResult:
+        """
+        Apply the HARD FAIL rules to one company's view row and audit the outcome.
+
+        Raises:
+            IneligibleTierError: If effective_tier = -1
+            ActiveOverrideError: If has blocking override
+            EligibilityCheckError: If there is no view row (no fallback)
+        """
         if eligibility is None:
             # HARD_FAIL: Could not verify eligibility (NO FALLBACK)
             audit_record = SendAttemptAuditRecord(
@@ -320,8 +465,7 @@ class MarketingSafetyGate:
         # ENFORCEMENT POINT: Check blocking overrides
         # =====================================================================
         if eligibility.has_active_override and eligibility.override_types:
-            blocking_types = {'marketing_disabled', 'legal_hold', 'customer_requested', 'cooldown'}
-            active_blocking = set(eligibility.override_types or []) & blocking_types
+            active_blocking = set(eligibility.override_types or []) & BLOCKING_OVERRIDE_TYPES
 
             if active_blocking:
                 audit_record = SendAttemptAuditRecord(
@@ -401,6 +545,17 @@ class MarketingSafetyGate:
     # ENFORCEMENT POINT: QUERY AUTHORITATIVE VIEW (NO FALLBACK)
     # =========================================================================
 
+    _ELIGIBILITY_COLUMNS = """
+                company_unique_id,
+                effective_tier,
+                computed_tier,
+                has_active_override,
+                override_types,
+                override_reasons,
+                tier_cap,
+                overall_status,
+                bit_score"""
+
     def _query_eligibility_view(
         self,
         company_unique_id: str
@@ -416,16 +571,7 @@ class MarketingSafetyGate:
             return None
 
         query = f"""
-            SELECT
-                company_unique_id,
-                effective_tier,
-                computed_tier,
-                has_active_override,
-                override_types,
-                override_reasons,
-                tier_cap,
-                overall_status,
-                bit_score
+            SELECT{self._ELIGIBILITY_COLUMNS}
             FROM {self.AUTHORITATIVE_VIEW}
             WHERE company_unique_id = %s
         """
@@ -447,24 +593,119 @@ class MarketingSafetyGate:
                 logger.error("SAFETY_GATE: Async connection not supported in sync context")
                 return None
 
-            return MarketingEligibilityResult(
-                company_unique_id=str(data['company_unique_id']),
-                effective_tier=int(data['effective_tier']),
-                computed_tier=int(data['computed_tier']),
-                has_active_override=bool(data['has_active_override']),
-                override_types=data.get('override_types'),
-                override_reasons=data.get('override_reasons'),
-                tier_cap=data.get('tier_cap'),
-                overall_status=str(data.get('overall_status', 'UNKNOWN')),
-                bit_score=float(data.get('bit_score', 0)),
-                raw_data=data,
-            )
+            return self._row_to_result(data)
 
         except Exception as e:
             # HARD_FAIL: Log error but do NOT fallback
             logger.error(f"SAFETY_GATE: Failed to query {self.AUTHORITATIVE_VIEW}: {e}")
+            if hasattr(self._conn, 'rollback'):
+                self._conn.rollback()
             return None
 
+    def _query_eligibility_view_batch(
+        self,
+        company_ids: List[str]
+    ) -> Dict[str, MarketingEligibilityResult]:
+        """
+        Query the AUTHORITATIVE view for many companies, ELIGIBILITY_BATCH_SIZE at a time.
+
+        DOCTRINE: NO FALLBACK to underlying views or tables. A chunk whose
+        query fails (e.g. one malformed id breaks the array cast) is re-read
+        from the same view one company at a time, so only the companies whose
+        own query fails are lost. Companies missing from the result (not in
+        the view, or their query failed) HARD FAIL in _enforce_eligibility.
+        """
+        if not self._conn:
+            logger.error("SAFETY_GATE: No database connection - HARD FAIL")
+            return {}
+        if not hasattr(self._conn, 'cursor'):
+            logger.error("SAFETY_GATE: Async connection not supported in sync context")
+            return {}
+
+        # The ids go in as a Postgres array literal of unknown type, so the
+        # server casts it to the column's own array type (text or uuid)
+        query = f"""
+            SELECT{self._ELIGIBILITY_COLUMNS}
+            FROM {self.AUTHORITATIVE_VIEW}
+            WHERE company_unique_id = ANY(%s)
+        """
+
+        results: Dict[str, MarketingEligibilityResult] = {}
+        for start in range(0, len(company_ids), ELIGIBILITY_BATCH_SIZE):
+            chunk = company_ids[start:start + ELIGIBILITY_BATCH_SIZE]
+            # uuid columns come back in canonical (lower-case) form
+            requested = {company_unique_id.lower(): company_unique_id for company_unique_id in chunk}
+            try:
+                with self._conn.cursor() as cursor:
+                    cursor.execute(query, (_pg_array_literal(chunk),))
+                    columns = [desc[0] for desc in cursor.description]
+                    for row in cursor.fetchall():
+                        eligibility = self._row_to_result(dict(zip(columns, row)))
+                        key = eligibility.company_unique_id
+                        results[requested.get(key.lower(), key)] = eligibility
+            except Exception as e:
+                logger.error(
+                    f"SAFETY_GATE: Failed to query {self.AUTHORITATIVE_VIEW} "
+                    f"for {len(chunk)} companies, checking them one by one: {e}"
+                )
+                if hasattr(self._conn, 'rollback'):
+                    self._conn.rollback()
+                for company_unique_id in chunk:
+                    eligibility = self._query_eligibility_view(company_unique_id)
+                    if eligibility is not None:
+                        results[company_unique_id] = eligibility
+
+        return results
+
+    def _eligibility_rows(
+        self,
+        company_ids: List[str],
+        campaign_id: str
+    ) -> Dict[str, Optional[MarketingEligibilityResult]]:
+        """View rows for company_ids, through the campaign snapshot when enabled."""
+        if self._snapshot_ttl <= 0:
+            return self._query_eligibility_view_batch(company_ids)
+
+        now = self._clock()
+        version = self._override_version() if self._override_version else None
+        snapshot = self._snapshots.get(campaign_id)
+        if (
+            snapshot is None
+            or now - snapshot.loaded_at >= self._snapshot_ttl
+            or snapshot.override_version != version
+        ):
+            if snapshot is not None and snapshot.override_version != version:
+                # Overrides changed: no campaign's rows can be trusted
+                self._snapshots.clear()
+            snapshot = self._snapshots[campaign_id] = _EligibilitySnapshot(now, version)
+
+        missing = [c for c in company_ids if c not in snapshot.rows]
+        if missing:
+            fetched = self._query_eligibility_view_batch(missing)
+            for company_unique_id in missing:
+                # Keep only what the view answered; failures are retried next call
+                if company_unique_id in fetched:
+                    snapshot.rows[company_unique_id] = fetched[company_unique_id]
+            return {c: snapshot.rows.get(c, fetched.get(c)) for c in company_ids}
+
+        return {c: snapshot.rows[c] for c in company_ids}
+
+    @staticmethod
+    def _row_to_result(data: Dict[str, Any]) -> MarketingEligibilityResult:
+        """Build a MarketingEligibilityResult from one view row."""
+        return MarketingEligibilityResult(
+            company_unique_id=str(data['company_unique_id']),
+            effective_tier=int(data['effective_tier']),
+            computed_tier=int(data['computed_tier']),
+            has_active_override=bool(data['has_active_override']),
+            override_types=data.get('override_types'),
+            override_reasons=data.get('override_reasons'),
+            tier_cap=data.get('tier_cap'),
+            overall_status=str(data.get('overall_status', 'UNKNOWN')),
+            bit_score=float(data.get('bit_score', 0)),
+            raw_data=data,
+        )
+
     # =========================================================================
     # AUDIT LOGGING (APPEND-ONLY)
     # =========================================================================
@@ -476,13 +717,34 @@ class MarketingSafetyGate:
         DOCTRINE: Every send attempt MUST be logged.
         This is append-only - no updates, no deletes.
         """
+        if self._audit_sink is not None:
+            try:
+                self._audit_sink.append(record)
+                return
+            except Exception as e:
+                logger.error(f"SAFETY_GATE: Audit sink rejected record {record.audit_id}: {e}")
+
         if not self._conn:
             # Buffer for later if no connection
             self._audit_buffer.append(record)
             logger.warning(f"SAFETY_GATE: Audit record buffered (no connection): {record.audit_id}")
             return
 
-        insert_query = """
+        try:
+            self._insert_audit_records([record])
+            logger.debug(f"SAFETY_GATE: Audit record written: {record.audit_id}")
+
+        except Exception as e:
+            # Log but don't fail - audit is critical but shouldn't block sends
+            logger.error(f"SAFETY_GATE: Failed to write audit record: {e}")
+            self._audit_buffer.append(record)
+
+    def _insert_audit_records(self, records: List[SendAttemptAuditRecord]) -> None:
+        """One multi-row INSERT + commit; rolls back and re-raises on error."""
+        import json
+
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(records))
+        insert_query = f"""
             INSERT INTO outreach.send_attempt_audit (
                 audit_id,
                 company_unique_id,
@@ -494,61 +756,84 @@ class MarketingSafetyGate:
                 failure_reason,
                 correlation_id,
                 created_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
+            ) VALUES {placeholders}
         """
+        params = []
+        for record in records:
+            params.extend((
+                record.audit_id,
+                record.company_unique_id,
+                record.campaign_id,
+                record.effective_tier,
+                record.computed_tier,
+                json.dumps(record.override_snapshot),
+                record.status,
+                record.failure_reason,
+                record.correlation_id,
+                record.created_at,
+            ))
 
         try:
-            import json
+            with self._conn.cursor() as cursor:
+                cursor.execute(insert_query, params)
+            self._conn.commit()
+        except Exception:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+            raise
 
-            if hasattr(self._conn, 'cursor'):
-                with self._conn.cursor() as cursor:
-                    cursor.execute(insert_query, (
-                        record.audit_id,
-                        record.company_unique_id,
-                        record.campaign_id,
-                        record.effective_tier,
-                        record.computed_tier,
-                        json.dumps(record.override_snapshot),
-                        record.status,
-                        record.failure_reason,
-                        record.correlation_id,
-                        record.created_at,
-                    ))
-                self._conn.commit()
+    def flush_audit_buffer(self) -> int:
+        """
+        Flush any buffered audit records. Returns count flushed.
 
-            logger.debug(f"SAFETY_GATE: Audit record written: {record.audit_id}")
+        Buffered records go to the audit sink when there is one, otherwise
+        out in a single multi-row INSERT. On failure they stay buffered.
+        """
+        if not self._audit_buffer:
+            return 0
+        if self._audit_sink is None and not self._conn:
+            return 0
 
-        except Exception as e:
-            # Log but don't fail - audit is critical but shouldn't block sends
-            logger.error(f"SAFETY_GATE: Failed to write audit record: {e}")
-            self._audit_buffer.append(record)
+        pending, self._audit_buffer = self._audit_buffer, []
 
-    def flush_audit_buffer(self) -> int:
-        """Flush any buffered audit records. Returns count flushed."""
-        if not self._conn or not self._audit_buffer:
-            return 0
+        if self._audit_sink is not None:
+            for i, record in enumerate(pending):
+                try:
+                    self._audit_sink.append(record)
+                except Exception as e:
+                    logger.error(f"Failed to flush audit record {record.audit_id} to sink: {e}")
+                    self._audit_buffer = pending[i:] + self._audit_buffer
+                    return i
+            return len(pending)
 
-        count = 0
-        for record in self._audit_buffer[:]:
-            try:
-                self._write_audit_record(record)
-                self._audit_buffer.remove(record)
-                count += 1
-            except Exception as e:
-                logger.error(f"Failed to flush audit record {record.audit_id}: {e}")
+        try:
+            self._insert_audit_records(pending)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(pending)} buffered audit records: {e}")
+            self._audit_buffer = pending + self._audit_buffer
+            return 0
 
-        return count
+        return len(pending)
 
 
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
-def create_safety_gate(db_connection=None) -> MarketingSafetyGate:
+def _pg_array_literal(values: List[str]) -> str:
+    """Render values as a Postgres array literal, e.g. {"a","b"}."""
+    quoted = (
+        '"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for v in values
+    )
+    return '{' + ','.join(quoted) + '}'
+
+
+def create_safety_gate(db_connection=None, audit_sink=None) -> MarketingSafetyGate:
     """Create a new MarketingSafetyGate instance."""
-    return MarketingSafetyGate(db_connection)
+    return MarketingSafetyGate(db_connection, audit_sink=audit_sink)
 
 
 # =============================================================================
@@ -559,8 +844,10 @@ __all__ = [
     # Gate
     'MarketingSafetyGate',
     'create_safety_gate',
+    'ELIGIBILITY_BATCH_SIZE',
     # Results
     'MarketingEligibilityResult',
+    'EligibilityBatchResult',
     'SendAttemptAuditRecord',
     'SendAttemptStatus',
     # Errors (HARD FAIL)
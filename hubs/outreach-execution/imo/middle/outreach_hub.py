@@ -16,6 +16,12 @@ BIT Score Thresholds:
     - HOT (50-74): Direct outreach (personalized email)
     - BURNING (75+): Priority outreach (phone + email)
 
+Batch evaluation:
+    Candidates for a set of companies are evaluated from a CandidateSnapshot,
+    loaded with one safety gate batch check, one pass over the Company
+    Pipeline and one people_master query per PERSON_BATCH_SIZE contacts.
+    get_priority_candidates and create_campaign_targets share a snapshot.
+
 Barton ID Range: 04.04.02.04.70000.###
 """
 
@@ -53,6 +59,7 @@ from ops.enforcement.hub_gate import validate_company_anchor, HubGateError, Gate
 from .marketing_safety_gate import (
     MarketingSafetyGate,
     MarketingEligibilityResult,
+    EligibilityBatchResult,
     IneligibleTierError,
     ActiveOverrideError,
     EligibilityCheckError,
@@ -62,6 +69,9 @@ from .marketing_safety_gate import (
 
 logger = logging.getLogger(__name__)
 
+# Person ids per people_master "= ANY(...)" query when loading a snapshot
+PERSON_BATCH_SIZE = 5000
+
 
 # =============================================================================
 # ENUMS
@@ -173,6 +183,31 @@ class CampaignTarget:
         }
 
 
+@dataclass
+class CandidateSnapshot:
+    """
+    Everything candidate evaluation reads for a set of companies, loaded in bulk.
+
+    company_ids keeps the caller's order (priority order for the hot set).
+    Evaluated candidates are cached so the snapshot can be shared by
+    get_priority_candidates and create_campaign_targets without re-evaluating.
+    """
+    company_ids: List[str]
+    eligibility: EligibilityBatchResult
+    companies: Dict[str, Dict[str, Any]]           # company_id -> _get_company_data()
+    anchors: Dict[str, Tuple[bool, List[str]]]      # company_id -> Golden Rule result
+    people: Dict[str, Dict[str, Any]]              # person_unique_id -> people_master row
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+    candidates: Dict[str, Optional[OutreachCandidate]] = field(default_factory=dict)
+
+    def evaluated_candidates(self) -> List[OutreachCandidate]:
+        """Candidates that passed evaluation, in company_ids order."""
+        return [
+            self.candidates[company_id] for company_id in self.company_ids
+            if self.candidates.get(company_id) is not None
+        ]
+
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -227,7 +262,8 @@ class OutreachSpoke(Spoke):
         bit_engine: Optional[BITEngine] = None,
         config: OutreachConfig = None,
         company_pipeline=None,
-        db_connection=None
+        db_connection=None,
+        audit_sink=None
     ):
         """
         Initialize Outreach Spoke.
@@ -238,6 +274,8 @@ class OutreachSpoke(Spoke):
             config: Outreach configuration
             company_pipeline: CompanyPipeline for anchor validation
             db_connection: Database connection for safety gate
+            audit_sink: Started SendAttemptAuditSink for the safety gate's
+                audit records (None = inline INSERT per record)
         """
         super().__init__(name="outreach", hub=hub)
         self.bit_engine = bit_engine or BITEngine()
@@ -248,7 +286,7 @@ class OutreachSpoke(Spoke):
         # =====================================================================
         # ENFORCEMENT POINT: Initialize Marketing Safety Gate (MANDATORY)
         # =====================================================================
-        self._safety_gate = MarketingSafetyGate(db_connection)
+        self._safety_gate = MarketingSafetyGate(db_connection, audit_sink=audit_sink)
 
         # Tracking
         self._outreach_history: Dict[str, datetime] = {}  # company_id -> last_contact
@@ -326,12 +364,9 @@ class OutreachSpoke(Spoke):
             )
 
         elif isinstance(data, list):
-            # List of company IDs
-            candidates = []
-            for company_id in data:
-                candidate = self._evaluate_company(company_id, correlation_id)
-                if candidate:
-                    candidates.append(candidate)
+            # List of company IDs - one bulk load, evaluated in memory
+            snapshot = self.load_candidate_snapshot(data, correlation_id)
+            candidates = self._evaluate_snapshot(snapshot)
 
             return SpokeResult(
                 status=ResultStatus.SUCCESS,
@@ -360,36 +395,125 @@ class OutreachSpoke(Spoke):
         Evaluate a single company for outreach readiness.
 
         Returns OutreachCandidate if ready, None otherwise.
+        """
+        snapshot = self.load_candidate_snapshot([company_id], correlation_id, campaign_id)
+        return self._evaluate_from_snapshot(company_id, snapshot)
 
-        ENFORCEMENT POINT: Safety Gate check happens FIRST before any other
-        processing. If company is ineligible, we HARD_FAIL and return None.
+    def load_candidate_snapshot(
+        self,
+        company_ids: List[str],
+        correlation_id: str,
+        campaign_id: str = "evaluation"
+    ) -> CandidateSnapshot:
         """
-        self.stats['total_evaluated'] += 1
+        Load everything needed to evaluate company_ids, in a few bulk reads.
+
+        ENFORCEMENT POINT: Safety Gate check happens FIRST, for the whole set
+        (one batched read of vw_marketing_eligibility_with_overrides, same
+        per-company HARD FAIL rules and audit records).
+
+        Then one Company Pipeline lookup per eligible company (anchors, slots)
+        and one people_master query per PERSON_BATCH_SIZE slot holders.
+        """
+        company_ids = list(dict.fromkeys(company_ids))
 
         # =====================================================================
         # ENFORCEMENT POINT: MARKETING SAFETY GATE (MUST BE FIRST)
-        # Reads from vw_marketing_eligibility_with_overrides
         # HARD_FAIL if effective_tier = -1 or marketing_disabled = true
         # =====================================================================
-        try:
-            eligibility = self._safety_gate.check_eligibility_or_fail(
-                company_unique_id=company_id,
-                campaign_id=campaign_id,
-                correlation_id=correlation_id
-            )
-            logger.debug(
-                f"Safety gate PASS for {company_id}: "
-                f"effective_tier={eligibility.effective_tier}"
-            )
-        except (IneligibleTierError, ActiveOverrideError, EligibilityCheckError) as e:
+        eligibility = self._safety_gate.check_eligibility_batch(
+            company_ids,
+            campaign_id=campaign_id,
+            correlation_id=correlation_id
+        )
+
+        companies: Dict[str, Dict[str, Any]] = {}
+        anchors: Dict[str, Tuple[bool, List[str]]] = {}
+        for company_id in eligibility.eligible:
+            anchors[company_id] = self._validate_company_anchors(company_id)
+            company_data = self._get_company_data(company_id)
+            if company_data:
+                companies[company_id] = company_data
+
+        person_ids = [
+            company_data[f'{slot_key}_person_id']
+            for company_data in companies.values()
+            for slot_key in ('hr', 'ceo', 'cfo')
+            if company_data.get(f'{slot_key}_person_id')
+        ]
+
+        return CandidateSnapshot(
+            company_ids=company_ids,
+            eligibility=eligibility,
+            companies=companies,
+            anchors=anchors,
+            people=self._load_people(person_ids),
+        )
+
+    def _evaluate_snapshot(
+        self,
+        snapshot: CandidateSnapshot,
+        limit: Optional[int] = None
+    ) -> List[OutreachCandidate]:
+        """Evaluate snapshot companies in order, stopping after limit candidates."""
+        candidates = []
+        for company_id in snapshot.company_ids:
+            candidate = self._evaluate_from_snapshot(company_id, snapshot)
+            if candidate:
+                candidates.append(candidate)
+            if limit is not None and len(candidates) >= limit:
+                break
+        return candidates
+
+    def _evaluate_from_snapshot(
+        self,
+        company_id: str,
+        snapshot: CandidateSnapshot
+    ) -> Optional[OutreachCandidate]:
+        """
+        Evaluate one company against a loaded snapshot (no I/O).
+
+        Each company is evaluated once per snapshot; later calls return the
+        cached result without touching stats or the daily count.
+
+        ENFORCEMENT POINT: the snapshot's Safety Gate result is checked FIRST.
+        If the company is ineligible, we HARD_FAIL and return None.
+        """
+        if company_id in snapshot.candidates:
+            return snapshot.candidates[company_id]
+
+        self.stats['total_evaluated'] += 1
+        candidate = None
+
+        # =====================================================================
+        # ENFORCEMENT POINT: MARKETING SAFETY GATE (MUST BE FIRST)
+        # =====================================================================
+        eligibility = snapshot.eligibility.eligible.get(company_id)
+        if eligibility is None:
             # HARD_FAIL: Company is ineligible - DO NOT PROCEED
             self.stats['failed_safety_gate'] += 1
+            blocked = snapshot.eligibility.blocked.get(company_id)
             logger.warning(
                 f"SAFETY_GATE_BLOCK: {company_id} blocked by safety gate: "
-                f"{e.error_code} - {str(e)}"
+                f"{getattr(blocked, 'error_code', 'SAFETY_GATE_CHECK_FAILED')} - {blocked}"
             )
-            return None
+        else:
+            logger.debug(
+                f"Safety gate PASS for {company_id}: "
+                f"effective_tier={eligibility.effective_tier}"
+            )
+            candidate = self._build_candidate(company_id, eligibility, snapshot)
 
+        snapshot.candidates[company_id] = candidate
+        return candidate
+
+    def _build_candidate(
+        self,
+        company_id: str,
+        eligibility: MarketingEligibilityResult,
+        snapshot: CandidateSnapshot
+    ) -> Optional[OutreachCandidate]:
+        """Apply the outreach rules to a gate-approved company."""
         # Check rate limit
         if self._daily_count >= self.config.max_outreach_per_day:
             self.stats['failed_rate_limit'] += 1
@@ -405,7 +529,7 @@ class OutreachSpoke(Spoke):
         # =====================================================================
         # THE GOLDEN RULE - Company Anchor Validation
         # =====================================================================
-        is_valid, missing_anchors = self._validate_company_anchors(company_id)
+        is_valid, missing_anchors = snapshot.anchors[company_id]
 
         if not is_valid:
             self.stats['failed_anchor'] += 1
@@ -432,12 +556,12 @@ class OutreachSpoke(Spoke):
         recommended_action = STATE_TO_ACTION[outreach_state]
 
         # Get company details
-        company_data = self._get_company_data(company_id)
+        company_data = snapshot.companies.get(company_id)
 
         # Build candidate
         candidate = OutreachCandidate(
             company_id=company_id,
-            company_name=self._get_company_name(company_id),
+            company_name=company_data['company_name'] if company_data else "",
             bit_score=bit_score,
             outreach_state=outreach_state,
             recommended_action=recommended_action,
@@ -452,7 +576,7 @@ class OutreachSpoke(Spoke):
             candidate.hr_slot_filled = company_data.get('hr_slot_filled', False)
 
             # Get primary contact (HR > CEO > CFO priority)
-            primary_contact = self._get_primary_contact(company_id, company_data)
+            primary_contact = self._get_primary_contact(company_id, company_data, snapshot.people)
             if primary_contact:
                 candidate.primary_contact_id = primary_contact.get('id')
                 candidate.primary_contact_name = primary_contact.get('name')
@@ -477,11 +601,10 @@ class OutreachSpoke(Spoke):
         """Evaluate all companies with HOT or BURNING status."""
         hot_companies = self.bit_engine.get_companies_above_threshold(BIT_THRESHOLD_HOT)
 
-        candidates = []
-        for score in hot_companies:
-            candidate = self._evaluate_company(score.company_id, correlation_id)
-            if candidate:
-                candidates.append(candidate)
+        snapshot = self.load_candidate_snapshot(
+            [score.company_id for score in hot_companies], correlation_id
+        )
+        candidates = self._evaluate_snapshot(snapshot)
 
         return SpokeResult(
             status=ResultStatus.SUCCESS,
@@ -539,14 +662,6 @@ class OutreachSpoke(Spoke):
         else:
             return OutreachState.SUSPECT
 
-    def _get_company_name(self, company_id: str) -> str:
-        """Get company name from Company Pipeline."""
-        if self._company_pipeline:
-            company = self._company_pipeline.get_company(company_id)
-            if company:
-                return company.company_name
-        return ""
-
     def _get_company_data(self, company_id: str) -> Optional[Dict[str, Any]]:
         """Get company data from Company Pipeline."""
         if self._company_pipeline:
@@ -558,6 +673,7 @@ class OutreachSpoke(Spoke):
                 hr_slot = company.slots.get('HR') if hasattr(company, 'slots') else None
 
                 return {
+                    'company_name': company.company_name,
                     'domain': company.domain,
                     'email_pattern': company.email_pattern,
                     'ceo_slot_filled': ceo_slot.is_filled if ceo_slot else False,
@@ -572,7 +688,8 @@ class OutreachSpoke(Spoke):
     def _get_primary_contact(
         self,
         company_id: str,
-        company_data: Dict[str, Any]
+        company_data: Dict[str, Any],
+        people: Dict[str, Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
         Select primary contact for outreach.
@@ -585,6 +702,7 @@ class OutreachSpoke(Spoke):
         Args:
             company_id: Company ID
             company_data: Company data from _get_company_data()
+            people: people_master rows by person_unique_id (_load_people())
 
         Returns:
             Dict with contact info or None
@@ -602,8 +720,7 @@ class OutreachSpoke(Spoke):
         for slot_key, slot_type in slot_priority:
             person_id = company_data.get(f'{slot_key}_person_id')
             if person_id:
-                # Try to get person details from People Hub
-                person_data = self._get_person_data(person_id)
+                person_data = people.get(person_id)
                 if person_data:
                     return {
                         'id': person_id,
@@ -615,26 +732,42 @@ class OutreachSpoke(Spoke):
 
         return None
 
-    def _get_person_data(self, person_id: str) -> Optional[Dict[str, Any]]:
+    def _load_people(self, person_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Get person data from People Hub or Neon.
+        Load people_master rows for slot holders, PERSON_BATCH_SIZE per query.
+
+        Uses the spoke's database connection when set, otherwise one pooled
+        CompanyNeonWriter connection for the whole load.
 
         Args:
-            person_id: Person unique ID
+            person_ids: Person unique IDs
 
         Returns:
-            Dict with person data or None
+            Dict of person_unique_id -> person data (unknown ids are absent)
         """
-        # Try Company Pipeline's hub if available
-        if self._company_pipeline and hasattr(self._company_pipeline, 'hub'):
-            # Check if hub has people data cached
+        person_ids = list(dict.fromkeys(person_ids))
+        if not person_ids:
+            return {}
+
+        writer = None
+        conn = self._db_connection
+        if conn is None:
+            if not (self._company_pipeline and hasattr(self._company_pipeline, 'hub')):
+                return {}
             try:
                 from hubs.company_target.imo.output.neon_writer import CompanyNeonWriter  # TODO: SOVEREIGNTY VIOLATION — this hub imports directly from another hub. Needs spoke contract.
                 writer = CompanyNeonWriter()
-
-                # Query people_master for this person
                 conn = writer._get_connection()
-                with conn.cursor() as cursor:
+            except Exception as e:
+                logger.error(f"Failed to open people_master connection: {e}")
+                if writer is not None:
+                    writer.close()
+                return {}
+
+        people: Dict[str, Dict[str, Any]] = {}
+        try:
+            with conn.cursor() as cursor:
+                for start in range(0, len(person_ids), PERSON_BATCH_SIZE):
                     cursor.execute(
                         """
                         SELECT
@@ -644,21 +777,24 @@ class OutreachSpoke(Spoke):
                             title,
                             linkedin_url
                         FROM marketing.people_master
-                        WHERE person_unique_id = %(person_id)s
-                        LIMIT 1
+                        WHERE person_unique_id = ANY(%(person_ids)s)
                         """,
-                        {'person_id': person_id}
+                        {'person_ids': person_ids[start:start + PERSON_BATCH_SIZE]}
                     )
-                    row = cursor.fetchone()
-                    if row:
-                        columns = [desc[0] for desc in cursor.description]
-                        return dict(zip(columns, row))
-
+                    columns = [desc[0] for desc in cursor.description]
+                    for row in cursor.fetchall():
+                        person = dict(zip(columns, row))
+                        people[person['person_unique_id']] = person
+        except Exception as e:
+            logger.error(f"Failed to load person data for {len(person_ids)} contacts: {e}")
+            if writer is None and hasattr(conn, 'rollback'):
+                conn.rollback()
+        finally:
+            # close() returns the pooled connection to the pool on every path
+            if writer is not None:
                 writer.close()
-            except Exception as e:
-                logger.error(f"Failed to get person data for {person_id}: {e}")
 
-        return None
+        return people
 
     def _in_cooling_off(self, company_id: str) -> bool:
         """Check if company is in cooling off period."""
@@ -715,9 +851,10 @@ class OutreachSpoke(Spoke):
     def create_campaign_targets(
         self,
         campaign_id: str,
-        candidates: List[OutreachCandidate],
+        candidates: Optional[List[OutreachCandidate]] = None,
         schedule_start: datetime = None,
-        correlation_id: str = None
+        correlation_id: str = None,
+        snapshot: Optional[CandidateSnapshot] = None
     ) -> List[CampaignTarget]:
         """
         Create campaign targets from candidates.
@@ -728,33 +865,41 @@ class OutreachSpoke(Spoke):
 
         Args:
             campaign_id: Campaign identifier
-            candidates: List of outreach candidates
+            candidates: List of outreach candidates (default: every candidate
+                already evaluated from snapshot)
             schedule_start: When to start the campaign
             correlation_id: Trace ID
+            snapshot: Snapshot the candidates were evaluated from; candidates
+                are taken from it instead of being loaded again
 
         Returns:
             List of CampaignTarget objects (only for eligible companies)
         """
+        if candidates is None:
+            candidates = snapshot.evaluated_candidates() if snapshot else []
+
         targets = []
         schedule = schedule_start or datetime.utcnow()
         blocked_count = 0
 
+        # =====================================================================
+        # ENFORCEMENT POINT: Re-check eligibility before target creation
+        # Eligibility may have changed since evaluation. One batched read of
+        # the authoritative view; same per-company HARD FAIL rules.
+        # =====================================================================
+        eligibility = self._safety_gate.check_eligibility_batch(
+            [candidate.company_id for candidate in candidates],
+            campaign_id=campaign_id,
+            correlation_id=correlation_id
+        )
+
         for candidate in candidates:
-            # =================================================================
-            # ENFORCEMENT POINT: Re-check eligibility before target creation
-            # Eligibility may have changed since evaluation
-            # =================================================================
-            try:
-                self._safety_gate.check_eligibility_or_fail(
-                    company_unique_id=candidate.company_id,
-                    campaign_id=campaign_id,
-                    correlation_id=correlation_id
-                )
-            except (IneligibleTierError, ActiveOverrideError, EligibilityCheckError) as e:
-                # Company became ineligible - skip
+            if not eligibility.is_eligible(candidate.company_id):
+                # Company became ineligible - skip (fail closed)
+                blocked = eligibility.blocked.get(candidate.company_id)
                 logger.warning(
                     f"CAMPAIGN_TARGET_BLOCKED: {candidate.company_id} blocked during "
-                    f"target creation: {e.error_code}"
+                    f"target creation: {getattr(blocked, 'error_code', 'SAFETY_GATE_CHECK_FAILED')}"
                 )
                 blocked_count += 1
                 continue
@@ -779,7 +924,8 @@ class OutreachSpoke(Spoke):
     def get_priority_candidates(
         self,
         limit: int = 10,
-        correlation_id: str = None
+        correlation_id: str = None,
+        snapshot: Optional[CandidateSnapshot] = None
     ) -> List[OutreachCandidate]:
         """
         Get top priority candidates for outreach.
@@ -791,6 +937,8 @@ class OutreachSpoke(Spoke):
         Args:
             limit: Maximum candidates to return
             correlation_id: Trace ID
+            snapshot: Pre-loaded snapshot (company_ids in priority order);
+                loaded for the hot set when omitted
 
         Returns:
             List of priority OutreachCandidate objects
@@ -799,27 +947,24 @@ class OutreachSpoke(Spoke):
             import uuid
             correlation_id = str(uuid.uuid4())
 
-        # Get all burning companies first, then hot
-        burning = self.bit_engine.get_companies_above_threshold(BIT_THRESHOLD_BURNING)
-        hot = [
-            c for c in self.bit_engine.get_companies_above_threshold(BIT_THRESHOLD_HOT)
-            if c.score < BIT_THRESHOLD_BURNING
-        ]
-
-        # Combine and sort by score
-        all_hot = burning + hot
-        all_hot.sort(key=lambda x: x.score, reverse=True)
-
-        # Evaluate each
-        candidates = []
-        for score in all_hot[:limit * 2]:  # Get extra in case some fail validation
-            candidate = self._evaluate_company(score.company_id, correlation_id)
-            if candidate:
-                candidates.append(candidate)
-            if len(candidates) >= limit:
-                break
+        if snapshot is None:
+            # Get all burning companies first, then hot
+            burning = self.bit_engine.get_companies_above_threshold(BIT_THRESHOLD_BURNING)
+            hot = [
+                c for c in self.bit_engine.get_companies_above_threshold(BIT_THRESHOLD_HOT)
+                if c.score < BIT_THRESHOLD_BURNING
+            ]
+
+            # Combine and sort by score
+            all_hot = burning + hot
+            all_hot.sort(key=lambda x: x.score, reverse=True)
+
+            # Get extra in case some fail validation
+            snapshot = self.load_candidate_snapshot(
+                [score.company_id for score in all_hot[:limit * 2]], correlation_id
+            )
 
-        return candidates
+        return self._evaluate_snapshot(snapshot, limit=limit)
 
     # =========================================================================
     # STATS & REPORTING
@@ -854,7 +999,9 @@ __all__ = [
     "OutreachConfig",
     "load_outreach_config",
     "OutreachCandidate",
+    "CandidateSnapshot",
     "CampaignTarget",
+    "PERSON_BATCH_SIZE",
     "OutreachState",
     "OutreachAction",
     # Safety Gate (ENFORCEMENT)
@@ -53,6 +53,10 @@ if sys.platform == "win32":
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.extensions
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+from src.sys.db.connection_pool import get_pool
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -83,13 +87,15 @@ ICP_STATES = {"PA", "VA", "MD", "OH", "WV", "KY"}
 # DB connection
 # ---------------------------------------------------------------------------
 def get_connection():
-    return psycopg2.connect(
+    """Pooled Neon connection; close() returns it to the shared pool."""
+    dsn = psycopg2.extensions.make_dsn(
         host=os.environ["NEON_HOST"],
         dbname=os.environ["NEON_DATABASE"],
         user=os.environ["NEON_USER"],
         password=os.environ["NEON_PASSWORD"],
         sslmode="require",
     )
+    return get_pool(dsn).getconn()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,70 @@
+-- =============================================================================
+-- Migration: BIT batch scoring change watermarks
+-- Date: 2026-03-20
+-- Purpose: (1) Create outreach.bit_score_watermarks, one high-water mark per
+--              signal source, read and advanced by ops/schedulers/bit_batch_score.py
+--          (2) Index the change columns the incremental run scans
+--              (dol.updated_at, blog.created_at, people.updated_at)
+-- CTB Registry: leaf_type = SYSTEM
+-- Doctrine: CTB_REGISTRY_ENFORCEMENT.md §4.2 — Register FIRST, create SECOND
+-- =============================================================================
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 1: Register in CTB (BEFORE table creation — DDL gate enforces this)
+-- ─────────────────────────────────────────────────────────────────────────────
+
+INSERT INTO ctb.table_registry (
+    table_schema,
+    table_name,
+    leaf_type,
+    registered_by,
+    is_frozen,
+    notes
+)
+VALUES (
+    'outreach',
+    'bit_score_watermarks',
+    'SYSTEM',
+    'bit_batch_score_migration',
+    FALSE,
+    'Per-source high-water marks for incremental BIT batch scoring (dol, blog, people).'
+)
+ON CONFLICT (table_schema, table_name) DO NOTHING;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 2: Create the watermark table
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE IF NOT EXISTS outreach.bit_score_watermarks (
+    source          TEXT        PRIMARY KEY
+                                CHECK (source IN ('dol', 'blog', 'people')),
+    high_water_mark TIMESTAMPTZ NOT NULL,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE outreach.bit_score_watermarks IS
+    'Latest change timestamp per signal source already folded into outreach.bit_scores. '
+    'Incremental runs re-score only outreach_ids with rows at or past the mark. '
+    'Delete a row (or run with --full) to force a full rebuild.';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 3: Index the change columns (range scans from the watermark)
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE INDEX IF NOT EXISTS idx_dol_updated_at
+    ON outreach.dol (updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_blog_created_at
+    ON outreach.blog (created_at);
+
+CREATE INDEX IF NOT EXISTS idx_people_updated_at
+    ON outreach.people (updated_at);
+
+-- =============================================================================
+-- ROLLBACK
+-- =============================================================================
+-- DROP INDEX IF EXISTS outreach.idx_people_updated_at;
+-- DROP INDEX IF EXISTS outreach.idx_blog_created_at;
+-- DROP INDEX IF EXISTS outreach.idx_dol_updated_at;
+-- DROP TABLE IF EXISTS outreach.bit_score_watermarks;
+-- DELETE FROM ctb.table_registry WHERE table_schema = 'outreach' AND table_name = 'bit_score_watermarks';
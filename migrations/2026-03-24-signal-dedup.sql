@@ -0,0 +1,63 @@
+-- =============================================================================
+-- Migration: Persistent signal deduplication table
+-- Date: 2026-03-24
+-- Purpose: Create outreach.signal_dedup, the lookup table behind
+--          ops/enforcement/signal_dedup.SignalDeduplicator (PostgresDedupStore).
+--          One row per dedup_key = sha256(signal_type:entity_id:window_start),
+--          kept until its window closes (24h operational / 365d structural).
+-- CTB Registry: leaf_type = SYSTEM
+-- Doctrine: CTB_REGISTRY_ENFORCEMENT.md §4.2 — Register FIRST, create SECOND
+-- =============================================================================
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 1: Register in CTB (BEFORE table creation — DDL gate enforces this)
+-- ─────────────────────────────────────────────────────────────────────────────
+
+INSERT INTO ctb.table_registry (
+    table_schema,
+    table_name,
+    leaf_type,
+    registered_by,
+    is_frozen,
+    notes
+)
+VALUES (
+    'outreach',
+    'signal_dedup',
+    'SYSTEM',
+    'signal_dedup_migration',
+    FALSE,
+    'Signal idempotency keys per dedup window, read and written by SignalDeduplicator.'
+)
+ON CONFLICT (table_schema, table_name) DO NOTHING;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 2: Create the dedup table
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE IF NOT EXISTS outreach.signal_dedup (
+    dedup_key   TEXT        PRIMARY KEY,
+    signal_type TEXT        NOT NULL,
+    entity_id   TEXT        NOT NULL,
+    first_seen  TIMESTAMPTZ NOT NULL DEFAULT now(),
+    window_end  TIMESTAMPTZ NOT NULL
+);
+
+COMMENT ON TABLE outreach.signal_dedup IS
+    'One row per emitted signal per dedup window. A signal whose dedup_key is present '
+    'with window_end in the future is a duplicate and is dropped. '
+    'Rows past window_end are purged by SignalDeduplicator.cleanup_expired().';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- STEP 3: Index window_end (expiry filter and purge)
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE INDEX IF NOT EXISTS idx_signal_dedup_window_end
+    ON outreach.signal_dedup (window_end);
+
+-- =============================================================================
+-- ROLLBACK
+-- =============================================================================
+-- DROP INDEX IF EXISTS outreach.idx_signal_dedup_window_end;
+-- DROP TABLE IF EXISTS outreach.signal_dedup;
+-- DELETE FROM ctb.table_registry WHERE table_schema = 'outreach' AND table_name = 'signal_dedup';
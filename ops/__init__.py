@@ -7,4 +7,5 @@ __all__ = [
     "validation",
     "providers",
     "reporting",
+    "caching",
 ]
@@ -0,0 +1,33 @@
+# Caching Module - shared in-process caches for pipeline hot paths
+
+from .normalization_cache import (
+    NormalizationCache,
+    cached_normalizer,
+    configure_normalization_cache,
+    get_normalization_cache,
+    DEFAULT_NORMALIZATION_CACHE_SIZE,
+    NORMALIZATION_CACHE_SIZE_ENV_VAR,
+)
+from .dns_cache import (
+    DNSCache,
+    DNSCacheStats,
+    configure_dns_cache,
+    get_dns_cache,
+    DEFAULT_DNS_CACHE_SIZE,
+    DNS_CACHE_SNAPSHOT_ENV_VAR,
+)
+
+__all__ = [
+    "NormalizationCache",
+    "cached_normalizer",
+    "configure_normalization_cache",
+    "get_normalization_cache",
+    "DEFAULT_NORMALIZATION_CACHE_SIZE",
+    "NORMALIZATION_CACHE_SIZE_ENV_VAR",
+    "DNSCache",
+    "DNSCacheStats",
+    "configure_dns_cache",
+    "get_dns_cache",
+    "DEFAULT_DNS_CACHE_SIZE",
+    "DNS_CACHE_SNAPSHOT_ENV_VAR",
+]
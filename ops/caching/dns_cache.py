@@ -0,0 +1,507 @@
+"""
+DNS Resolution Cache
+====================
+Process-wide, TTL-respecting cache in front of dnspython for the DNS/MX
+lookups behind domain and email verification.
+
+People at the same company share a domain, so Phase 2 domain validation,
+Phase 4 MX checks and email verification resolve the same names over and
+over. Every lookup goes through one DNSCache:
+
+- Answers are kept for their record TTL (clamped to min_ttl/max_ttl)
+- NXDOMAIN and NoAnswer are cached for negative_ttl and re-raised from cache;
+  an NXDOMAIN covers every record type of that name
+- Concurrent lookups of the same (name, type) share one query (coalescing),
+  for threads via resolve() and for asyncio tasks via resolve_async()
+- Timeouts and resolver errors are never cached
+- Optional JSON snapshot (DNS_CACHE_SNAPSHOT or snapshot_path) is loaded at
+  startup and saved at exit, so a re-run skips still-fresh answers
+
+Answers are returned as plain records so they can be snapshotted:
+- MX: [(preference, exchange), ...] in answer order
+- Other types: [record text, ...] (A/AAAA: addresses)
+
+Usage:
+    from ops.caching import get_dns_cache
+
+    mx = get_dns_cache().resolve("acme.com", "MX", timeout=5.0)
+
+    # Inside an event loop (dns.asyncresolver, no thread per query)
+    mx = await get_dns_cache().resolve_async("acme.com", "MX", timeout=5.0)
+"""
+
+import os
+import json
+import time
+import atexit
+import asyncio
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import dns.resolver
+    import dns.asyncresolver
+    _DNS_AVAILABLE = True
+except ImportError:
+    _DNS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DNS_CACHE_SNAPSHOT_ENV_VAR = "DNS_CACHE_SNAPSHOT"
+DEFAULT_DNS_CACHE_SIZE = 500_000
+DEFAULT_NEGATIVE_TTL = 300.0     # NXDOMAIN / NoAnswer
+DEFAULT_MIN_TTL = 30.0
+DEFAULT_MAX_TTL = 86400.0
+DEFAULT_DNS_TIMEOUT = 5.0
+
+NXDOMAIN = "NXDOMAIN"
+NO_ANSWER = "NoAnswer"
+_ANY_TYPE = "*"                  # rdtype slot for name-wide NXDOMAIN entries
+
+
+@dataclass
+class DNSCacheStats:
+    """Counters for one DNSCache."""
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    queries: int = 0
+    errors: int = 0
+    evictions: int = 0
+    expired: int = 0
+    snapshot_loaded: int = 0
+
+
+@dataclass
+class _Entry:
+    records: Optional[List[Any]]
+    expires_at: float
+    error: Optional[str] = None          # NXDOMAIN / NoAnswer for negative entries
+
+
+class _InFlight:
+    """A query in progress; other callers for the same key wait on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry: Optional[_Entry] = None
+        self.exception: Optional[BaseException] = None
+
+
+def _negative_exception(error: str) -> Exception:
+    if error == NXDOMAIN:
+        return dns.resolver.NXDOMAIN()
+    return dns.resolver.NoAnswer()
+
+
+def _records_from_answer(rdtype: str, answer: Any) -> List[Any]:
+    if rdtype == "MX":
+        return [(r.preference, str(r.exchange).rstrip('.')) for r in answer]
+    return [str(r) for r in answer]
+
+
+def _answer_ttl(answer: Any) -> Optional[float]:
+    rrset = getattr(answer, 'rrset', None)
+    return getattr(rrset, 'ttl', None)
+
+
+def _consume_exception(task: "asyncio.Task") -> None:
+    """Mark a shared query's exception retrieved even if every waiter was cancelled."""
+    if not task.cancelled():
+        task.exception()
+
+
+class DNSCache:
+    """
+    Thread-safe DNS answer cache with negative caching and coalescing.
+
+    Usage:
+        cache = DNSCache(resolver=dns.resolver.Resolver())
+        records = cache.resolve("acme.com", "MX")
+    """
+
+    def __init__(
+        self,
+        resolver: Any = None,
+        async_resolver: Any = None,
+        maxsize: int = DEFAULT_DNS_CACHE_SIZE,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        min_ttl: float = DEFAULT_MIN_TTL,
+        max_ttl: float = DEFAULT_MAX_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            resolver: Object with resolve(name, rdtype, lifetime=...) returning
+                a dnspython-style answer (default: dns.resolver.Resolver())
+            async_resolver: Same, with a coroutine resolve() for resolve_async()
+                (default: dns.asyncresolver.Resolver(), created on first use)
+            maxsize: Maximum cached (name, type) entries (LRU eviction)
+            negative_ttl: Seconds to cache NXDOMAIN / NoAnswer
+            min_ttl: Floor for positive answer TTLs
+            max_ttl: Ceiling for positive answer TTLs
+            clock: Wall clock (snapshots store absolute expiry times)
+        """
+        if resolver is None:
+            if not _DNS_AVAILABLE:
+                raise ImportError("dnspython is required for DNSCache (pip install dnspython)")
+            resolver = dns.resolver.Resolver()
+        self.resolver = resolver
+        self.async_resolver = async_resolver
+        self.maxsize = max(0, int(maxsize))
+        self.negative_ttl = negative_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str], _InFlight] = {}
+        # asyncio queries in flight, per event loop
+        self._async_in_flight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = DNSCacheStats()
+
+    # -------------------------------------------------------------------------
+    # RESOLVE
+    # -------------------------------------------------------------------------
+
+    def resolve(self, name: str, rdtype: str = "A",
+                timeout: float = DEFAULT_DNS_TIMEOUT) -> List[Any]:
+        """
+        Resolve name/rdtype, answering from cache while the TTL holds.
+
+        Args:
+            name: Domain name
+            rdtype: Record type (A, AAAA, MX, ...)
+            timeout: Query lifetime in seconds (cache misses only)
+
+        Returns:
+            List of records (see module docstring for the format)
+
+        Raises:
+            dns.resolver.NXDOMAIN / dns.resolver.NoAnswer: Live or cached negative answer
+            dns.resolver.Timeout (or other resolver errors): Never cached
+        """
+        key = (name.lower().rstrip('.'), rdtype.upper())
+
+        with self._lock:
+            entry = self._lookup_locked(key)
+            if entry is None:
+                waiter = self._in_flight.get(key)
+                if waiter is None:
+                    waiter = self._in_flight[key] = _InFlight()
+                    owner = True
+                    self._stats.misses += 1
+                else:
+                    owner = False
+                    self._stats.coalesced += 1
+
+        if entry is not None:
+            return self._answer(entry)
+
+        if not owner:
+            waiter.done.wait()
+            if waiter.exception is not None:
+                raise waiter.exception
+            return self._answer(waiter.entry)
+
+        try:
+            waiter.entry = self._query(key, timeout)
+        except BaseException as e:
+            waiter.exception = e
+            raise
+        finally:
+            with self._lock:
+                if waiter.entry is not None:
+                    self._store_locked(key, waiter.entry)
+                del self._in_flight[key]
+            waiter.done.set()
+
+        return self._answer(waiter.entry)
+
+    def _query(self, key: Tuple[str, str], timeout: float) -> _Entry:
+        """Run one live query; negative answers become entries, errors propagate."""
+        name, rdtype = key
+        self._count_query()
+        try:
+            answer = self.resolver.resolve(name, rdtype, lifetime=timeout)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            return self._negative_entry(e)
+        except Exception:
+            self._count_error()
+            raise
+        return self._positive_entry(rdtype, answer)
+
+    def _positive_entry(self, rdtype: str, answer: Any) -> _Entry:
+        ttl = _answer_ttl(answer)
+        ttl = self.max_ttl if ttl is None else min(self.max_ttl, max(self.min_ttl, ttl))
+        return _Entry(_records_from_answer(rdtype, answer), self._clock() + ttl)
+
+    def _negative_entry(self, error: Exception) -> _Entry:
+        kind = NXDOMAIN if isinstance(error, dns.resolver.NXDOMAIN) else NO_ANSWER
+        return _Entry(None, self._clock() + self.negative_ttl, kind)
+
+    def _count_query(self) -> None:
+        with self._lock:
+            self._stats.queries += 1
+
+    def _count_error(self) -> None:
+        with self._lock:
+            self._stats.errors += 1
+
+    # -------------------------------------------------------------------------
+    # RESOLVE (ASYNCIO)
+    # -------------------------------------------------------------------------
+
+    async def resolve_async(self, name: str, rdtype: str = "A",
+                            timeout: float = DEFAULT_DNS_TIMEOUT) -> List[Any]:
+        """
+        Coroutine version of resolve() for event-loop callers.
+
+        Shares entries and stats with resolve(). Tasks on the same loop asking
+        for the same (name, type) await one query; cancelling one waiter does
+        not cancel the query for the others.
+
+        Args:
+            name: Domain name
+            rdtype: Record type (A, AAAA, MX, ...)
+            timeout: Query lifetime in seconds (cache misses only)
+
+        Returns:
+            List of records (see module docstring for the format)
+
+        Raises:
+            Same as resolve()
+        """
+        key = (name.lower().rstrip('.'), rdtype.upper())
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            entry = self._lookup_locked(key)
+            if entry is None:
+                in_flight = self._async_in_flight.setdefault(loop, {})
+                task = in_flight.get(key)
+                if task is None:
+                    task = in_flight[key] = loop.create_task(self._query_async(key, timeout, in_flight))
+                    task.add_done_callback(_consume_exception)
+                    self._stats.misses += 1
+                else:
+                    self._stats.coalesced += 1
+
+        if entry is None:
+            entry = await asyncio.shield(task)
+        return self._answer(entry)
+
+    async def _query_async(self, key: Tuple[str, str], timeout: float,
+                           in_flight: Dict[Tuple[str, str], "asyncio.Task"]) -> _Entry:
+        name, rdtype = key
+        entry = None
+        self._count_query()
+        try:
+            if self.async_resolver is None:
+                self.async_resolver = dns.asyncresolver.Resolver()
+            try:
+                answer = await self.async_resolver.resolve(name, rdtype, lifetime=timeout)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+                entry = self._negative_entry(e)
+            except Exception:
+                self._count_error()
+                raise
+            else:
+                entry = self._positive_entry(rdtype, answer)
+            return entry
+        finally:
+            with self._lock:
+                if entry is not None:
+                    self._store_locked(key, entry)
+                in_flight.pop(key, None)
+
+    @staticmethod
+    def _answer(entry: _Entry) -> List[Any]:
+        if entry.error is not None:
+            raise _negative_exception(entry.error)
+        return list(entry.records)
+
+    def _lookup_locked(self, key: Tuple[str, str]) -> Optional[_Entry]:
+        now = self._clock()
+        for candidate in (key, (key[0], _ANY_TYPE)):
+            entry = self._entries.get(candidate)
+            if entry is None:
+                continue
+            if entry.expires_at <= now:
+                del self._entries[candidate]
+                self._stats.expired += 1
+                continue
+            self._entries.move_to_end(candidate)
+            if entry.error is not None:
+                self._stats.negative_hits += 1
+            else:
+                self._stats.hits += 1
+            return entry
+        return None
+
+    def _store_locked(self, key: Tuple[str, str], entry: _Entry) -> None:
+        if self.maxsize == 0:
+            return
+        if entry.error == NXDOMAIN:
+            # The name does not exist: no record type will resolve
+            key = (key[0], _ANY_TYPE)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    # -------------------------------------------------------------------------
+    # SNAPSHOT
+    # -------------------------------------------------------------------------
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        Write unexpired entries to a JSON snapshot (atomic replace).
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries written
+        """
+        now = self._clock()
+        with self._lock:
+            rows = [
+                [name, rdtype, entry.records, entry.expires_at, entry.error]
+                for (name, rdtype), entry in self._entries.items()
+                if entry.expires_at > now
+            ]
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': 1, 'entries': rows}, f)
+        os.replace(tmp_path, path)
+        return len(rows)
+
+    def load_snapshot(self, path: str) -> int:
+        """
+        Load unexpired entries from a JSON snapshot (missing file is not an error).
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries loaded
+        """
+        try:
+            with open(path) as f:
+                rows = json.load(f).get('entries', [])
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable DNS cache snapshot {path}: {e}")
+            return 0
+
+        now = self._clock()
+        loaded = 0
+        with self._lock:
+            for name, rdtype, records, expires_at, error in rows:
+                if expires_at <= now:
+                    continue
+                if records is not None and rdtype == "MX":
+                    records = [tuple(record) for record in records]
+                self._store_locked((name, rdtype), _Entry(records, expires_at, error))
+                loaded += 1
+            self._stats.snapshot_loaded += loaded
+        return loaded
+
+    # -------------------------------------------------------------------------
+    # MANAGEMENT
+    # -------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = DNSCacheStats()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict with counters, size, maxsize and hit_rate
+        """
+        with self._lock:
+            data = asdict(self._stats)
+            data['size'] = len(self._entries)
+        data['maxsize'] = self.maxsize
+        lookups = data['hits'] + data['negative_hits'] + data['misses'] + data['coalesced']
+        served = lookups - data['misses']
+        data['hit_rate'] = served / lookups if lookups else 0.0
+        return data
+
+
+# =============================================================================
+# PROCESS-WIDE CACHE
+# =============================================================================
+
+_cache: Optional[DNSCache] = None
+_cache_lock = threading.RLock()
+_snapshot_path: Optional[str] = None
+
+
+def _save_snapshot_at_exit() -> None:
+    if _cache is not None and _snapshot_path:
+        try:
+            count = _cache.save_snapshot(_snapshot_path)
+            logger.info(f"Saved {count} DNS cache entries to {_snapshot_path}")
+        except OSError as e:
+            logger.warning(f"Could not save DNS cache snapshot {_snapshot_path}: {e}")
+
+
+def configure_dns_cache(snapshot_path: Optional[str] = None, **options: Any) -> DNSCache:
+    """
+    Replace the process-wide DNS cache.
+
+    Args:
+        snapshot_path: Load this snapshot now and save back to it at exit
+            (default: DNS_CACHE_SNAPSHOT env var, if set)
+        **options: DNSCache keyword arguments (resolver, maxsize, negative_ttl, ...)
+
+    Returns:
+        The new process-wide cache
+    """
+    global _cache, _snapshot_path
+    snapshot_path = snapshot_path or os.environ.get(DNS_CACHE_SNAPSHOT_ENV_VAR) or None
+    cache = DNSCache(**options)
+    if snapshot_path:
+        loaded = cache.load_snapshot(snapshot_path)
+        logger.info(f"Loaded {loaded} DNS cache entries from {snapshot_path}")
+    with _cache_lock:
+        if snapshot_path and not _snapshot_path:
+            atexit.register(_save_snapshot_at_exit)
+        _cache, _snapshot_path = cache, snapshot_path
+    return cache
+
+
+def get_dns_cache() -> DNSCache:
+    """Return the process-wide DNS cache (created on first use)."""
+    cache = _cache
+    if cache is None:
+        with _cache_lock:
+            cache = _cache if _cache is not None else configure_dns_cache()
+    return cache
+
+
+__all__ = [
+    "DNSCache",
+    "DNSCacheStats",
+    "configure_dns_cache",
+    "get_dns_cache",
+    "DNS_CACHE_SNAPSHOT_ENV_VAR",
+    "DEFAULT_DNS_CACHE_SIZE",
+]
@@ -0,0 +1,180 @@
+"""
+Normalization Cache
+===================
+Bounded, process-wide memo cache for deterministic text normalizers
+(company names, domains, cities, states).
+
+The same employer names and domains are normalized over and over: once when
+indices are built, once per person, and again by every hub lookup. Every
+normalizer registered with @cached_normalizer shares one LRU cache, keyed by
+(namespace, arguments), so the total memory is bounded by a single size.
+
+- Results are interned (sys.intern) so repeated names share one string
+- Hit/miss/eviction counters are exposed per namespace via stats()
+- Size is configurable via NORMALIZATION_CACHE_SIZE or
+  configure_normalization_cache(maxsize); maxsize=0 disables caching
+
+Only pure functions may be cached. Normalizers are deterministic per doctrine.
+"""
+
+import os
+import sys
+import functools
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+NORMALIZATION_CACHE_SIZE_ENV_VAR = "NORMALIZATION_CACHE_SIZE"
+DEFAULT_NORMALIZATION_CACHE_SIZE = 200_000
+
+
+class NormalizationCache:
+    """
+    Thread-safe LRU cache shared by all registered normalizers.
+
+    Usage:
+        cache = NormalizationCache(maxsize=100_000)
+        value = cache.get_or_compute("company_name", normalize, (name,))
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_NORMALIZATION_CACHE_SIZE):
+        self.maxsize = max(0, int(maxsize))
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _counter(self, namespace: str) -> Dict[str, int]:
+        counter = self._counters.get(namespace)
+        if counter is None:
+            counter = self._counters[namespace] = {"hits": 0, "misses": 0}
+        return counter
+
+    def get_or_compute(self, namespace: str, func: Callable[..., Any],
+                       args: tuple, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Return the cached result of func(*args, **kwargs), computing on miss.
+
+        Args:
+            namespace: Cache namespace (one per normalizer)
+            func: Normalizer to call on a miss
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            Normalized value
+        """
+        kwargs = kwargs or {}
+        if self.maxsize == 0:
+            return func(*args, **kwargs)
+
+        key = (namespace, args, tuple(sorted(kwargs.items())) if kwargs else ())
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable input - normalize without caching
+            return func(*args, **kwargs)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counter(namespace)["hits"] += 1
+                return self._entries[key]
+
+        result = func(*args, **kwargs)
+        if isinstance(result, str):
+            result = sys.intern(result)
+
+        with self._lock:
+            self._counter(namespace)["misses"] += 1
+            self._entries[key] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        """Change the size bound, evicting least-recently-used entries."""
+        with self._lock:
+            self.maxsize = max(0, int(maxsize))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict with size, maxsize, total hits/misses and per-namespace counters
+        """
+        with self._lock:
+            namespaces = {name: dict(counter) for name, counter in self._counters.items()}
+            size = len(self._entries)
+
+        hits = sum(counter["hits"] for counter in namespaces.values())
+        misses = sum(counter["misses"] for counter in namespaces.values())
+        return {
+            "size": size,
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "namespaces": namespaces,
+        }
+
+
+def _default_size() -> int:
+    value = os.environ.get(NORMALIZATION_CACHE_SIZE_ENV_VAR, "")
+    try:
+        return int(value) if value else DEFAULT_NORMALIZATION_CACHE_SIZE
+    except ValueError:
+        logger.warning(f"Invalid {NORMALIZATION_CACHE_SIZE_ENV_VAR}={value!r}, using default")
+        return DEFAULT_NORMALIZATION_CACHE_SIZE
+
+
+_cache = NormalizationCache(_default_size())
+
+
+def get_normalization_cache() -> NormalizationCache:
+    """Return the process-wide normalization cache."""
+    return _cache
+
+
+def configure_normalization_cache(maxsize: int) -> NormalizationCache:
+    """
+    Resize the process-wide normalization cache.
+
+    Args:
+        maxsize: Maximum cached results across all normalizers (0 disables)
+
+    Returns:
+        The process-wide cache
+    """
+    _cache.resize(maxsize)
+    return _cache
+
+
+def cached_normalizer(namespace: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator: memoize a pure normalizer in the process-wide cache.
+
+    The undecorated function stays available as func.__wrapped__.
+
+    Args:
+        namespace: Unique cache namespace for this normalizer
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return _cache.get_or_compute(namespace, func, args, kwargs)
+        wrapper.cache_namespace = namespace
+        return wrapper
+    return decorator
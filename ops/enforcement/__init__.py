@@ -3,7 +3,12 @@
 
 from .correlation_id import validate_correlation_id, CorrelationIDError
 from .hub_gate import validate_company_anchor, HubGateError
-from .signal_dedup import SignalDeduplicator, DuplicateSignalError
+from .signal_dedup import (
+    SignalDeduplicator,
+    DuplicateSignalError,
+    SQLiteDedupStore,
+    PostgresDedupStore,
+)
 from .error_codes import (
     HubErrorCodes,
     PeopleErrorCodes,
@@ -50,6 +55,8 @@ __all__ = [
     # Signal Deduplication
     "SignalDeduplicator",
     "DuplicateSignalError",
+    "SQLiteDedupStore",
+    "PostgresDedupStore",
     # Error Codes
     "HubErrorCodes",
     "PeopleErrorCodes",
@@ -7,16 +7,26 @@ DOCTRINE: Signals must be deduplicated within time windows.
 
 Mechanism:
 - Deterministic hash: (signal_type + entity_id + window_start)
-- Lookup table for deduplication
+- Lookup table for deduplication (signal_dedup, keyed by dedup_key)
 - Duplicate signal → ignored, no score impact
 
+Storage:
+- In-memory: keys live in time buckets (one per window_end); a whole
+  bucket is dropped in O(1) once its window has closed
+- Persistent: SQLite file or Postgres outreach.signal_dedup table is the
+  source of truth; the bucketed cache fronts it so repeat keys never
+  reach the database
+- should_emit_many(): checks and records a whole batch in one round trip
+
 No probabilistic logic. No ML. No guessing.
 """
 
 import hashlib
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Set
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from threading import Lock
@@ -82,6 +92,192 @@ class DedupEntry:
     count: int = 1
 
 
+# Keys kept in the front cache of a persistent deduplicator before it is reset
+# (the store stays authoritative, so a reset only costs extra lookups)
+FRONT_CACHE_MAX_KEYS = 1_000_000
+
+# Keys per SQLite statement (stays under SQLITE_MAX_VARIABLE_NUMBER)
+SQLITE_CHUNK_KEYS = 500
+
+
+class BucketedKeyCache:
+    """
+    Dedup keys grouped by window_end.
+
+    Windows are aligned (midnight UTC / Jan 1), so every key of a window
+    shares one window_end and the cache only ever holds a handful of
+    buckets. Expiry pops whole buckets off a heap - no per-key scan.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[datetime, Set[str]] = {}
+        self._ends: List[datetime] = []   # min-heap of bucket window_ends
+        self._size = 0
+
+    def __contains__(self, dedup_key: str) -> bool:
+        return any(dedup_key in keys for keys in self._buckets.values())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, dedup_key: str, window_end: datetime) -> None:
+        keys = self._buckets.get(window_end)
+        if keys is None:
+            keys = self._buckets[window_end] = set()
+            heapq.heappush(self._ends, window_end)
+        if dedup_key not in keys:
+            keys.add(dedup_key)
+            self._size += 1
+
+    def expire(self, now: datetime) -> int:
+        """Drop every bucket whose window has closed. Returns keys removed."""
+        removed = 0
+        while self._ends and self._ends[0] <= now:
+            removed += len(self._buckets.pop(heapq.heappop(self._ends)))
+        self._size -= removed
+        return removed
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._ends.clear()
+        self._size = 0
+
+
+class SQLiteDedupStore:
+    """
+    Local signal_dedup table in a SQLite file (single host, many processes).
+
+    Usage:
+        store = SQLiteDedupStore("/var/lib/outreach/signal_dedup.db")
+        dedup = SignalDeduplicator(store=store)
+    """
+
+    CREATE_SQL = """
+        CREATE TABLE IF NOT EXISTS signal_dedup (
+            dedup_key   TEXT PRIMARY KEY,
+            signal_type TEXT NOT NULL,
+            entity_id   TEXT NOT NULL,
+            first_seen  TEXT NOT NULL,
+            window_end  TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, path_or_connection=":memory:"):
+        if isinstance(path_or_connection, sqlite3.Connection):
+            self._conn = path_or_connection
+        else:
+            self._conn = sqlite3.connect(
+                str(path_or_connection), timeout=30, isolation_level=None, check_same_thread=False
+            )
+        self._conn.execute(self.CREATE_SQL)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_signal_dedup_window_end ON signal_dedup (window_end)"
+        )
+
+    @staticmethod
+    def _ts(value: datetime) -> str:
+        return value.isoformat(sep=" ", timespec="microseconds")
+
+    def _existing(self, keys: Sequence[str], now: datetime) -> Set[str]:
+        found: Set[str] = set()
+        for i in range(0, len(keys), SQLITE_CHUNK_KEYS):
+            chunk = keys[i:i + SQLITE_CHUNK_KEYS]
+            rows = self._conn.execute(
+                f"SELECT dedup_key FROM signal_dedup "
+                f"WHERE dedup_key IN ({','.join('?' * len(chunk))}) AND window_end > ?",
+                (*chunk, self._ts(now))
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+    def existing(self, keys: Sequence[str], now: datetime) -> Set[str]:
+        """Keys already recorded in an open window."""
+        return self._existing(list(keys), now)
+
+    def claim(self, entries: Sequence[DedupEntry], now: datetime) -> Set[str]:
+        """Record entries not already present. Returns the keys newly recorded."""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")   # serializes claimers across processes
+        try:
+            taken = self._existing([e.dedup_key for e in entries], now)
+            new = [e for e in entries if e.dedup_key not in taken]
+            conn.executemany(
+                "INSERT OR REPLACE INTO signal_dedup "
+                "(dedup_key, signal_type, entity_id, first_seen, window_end) VALUES (?, ?, ?, ?, ?)",
+                [(e.dedup_key, e.signal_type, e.entity_id, self._ts(e.first_seen), self._ts(e.window_end))
+                 for e in new]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {e.dedup_key for e in new}
+
+    def purge_expired(self, now: datetime) -> int:
+        cur = self._conn.execute("DELETE FROM signal_dedup WHERE window_end <= ?", (self._ts(now),))
+        return cur.rowcount
+
+
+class PostgresDedupStore:
+    """
+    outreach.signal_dedup in Postgres (shared by every worker host).
+
+    Each batch is a single statement: arrays are unnested server-side and
+    ON CONFLICT ... RETURNING reports which keys were newly recorded.
+    """
+
+    def __init__(self, connection, table: str = "outreach.signal_dedup"):
+        self._conn = connection
+        self._table = table
+
+    @staticmethod
+    def _ts(value: datetime) -> datetime:
+        return value.replace(tzinfo=timezone.utc)
+
+    def existing(self, keys: Sequence[str], now: datetime) -> Set[str]:
+        """Keys already recorded in an open window."""
+        with self._conn.cursor() as cur:
+            cur.execute(
+                f"SELECT dedup_key FROM {self._table} "
+                f"WHERE dedup_key = ANY(%s) AND window_end > %s",
+                (list(keys), self._ts(now))
+            )
+            return {row[0] for row in cur.fetchall()}
+
+    def claim(self, entries: Sequence[DedupEntry], now: datetime) -> Set[str]:
+        """Record entries not already present. Returns the keys newly recorded."""
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    INSERT INTO {self._table} (dedup_key, signal_type, entity_id, first_seen, window_end)
+                    SELECT * FROM unnest(%s::text[], %s::text[], %s::text[], %s::timestamptz[], %s::timestamptz[])
+                    ON CONFLICT (dedup_key) DO NOTHING
+                    RETURNING dedup_key
+                    """,
+                    (
+                        [e.dedup_key for e in entries],
+                        [e.signal_type for e in entries],
+                        [e.entity_id for e in entries],
+                        [self._ts(e.first_seen) for e in entries],
+                        [self._ts(e.window_end) for e in entries],
+                    )
+                )
+                claimed = {row[0] for row in cur.fetchall()}
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        return claimed
+
+    def purge_expired(self, now: datetime) -> int:
+        with self._conn.cursor() as cur:
+            cur.execute(f"DELETE FROM {self._table} WHERE window_end <= %s", (self._ts(now),))
+            removed = cur.rowcount
+        self._conn.commit()
+        return removed
+
+
 class SignalDeduplicator:
     """
     Signal deduplication service.
@@ -98,9 +294,18 @@ class SignalDeduplicator:
             dedup.record_emission("SLOT_FILLED", "C001:P001")
         else:
             logger.debug("Duplicate signal dropped")
+
+        # Bulk emitters: one store round trip for the whole batch
+        allowed = dedup.should_emit_many([("FORM_5500_FILED", "C001"), ...])
     """
 
-    def __init__(self, use_persistence: bool = False, db_connection=None):
+    def __init__(
+        self,
+        use_persistence: bool = False,
+        db_connection=None,
+        store=None,
+        clock: Optional[Callable[[], datetime]] = None
+    ):
         """
         Initialize deduplicator.
 
@@ -108,15 +313,32 @@ class SignalDeduplicator:
             use_persistence: If True, use database for persistence (production)
                            If False, use in-memory cache (testing/development)
             db_connection: Database connection for persistent mode
+                           (sqlite3 connection → SQLiteDedupStore,
+                            anything else → PostgresDedupStore)
+            store: Explicit SQLiteDedupStore / PostgresDedupStore (implies persistence)
+            clock: Returns the current UTC time (naive); defaults to datetime.utcnow
         """
-        self._cache: Dict[str, DedupEntry] = {}
-        self._lock = Lock()
-        self._use_persistence = use_persistence
+        if store is None and use_persistence and db_connection is not None:
+            if isinstance(db_connection, sqlite3.Connection):
+                store = SQLiteDedupStore(db_connection)
+            else:
+                store = PostgresDedupStore(db_connection)
+        self._store = store
+        self._use_persistence = store is not None
         self._db = db_connection
-        self._stats = {
+        self._clock = clock or datetime.utcnow
+        # Authoritative in memory mode; a front for the store in persistent mode
+        self._cache = BucketedKeyCache()
+        self._lock = Lock()
+        self._stats = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> Dict[str, int]:
+        return {
             'signals_checked': 0,
             'signals_allowed': 0,
             'signals_blocked': 0,
+            'store_round_trips': 0,
         }
 
     def should_emit(
@@ -146,46 +368,80 @@ class SignalDeduplicator:
         Returns:
             True if signal should be emitted, False if duplicate
         """
-        self._stats['signals_checked'] += 1
+        return self.should_emit_many(
+            [(signal_type, entity_id)],
+            correlation_id=correlation_id,
+            check_only=check_only
+        )[0]
 
-        # Get window type
-        window = SIGNAL_WINDOWS.get(signal_type, SignalWindow.OPERATIONAL)
-        window_hours = WINDOW_HOURS[window]
+    def should_emit_many(
+        self,
+        signals: Iterable[Tuple[str, str]],
+        correlation_id: Optional[str] = None,
+        check_only: bool = False
+    ) -> List[bool]:
+        """
+        Batch form of should_emit().
 
-        # Calculate deterministic window start
-        now = datetime.utcnow()
-        window_start = self._calculate_window_start(now, window_hours)
+        Same window/key logic per signal. Keys missing from the front cache
+        are checked and recorded in ONE store call; a key repeated within the
+        batch is allowed once (unless check_only, which records nothing).
 
-        # Generate deterministic dedup key
-        dedup_key = self._generate_dedup_key(signal_type, entity_id, window_start)
+        Args:
+            signals: (signal_type, entity_id) pairs
+            correlation_id: Optional correlation ID for logging
+            check_only: If True, don't record the emissions (dry run)
+
+        Returns:
+            One bool per signal, in input order (True = emit)
+        """
+        now = self._clock()
+        entries = [self._entry(signal_type, entity_id, now) for signal_type, entity_id in signals]
+        if not entries:
+            return []
 
         with self._lock:
-            # Check cache
-            if self._use_persistence and self._db:
-                exists = self._check_db(dedup_key)
+            self._cache.expire(now)
+            unknown = {}
+            for entry in entries:
+                if entry.dedup_key not in self._cache:
+                    unknown.setdefault(entry.dedup_key, entry)
+
+            if self._use_persistence and unknown:
+                self._stats['store_round_trips'] += 1
+                if check_only:
+                    taken = self._store.existing(list(unknown), now)
+                    fresh = set(unknown) - taken
+                else:
+                    fresh = self._store.claim(list(unknown.values()), now)
+                    taken = set(unknown) - fresh
+                if len(self._cache) + len(unknown) > FRONT_CACHE_MAX_KEYS:
+                    self._cache.clear()
+                # Keys the store already holds are duplicates for the rest of their window
+                for key in taken:
+                    self._cache.add(key, unknown[key].window_end)
             else:
-                exists = dedup_key in self._cache
-
-            if exists:
-                self._stats['signals_blocked'] += 1
-                logger.debug(
-                    f"Duplicate signal blocked: {signal_type} for {entity_id} "
-                    f"(dedup_key: {dedup_key[:16]}..., correlation: {correlation_id})"
-                )
-                return False
-
-            # Record emission if not check_only
-            if not check_only:
-                self._record_internal(
-                    dedup_key=dedup_key,
-                    signal_type=signal_type,
-                    entity_id=entity_id,
-                    window_start=window_start,
-                    window_hours=window_hours
-                )
-
-            self._stats['signals_allowed'] += 1
-            return True
+                fresh = set(unknown)
+
+            results = []
+            for entry in entries:
+                allowed = entry.dedup_key in fresh
+                if allowed and not check_only:
+                    fresh.discard(entry.dedup_key)
+                    self._cache.add(entry.dedup_key, entry.window_end)
+                results.append(allowed)
+
+            allowed_count = sum(results)
+            self._stats['signals_checked'] += len(results)
+            self._stats['signals_allowed'] += allowed_count
+            self._stats['signals_blocked'] += len(results) - allowed_count
+
+        if allowed_count < len(results):
+            logger.debug(
+                f"Duplicate signals blocked: {len(results) - allowed_count} of {len(results)} "
+                f"(correlation: {correlation_id})"
+            )
+        return results
 
     def record_emission(
         self,
@@ -207,23 +463,40 @@ class SignalDeduplicator:
         Returns:
             The dedup_key used
         """
-        window = SIGNAL_WINDOWS.get(signal_type, SignalWindow.OPERATIONAL)
-        window_hours = WINDOW_HOURS[window]
+        return self.record_emissions([(signal_type, entity_id)], correlation_id)[0]
 
-        now = datetime.utcnow()
-        window_start = self._calculate_window_start(now, window_hours)
-        dedup_key = self._generate_dedup_key(signal_type, entity_id, window_start)
+    def record_emissions(
+        self,
+        signals: Iterable[Tuple[str, str]],
+        correlation_id: Optional[str] = None
+    ) -> List[str]:
+        """Batch form of record_emission(). Returns the dedup_keys used."""
+        now = self._clock()
+        entries = [self._entry(signal_type, entity_id, now) for signal_type, entity_id in signals]
 
         with self._lock:
-            self._record_internal(
-                dedup_key=dedup_key,
-                signal_type=signal_type,
-                entity_id=entity_id,
-                window_start=window_start,
-                window_hours=window_hours
-            )
+            self._cache.expire(now)
+            if self._use_persistence and entries:
+                self._stats['store_round_trips'] += 1
+                self._store.claim(entries, now)
+            for entry in entries:
+                self._cache.add(entry.dedup_key, entry.window_end)
+
+        return [entry.dedup_key for entry in entries]
+
+    def _entry(self, signal_type: str, entity_id: str, now: datetime) -> DedupEntry:
+        """Build the dedup entry for one signal at time now."""
+        window = SIGNAL_WINDOWS.get(signal_type, SignalWindow.OPERATIONAL)
+        window_hours = WINDOW_HOURS[window]
+        window_start = self._calculate_window_start(now, window_hours)
 
-        return dedup_key
+        return DedupEntry(
+            dedup_key=self._generate_dedup_key(signal_type, entity_id, window_start),
+            signal_type=signal_type,
+            entity_id=entity_id,
+            first_seen=now,
+            window_end=self._calculate_window_end(window_start, window_hours)
+        )
 
     def _calculate_window_start(self, timestamp: datetime, window_hours: int) -> datetime:
         """
@@ -253,6 +526,17 @@ class SignalDeduplicator:
         window_number = int(hours_since_epoch // window_hours)
         return epoch + timedelta(hours=window_number * window_hours)
 
+    def _calculate_window_end(self, window_start: datetime, window_hours: int) -> datetime:
+        """
+        Next aligned boundary after window_start (when its keys stop blocking).
+
+        Year windows end on the next Jan 1, so a leap year's window is 366
+        days long and still covers Dec 31.
+        """
+        if window_hours >= 365 * 24:
+            return datetime(window_start.year + 1, 1, 1)
+        return window_start + timedelta(hours=window_hours)
+
     def _generate_dedup_key(
         self,
         signal_type: str,
@@ -275,67 +559,22 @@ class SignalDeduplicator:
         key_material = f"{signal_type}:{entity_id}:{window_start.isoformat()}"
         return hashlib.sha256(key_material.encode()).hexdigest()
 
-    def _record_internal(
-        self,
-        dedup_key: str,
-        signal_type: str,
-        entity_id: str,
-        window_start: datetime,
-        window_hours: int
-    ) -> None:
-        """
-        Internal method to record emission (must be called with lock held).
-        """
-        window_end = window_start + timedelta(hours=window_hours)
-
-        entry = DedupEntry(
-            dedup_key=dedup_key,
-            signal_type=signal_type,
-            entity_id=entity_id,
-            first_seen=datetime.utcnow(),
-            window_end=window_end
-        )
-
-        if self._use_persistence and self._db:
-            self._insert_db(entry)
-        else:
-            self._cache[dedup_key] = entry
-
-    def _check_db(self, dedup_key: str) -> bool:
-        """Check if dedup_key exists in database."""
-        # Placeholder for database implementation
-        # In production, this would query:
-        # SELECT 1 FROM signal_dedup WHERE dedup_key = ? AND window_end > NOW()
-        return False
-
-    def _insert_db(self, entry: DedupEntry) -> None:
-        """Insert dedup entry into database."""
-        # Placeholder for database implementation
-        # In production, this would insert:
-        # INSERT INTO signal_dedup (dedup_key, signal_type, entity_id, first_seen, window_end)
-        pass
-
     def cleanup_expired(self) -> int:
         """
-        Remove expired entries from cache.
+        Remove expired entries.
 
-        Call this periodically to prevent memory growth.
+        The cache drops closed windows on every check, so this is only
+        needed to purge the persistent store (e.g. from a nightly job).
 
         Returns:
-            Number of entries removed
+            Number of entries removed (store rows in persistent mode)
         """
-        now = datetime.utcnow()
-        removed = 0
+        now = self._clock()
 
         with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.window_end < now
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-                removed += 1
+            removed = self._cache.expire(now)
+            if self._use_persistence:
+                removed = self._store.purge_expired(now)
 
         return removed
 
@@ -353,11 +592,7 @@ class SignalDeduplicator:
         """Reset deduplicator state (for testing)."""
         with self._lock:
             self._cache.clear()
-            self._stats = {
-                'signals_checked': 0,
-                'signals_allowed': 0,
-                'signals_blocked': 0,
-            }
+            self._stats = self._new_stats()
 
 
 # Global singleton instance
@@ -395,3 +630,22 @@ def should_emit_signal(
         entity_id=entity_id,
         correlation_id=correlation_id
     )
+
+
+def should_emit_signals(
+    signals: Iterable[Tuple[str, str]],
+    correlation_id: Optional[str] = None
+) -> List[bool]:
+    """
+    Bulk form of should_emit_signal() for batch emitters.
+
+    Uses the global deduplicator instance.
+
+    Args:
+        signals: (signal_type, entity_id) pairs
+        correlation_id: Optional correlation ID
+
+    Returns:
+        One bool per signal, in input order (True = emit)
+    """
+    return get_deduplicator().should_emit_many(signals, correlation_id=correlation_id)
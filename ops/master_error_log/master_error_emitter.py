@@ -48,15 +48,26 @@ Usage:
         )
 """
 
+import os
 import uuid
 import json
 import re
+import time
+import queue
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass
 
+try:
+    import fcntl
+except ImportError:     # Windows: no advisory locks, one process per spill file
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -429,6 +440,93 @@ class MasterErrorEmitter:
                             This is FAIL HARD - no error can be emitted without
                             valid correlation_id AND process_id.
         """
+        error_id, params = self._prepare_row(
+            correlation_id=correlation_id,
+            hub=hub,
+            process_id=process_id,
+            pipeline_phase=pipeline_phase,
+            entity_type=entity_type,
+            severity=severity,
+            error_code=error_code,
+            error_message=error_message,
+            unique_id=unique_id,
+            sub_hub=sub_hub,
+            entity_id=entity_id,
+            source_tool=source_tool,
+            retryable=retryable,
+            cost_impact_usd=cost_impact_usd,
+            metadata=metadata
+        )
+
+        # Build insert query (includes unique_id for HEIR compliance)
+        query = """
+            INSERT INTO public.shq_master_error_log (
+                error_id, timestamp_utc, correlation_id, unique_id,
+                hub, sub_hub, process_id, pipeline_phase,
+                entity_type, entity_id,
+                severity, error_code, error_message,
+                source_tool, operating_mode, retryable,
+                cost_impact_usd, metadata
+            ) VALUES (
+                %s, %s, %s, %s,
+                %s, %s, %s, %s,
+                %s, %s,
+                %s, %s, %s,
+                %s, %s, %s,
+                %s, %s
+            )
+        """
+
+        try:
+            self.db.execute(query, params)
+            logger.info(
+                f"Master error emitted: {error_id}",
+                extra={
+                    "error_id": error_id,
+                    "correlation_id": correlation_id,
+                    "hub": hub.value,
+                    "process_id": process_id,
+                    "severity": severity.value,
+                    "error_code": error_code
+                }
+            )
+            return error_id
+
+        except Exception as e:
+            logger.error(
+                f"Failed to emit master error: {e}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "hub": hub.value,
+                    "error_code": error_code
+                }
+            )
+            raise
+
+    def _prepare_row(
+        self,
+        correlation_id: str,
+        hub: Hub,
+        process_id: str,
+        pipeline_phase: str,
+        entity_type: EntityType,
+        severity: Severity,
+        error_code: str,
+        error_message: str,
+        unique_id: Optional[str],
+        sub_hub: Optional[str],
+        entity_id: Optional[str],
+        source_tool: Optional[str],
+        retryable: bool,
+        cost_impact_usd: Optional[float],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Tuple]:
+        """
+        Validate an error event and build its row (MASTER_ERROR_COLUMNS order).
+
+        Raises:
+            ValidationError: FAIL HARD, see emit()
+        """
         # ============================================================
         # MANDATORY VALIDATION - FAIL HARD
         # ============================================================
@@ -472,25 +570,6 @@ class MasterErrorEmitter:
         # Generate error_id
         error_id = str(uuid.uuid4())
 
-        # Build insert query (includes unique_id for HEIR compliance)
-        query = """
-            INSERT INTO public.shq_master_error_log (
-                error_id, timestamp_utc, correlation_id, unique_id,
-                hub, sub_hub, process_id, pipeline_phase,
-                entity_type, entity_id,
-                severity, error_code, error_message,
-                source_tool, operating_mode, retryable,
-                cost_impact_usd, metadata
-            ) VALUES (
-                %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s,
-                %s, %s, %s,
-                %s, %s, %s,
-                %s, %s
-            )
-        """
-
         params = (
             error_id,
             datetime.utcnow(),
@@ -511,32 +590,7 @@ class MasterErrorEmitter:
             cost_impact_usd,
             json.dumps(metadata) if metadata else None
         )
-
-        try:
-            self.db.execute(query, params)
-            logger.info(
-                f"Master error emitted: {error_id}",
-                extra={
-                    "error_id": error_id,
-                    "correlation_id": correlation_id,
-                    "hub": hub.value,
-                    "process_id": process_id,
-                    "severity": severity.value,
-                    "error_code": error_code
-                }
-            )
-            return error_id
-
-        except Exception as e:
-            logger.error(
-                f"Failed to emit master error: {e}",
-                extra={
-                    "correlation_id": correlation_id,
-                    "hub": hub.value,
-                    "error_code": error_code
-                }
-            )
-            raise
+        return error_id, params
 
     def emit_from_event(self, event: MasterErrorEvent) -> str:
         """
@@ -567,6 +621,525 @@ class MasterErrorEmitter:
         )
 
 
+# ============================================================================
+# BUFFERED (ASYNCHRONOUS) EMITTER
+# ============================================================================
+
+# Column order of a prepared row (MasterErrorEmitter._prepare_row)
+MASTER_ERROR_COLUMNS = (
+    "error_id", "timestamp_utc", "correlation_id", "unique_id",
+    "hub", "sub_hub", "process_id", "pipeline_phase",
+    "entity_type", "entity_id",
+    "severity", "error_code", "error_message",
+    "source_tool", "operating_mode", "retryable",
+    "cost_impact_usd", "metadata",
+)
+
+# Default spill file, shared by every buffered emitter of this user. Kept out
+# of the temp dir, which is often cleared on reboot; SHQ_MASTER_ERROR_SPILL
+# overrides it.
+DEFAULT_SPILL_PATH = Path(
+    os.environ.get("SHQ_MASTER_ERROR_SPILL")
+    or Path(os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state")
+    / "shq" / "master_error_spill.jsonl"
+)
+
+# Bytes copied per read when moving a replay file's tail back to the spill file
+SPILL_COPY_CHUNK = 1024 * 1024
+
+# Queue markers for the writer thread
+_FLUSH = object()
+_STOP = object()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class BufferedMasterErrorEmitter(MasterErrorEmitter):
+    """
+    MasterErrorEmitter that writes in multi-row batches on a background thread.
+
+    emit() still validates SYNCHRONOUSLY (ValidationError raises in the
+    caller, FAIL HARD) and returns the error_id; only the INSERT is deferred.
+
+    - Rows are coalesced into one INSERT of up to batch_size rows, written
+      when the batch fills or flush_interval seconds after its first row
+    - Memory is bounded by max_buffer queued rows; once full, emit() appends
+      straight to the spill file instead of growing the queue
+    - If the database is unavailable the batch is appended to a local
+      JSON-lines spill file (append-only) and the database is retried after
+      retry_interval; spilled rows are replayed once a write succeeds, when
+      the writer is idle and retry_interval has passed, and on close();
+      unparseable lines are quarantined rather than blocking the replay
+    - aggregate=True folds identical (process_id, error_code) rows within a
+      batch into the first one; its metadata records aggregated_count,
+      first_seen/last_seen and the folded error_ids / correlation_ids
+
+    Replayed rows use ON CONFLICT (error_id) DO NOTHING, so a replay that
+    stops halfway can be repeated without duplicating history.
+
+    Example:
+        with BufferedMasterErrorEmitter(db_conn, OperatingMode.STEADY_STATE, aggregate=True) as emitter:
+            emitter.emit(correlation_id=..., hub=Hub.PEOPLE, process_id=..., ...)
+        # leaving the block flushes and stops the writer thread
+    """
+
+    def __init__(
+        self,
+        db_connection,
+        operating_mode: OperatingMode,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        spill_path: Optional[Union[str, Path]] = None,
+        aggregate: bool = False,
+        retry_interval: float = 30.0
+    ):
+        """
+        Initialize the buffered emitter and start its writer thread.
+
+        Args:
+            db_connection: Database connection object with execute() method
+            operating_mode: BURN_IN or STEADY_STATE (affects alerting)
+            batch_size: Max rows per INSERT
+            flush_interval: Max seconds a row waits for its batch to fill
+            max_buffer: Max rows queued in memory
+            spill_path: Append-only JSON-lines file used while the DB is down
+                        (defaults to DEFAULT_SPILL_PATH); may be shared by
+                        several processes
+            aggregate: Fold identical (process_id, error_code) rows per batch
+            retry_interval: Seconds to spill without trying the DB after a failure
+        """
+        super().__init__(db_connection, operating_mode)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.aggregate = aggregate
+        self.retry_interval = retry_interval
+        self.spill_path = Path(spill_path) if spill_path else DEFAULT_SPILL_PATH
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_buffer))
+        self._spill_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # Orders emit()/flush() against close(), so nothing is queued after _STOP
+        self._close_lock = threading.Lock()
+        self._retry_at = 0.0
+        self._closed = False
+        self.stats = {
+            "emitted": 0,
+            "rows_written": 0,
+            "batches_written": 0,
+            "rows_aggregated": 0,
+            "rows_spilled": 0,
+            "rows_replayed": 0,
+            "rows_quarantined": 0,
+        }
+        self._thread = threading.Thread(target=self._run, name="master-error-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BufferedMasterErrorEmitter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def emit(self, correlation_id: str, hub: Hub, process_id: str, pipeline_phase: str,
+             entity_type: EntityType, severity: Severity, error_code: str, error_message: str,
+             unique_id: Optional[str] = None, sub_hub: Optional[str] = None,
+             entity_id: Optional[str] = None, source_tool: Optional[str] = None,
+             retryable: bool = False, cost_impact_usd: Optional[float] = None,
+             metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Validate now, write later. Same arguments and ValidationError
+        behaviour as MasterErrorEmitter.emit().
+
+        Returns:
+            error_id: UUID the row will be inserted with
+        """
+        error_id, row = self._prepare_row(
+            correlation_id=correlation_id,
+            hub=hub,
+            process_id=process_id,
+            pipeline_phase=pipeline_phase,
+            entity_type=entity_type,
+            severity=severity,
+            error_code=error_code,
+            error_message=error_message,
+            unique_id=unique_id,
+            sub_hub=sub_hub,
+            entity_id=entity_id,
+            source_tool=source_tool,
+            retryable=retryable,
+            cost_impact_usd=cost_impact_usd,
+            metadata=metadata
+        )
+
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("BufferedMasterErrorEmitter is closed")
+            self._count("emitted", 1)
+            try:
+                self._queue.put_nowait(row)
+                return error_id
+            except queue.Full:
+                pass
+        # Bounded memory: overflow goes to disk, never dropped
+        self._spill([row])
+        return error_id
+
+    def flush(self) -> None:
+        """Block until every row emitted so far is written (or spilled)."""
+        with self._close_lock:
+            if self._closed:
+                return          # close() already wrote everything
+            self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flush, stop the writer thread and try once more to replay the spill
+        file. Further emit() calls raise.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        self._replay_pending_spill()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Emission, batching and spill counters plus current queue depth."""
+        with self._stats_lock:
+            return {**self.stats, "queued": self._queue.qsize()}
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Tuple] = []
+            markers = 0
+            stop = False
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = self._idle_timeout() if deadline is None else deadline - time.monotonic()
+                try:
+                    if timeout is not None and timeout <= 0:
+                        item = self._queue.get_nowait()
+                    else:
+                        item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _FLUSH or item is _STOP:
+                    markers += 1
+                    stop = item is _STOP
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    logger.error(f"Master error writer failed: {e}")
+            elif not markers and time.monotonic() >= self._retry_at:
+                # Idle: nothing new will trigger a replay, so retry on a timer
+                self._replay_pending_spill()
+            for _ in range(len(batch) + markers):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _idle_timeout(self) -> Optional[float]:
+        """How long an idle writer waits: forever, unless spilled rows await replay."""
+        if not self.spill_path.exists():
+            return None
+        # At least flush_interval, so a DB that keeps failing is not hammered
+        return max(self._retry_at - time.monotonic(), self.flush_interval)
+
+    def _replay_pending_spill(self) -> None:
+        if not self.spill_path.exists():
+            return
+        try:
+            self.replay_spill()
+        except Exception as e:
+            logger.error(f"Master error spill replay failed: {e}")
+
+    def _write_batch(self, rows: List[Tuple]) -> None:
+        if self.aggregate:
+            folded = self._aggregate(rows)
+            self._count("rows_aggregated", len(rows) - len(folded))
+            rows = folded
+
+        if time.monotonic() < self._retry_at:
+            self._spill(rows)
+            return
+
+        try:
+            self._insert_rows(rows)
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.retry_interval
+            logger.warning(
+                f"Master error log unavailable, spilling {len(rows)} rows to {self.spill_path}: {e}"
+            )
+            self._spill(rows)
+            return
+
+        self._count("rows_written", len(rows))
+        self._count("batches_written", 1)
+        if self.spill_path.exists():
+            self.replay_spill()
+
+    def _insert_rows(self, rows: Sequence[Tuple]) -> None:
+        """One multi-row INSERT for rows."""
+        placeholders = "(" + ", ".join(["%s"] * len(MASTER_ERROR_COLUMNS)) + ")"
+        query = (
+            f"INSERT INTO public.shq_master_error_log ({', '.join(MASTER_ERROR_COLUMNS)}) "
+            f"VALUES {', '.join([placeholders] * len(rows))} "
+            f"ON CONFLICT (error_id) DO NOTHING"
+        )
+        self.db.execute(query, [value for row in rows for value in row])
+
+    @staticmethod
+    def _aggregate(rows: List[Tuple]) -> List[Tuple]:
+        """Fold rows sharing (process_id, error_code) into the first of each group."""
+        pid = MASTER_ERROR_COLUMNS.index("process_id")
+        code = MASTER_ERROR_COLUMNS.index("error_code")
+        groups: Dict[Tuple[str, str], List[Tuple]] = {}
+        for row in rows:
+            groups.setdefault((row[pid], row[code]), []).append(row)
+
+        ts = MASTER_ERROR_COLUMNS.index("timestamp_utc")
+        meta = MASTER_ERROR_COLUMNS.index("metadata")
+        folded = []
+        for group in groups.values():
+            first = group[0]
+            if len(group) == 1:
+                folded.append(first)
+                continue
+            metadata = json.loads(first[meta]) if first[meta] else {}
+            metadata.update({
+                "aggregated_count": len(group),
+                "first_seen": min(r[ts] for r in group).isoformat(),
+                "last_seen": max(r[ts] for r in group).isoformat(),
+                "aggregated_error_ids": [r[0] for r in group[1:]],
+                "aggregated_correlation_ids": sorted({r[2] for r in group} - {first[2]}),
+            })
+            folded.append(first[:meta] + (json.dumps(metadata),) + first[meta + 1:])
+        return folded
+
+    # ------------------------------------------------------------------
+    # Spill file
+    # ------------------------------------------------------------------
+
+    def _spill(self, rows: Sequence[Tuple]) -> None:
+        lines = "".join(self._row_to_spill(row) for row in rows)
+        with self._locked():
+            self._append(self.spill_path, lines)
+        self._count("rows_spilled", len(rows))
+
+    @property
+    def lock_path(self) -> Path:
+        """File flocked around every spill append, rename and adoption."""
+        return self.spill_path.with_name(f"{self.spill_path.name}.lock")
+
+    @contextmanager
+    def _locked(self):
+        """
+        Exclude other threads (_spill_lock) and other processes (flock on
+        lock_path, which is never renamed) from the spill files.
+        """
+        with self._spill_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _append(path: Path, text: str) -> None:
+        """Append text and fsync, first ending a line torn by a crash mid-append."""
+        with open(path, "a+b") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    text = "\n" + text
+            f.write(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def replay_spill(self) -> int:
+        """
+        Insert every spilled row, batch_size rows at a time. Returns the
+        number replayed.
+
+        The spill file is renamed to a unique replay file first, so concurrent
+        replays never insert the same lines twice. The rename and every
+        append hold the spill lock (threads and processes), so no append can
+        land in a replay file. The replay file is streamed one batch at a time
+        (memory stays bounded however long the outage was), and the byte
+        offset of the last inserted batch is kept in a progress file. If an
+        insert fails, the rest of the file is appended back to the spill file.
+        If the process dies, another one adopts the replay file and resumes
+        from that offset. Lines that do not parse (a torn append) are moved to
+        quarantine_path.
+        """
+        replay_path = self.spill_path.with_name(
+            f"{self.spill_path.name}.{os.getpid()}.{uuid.uuid4().hex}.replay"
+        )
+        with self._locked():
+            self._adopt_orphaned_replays()
+            try:
+                os.replace(self.spill_path, replay_path)
+            except FileNotFoundError:
+                return 0
+
+        progress_path = self._progress_path(replay_path)
+        replayed = 0
+        with open(replay_path, "rb") as f:
+            done = 0
+            try:
+                for rows, rejected, end in self._spill_batches(f):
+                    if rows:
+                        self._insert_rows(rows)
+                        replayed += len(rows)
+                    if rejected:
+                        self._quarantine(rejected)
+                    done = end
+                    self._save_progress(progress_path, done)
+            except Exception as e:
+                self._retry_at = time.monotonic() + self.retry_interval
+                logger.warning(f"Master error spill replay stopped after {replayed} rows: {e}")
+                f.seek(done)
+                with self._locked():
+                    self._append_file(self.spill_path, f)
+        # Only reached once every row is inserted or back in the spill file
+        replay_path.unlink()
+        progress_path.unlink(missing_ok=True)
+
+        self._count("rows_replayed", replayed)
+        return replayed
+
+    @property
+    def quarantine_path(self) -> Path:
+        """Append-only file for spill lines that could not be parsed."""
+        return self.spill_path.with_name(f"{self.spill_path.name}.rejected")
+
+    def _spill_batches(self, f) -> Iterator[Tuple[List[Tuple], List[str], int]]:
+        """
+        Read binary spill file f from its position in batch_size chunks.
+
+        Yields (rows, unparseable lines, offset just past the chunk).
+        """
+        rows: List[Tuple] = []
+        rejected: List[str] = []
+        for raw in iter(f.readline, b""):
+            line = raw.decode("utf-8", errors="replace")
+            if line.strip():
+                try:
+                    rows.append(self._row_from_spill(line))
+                except (ValueError, KeyError, TypeError):
+                    rejected.append(line if line.endswith("\n") else line + "\n")
+            if len(rows) >= self.batch_size:
+                yield rows, rejected, f.tell()
+                rows, rejected = [], []
+        if rows or rejected:
+            yield rows, rejected, f.tell()
+
+    def _quarantine(self, lines: List[str]) -> None:
+        logger.error(
+            f"Master error spill: {len(lines)} unreadable lines moved to {self.quarantine_path}"
+        )
+        with self._locked():
+            self._append(self.quarantine_path, "".join(lines))
+        self._count("rows_quarantined", len(lines))
+
+    @staticmethod
+    def _progress_path(replay_path: Path) -> Path:
+        """Byte offset of replay_path already inserted."""
+        return replay_path.with_name(f"{replay_path.name}.done")
+
+    @staticmethod
+    def _save_progress(path: Path, offset: int) -> None:
+        with open(path, "w") as f:
+            f.write(str(offset))
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _load_progress(path: Path) -> int:
+        try:
+            return int(path.read_text())
+        except (FileNotFoundError, ValueError):
+            return 0        # replay from the start; ON CONFLICT drops repeats
+
+    @staticmethod
+    def _append_file(path: Path, src) -> None:
+        """Append the rest of binary file src to path, as _append() does text."""
+        with open(path, "a+b") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            last = b"\n"
+            for chunk in iter(lambda: src.read(SPILL_COPY_CHUNK), b""):
+                f.write(chunk)
+                last = chunk[-1:]
+            if last != b"\n":
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _adopt_orphaned_replays(self) -> None:
+        """
+        Move the unreplayed part of replay files left by crashed processes
+        back into the spill file (lock held).
+        """
+        prefix = f"{self.spill_path.name}."
+        for path in self.spill_path.parent.glob(f"{self.spill_path.name}.*.replay"):
+            pid = path.name[len(prefix):].split(".", 1)[0]
+            if not pid.isdigit() or int(pid) == os.getpid() or _pid_alive(int(pid)):
+                continue
+            progress_path = self._progress_path(path)
+            try:
+                with open(path, "rb") as f:
+                    f.seek(self._load_progress(progress_path))
+                    self._append_file(self.spill_path, f)
+            except FileNotFoundError:
+                continue
+            path.unlink(missing_ok=True)
+            progress_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _row_to_spill(row: Tuple) -> str:
+        record = dict(zip(MASTER_ERROR_COLUMNS, row))
+        record["timestamp_utc"] = row[MASTER_ERROR_COLUMNS.index("timestamp_utc")].isoformat()
+        return json.dumps(record) + "\n"
+
+    @staticmethod
+    def _row_from_spill(line: str) -> Tuple:
+        record = json.loads(line)
+        record["timestamp_utc"] = datetime.fromisoformat(record["timestamp_utc"])
+        return tuple(record[column] for column in MASTER_ERROR_COLUMNS)
+
+    def _count(self, key: str, n: int) -> None:
+        with self._stats_lock:
+            self.stats[key] += n
+
+
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
@@ -4,4 +4,5 @@
 __all__ = [
     "providers",
     "rate_limiter",
+    "async_waterfall",
 ]
@@ -0,0 +1,353 @@
+"""
+Async Provider Waterfall
+========================
+Runs the tier waterfall for many domains concurrently.
+
+Each domain still walks Tier 0 → Tier 1 → Tier 2 in registry order and
+stops at the first accepted result, so the providers called, the results
+returned and their cost_credits match execute_tier_waterfall(). What
+changes is how the calls are scheduled:
+- One pooled keep-alive httpx.AsyncClient shared by every provider
+- Per-provider concurrency caps (semaphores) and rate caps (token buckets)
+- Free tiers are raced: all providers of the tier start together and, once
+  one resolves the domain, lower-priority in-flight requests are cancelled
+- Paid tiers stay one provider at a time, so no credit is spent on a call
+  the sequential waterfall would not have made
+
+Usage:
+    from ops.providers.async_waterfall import execute_waterfall_many
+
+    results = execute_waterfall_many(registry, ["acme.com", "globex.com"])
+    # {"acme.com": [ProviderResult, ...], ...}
+
+    # Inside an event loop
+    async with AsyncProviderTransport() as transport:
+        results = await run_waterfall_many(registry, domains, transport=transport)
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from .providers import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    ProviderBase,
+    ProviderRegistry,
+    ProviderResult,
+    ProviderTier,
+    ProviderTransport,
+)
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PROVIDER_CONCURRENCY = 4    # in-flight requests per provider
+DEFAULT_DOMAIN_CONCURRENCY = 32     # domains walking the waterfall at once
+DEFAULT_RACE_TIERS = (ProviderTier.TIER_0,)  # free tier: safe to race
+
+TIER_ORDER = (ProviderTier.TIER_0, ProviderTier.TIER_1, ProviderTier.TIER_2)
+
+DomainInput = Union[str, Tuple[str, Optional[str]]]
+
+
+@dataclass
+class TransportStats:
+    """Counters for one AsyncProviderTransport."""
+    requests: int = 0
+    cancelled: int = 0
+    rate_limit_waits: int = 0
+    in_flight: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    max_in_flight: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['in_flight'] = dict(self.in_flight)
+        data['max_in_flight'] = dict(self.max_in_flight)
+        return data
+
+
+class AsyncProviderTransport(ProviderTransport):
+    """
+    Non-blocking transport on a pooled keep-alive httpx.AsyncClient.
+
+    Every request waits for its provider's concurrency slot and rate-limit
+    token before it is sent. Cancelling the awaiting task aborts the
+    request (the slot and connection are released).
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient = None,
+        rate_limiter: RateLimiter = None,
+        provider_concurrency: Dict[str, int] = None,
+        default_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            client: AsyncClient to use (default: pooled client owned by this transport)
+            rate_limiter: Token-bucket limiter (default: one per transport, no global cap)
+            provider_concurrency: In-flight cap per provider name
+            default_concurrency: In-flight cap for providers not listed
+            max_connections: Connection pool size for the default client
+        """
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, DEFAULT_MAX_KEEPALIVE)
+        ))
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+            rate_limiter.global_limit = float('inf')
+        self.rate_limiter = rate_limiter
+        self.provider_concurrency = dict(provider_concurrency or {})
+        self.default_concurrency = default_concurrency
+        self.stats = TransportStats()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._configured: set = set()
+
+    def configure_provider(self, provider: ProviderBase) -> None:
+        """Apply a provider's own rate limit (config 'rate_limit', per minute) once."""
+        if provider.name in self._configured:
+            return
+        self._configured.add(provider.name)
+        if provider.rate_limit_per_minute:
+            self.rate_limiter.set_provider_limit(provider.name, provider.rate_limit_per_minute / 60.0)
+
+    def _semaphore(self, provider_name: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(provider_name)
+        if semaphore is None:
+            limit = self.provider_concurrency.get(provider_name, self.default_concurrency)
+            semaphore = self._semaphores[provider_name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    async def send(self, provider_name: str, method: str, url: str,
+                   **kwargs: Any) -> httpx.Response:
+        stats = self.stats
+        try:
+            async with self._semaphore(provider_name):
+                if await self.rate_limiter.acquire_async(provider_name) > 0:
+                    stats.rate_limit_waits += 1
+                stats.requests += 1
+                stats.in_flight[provider_name] += 1
+                stats.max_in_flight[provider_name] = max(
+                    stats.max_in_flight[provider_name], stats.in_flight[provider_name]
+                )
+                try:
+                    return await self.client.request(method, url, **kwargs)
+                finally:
+                    stats.in_flight[provider_name] -= 1
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncProviderTransport":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+# =============================================================================
+# WATERFALL
+# =============================================================================
+
+async def _call_provider(provider: ProviderBase, domain: str, company_name: Optional[str],
+                         transport: AsyncProviderTransport) -> ProviderResult:
+    """One provider call; exceptions become a failed result so siblings keep running."""
+    try:
+        return await provider.discover_pattern_async(domain, company_name, transport=transport)
+    except Exception as e:
+        logger.warning(f"Provider {provider.name} failed for {domain}: {e}")
+        return ProviderResult(
+            success=False,
+            provider_name=provider.name,
+            tier=provider.get_tier(),
+            error_message=f"{type(e).__name__}: {e}"
+        )
+
+
+async def _race_tier(providers: List[ProviderBase], domain: str, company_name: Optional[str],
+                     transport: AsyncProviderTransport,
+                     accept: Callable[[ProviderResult], bool],
+                     stop_on_pattern: bool) -> Tuple[List[ProviderResult], bool]:
+    """
+    Start every provider of a tier at once, but consume results in priority
+    order. Once one is accepted, cancel the lower-priority calls still running.
+    """
+    tasks = [
+        asyncio.ensure_future(_call_provider(provider, domain, company_name, transport))
+        for provider in providers
+    ]
+    results = []
+    try:
+        for task in tasks:
+            result = await task
+            results.append(result)
+            if stop_on_pattern and accept(result):
+                return results, True
+        return results, False
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def execute_tier_waterfall_async(
+    registry: ProviderRegistry,
+    domain: str,
+    company_name: str = None,
+    max_tier: ProviderTier = ProviderTier.TIER_2,
+    stop_on_pattern: bool = True,
+    transport: AsyncProviderTransport = None,
+    accept: Callable[[ProviderResult], bool] = None,
+    tiers: Sequence[ProviderTier] = None,
+    race_tiers: Sequence[ProviderTier] = DEFAULT_RACE_TIERS,
+) -> List[ProviderResult]:
+    """
+    Async execute_tier_waterfall() for one domain.
+
+    Args:
+        registry: Provider registry
+        domain: Domain to search
+        company_name: Optional company name
+        max_tier: Maximum tier to try
+        stop_on_pattern: Stop when a result is accepted
+        transport: Shared transport (default: a transport for this call)
+        accept: When a result ends the waterfall (default: has_pattern())
+        tiers: Tiers to walk, in order (default: all up to max_tier)
+        race_tiers: Tiers whose providers run concurrently
+
+    Returns:
+        List of ProviderResults from each provider tried, as the blocking
+        waterfall would have returned them
+    """
+    if transport is None:
+        async with AsyncProviderTransport() as owned:
+            return await execute_tier_waterfall_async(
+                registry, domain, company_name, max_tier, stop_on_pattern,
+                owned, accept, tiers, race_tiers
+            )
+
+    accept = accept or ProviderResult.has_pattern
+    tiers = tiers if tiers is not None else [t for t in TIER_ORDER if t.value <= max_tier.value]
+    providers_by_tier = registry.get_all_providers()
+    results = []
+
+    for tier in tiers:
+        providers = [p for p in providers_by_tier.get(tier, []) if p.is_available()[0]]
+        for provider in providers:
+            transport.configure_provider(provider)
+
+        if tier in race_tiers and len(providers) > 1:
+            tier_results, resolved = await _race_tier(
+                providers, domain, company_name, transport, accept, stop_on_pattern
+            )
+            results.extend(tier_results)
+            if resolved:
+                return results
+            continue
+
+        for provider in providers:
+            result = await _call_provider(provider, domain, company_name, transport)
+            results.append(result)
+            if stop_on_pattern and accept(result):
+                return results
+
+    return results
+
+
+async def run_waterfall_many(
+    registry: ProviderRegistry,
+    domains: Iterable[DomainInput],
+    max_tier: ProviderTier = ProviderTier.TIER_2,
+    stop_on_pattern: bool = True,
+    transport: AsyncProviderTransport = None,
+    accept: Callable[[ProviderResult], bool] = None,
+    tiers: Sequence[ProviderTier] = None,
+    race_tiers: Sequence[ProviderTier] = DEFAULT_RACE_TIERS,
+    max_concurrent_domains: int = DEFAULT_DOMAIN_CONCURRENCY,
+    provider_concurrency: Dict[str, int] = None,
+) -> Dict[str, List[ProviderResult]]:
+    """
+    Run the waterfall for many domains concurrently.
+
+    Args:
+        registry: Provider registry
+        domains: Domains, or (domain, company_name) tuples
+        max_tier: Maximum tier to try
+        stop_on_pattern: Stop each domain when a result is accepted
+        transport: Shared transport (default: one for this run, closed after)
+        accept: When a result ends a domain's waterfall (default: has_pattern())
+        tiers: Tiers to walk, in order (default: all up to max_tier)
+        race_tiers: Tiers whose providers run concurrently
+        max_concurrent_domains: Domains in flight at once
+        provider_concurrency: In-flight cap per provider (default transport only)
+
+    Returns:
+        Dict of domain -> ProviderResults (same as execute_tier_waterfall per domain)
+    """
+    if transport is None:
+        async with AsyncProviderTransport(provider_concurrency=provider_concurrency) as owned:
+            return await run_waterfall_many(
+                registry, domains, max_tier, stop_on_pattern, owned, accept,
+                tiers, race_tiers, max_concurrent_domains
+            )
+
+    items = [(d, None) if isinstance(d, str) else (d[0], d[1]) for d in domains]
+    semaphore = asyncio.Semaphore(max_concurrent_domains)
+
+    async def run_domain(domain: str, company_name: Optional[str]) -> List[ProviderResult]:
+        async with semaphore:
+            return await execute_tier_waterfall_async(
+                registry, domain, company_name, max_tier, stop_on_pattern,
+                transport, accept, tiers, race_tiers
+            )
+
+    results = await asyncio.gather(*(run_domain(domain, name) for domain, name in items))
+    return {domain: domain_results for (domain, _), domain_results in zip(items, results)}
+
+
+def execute_waterfall_many(registry: ProviderRegistry, domains: Iterable[DomainInput],
+                           **kwargs: Any) -> Dict[str, List[ProviderResult]]:
+    """
+    Blocking entry point for run_waterfall_many() (starts its own event loop).
+
+    Called from a running event loop, the run gets its own loop on a worker
+    thread (asyncio.run() would raise there); the caller still blocks, so
+    async callers should await run_waterfall_many() instead.
+    """
+    coro = run_waterfall_many(registry, domains, **kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+__all__ = [
+    "AsyncProviderTransport",
+    "TransportStats",
+    "execute_tier_waterfall_async",
+    "run_waterfall_many",
+    "execute_waterfall_many",
+]
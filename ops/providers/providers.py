@@ -4,6 +4,10 @@ Provider Utilities
 API provider wrappers for email pattern discovery.
 Implements tiered waterfall: Tier 0 (free) → Tier 1 (low cost) → Tier 2 (premium).
 
+Providers implement discover_pattern_async() against a ProviderTransport:
+- discover_pattern() / execute_tier_waterfall(): blocking, pooled httpx.Client
+- ops.providers.async_waterfall: many domains concurrently on httpx.AsyncClient
+
 Integrated with Provider Benchmark Engine (PBE) for metrics tracking.
 """
 
@@ -11,7 +15,8 @@ import re
 import time
 import json
 import logging
-import requests
+import threading
+import httpx
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
@@ -84,6 +89,88 @@ class ProviderStats:
     rate_limit_hits: int = 0
 
 
+# =============================================================================
+# HTTP Transport
+# =============================================================================
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+
+
+class ProviderTransport(ABC):
+    """
+    HTTP transport used by providers.
+
+    Providers await send() and sleep(); the transport decides whether that
+    blocks (BlockingTransport) or yields to an event loop
+    (ops.providers.async_waterfall.AsyncProviderTransport).
+    """
+
+    @abstractmethod
+    async def send(self, provider_name: str, method: str, url: str,
+                   **kwargs: Any) -> httpx.Response:
+        """Send one request on behalf of provider_name."""
+        pass
+
+    @abstractmethod
+    async def sleep(self, seconds: float) -> None:
+        """Back off between retries."""
+        pass
+
+
+class BlockingTransport(ProviderTransport):
+    """
+    Blocking transport on a pooled keep-alive httpx.Client.
+
+    Its coroutines never suspend, so run_blocking() can drive a provider's
+    discover_pattern_async() to completion without an event loop.
+    """
+
+    def __init__(self, client: httpx.Client = None):
+        self.client = client or httpx.Client(limits=httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE
+        ))
+
+    async def send(self, provider_name: str, method: str, url: str,
+                   **kwargs: Any) -> httpx.Response:
+        return self.client.request(method, url, **kwargs)
+
+    async def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+_blocking_transport: Optional[BlockingTransport] = None
+_blocking_transport_lock = threading.Lock()
+
+
+def get_blocking_transport() -> BlockingTransport:
+    """Process-wide blocking transport (created on first use)."""
+    global _blocking_transport
+    with _blocking_transport_lock:
+        if _blocking_transport is None:
+            _blocking_transport = BlockingTransport()
+        return _blocking_transport
+
+
+def run_blocking(coro) -> Any:
+    """
+    Run a provider coroutine that only awaits a BlockingTransport.
+
+    Raises:
+        RuntimeError: If the coroutine suspends (awaited a non-blocking transport)
+    """
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("Provider call suspended; await it on an event loop instead")
+
+
 class ProviderBase(ABC):
     """
     Base class for email pattern providers.
@@ -116,15 +203,39 @@ class ProviderBase(ABC):
         self.retry_delay = self.config.get('retry_delay', 1.0)
         self.timeout = self.config.get('timeout', 30)
 
-    @abstractmethod
     def discover_pattern(self, domain: str,
                          company_name: str = None) -> ProviderResult:
         """
+        Discover email pattern for domain (blocking).
+
+        Runs discover_pattern_async() on the shared pooled HTTP client.
+
+        Args:
+            domain: Domain to discover pattern for
+            company_name: Optional company name for context
+
+        Returns:
+            ProviderResult with pattern info
+        """
+        return run_blocking(self.discover_pattern_async(
+            domain, company_name, transport=get_blocking_transport()
+        ))
+
+    @abstractmethod
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
+        """
         Discover email pattern for domain.
 
+        All HTTP goes through transport, so the same code serves the
+        blocking path (discover_pattern) and the concurrent waterfall
+        (ops.providers.async_waterfall).
+
         Args:
             domain: Domain to discover pattern for
             company_name: Optional company name for context
+            transport: Transport for HTTP calls (default: blocking transport)
 
         Returns:
             ProviderResult with pattern info
@@ -237,7 +348,7 @@ class ProviderBase(ABC):
                       headers: Dict = None, params: Dict = None,
                       data: Dict = None, json_data: Dict = None) -> Tuple[bool, Any]:
         """
-        Make HTTP request with retries.
+        Make HTTP request with retries (blocking).
 
         Args:
             method: HTTP method (GET, POST)
@@ -250,13 +361,40 @@ class ProviderBase(ABC):
         Returns:
             Tuple of (success, response_or_error)
         """
+        return run_blocking(self._make_request_async(
+            get_blocking_transport(), method, url,
+            headers=headers, params=params, data=data, json_data=json_data
+        ))
+
+    async def _make_request_async(self, transport: "ProviderTransport",
+                                  method: str, url: str,
+                                  headers: Dict = None, params: Dict = None,
+                                  data: Dict = None, json_data: Dict = None) -> Tuple[bool, Any]:
+        """
+        Make HTTP request with retries through a transport.
+
+        Args:
+            transport: Transport for the call (None: blocking transport)
+            method: HTTP method (GET, POST)
+            url: Request URL
+            headers: HTTP headers
+            params: Query parameters
+            data: Form data
+            json_data: JSON body
+
+        Returns:
+            Tuple of (success, response_or_error)
+        """
+        transport = transport or get_blocking_transport()
+
         for attempt in range(self.max_retries):
             try:
                 start_time = time.time()
 
-                response = requests.request(
-                    method=method,
-                    url=url,
+                response = await transport.send(
+                    self.name,
+                    method,
+                    url,
                     headers=headers,
                     params=params,
                     data=data,
@@ -272,7 +410,7 @@ class ProviderBase(ABC):
                     self.stats.rate_limit_hits += 1
                     wait_time = self.retry_delay * (2 ** attempt)
                     self.logger.warning(f"Rate limited, waiting {wait_time}s")
-                    time.sleep(wait_time)
+                    await transport.sleep(wait_time)
                     continue
 
                 response.raise_for_status()
@@ -283,15 +421,15 @@ class ProviderBase(ABC):
                     'status_code': response.status_code
                 })
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 self.logger.warning(f"Request timeout (attempt {attempt + 1})")
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    await transport.sleep(self.retry_delay)
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 self.logger.error(f"Request failed: {e}")
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    await transport.sleep(self.retry_delay)
                 else:
                     return (False, str(e))
 
@@ -376,8 +514,9 @@ class FirecrawlProvider(ProviderBase):
 
     BASE_URL = "https://api.firecrawl.dev/v0"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Scrape website to find email patterns."""
         start_time = time.time()
 
@@ -404,7 +543,8 @@ class FirecrawlProvider(ProviderBase):
         raw_response = {}
 
         for page_url in pages_to_try:
-            success, response = self._make_request(
+            success, response = await self._make_request_async(
+                transport,
                 method='POST',
                 url=f"{self.BASE_URL}/scrape",
                 headers={
@@ -536,8 +676,9 @@ class GooglePlacesProvider(ProviderBase):
 
     BASE_URL = "https://maps.googleapis.com/maps/api/place"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Get business email from Google Places."""
         start_time = time.time()
 
@@ -559,7 +700,8 @@ class GooglePlacesProvider(ProviderBase):
             )
 
         # Search for the business
-        search_success, search_response = self._make_request(
+        search_success, search_response = await self._make_request_async(
+            transport,
             method='GET',
             url=f"{self.BASE_URL}/findplacefromtext/json",
             params={
@@ -596,7 +738,8 @@ class GooglePlacesProvider(ProviderBase):
 
         # Get place details
         place_id = candidates[0].get('place_id')
-        details_success, details_response = self._make_request(
+        details_success, details_response = await self._make_request_async(
+            transport,
             method='GET',
             url=f"{self.BASE_URL}/details/json",
             params={
@@ -650,8 +793,9 @@ class WebScraperProvider(ProviderBase):
     Method: Direct HTTP scraping of contact pages
     """
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Scrape website contact pages for emails."""
         start_time = time.time()
 
@@ -665,11 +809,13 @@ class WebScraperProvider(ProviderBase):
 
         all_emails = []
 
+        transport = transport or get_blocking_transport()
+
         for url in pages:
             try:
-                response = requests.get(url, timeout=10, headers={
+                response = await transport.send(self.name, 'GET', url, timeout=10, headers={
                     'User-Agent': 'Mozilla/5.0 (compatible; EmailBot/1.0)'
-                })
+                }, follow_redirects=True)
                 if response.status_code == 200:
                     emails = self._extract_emails(response.text, domain)
                     all_emails.extend(emails)
@@ -758,8 +904,9 @@ class HunterProvider(ProviderBase):
 
     BASE_URL = "https://api.hunter.io/v2"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Find email pattern via Hunter.io API."""
         start_time = time.time()
 
@@ -772,7 +919,8 @@ class HunterProvider(ProviderBase):
                 error_message=f"Provider unavailable: {status.value}"
             )
 
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='GET',
             url=f"{self.BASE_URL}/domain-search",
             params={
@@ -864,8 +1012,9 @@ class ClearbitProvider(ProviderBase):
 
     BASE_URL = "https://company.clearbit.com/v2"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Get company info via Clearbit (no direct email pattern)."""
         start_time = time.time()
 
@@ -878,7 +1027,8 @@ class ClearbitProvider(ProviderBase):
                 error_message=f"Provider unavailable: {status.value}"
             )
 
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='GET',
             url=f"{self.BASE_URL}/companies/find",
             headers={'Authorization': f'Bearer {self.api_key}'},
@@ -933,8 +1083,9 @@ class ApolloProvider(ProviderBase):
 
     BASE_URL = "https://api.apollo.io/v1"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Find email pattern via Apollo.io."""
         start_time = time.time()
 
@@ -948,7 +1099,8 @@ class ApolloProvider(ProviderBase):
             )
 
         # Search for people at the company
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='POST',
             url=f"{self.BASE_URL}/mixed_people/search",
             headers={
@@ -1032,8 +1184,9 @@ class ProspeoProvider(ProviderBase):
 
     BASE_URL = "https://api.prospeo.io/v1"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Find email pattern via Prospeo."""
         start_time = time.time()
 
@@ -1046,7 +1199,8 @@ class ProspeoProvider(ProviderBase):
                 error_message=f"Provider unavailable: {status.value}"
             )
 
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='POST',
             url=f"{self.BASE_URL}/domain-search",
             headers={
@@ -1119,8 +1273,9 @@ class SnovProvider(ProviderBase):
 
     BASE_URL = "https://api.snov.io/v1"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Find email pattern via Snov.io."""
         start_time = time.time()
 
@@ -1134,7 +1289,8 @@ class SnovProvider(ProviderBase):
             )
 
         # Get domain emails count first
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='POST',
             url=f"{self.BASE_URL}/get-domain-emails-count",
             data={
@@ -1156,7 +1312,8 @@ class SnovProvider(ProviderBase):
             )
 
         # Get actual emails
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='POST',
             url=f"{self.BASE_URL}/get-domain-emails-with-info",
             data={
@@ -1230,8 +1387,9 @@ class ClayProvider(ProviderBase):
 
     BASE_URL = "https://api.clay.com/v1"
 
-    def discover_pattern(self, domain: str,
-                         company_name: str = None) -> ProviderResult:
+    async def discover_pattern_async(self, domain: str,
+                                     company_name: str = None,
+                                     transport: "ProviderTransport" = None) -> ProviderResult:
         """Get email pattern via Clay."""
         start_time = time.time()
 
@@ -1245,7 +1403,8 @@ class ClayProvider(ProviderBase):
             )
 
         # Clay uses company enrichment
-        success, response = self._make_request(
+        success, response = await self._make_request_async(
+            transport,
             method='POST',
             url=f"{self.BASE_URL}/enrich/company",
             headers={
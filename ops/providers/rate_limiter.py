@@ -11,8 +11,15 @@ Prevents:
 Usage:
     from rate_limiter import rate_limiter, get_rate_limiter_status
 
-    # Before any API call
-    rate_limiter.wait_if_needed("firecrawl")
+    # Before any API call (blocks until a slot is free)
+    rate_limiter.acquire("firecrawl")
+
+    # From asyncio code (yields to the event loop while waiting)
+    await rate_limiter.acquire_async("firecrawl")
+
+    # Skip instead of waiting
+    if rate_limiter.try_acquire("firecrawl"):
+        ...
 
     # After failure
     rate_limiter.record_failure("firecrawl")
@@ -27,25 +34,74 @@ Barton Doctrine ID: 04.04.02.04.enrichment.rate_limiter
 """
 
 import time
-from collections import defaultdict, deque
-from typing import Dict, Optional
+import asyncio
+from collections import defaultdict
+from typing import Callable, Dict, Optional, Tuple
 import threading
 
 
+class TokenBucket:
+    """
+    Token bucket in virtual-scheduling form (GCRA).
+
+    Instead of counting tokens and polling until one appears, the bucket
+    keeps the theoretical arrival time (TAT) of the next conforming call.
+    A caller reserves a slot under the limiter lock and then sleeps exactly
+    until that slot - no polling, no lock held while waiting.
+
+    rate: tokens per second; capacity: burst size (tokens available at once).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tat = float("-inf")
+        self.last_start = float("-inf")  # start of the last call actually let through
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.rate
+
+    def earliest(self, at: float) -> float:
+        """Earliest time >= at when one token is available."""
+        return max(at, self._tat - (self.capacity - 1.0) * self.interval)
+
+    def consume(self, at: float) -> None:
+        """Take one token at time at (at must be >= earliest(at))."""
+        self._tat = max(self._tat, at) + self.interval
+
+
 class RateLimiter:
     """
     Global rate limiter with per-provider limits and circuit breaker.
 
     Features:
-    - Global rate limit (max calls/second across all providers)
-    - Per-provider rate limits (respects each API's limits)
+    - Global token bucket (max calls/second across all providers, evenly paced)
+    - Per-provider token buckets (respects each API's limits)
     - Circuit breaker (stops calling failing providers)
-    - Thread-safe (can be used in async contexts)
+    - acquire() for threads, acquire_async() for asyncio, try_acquire()
+      non-blocking; waiters sleep until their reserved slot (no polling)
+    - Two-phase reservation: the global slot is taken only once the provider
+      slot comes due, so a throttled provider never blocks the others
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+    ):
+        """
+        Args:
+            clock: Monotonic clock (injectable for tests)
+            sleep: Blocking sleep used by acquire()
+            async_sleep: Coroutine sleep used by acquire_async()
+        """
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+
         self.global_limit = 5  # Max 5 calls/second globally
-        self.global_calls = deque()
 
         # Per-provider limits (calls per second)
         # These are CONSERVATIVE estimates - actual limits may be higher
@@ -81,8 +137,12 @@ class RateLimiter:
             "apify": 0.5            # 1 call/2 seconds (actor startup time)
         }
 
-        # Track calls per provider
-        self.provider_calls: Dict[str, deque] = defaultdict(deque)
+        # Token buckets (created lazily from global_limit / provider_limits)
+        self._global_bucket: Optional[TokenBucket] = None
+        self._buckets: Dict[str, TokenBucket] = {}
+
+        # Calls granted per provider
+        self.provider_calls: Dict[str, int] = defaultdict(int)
 
         # Track consecutive failures per provider
         self.provider_failures: Dict[str, int] = defaultdict(int)
@@ -94,7 +154,7 @@ class RateLimiter:
         self.circuit_breaker_threshold = 5  # 5 consecutive failures opens circuit
         self.circuit_breaker_cooldown = 60.0  # 60 seconds cooldown
 
-        # Thread safety
+        # Thread safety (held only to reserve slots, never while waiting)
         self.lock = threading.Lock()
 
         # Stats
@@ -102,83 +162,179 @@ class RateLimiter:
         self.total_waits = 0
         self.total_wait_time = 0.0
 
-    def wait_if_needed(self, provider: str) -> float:
+    # -------------------------------------------------------------------------
+    # ACQUIRE
+    # -------------------------------------------------------------------------
+
+    def acquire(self, provider: str) -> float:
         """
         Block until it's safe to make a call to this provider.
-        Enforces both global and per-provider rate limits.
+        Enforces circuit breaker, global and per-provider rate limits.
 
         Args:
-            provider: Name of the API provider (lowercase)
+            provider: Name of the API provider (case-insensitive)
 
         Returns:
             float: Time spent waiting (seconds)
         """
         provider = provider.lower()
-        wait_start = time.time()
-        total_waited = 0.0
+        requested, due = self._reserve(provider)
+        if due > requested:
+            self._sleep(due - requested)
+            self._close_expired_breaker(provider)
+        at, start = self._take_global(provider, requested, due)
+        if start > at:
+            self._sleep(start - at)
+        return start - requested
+
+    # Backwards-compatible name
+    wait_if_needed = acquire
+
+    async def acquire_async(self, provider: str) -> float:
+        """
+        Await until it's safe to make a call to this provider.
+
+        Same limits as acquire(), but yields to the event loop while waiting.
+        A cancelled waiter keeps its provider slot consumed (never exceeds the rate).
+
+        Returns:
+            float: Time spent waiting (seconds)
+        """
+        provider = provider.lower()
+        requested, due = self._reserve(provider)
+        if due > requested:
+            await self._async_sleep(due - requested)
+            self._close_expired_breaker(provider)
+        at, start = self._take_global(provider, requested, due)
+        if start > at:
+            await self._async_sleep(start - at)
+        return start - requested
+
+    def try_acquire(self, provider: str) -> bool:
+        """
+        Take a call slot only if one is available right now.
+
+        Returns:
+            True if the call may proceed immediately, False otherwise
+        """
+        provider = provider.lower()
+        with self.lock:
+            now = self._clock()
+            if self._circuit_open_locked(provider, now):
+                return False
+            bucket = self._provider_bucket_locked(provider)
+            if bucket.earliest(now) > now or self._global_start_locked(bucket, now) > now:
+                return False
+            bucket.consume(now)
+            self._commit_global_locked(bucket, now, wait=0.0)
+            self.provider_calls[provider] += 1
+            self.total_calls += 1
+            return True
 
+    def _reserve(self, provider: str) -> Tuple[float, float]:
+        """
+        Phase one: reserve the next provider slot.
+
+        Only the provider bucket is charged here. The global slot is taken in
+        phase two, once the provider slot comes due, so a caller queued behind
+        a slow provider never holds global capacity other providers could use.
+
+        Returns:
+            (now, time the provider slot comes due)
+        """
         with self.lock:
+            now = self._clock()
+            earliest = now
+
             # Check circuit breaker first
             if provider in self.circuit_breakers:
                 cooldown_until = self.circuit_breakers[provider]
-                if time.time() < cooldown_until:
-                    wait_time = cooldown_until - time.time()
-                    print(f"  [CIRCUIT BREAKER] {provider} cooling down, waiting {wait_time:.1f}s")
-                    # Release lock while waiting
-                    self.lock.release()
-                    time.sleep(wait_time)
-                    self.lock.acquire()
-                    total_waited += wait_time
-
-                # Circuit breaker expired, reset
-                if provider in self.circuit_breakers:
+                if now < cooldown_until:
+                    print(f"  [CIRCUIT BREAKER] {provider} cooling down, waiting {cooldown_until - now:.1f}s")
+                    earliest = cooldown_until
+                else:
+                    # Circuit breaker expired, reset
                     del self.circuit_breakers[provider]
-                self.provider_failures[provider] = 0
+                    self.provider_failures[provider] = 0
 
-            # Enforce global rate limit
-            now = time.time()
-            self._cleanup_old_calls(self.global_calls, now, 1.0)
-
-            while len(self.global_calls) >= self.global_limit:
-                self.lock.release()
-                time.sleep(0.2)
-                self.lock.acquire()
-                now = time.time()
-                self._cleanup_old_calls(self.global_calls, now, 1.0)
-                total_waited += 0.2
-
-            # Enforce per-provider rate limit
-            provider_limit = self.provider_limits.get(provider, 1.0)
-            min_interval = 1.0 / provider_limit  # Seconds between calls
-
-            provider_queue = self.provider_calls[provider]
-            self._cleanup_old_calls(provider_queue, now, 1.0)
-
-            if provider_queue:
-                time_since_last = now - provider_queue[-1]
-                if time_since_last < min_interval:
-                    wait_time = min_interval - time_since_last
-                    self.lock.release()
-                    time.sleep(wait_time)
-                    self.lock.acquire()
-                    now = time.time()
-                    total_waited += wait_time
-
-            # Record this call
-            self.global_calls.append(now)
-            self.provider_calls[provider].append(now)
+            bucket = self._provider_bucket_locked(provider)
+            due = bucket.earliest(earliest)
+            bucket.consume(due)
+            self.provider_calls[provider] += 1
             self.total_calls += 1
+            return now, due
 
-            if total_waited > 0:
-                self.total_waits += 1
-                self.total_wait_time += total_waited
+    def _take_global(self, provider: str, requested: float, due: float) -> Tuple[float, float]:
+        """
+        Phase two: take the next global slot at or after the provider slot.
 
-        return total_waited
+        Returns:
+            (time of this call, start of the global slot)
+        """
+        with self.lock:
+            at = max(self._clock(), due)
+            bucket = self._provider_bucket_locked(provider)
+            start = self._global_start_locked(bucket, at)
+            self._commit_global_locked(bucket, start, wait=start - requested)
+            return at, start
+
+    def _global_start_locked(self, bucket: TokenBucket, at: float) -> float:
+        # A call delayed by global pacing pushes the provider's next call back too
+        at = max(at, bucket.last_start + bucket.interval)
+        return self._global_bucket_locked().earliest(at)
+
+    def _commit_global_locked(self, bucket: TokenBucket, start: float, wait: float) -> None:
+        self._global_bucket_locked().consume(start)
+        bucket.last_start = max(bucket.last_start, start)
+        if wait > 0:
+            self.total_waits += 1
+            self.total_wait_time += wait
+
+    def _global_bucket_locked(self) -> TokenBucket:
+        bucket = self._global_bucket
+        if bucket is None or bucket.rate != self.global_limit:
+            # Burst of 1: evenly paced, so no 1-second window exceeds global_limit
+            bucket = TokenBucket(self.global_limit, capacity=1.0)
+            if self._global_bucket is not None:
+                bucket._tat = self._global_bucket._tat
+            self._global_bucket = bucket
+        return bucket
+
+    def _provider_bucket_locked(self, provider: str) -> TokenBucket:
+        rate = self.provider_limits.get(provider, 1.0)
+        bucket = self._buckets.get(provider)
+        if bucket is None or bucket.rate != rate:
+            # New provider, or its limit was changed at runtime
+            previous = bucket
+            bucket = self._buckets[provider] = TokenBucket(rate, capacity=1.0)
+            if previous is not None:
+                bucket._tat = previous._tat
+                bucket.last_start = previous.last_start
+        return bucket
+
+    def _close_expired_breaker(self, provider: str) -> None:
+        """After waiting out a cooldown, close the breaker and reset failures."""
+        with self.lock:
+            until = self.circuit_breakers.get(provider)
+            if until is not None and self._clock() >= until:
+                del self.circuit_breakers[provider]
+                self.provider_failures[provider] = 0
 
-    def _cleanup_old_calls(self, queue: deque, now: float, window: float):
-        """Remove calls older than window seconds"""
-        while queue and (now - queue[0]) > window:
-            queue.popleft()
+    def _circuit_open_locked(self, provider: str, now: float) -> bool:
+        return provider in self.circuit_breakers and now < self.circuit_breakers[provider]
+
+    def set_provider_limit(self, provider: str, calls_per_second: float):
+        """
+        Set a provider's rate limit (takes effect on the next acquire).
+
+        Args:
+            provider: Name of the provider
+            calls_per_second: Sustained rate (must be > 0)
+        """
+        if calls_per_second <= 0:
+            raise ValueError(f"calls_per_second must be > 0, got {calls_per_second}")
+        with self.lock:
+            self.provider_limits[provider.lower()] = calls_per_second
 
     def record_failure(self, provider: str):
         """
@@ -194,7 +350,7 @@ class RateLimiter:
 
             if self.provider_failures[provider] >= self.circuit_breaker_threshold:
                 # Open circuit breaker
-                cooldown_until = time.time() + self.circuit_breaker_cooldown
+                cooldown_until = self._clock() + self.circuit_breaker_cooldown
                 self.circuit_breakers[provider] = cooldown_until
                 print(f"  [CIRCUIT BREAKER OPEN] {provider} - {self.circuit_breaker_threshold} consecutive failures")
                 print(f"     Will retry after {self.circuit_breaker_cooldown}s cooldown")
@@ -219,7 +375,7 @@ class RateLimiter:
         provider = provider.lower()
         with self.lock:
             if provider in self.circuit_breakers:
-                return time.time() < self.circuit_breakers[provider]
+                return self._circuit_open_locked(provider, self._clock())
             return False
 
     def get_status(self) -> str:
@@ -243,7 +399,7 @@ class RateLimiter:
                 lines.append("")
                 lines.append("CIRCUIT BREAKERS OPEN:")
                 for provider, until in self.circuit_breakers.items():
-                    remaining = until - time.time()
+                    remaining = until - self._clock()
                     if remaining > 0:
                         lines.append(f"  {provider}: {remaining:.1f}s remaining")
                     else:
@@ -269,7 +425,8 @@ class RateLimiter:
     def reset(self):
         """Reset all state (for testing)"""
         with self.lock:
-            self.global_calls.clear()
+            self._global_bucket = None
+            self._buckets.clear()
             self.provider_calls.clear()
             self.provider_failures.clear()
             self.circuit_breakers.clear()
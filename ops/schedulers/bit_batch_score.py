@@ -19,14 +19,30 @@ Tier Mapping (per Doctrine):
 
 For Tier 3 eligibility: BIT score >= 50 (HOT or BURNING)
 
+Run Modes:
+- Incremental (default): each source keeps a high-water mark on its change
+  column in outreach.bit_score_watermarks (dol.updated_at, blog.created_at,
+  people.updated_at). Only outreach_ids with rows at or past a mark are
+  re-aggregated, so a run scales with the daily delta, not the table size.
+  Marks are held WATERMARK_OVERLAP_MINUTES behind the clock: writers stamp
+  NOW() (their transaction start), so a row can commit after a run with a
+  timestamp below that run's MAX. Each run re-scores that overlap.
+  Falls back to a full rebuild when no watermarks exist yet.
+- Full (--full): re-aggregates every company, then records fresh watermarks.
+  Use after deletes or backfilled timestamps, which the marks cannot see.
+
+Either way bit_score_snapshot is only rewritten where the score changed.
+
 Usage:
-    python ops/schedulers/bit_batch_score.py [--dry-run]
+    python ops/schedulers/bit_batch_score.py [--dry-run] [--full]
 """
 
 import argparse
+import csv
+import io
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional
 from uuid import uuid4
@@ -86,6 +102,134 @@ def get_tier(score: Decimal) -> str:
         return 'COLD'
 
 
+# ============================================================================
+# CHANGE WATERMARKS (incremental mode)
+# ============================================================================
+# source -> (table, change column). Rows at or past a source's high-water mark
+# put their outreach_id back up for scoring. The comparison is >= so rows that
+# share the boundary timestamp are never skipped; re-scoring them is harmless.
+WATERMARK_SOURCES = {
+    'dol': ('outreach.dol', 'updated_at'),
+    'blog': ('outreach.blog', 'created_at'),
+    'people': ('outreach.people', 'updated_at'),
+}
+
+# Stored marks never pass clock_timestamp() minus this. A writer transaction
+# still open when the marks are taken, and shorter than this, stamps a
+# time at or past the mark, so the next run still sees its rows.
+WATERMARK_OVERLAP_MINUTES = 15
+
+# Restricts the score query to the outreach_ids staged for this run: the outer
+# company filter and each per-source pre-aggregation
+INCREMENTAL_SCOPE = "AND ct.outreach_id IN (SELECT outreach_id FROM bit_changed_ids)"
+SOURCE_SCOPE = "WHERE outreach_id IN (SELECT outreach_id FROM bit_changed_ids)"
+
+# ============================================================================
+# SINGLE-PASS SCORING QUERY
+# ============================================================================
+# Each source is pre-aggregated by outreach_id in its own subquery, then joined
+# once onto company_target, so the database does one pass per table and the
+# result streams back through a server-side cursor one page at a time.
+SCORE_QUERY = """
+    SELECT
+        ct.outreach_id,
+        COALESCE(d.dol_signal_count, 0) AS dol_signal_count,
+        COALESCE(d.dol_score, 0) AS dol_score,
+        d.dol_last_signal_at,
+        COALESCE(b.blog_signal_count, 0) AS blog_signal_count,
+        COALESCE(b.blog_score, 0) AS blog_score,
+        b.blog_last_signal_at,
+        COALESCE(p.people_signal_count, 0) AS people_signal_count,
+        COALESCE(p.people_score, 0) AS people_score,
+        p.people_last_signal_at
+    FROM outreach.company_target ct
+    LEFT JOIN (
+        -- DOL signals: Each filing_present=True → +5 per company
+        SELECT
+            outreach_id,
+            COUNT(dol_id) AS dol_signal_count,
+            SUM(CASE WHEN filing_present THEN %(form_5500_filed)s ELSE 0 END) AS dol_score,
+            MAX(updated_at) AS dol_last_signal_at
+        FROM outreach.dol
+        {source_scope}
+        GROUP BY outreach_id
+    ) d ON d.outreach_id = ct.outreach_id
+    LEFT JOIN (
+        -- Blog signals: Each blog record → +5 per company
+        SELECT
+            outreach_id,
+            COUNT(blog_id) AS blog_signal_count,
+            COUNT(blog_id) * %(content_signal)s AS blog_score,
+            MAX(COALESCE(context_timestamp, created_at)) AS blog_last_signal_at
+        FROM outreach.blog
+        {source_scope}
+        GROUP BY outreach_id
+    ) b ON b.outreach_id = ct.outreach_id
+    LEFT JOIN (
+        -- People signals (future - currently 0 records)
+        SELECT
+            outreach_id,
+            COUNT(person_id) AS people_signal_count,
+            COUNT(person_id) * %(slot_filled)s AS people_score,
+            MAX(updated_at) AS people_last_signal_at
+        FROM outreach.people
+        {source_scope}
+        GROUP BY outreach_id
+    ) p ON p.outreach_id = ct.outreach_id
+    WHERE ct.company_unique_id IS NOT NULL
+      AND (d.outreach_id IS NOT NULL OR b.outreach_id IS NOT NULL OR p.outreach_id IS NOT NULL)
+      {scope}
+"""
+
+# Rows fetched per round trip from the server-side cursor (and per COPY)
+DEFAULT_PAGE_SIZE = 10_000
+
+# Scored rows are COPYed into this temp table, then merged with one upsert
+STAGE_COLUMNS = (
+    'outreach_id', 'score', 'score_tier', 'signal_count',
+    'people_score', 'dol_score', 'blog_score', 'talent_flow_score',
+    'last_signal_at',
+)
+
+CREATE_STAGE_SQL = """
+    CREATE TEMP TABLE bit_scores_stage (
+        outreach_id       UUID,
+        score             NUMERIC,
+        score_tier        TEXT,
+        signal_count      INTEGER,
+        people_score      NUMERIC,
+        dol_score         NUMERIC,
+        blog_score        NUMERIC,
+        talent_flow_score NUMERIC,
+        last_signal_at    TIMESTAMPTZ
+    ) ON COMMIT DROP
+"""
+
+MERGE_STAGE_SQL = """
+    INSERT INTO outreach.bit_scores (
+        outreach_id, score, score_tier, signal_count,
+        people_score, dol_score, blog_score, talent_flow_score,
+        last_signal_at, last_scored_at, created_at, updated_at
+    )
+    SELECT
+        outreach_id, score, score_tier, signal_count,
+        people_score, dol_score, blog_score, talent_flow_score,
+        last_signal_at, NOW(), NOW(), NOW()
+    FROM bit_scores_stage
+    ON CONFLICT (outreach_id) DO UPDATE SET
+        score = EXCLUDED.score,
+        score_tier = EXCLUDED.score_tier,
+        signal_count = EXCLUDED.signal_count,
+        people_score = EXCLUDED.people_score,
+        dol_score = EXCLUDED.dol_score,
+        blog_score = EXCLUDED.blog_score,
+        talent_flow_score = EXCLUDED.talent_flow_score,
+        last_signal_at = EXCLUDED.last_signal_at,
+        last_scored_at = NOW(),
+        updated_at = NOW()
+"""
+
+
 def get_db_connection():
     """Get database connection.
     
@@ -103,30 +247,202 @@ def get_db_connection():
     )
 
 
-def batch_score_companies(dry_run: bool = False) -> dict:
+def load_watermarks(cur) -> dict:
+    """Read the stored high-water mark per source ({} before the first run)."""
+    cur.execute("SELECT source, high_water_mark FROM outreach.bit_score_watermarks")
+    return {r['source']: r['high_water_mark'] for r in cur.fetchall()}
+
+
+def capture_high_water_marks(cur, overlap_minutes: int = WATERMARK_OVERLAP_MINUTES) -> dict:
+    """
+    Change mark per source, taken BEFORE aggregating.
+    
+    The mark is the earlier of MAX(change column) and clock_timestamp() -
+    overlap_minutes. Change columns hold each writer's transaction start
+    (NOW()), not its commit time, so a row committed after this query can
+    carry a timestamp below MAX. Holding the mark back keeps such rows at
+    or past it for any writer transaction shorter than the overlap.
+    
+    Args:
+        cur: Open cursor
+        overlap_minutes: How far behind the clock a mark may be
+        
+    Returns:
+        source -> mark (None for a source with no rows)
+    """
+    marks = {}
+    for source, (table, column) in WATERMARK_SOURCES.items():
+        cur.execute(
+            f"SELECT CASE WHEN MAX({column}) IS NULL THEN NULL "
+            f"ELSE LEAST(MAX({column}), clock_timestamp() - make_interval(mins => %s)) END "
+            f"AS high_water_mark FROM {table}",
+            (overlap_minutes,)
+        )
+        marks[source] = cur.fetchone()['high_water_mark']
+    return marks
+
+
+def save_watermarks(cur, marks: dict) -> None:
+    """Advance the stored marks (sources with no rows yet are left unset)."""
+    rows = [
+        {'source': source, 'high_water_mark': mark}
+        for source, mark in marks.items() if mark is not None
+    ]
+    if rows:
+        execute_batch(cur, """
+            INSERT INTO outreach.bit_score_watermarks (source, high_water_mark, updated_at)
+            VALUES (%(source)s, %(high_water_mark)s, NOW())
+            ON CONFLICT (source) DO UPDATE SET
+                high_water_mark = EXCLUDED.high_water_mark,
+                updated_at = NOW()
+        """, rows)
+
+
+def stage_changed_outreach_ids(cur, watermarks: dict) -> int:
+    """
+    Collect outreach_ids with new or changed signals into the session-local
+    temp table bit_changed_ids.
+    
+    Args:
+        cur: Open cursor (the temp table lives for the connection)
+        watermarks: Stored marks; a source without one is scanned in full
+        
+    Returns:
+        Number of distinct outreach_ids staged
+    """
+    selects, params = [], []
+    for source, (table, column) in WATERMARK_SOURCES.items():
+        if watermarks.get(source) is None:
+            selects.append(f"SELECT outreach_id FROM {table} WHERE outreach_id IS NOT NULL")
+        else:
+            selects.append(
+                f"SELECT outreach_id FROM {table} WHERE {column} >= %s AND outreach_id IS NOT NULL"
+            )
+            params.append(watermarks[source])
+    
+    cur.execute("DROP TABLE IF EXISTS bit_changed_ids")
+    cur.execute(
+        "CREATE TEMP TABLE bit_changed_ids AS " + " UNION ".join(selects),
+        params
+    )
+    cur.execute("ALTER TABLE bit_changed_ids ADD PRIMARY KEY (outreach_id)")
+    cur.execute("ANALYZE bit_changed_ids")
+    cur.execute("SELECT COUNT(*) AS changed FROM bit_changed_ids")
+    return cur.fetchone()['changed']
+
+
+def score_company(row: dict, stale_threshold: datetime, stats: dict) -> Optional[dict]:
     """
-    Batch score all companies with signals.
+    Combine one company's per-source aggregates into a bit_scores record.
+    
+    Args:
+        row: Row from SCORE_QUERY (scores arrive as Decimal, counts as int)
+        stale_threshold: Signals older than this count as stale
+        stats: Run statistics, updated in place
+        
+    Returns:
+        Record keyed by STAGE_COLUMNS, or None when the total score is zero
+    """
+    dol_score = row['dol_score']
+    blog_score = row['blog_score']
+    people_score = row['people_score']
+    talent_flow_score = Decimal('0')  # Not implemented yet
+    
+    total_score = dol_score + blog_score + people_score + talent_flow_score
+    
+    # Only process companies with at least one signal
+    if total_score <= 0:
+        return None
+    
+    signal_count = row['dol_signal_count'] + row['blog_signal_count'] + row['people_signal_count']
+    
+    # Determine last signal timestamp (most recent across all sources)
+    valid_timestamps = [
+        t for t in (row['dol_last_signal_at'], row['blog_last_signal_at'], row['people_last_signal_at'])
+        if t is not None
+    ]
+    last_signal_at = max(valid_timestamps) if valid_timestamps else None
+    
+    tier = get_tier(total_score)
+    stats['tier_distribution'][tier] += 1
+    stats['signals_counted'] += signal_count
+    
+    for source in ('dol', 'blog', 'people'):
+        if row[f'{source}_score'] > 0:
+            stats['source_companies'][source] += 1
+    
+    if total_score >= TIER_THRESHOLDS['HOT']:
+        stats['companies_tier3_eligible'] += 1
+    
+    # Track stale companies (no signals in 30+ days)
+    if last_signal_at and last_signal_at.replace(tzinfo=None) < stale_threshold:
+        stats['stale_companies'] += 1
+    
+    return {
+        'outreach_id': row['outreach_id'],
+        'score': total_score,
+        'score_tier': tier,
+        'signal_count': signal_count,
+        'people_score': people_score,
+        'dol_score': dol_score,
+        'blog_score': blog_score,
+        'talent_flow_score': talent_flow_score,
+        'last_signal_at': last_signal_at,
+    }
+
+
+def copy_to_stage(cur, records: list) -> None:
+    """COPY one page of scored records into bit_scores_stage."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        writer.writerow(['' if record[c] is None else record[c] for c in STAGE_COLUMNS])
+    buffer.seek(0)
+    
+    cur.copy_expert(
+        f"COPY bit_scores_stage ({', '.join(STAGE_COLUMNS)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '')",
+        buffer
+    )
+
+
+def batch_score_companies(dry_run: bool = False, full: bool = False,
+                          page_size: int = DEFAULT_PAGE_SIZE) -> dict:
+    """
+    Batch score companies with signals.
     
     Process:
-    1. Aggregate signals from DOL, Blog tables by outreach_id
-    2. Calculate total score and component scores
-    3. Determine tier
-    4. Upsert to bit_scores table
+    1. Capture per-source high-water marks; in incremental mode stage the
+       outreach_ids with signals at or past the stored marks
+    2. Aggregate DOL, Blog, People signals in one query (staged ids only,
+       unless full), read through a server-side cursor page by page
+    3. Calculate total score, component scores and tier per row; COPY each
+       page into a temp staging table
+    4. Merge the stage into bit_scores, refresh changed bit_score_snapshot
+       values and advance the watermarks in one transaction
+    
+    Memory stays at one page of rows whatever the number of companies.
     
     Args:
         dry_run: If True, don't commit changes
+        full: If True, re-score every company instead of the changed ones
+        page_size: Rows per server-side cursor fetch and per COPY
         
     Returns:
-        Statistics dict
+        Statistics dict (tier figures cover the companies re-scored this run)
     """
     conn = get_db_connection()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     stats = {
+        'mode': 'full' if full else 'incremental',
+        'changed_companies': None,  # incremental only
+        'snapshots_updated': 0,
         'companies_processed': 0,
         'companies_updated': 0,
         'companies_created': 0,
         'signals_counted': 0,
+        'source_companies': {'dol': 0, 'blog': 0, 'people': 0},
         'tier_distribution': {'COLD': 0, 'WARM': 0, 'HOT': 0, 'BURNING': 0},
         'companies_tier3_eligible': 0,  # BIT >= 50
         'stale_companies': 0,  # No signals in 30+ days
@@ -137,180 +453,95 @@ def batch_score_companies(dry_run: bool = False) -> dict:
     
     try:
         # ====================================================================
-        # STEP 1: Calculate scores from signal sources
+        # STEP 0: Watermarks - decide what needs re-scoring
         # ====================================================================
         
-        # DOL signals: Each filing_present=True → +5 per company
-        logger.info("Aggregating DOL signals...")
-        cur.execute("""
-            SELECT 
-                ct.outreach_id,
-                ct.company_unique_id,
-                COUNT(d.dol_id) as dol_signal_count,
-                COALESCE(SUM(CASE WHEN d.filing_present THEN %s ELSE 0 END), 0) as dol_score,
-                MAX(d.updated_at) as dol_last_signal_at
-            FROM outreach.company_target ct
-            LEFT JOIN outreach.dol d ON d.outreach_id = ct.outreach_id
-            WHERE ct.company_unique_id IS NOT NULL
-            GROUP BY ct.outreach_id, ct.company_unique_id
-        """, (SIGNAL_IMPACTS['form_5500_filed'],))
-        dol_scores = {r['outreach_id']: r for r in cur.fetchall()}
-        logger.info(f"  Found {len([d for d in dol_scores.values() if d['dol_score'] > 0])} companies with DOL signals")
-        
-        # Blog signals: Each blog record → +5 per company
-        # Note: Blog uses outreach_id directly
-        logger.info("Aggregating Blog signals...")
-        cur.execute("""
-            SELECT 
-                ct.outreach_id,
-                COUNT(b.blog_id) as blog_signal_count,
-                COALESCE(COUNT(b.blog_id) * %s, 0) as blog_score,
-                MAX(COALESCE(b.context_timestamp, b.created_at)) as blog_last_signal_at
-            FROM outreach.company_target ct
-            LEFT JOIN outreach.blog b ON b.outreach_id = ct.outreach_id
-            WHERE ct.company_unique_id IS NOT NULL
-            GROUP BY ct.outreach_id
-        """, (SIGNAL_IMPACTS['content_signal'],))
-        blog_scores = {r['outreach_id']: r for r in cur.fetchall()}
-        logger.info(f"  Found {len([b for b in blog_scores.values() if b['blog_score'] > 0])} companies with Blog signals")
+        marks = capture_high_water_marks(cur)
+        scope, source_scope = "", ""
         
-        # People signals (future - currently 0 records)
-        logger.info("Aggregating People signals...")
-        cur.execute("""
-            SELECT 
-                ct.outreach_id,
-                COUNT(p.person_id) as people_signal_count,
-                COALESCE(COUNT(p.person_id) * %s, 0) as people_score,
-                MAX(p.updated_at) as people_last_signal_at
-            FROM outreach.company_target ct
-            LEFT JOIN outreach.people p ON p.outreach_id = ct.outreach_id
-            WHERE ct.company_unique_id IS NOT NULL
-            GROUP BY ct.outreach_id
-        """, (SIGNAL_IMPACTS['slot_filled'],))
-        people_scores = {r['outreach_id']: r for r in cur.fetchall()}
-        people_with_signals = len([p for p in people_scores.values() if p['people_score'] > 0])
-        logger.info(f"  Found {people_with_signals} companies with People signals")
+        if not full:
+            watermarks = load_watermarks(cur)
+            if not watermarks:
+                logger.info("No watermarks recorded yet - running a full rebuild")
+                stats['mode'] = 'full'
+            else:
+                stats['changed_companies'] = stage_changed_outreach_ids(cur, watermarks)
+                scope, source_scope = INCREMENTAL_SCOPE, SOURCE_SCOPE
+                logger.info(f"{stats['changed_companies']} companies with new or changed signals since last run")
+                
+                if stats['changed_companies'] == 0:
+                    if not dry_run:
+                        save_watermarks(cur, marks)
+                        conn.commit()
+                    return stats
         
         # ====================================================================
-        # STEP 2: Combine scores and upsert to bit_scores
+        # STEP 1-2: Stream per-company aggregates, score and stage each page
         # ====================================================================
         
-        logger.info("Calculating combined scores...")
-        
-        # Get all outreach_ids from company_target
-        all_outreach_ids = set(dol_scores.keys()) | set(blog_scores.keys()) | set(people_scores.keys())
+        if not dry_run:
+            cur.execute(CREATE_STAGE_SQL)
         
         # Staleness threshold: 30 days
-        from datetime import timedelta
         stale_threshold = datetime.now() - timedelta(days=30)
         
-        batch_data = []
-        for outreach_id in all_outreach_ids:
-            dol_data = dol_scores.get(outreach_id, {'dol_score': Decimal('0'), 'dol_signal_count': 0, 'dol_last_signal_at': None})
-            blog_data = blog_scores.get(outreach_id, {'blog_score': Decimal('0'), 'blog_signal_count': 0, 'blog_last_signal_at': None})
-            people_data = people_scores.get(outreach_id, {'people_score': Decimal('0'), 'people_signal_count': 0, 'people_last_signal_at': None})
-            
-            dol_score = Decimal(str(dol_data['dol_score']))
-            blog_score = Decimal(str(blog_data['blog_score']))
-            people_score = Decimal(str(people_data['people_score']))
-            talent_flow_score = Decimal('0')  # Not implemented yet
-            
-            total_score = dol_score + blog_score + people_score + talent_flow_score
-            signal_count = (
-                dol_data['dol_signal_count'] + 
-                blog_data['blog_signal_count'] + 
-                people_data['people_signal_count']
+        logger.info("Aggregating DOL, Blog and People signals...")
+        stream = conn.cursor(name='bit_score_stream', cursor_factory=RealDictCursor)
+        stream.itersize = page_size
+        try:
+            stream.execute(
+                SCORE_QUERY.format(scope=scope, source_scope=source_scope),
+                SIGNAL_IMPACTS
             )
-            
-            # Determine last signal timestamp (most recent across all sources)
-            signal_timestamps = [
-                dol_data.get('dol_last_signal_at'),
-                blog_data.get('blog_last_signal_at'),
-                people_data.get('people_last_signal_at'),
-            ]
-            valid_timestamps = [t for t in signal_timestamps if t is not None]
-            last_signal_at = max(valid_timestamps) if valid_timestamps else None
-            
-            # Only process companies with at least one signal
-            if total_score > 0:
-                tier = get_tier(total_score)
-                stats['tier_distribution'][tier] += 1
-                stats['signals_counted'] += signal_count
-                
-                if total_score >= TIER_THRESHOLDS['HOT']:
-                    stats['companies_tier3_eligible'] += 1
-                
-                # Track stale companies (no signals in 30+ days)
-                if last_signal_at and last_signal_at.replace(tzinfo=None) < stale_threshold:
-                    stats['stale_companies'] += 1
+            while True:
+                page = stream.fetchmany(page_size)
+                if not page:
+                    break
                 
-                batch_data.append({
-                    'outreach_id': outreach_id,
-                    'score': total_score,
-                    'score_tier': tier,
-                    'signal_count': signal_count,
-                    'people_score': people_score,
-                    'dol_score': dol_score,
-                    'blog_score': blog_score,
-                    'talent_flow_score': talent_flow_score,
-                    'last_signal_at': last_signal_at,
-                })
+                records = [r for r in (score_company(row, stale_threshold, stats) for row in page) if r]
+                stats['companies_processed'] += len(records)
+                if records and not dry_run:
+                    copy_to_stage(cur, records)
+        finally:
+            stream.close()
         
-        stats['companies_processed'] = len(batch_data)
-        logger.info(f"Prepared {len(batch_data)} companies for scoring")
+        for source, count in stats['source_companies'].items():
+            logger.info(f"  Found {count} companies with {source.upper()} signals")
+        logger.info(f"Prepared {stats['companies_processed']} companies for scoring")
         
         # ====================================================================
-        # STEP 3: Upsert to bit_scores
+        # STEP 3: Merge the stage into bit_scores
         # ====================================================================
         
-        if not dry_run and batch_data:
+        if not dry_run and stats['companies_processed']:
             logger.info("Upserting to outreach.bit_scores...")
-            
-            upsert_sql = """
-                INSERT INTO outreach.bit_scores (
-                    outreach_id, score, score_tier, signal_count,
-                    people_score, dol_score, blog_score, talent_flow_score,
-                    last_signal_at, last_scored_at, created_at, updated_at
-                ) VALUES (
-                    %(outreach_id)s, %(score)s, %(score_tier)s, %(signal_count)s,
-                    %(people_score)s, %(dol_score)s, %(blog_score)s, %(talent_flow_score)s,
-                    %(last_signal_at)s, NOW(), NOW(), NOW()
-                )
-                ON CONFLICT (outreach_id) DO UPDATE SET
-                    score = EXCLUDED.score,
-                    score_tier = EXCLUDED.score_tier,
-                    signal_count = EXCLUDED.signal_count,
-                    people_score = EXCLUDED.people_score,
-                    dol_score = EXCLUDED.dol_score,
-                    blog_score = EXCLUDED.blog_score,
-                    talent_flow_score = EXCLUDED.talent_flow_score,
-                    last_signal_at = EXCLUDED.last_signal_at,
-                    last_scored_at = NOW(),
-                    updated_at = NOW()
-            """
-            
-            execute_batch(cur, upsert_sql, batch_data, page_size=1000)
-            conn.commit()
-            
-            stats['companies_updated'] = len(batch_data)
-            logger.info(f"Upserted {len(batch_data)} bit_scores")
+            cur.execute(MERGE_STAGE_SQL)
+            stats['companies_updated'] = stats['companies_processed']
+            logger.info(f"Upserted {stats['companies_updated']} bit_scores")
         
         # ====================================================================
-        # STEP 4: Update bit_score_snapshot in company_target
+        # STEP 4: Update changed bit_score_snapshot values, advance watermarks
         # ====================================================================
         
-        if not dry_run and batch_data:
-            logger.info("Updating bit_score_snapshot in company_target...")
+        if not dry_run:
+            if stats['companies_processed']:
+                logger.info("Updating bit_score_snapshot in company_target...")
+                
+                update_snapshot_sql = """
+                    UPDATE outreach.company_target ct
+                    SET bit_score_snapshot = bs.score::integer
+                    FROM outreach.bit_scores bs
+                    WHERE ct.outreach_id = bs.outreach_id
+                      AND ct.bit_score_snapshot IS DISTINCT FROM bs.score::integer
+                      {scope}
+                """.format(scope=scope)
+                cur.execute(update_snapshot_sql)
+                stats['snapshots_updated'] = cur.rowcount
+                logger.info(f"Updated {stats['snapshots_updated']} bit_score_snapshot values")
             
-            update_snapshot_sql = """
-                UPDATE outreach.company_target ct
-                SET bit_score_snapshot = bs.score::integer
-                FROM outreach.bit_scores bs
-                WHERE ct.outreach_id = bs.outreach_id
-            """
-            cur.execute(update_snapshot_sql)
+            # Scores, snapshots and watermarks land together or not at all
+            save_watermarks(cur, marks)
             conn.commit()
-            logger.info("Updated bit_score_snapshot values")
         
     except Exception as e:
         logger.error(f"Error during batch scoring: {e}")
@@ -327,6 +558,10 @@ def batch_score_companies(dry_run: bool = False) -> dict:
 def main():
     parser = argparse.ArgumentParser(description='BIT Batch Scoring Engine')
     parser.add_argument('--dry-run', action='store_true', help='Run without committing changes')
+    parser.add_argument('--full', action='store_true',
+                        help='Re-score every company instead of only those with changed signals')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help='Rows per server-side cursor fetch and COPY batch')
     args = parser.parse_args()
     
     logger.info("=" * 60)
@@ -337,14 +572,18 @@ def main():
         logger.info("*** DRY RUN MODE - No changes will be committed ***")
     
     try:
-        stats = batch_score_companies(dry_run=args.dry_run)
+        stats = batch_score_companies(dry_run=args.dry_run, full=args.full, page_size=args.page_size)
         
         logger.info("")
         logger.info("=" * 60)
         logger.info("RESULTS")
         logger.info("=" * 60)
+        logger.info(f"Mode: {stats['mode']}")
+        if stats['changed_companies'] is not None:
+            logger.info(f"Companies with changed signals: {stats['changed_companies']}")
         logger.info(f"Companies processed: {stats['companies_processed']}")
         logger.info(f"Companies updated: {stats['companies_updated']}")
+        logger.info(f"Snapshots updated: {stats['snapshots_updated']}")
         logger.info(f"Total signals counted: {stats['signals_counted']}")
         logger.info("")
         logger.info("Tier Distribution:")
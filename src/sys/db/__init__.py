@@ -11,6 +11,15 @@ from .guarded_connection import (
     wrap_connection,
     with_schema_guard,
 )
+from .connection_pool import (
+    ConnectionPool,
+    PooledConnection,
+    PoolStats,
+    PoolTimeoutError,
+    get_pool,
+    close_all_pools,
+    all_pool_stats,
+)
 
 __all__ = [
     "GuardedCursor",
@@ -21,4 +30,11 @@ __all__ = [
     "wrap_cursor",
     "wrap_connection",
     "with_schema_guard",
+    "ConnectionPool",
+    "PooledConnection",
+    "PoolStats",
+    "PoolTimeoutError",
+    "get_pool",
+    "close_all_pools",
+    "all_pool_stats",
 ]
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Shared Connection Pool — Reuse Neon Connections Across Lookups
+
+Opening a Neon connection costs a TCP + TLS handshake and authentication,
+which dwarfs the cost of a point lookup. This module keeps one thread-safe
+pool per DSN so writers, hub lookups, dumb workers and guarded connections
+reuse warm connections instead of reconnecting per call.
+
+Usage:
+    from src.sys.db.connection_pool import get_pool
+
+    pool = get_pool(dsn, min_size=1, max_size=10)
+
+    # Option 1: Context manager (released on exit, rolled back on error)
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+
+    # Option 2: Drop-in psycopg2 connection - close() returns it to the pool
+    conn = pool.getconn()
+    ...
+    conn.close()
+
+Pool behaviour:
+- min_size connections are kept warm; at most max_size are open at once
+- Checkout blocks up to `timeout` seconds when the pool is exhausted
+- Health check on checkout: broken connections are discarded, and
+  connections idle longer than `ping_after` are pinged with SELECT 1
+- Connections idle longer than `idle_timeout` are evicted (down to min_size)
+- Released connections are rolled back so no transaction leaks between users
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MIN_SIZE = 1
+DEFAULT_MAX_SIZE = 10
+DEFAULT_IDLE_TIMEOUT = 300.0   # seconds before an idle connection is evicted
+DEFAULT_PING_AFTER = 30.0      # seconds idle before checkout pings the server
+DEFAULT_TIMEOUT = 30.0         # seconds to wait for a free connection
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the timeout."""
+    pass
+
+
+@dataclass
+class PoolStats:
+    """Counters for one connection pool."""
+    created: int = 0
+    reused: int = 0
+    checkouts: int = 0
+    releases: int = 0
+    evicted: int = 0
+    discarded: int = 0
+    health_check_failures: int = 0
+    waits: int = 0
+    in_use: int = 0
+    idle: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+# =============================================================================
+# POOLED CONNECTION
+# =============================================================================
+
+class PooledConnection:
+    """
+    psycopg2 connection proxy whose close() returns it to the pool.
+
+    Everything else is delegated to the underlying connection, so existing
+    code that calls conn.cursor()/commit()/close() works unchanged.
+    """
+
+    def __init__(self, pool: "ConnectionPool", connection: Any):
+        self._pool = pool
+        self._connection = connection
+        self._released = False
+
+    @property
+    def closed(self) -> int:
+        """Non-zero once released to the pool or closed by the server."""
+        if self._released:
+            return 1
+        return self._connection.closed
+
+    def close(self) -> None:
+        """Return the connection to the pool (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._connection)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._released:
+            raise AttributeError(f"connection already returned to pool ({name})")
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._connection, name, value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None and not self._released:
+            self._connection.rollback()
+        self.close()
+        return False
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections for a single DSN.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ping_after: float = DEFAULT_PING_AFTER,
+        timeout: float = DEFAULT_TIMEOUT,
+        connect: Callable[[str], Any] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize pool. Connections are opened lazily.
+
+        Args:
+            dsn: libpq connection string
+            min_size: Connections kept open when idle
+            max_size: Maximum open connections (in use + idle)
+            idle_timeout: Seconds idle before eviction (above min_size)
+            ping_after: Seconds idle before checkout runs SELECT 1
+            timeout: Seconds checkout waits when the pool is exhausted
+            connect: Connection factory (default psycopg2.connect)
+            clock: Monotonic clock (injectable for tests)
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size} max={max_size}")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.ping_after = ping_after
+        self.timeout = timeout
+        self._connect = connect or _psycopg2_connect
+        self._clock = clock
+
+        self._idle: List[Tuple[Any, float]] = []  # (connection, released_at), LIFO
+        self._open = 0
+        self._stats = PoolStats()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._pid = os.getpid()
+
+    # -------------------------------------------------------------------------
+    # CHECKOUT / RELEASE
+    # -------------------------------------------------------------------------
+
+    def getconn(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Check out a healthy connection.
+
+        Args:
+            timeout: Seconds to wait when exhausted (default self.timeout)
+
+        Returns:
+            PooledConnection (close() returns it to the pool)
+
+        Raises:
+            PoolTimeoutError: If no connection is available in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = self._clock() + timeout
+
+        while True:
+            connection, idle_seconds = self._acquire_slot(deadline)
+            if connection is None:
+                # Reserved a slot for a new connection
+                try:
+                    connection = self._connect(self.dsn)
+                except Exception:
+                    self._forget(connection=None)
+                    raise
+                with self._lock:
+                    self._stats.created += 1
+                    self._stats.checkouts += 1
+                    self._stats.in_use += 1
+                return PooledConnection(self, connection)
+
+            if self._is_healthy(connection, idle_seconds):
+                with self._lock:
+                    self._stats.reused += 1
+                    self._stats.checkouts += 1
+                    self._stats.in_use += 1
+                return PooledConnection(self, connection)
+
+            with self._lock:
+                self._stats.health_check_failures += 1
+            self._forget(connection)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[PooledConnection]:
+        """Context manager: check out, roll back on error, always release."""
+        conn = self.getconn(timeout)
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _acquire_slot(self, deadline: float) -> Tuple[Optional[Any], float]:
+        """
+        Take an idle connection or reserve room for a new one.
+
+        Returns:
+            (connection, idle_seconds), or (None, 0.0) if a new connection
+            should be opened by the caller.
+        """
+        with self._available:
+            self._check_fork()
+            self._evict_idle()
+            while True:
+                if self._idle:
+                    connection, released_at = self._idle.pop()
+                    return connection, self._clock() - released_at
+                if self._open < self.max_size:
+                    self._open += 1
+                    return None, 0.0
+
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"No connection available within timeout (max_size={self.max_size})"
+                    )
+                self._stats.waits += 1
+                self._available.wait(remaining)
+
+    def _release(self, connection: Any) -> None:
+        """Return a connection to the pool (called by PooledConnection.close)."""
+        reusable = not connection.closed
+        if reusable:
+            try:
+                # Never hand a half-finished transaction to the next user
+                connection.rollback()
+                if connection.autocommit:
+                    connection.autocommit = False
+            except Exception as e:
+                logger.warning(f"Discarding pooled connection on release: {e}")
+                reusable = False
+
+        with self._available:
+            self._stats.releases += 1
+            self._stats.in_use -= 1
+            if reusable and os.getpid() == self._pid:
+                self._idle.append((connection, self._clock()))
+                self._evict_idle()
+                self._available.notify()
+                return
+
+        self._forget(connection)
+
+    def _forget(self, connection: Any) -> None:
+        """Close a connection (if any) and free its slot."""
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        with self._available:
+            self._open -= 1
+            if connection is not None:
+                self._stats.discarded += 1
+            self._available.notify()
+
+    # -------------------------------------------------------------------------
+    # HEALTH / EVICTION
+    # -------------------------------------------------------------------------
+
+    def _is_healthy(self, connection: Any, idle_seconds: float) -> bool:
+        """Cheap status check; SELECT 1 only after ping_after seconds idle."""
+        if connection.closed:
+            return False
+        if idle_seconds < self.ping_after:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except Exception as e:
+            logger.info(f"Pooled connection failed health check: {e}")
+            return False
+
+    def _evict_idle(self) -> None:
+        """Close connections idle past idle_timeout, keeping min_size open (lock held)."""
+        now = self._clock()
+        keep = []
+        # Oldest first; stop evicting once at min_size
+        for connection, released_at in self._idle:
+            if now - released_at > self.idle_timeout and self._open > self.min_size:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+                self._open -= 1
+                self._stats.evicted += 1
+            else:
+                keep.append((connection, released_at))
+        self._idle = keep
+
+    def _check_fork(self) -> None:
+        """After fork, drop inherited sockets without closing the parent's (lock held)."""
+        if os.getpid() != self._pid:
+            self._idle = []
+            self._open = 0
+            self._stats.in_use = 0
+            self._pid = os.getpid()
+
+    # -------------------------------------------------------------------------
+    # MANAGEMENT
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        """Pool counters plus current in-use/idle sizes."""
+        with self._lock:
+            self._stats.idle = len(self._idle)
+            return self._stats.to_dict()
+
+    def close_all(self) -> None:
+        """Close idle connections. Checked-out connections close on release."""
+        with self._available:
+            for connection, _ in self._idle:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+            self._open -= len(self._idle)
+            self._idle = []
+
+
+# =============================================================================
+# POOL REGISTRY
+# =============================================================================
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _psycopg2_connect(dsn: str) -> Any:
+    import psycopg2
+    return psycopg2.connect(dsn)
+
+
+def get_pool(dsn: str, **options: Any) -> ConnectionPool:
+    """
+    Get the process-wide pool for a DSN (created on first use).
+
+    Options (min_size, max_size, idle_timeout, ...) apply only when the pool
+    is created; later callers share the existing pool.
+
+    Args:
+        dsn: libpq connection string
+        **options: ConnectionPool keyword arguments
+
+    Returns:
+        ConnectionPool for this DSN
+    """
+    with _pools_lock:
+        pool = _pools.get(dsn)
+        if pool is None:
+            pool = _pools[dsn] = ConnectionPool(dsn, **options)
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close idle connections in every pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
+
+
+def all_pool_stats() -> Dict[str, Dict[str, int]]:
+    """Stats for every pool, keyed by host/database (no credentials)."""
+    with _pools_lock:
+        pools = list(_pools.items())
+    return {_redact(dsn): pool.stats() for dsn, pool in pools}
+
+
+def _redact(dsn: str) -> str:
+    """Strip credentials from a DSN for logging/stats."""
+    if "@" in dsn:
+        scheme, _, rest = dsn.partition("://")
+        return f"{scheme}://{rest.split('@', 1)[1]}" if rest else dsn
+    return " ".join(part for part in dsn.split() if not part.startswith("password="))
+
+
+__all__ = [
+    "ConnectionPool",
+    "PooledConnection",
+    "PoolStats",
+    "PoolTimeoutError",
+    "get_pool",
+    "close_all_pools",
+    "all_pool_stats",
+]
@@ -43,6 +43,8 @@ from ops.enforcement.schema_guard import (
     get_guard,
 )
 
+from .connection_pool import get_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -193,14 +195,20 @@ class GuardedConnection:
 
 def get_guarded_connection(
     connection_string: str = None,
-    repo_context: RepoContext = None
+    repo_context: RepoContext = None,
+    pooled: bool = True
 ) -> GuardedConnection:
     """
     Get a guarded database connection.
 
+    Pooled connections come from the shared pool for the connection string
+    (src/sys/db/connection_pool.py); close() or the context manager returns
+    them to the pool instead of closing the socket.
+
     Args:
         connection_string: Neon connection string (reads from env if None)
         repo_context: Repository context for schema rules (defaults to OUTREACH)
+        pooled: Draw from the shared pool (False opens a dedicated connection)
 
     Returns:
         GuardedConnection that validates all queries
@@ -218,8 +226,11 @@ def get_guarded_connection(
     # Create the guard
     guard = SchemaGuard(repo_context) if repo_context else get_guard()
 
-    # Create the connection
-    connection = psycopg2.connect(connection_string)
+    # Create (or check out) the connection
+    if pooled:
+        connection = get_pool(connection_string).getconn()
+    else:
+        connection = psycopg2.connect(connection_string)
 
     # Wrap in guarded connection
     return GuardedConnection(connection, guard)
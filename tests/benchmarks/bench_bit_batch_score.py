@@ -0,0 +1,220 @@
+"""
+Benchmark: BIT batch scoring, three-dict merge vs single-pass streaming
+=======================================================================
+Seeds N synthetic companies (plus DOL / Blog / People rows) into the
+outreach tables on a LOCAL Postgres and scores them two ways, each in a
+fresh child process so peak RSS is measured per run:
+- legacy: the previous flow, three GROUP BY queries fetched into dicts,
+  merged in Python, upserted with execute_batch
+- streaming: batch_score_companies(full=True), one pre-aggregated query
+  on a server-side cursor, COPY into a stage, one merge
+
+Peak RSS for the streaming run should stay flat as --companies grows.
+The schema is created if missing - point --dsn at a scratch database,
+never at Neon.
+
+Usage:
+    createdb bench_outreach
+    python tests/benchmarks/bench_bit_batch_score.py \\
+        --dsn postgresql://localhost/bench_outreach --companies 100000,1000000
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import psycopg2
+from psycopg2.extras import RealDictCursor, execute_batch
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.schedulers import bit_batch_score
+
+SCHEMA_SQL = """
+    CREATE SCHEMA IF NOT EXISTS outreach;
+    CREATE TABLE IF NOT EXISTS outreach.company_target (
+        outreach_id UUID PRIMARY KEY,
+        company_unique_id TEXT,
+        bit_score_snapshot INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS outreach.dol (
+        dol_id BIGSERIAL PRIMARY KEY,
+        outreach_id UUID,
+        filing_present BOOLEAN,
+        updated_at TIMESTAMPTZ
+    );
+    CREATE TABLE IF NOT EXISTS outreach.blog (
+        blog_id BIGSERIAL PRIMARY KEY,
+        outreach_id UUID,
+        context_timestamp TIMESTAMPTZ,
+        created_at TIMESTAMPTZ
+    );
+    CREATE TABLE IF NOT EXISTS outreach.people (
+        person_id BIGSERIAL PRIMARY KEY,
+        outreach_id UUID,
+        updated_at TIMESTAMPTZ
+    );
+    CREATE TABLE IF NOT EXISTS outreach.bit_scores (
+        outreach_id UUID PRIMARY KEY,
+        score NUMERIC,
+        score_tier TEXT,
+        signal_count INTEGER,
+        people_score NUMERIC,
+        dol_score NUMERIC,
+        blog_score NUMERIC,
+        talent_flow_score NUMERIC,
+        last_signal_at TIMESTAMPTZ,
+        last_scored_at TIMESTAMPTZ,
+        created_at TIMESTAMPTZ,
+        updated_at TIMESTAMPTZ
+    );
+    CREATE TABLE IF NOT EXISTS outreach.bit_score_watermarks (
+        source TEXT PRIMARY KEY,
+        high_water_mark TIMESTAMPTZ NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+"""
+
+# Every company gets a DOL row, one in three has two blog posts, one in ten a person
+SEED_SQL = """
+    TRUNCATE outreach.company_target, outreach.dol, outreach.blog, outreach.people,
+             outreach.bit_scores, outreach.bit_score_watermarks;
+    INSERT INTO outreach.company_target (outreach_id, company_unique_id)
+        SELECT md5(i::text)::uuid, 'BENCH.' || i FROM generate_series(1, %(n)s) i;
+    INSERT INTO outreach.dol (outreach_id, filing_present, updated_at)
+        SELECT md5(i::text)::uuid, i %% 4 <> 0, now() - (i %% 90) * interval '1 day'
+        FROM generate_series(1, %(n)s) i;
+    INSERT INTO outreach.blog (outreach_id, context_timestamp, created_at)
+        SELECT md5(i::text)::uuid, NULL, now() - (i %% 45) * interval '1 day'
+        FROM generate_series(1, %(n)s) i, generate_series(1, 2) post
+        WHERE i %% 3 = 0;
+    INSERT INTO outreach.people (outreach_id, updated_at)
+        SELECT md5(i::text)::uuid, now() FROM generate_series(1, %(n)s) i WHERE i %% 10 = 0;
+    ANALYZE outreach.company_target, outreach.dol, outreach.blog, outreach.people;
+"""
+
+LEGACY_UPSERT_SQL = """
+    INSERT INTO outreach.bit_scores (
+        outreach_id, score, score_tier, signal_count,
+        people_score, dol_score, blog_score, talent_flow_score,
+        last_signal_at, last_scored_at, created_at, updated_at
+    ) VALUES (
+        %(outreach_id)s, %(score)s, %(score_tier)s, %(signal_count)s,
+        %(people_score)s, %(dol_score)s, %(blog_score)s, %(talent_flow_score)s,
+        %(last_signal_at)s, NOW(), NOW(), NOW()
+    )
+    ON CONFLICT (outreach_id) DO UPDATE SET
+        score = EXCLUDED.score, score_tier = EXCLUDED.score_tier,
+        signal_count = EXCLUDED.signal_count, people_score = EXCLUDED.people_score,
+        dol_score = EXCLUDED.dol_score, blog_score = EXCLUDED.blog_score,
+        talent_flow_score = EXCLUDED.talent_flow_score,
+        last_signal_at = EXCLUDED.last_signal_at, last_scored_at = NOW(), updated_at = NOW()
+"""
+
+
+def legacy_score(dsn: str) -> int:
+    """The previous three-query flow (aggregate, merge in Python, execute_batch)."""
+    conn = psycopg2.connect(dsn)
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    by_source = []
+    for sql, impact in (
+        ("""SELECT ct.outreach_id, COUNT(d.dol_id) AS n,
+                   COALESCE(SUM(CASE WHEN d.filing_present THEN %s ELSE 0 END), 0) AS score,
+                   MAX(d.updated_at) AS last_at
+            FROM outreach.company_target ct LEFT JOIN outreach.dol d ON d.outreach_id = ct.outreach_id
+            WHERE ct.company_unique_id IS NOT NULL GROUP BY ct.outreach_id""", 'form_5500_filed'),
+        ("""SELECT ct.outreach_id, COUNT(b.blog_id) AS n, COALESCE(COUNT(b.blog_id) * %s, 0) AS score,
+                   MAX(COALESCE(b.context_timestamp, b.created_at)) AS last_at
+            FROM outreach.company_target ct LEFT JOIN outreach.blog b ON b.outreach_id = ct.outreach_id
+            WHERE ct.company_unique_id IS NOT NULL GROUP BY ct.outreach_id""", 'content_signal'),
+        ("""SELECT ct.outreach_id, COUNT(p.person_id) AS n, COALESCE(COUNT(p.person_id) * %s, 0) AS score,
+                   MAX(p.updated_at) AS last_at
+            FROM outreach.company_target ct LEFT JOIN outreach.people p ON p.outreach_id = ct.outreach_id
+            WHERE ct.company_unique_id IS NOT NULL GROUP BY ct.outreach_id""", 'slot_filled'),
+    ):
+        cur.execute(sql, (bit_batch_score.SIGNAL_IMPACTS[impact],))
+        by_source.append({r['outreach_id']: r for r in cur.fetchall()})
+
+    empty = {'score': 0, 'n': 0, 'last_at': None}
+    batch = []
+    for outreach_id in set().union(*by_source):
+        dol, blog, people = (source.get(outreach_id, empty) for source in by_source)
+        scores = [Decimal(str(s['score'])) for s in (dol, blog, people)]
+        total = sum(scores)
+        if total > 0:
+            stamps = [s['last_at'] for s in (dol, blog, people) if s['last_at'] is not None]
+            batch.append({
+                'outreach_id': outreach_id, 'score': total,
+                'score_tier': bit_batch_score.get_tier(total),
+                'signal_count': dol['n'] + blog['n'] + people['n'],
+                'dol_score': scores[0], 'blog_score': scores[1], 'people_score': scores[2],
+                'talent_flow_score': Decimal('0'),
+                'last_signal_at': max(stamps) if stamps else None,
+            })
+    execute_batch(cur, LEGACY_UPSERT_SQL, batch, page_size=1000)
+    conn.commit()
+    conn.close()
+    return len(batch)
+
+
+def streaming_score(dsn: str) -> int:
+    bit_batch_score.get_db_connection = lambda: psycopg2.connect(dsn)
+    return bit_batch_score.batch_score_companies(full=True)['companies_processed']
+
+
+def _child(mode: str, dsn: str, results) -> None:
+    bit_batch_score.logger.disabled = True
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    scored = (legacy_score if mode == "legacy" else streaming_score)(dsn)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss
+    results.put((scored, elapsed, peak_kb / 1024))
+
+
+def run_isolated(mode: str, dsn: str):
+    results = multiprocessing.Queue()
+    child = multiprocessing.Process(target=_child, args=(mode, dsn, results))
+    child.start()
+    outcome = results.get()
+    child.join()
+    return outcome
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dsn", default=os.getenv("BENCH_PG_DSN", "postgresql://localhost/bench_outreach"))
+    parser.add_argument("--companies", default="100000,1000000",
+                        help="comma-separated company counts to seed and score")
+    parser.add_argument("--skip-legacy", action="store_true",
+                        help="only time the streaming path (legacy holds every row in memory)")
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    with conn.cursor() as cursor:
+        cursor.execute(SCHEMA_SQL)
+    conn.commit()
+
+    modes = ("streaming",) if args.skip_legacy else ("legacy", "streaming")
+    print(f"{'companies':>10s} {'mode':10s} {'scored':>10s} {'seconds':>9s} {'peak RSS MB':>12s}")
+    for companies in (int(n) for n in args.companies.split(",")):
+        with conn.cursor() as cursor:
+            cursor.execute(SEED_SQL, {'n': companies})
+        conn.commit()
+
+        for mode in modes:
+            scored, seconds, peak_mb = run_isolated(mode, args.dsn)
+            print(f"{companies:10,d} {mode:10s} {scored:10,d} {seconds:9.2f} {peak_mb:12.1f}")
+
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
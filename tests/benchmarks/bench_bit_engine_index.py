@@ -0,0 +1,121 @@
+"""
+Benchmark: BITEngine queries, full scans vs score/recency indexes
+=================================================================
+Feeds N companies a stream of signals, then runs outreach-style ticks
+(a burst of --signals-per-tick signals followed by top-N, HOT threshold,
+lifecycle-state and recent-mover queries):
+- scan: the previous sorted() / list-comprehension queries over every
+  CompanyBITScore, with no index upkeep in process_signal
+- index: BITEngine as shipped, indexes updated per signal
+
+Usage:
+    python tests/benchmarks/bench_bit_engine_index.py --companies 500000 --ticks 20
+"""
+
+import argparse
+import random
+import sys
+import time
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+engine_spec = importlib.util.spec_from_file_location(
+    "company_target_bit_engine",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "bit_engine.py"
+)
+bit_engine = importlib.util.module_from_spec(engine_spec)
+engine_spec.loader.exec_module(bit_engine)
+
+IMPACTS = [10.0, 5.0, 15.0, 8.0, 12.0, -5.0, -3.0, 3.0]
+
+
+class ScanEngine(bit_engine.BITEngine):
+    """The previous query implementations; no index upkeep."""
+
+    def _reindex(self, company_id):
+        pass
+
+    def get_top_companies(self, limit=10):
+        return sorted(self._scores.values(), key=lambda x: x.score, reverse=True)[:limit]
+
+    def get_companies_above_threshold(self, threshold):
+        return [s for s in self._scores.values() if s.score >= threshold]
+
+    def get_recent_movers(self, hours=24, min_signals=3):
+        cutoff = datetime.now().timestamp() - (hours * 3600)
+        return [s for s in self._scores.values()
+                if s.last_signal_at and s.last_signal_at.timestamp() > cutoff
+                and s.signal_count >= min_signals]
+
+    def get_companies_by_state(self, state):
+        low, high = {'HOT': (bit_engine.BIT_THRESHOLD_HOT, bit_engine.BIT_THRESHOLD_BURNING)}[state]
+        return [s for s in self._scores.values() if low <= s.score < high]
+
+
+def signal_stream(companies: int, count: int, seed: int):
+    rng = random.Random(seed)
+    now = datetime.now()
+    for _ in range(count):
+        yield bit_engine.BITSignal(
+            signal_type=bit_engine.SignalType.FORM_5500_FILED,
+            company_id=f"C{rng.randrange(companies):07d}",
+            source_spoke='dol_node',
+            impact=rng.choice(IMPACTS),
+            timestamp=now - timedelta(minutes=rng.randrange(60 * 24 * 30)),
+        )
+
+
+def run(engine, args):
+    engine.logger.disabled = True
+    start = time.perf_counter()
+    for signal in signal_stream(args.companies, args.companies * 2, seed=1):
+        engine.process_signal(signal)
+    load_seconds = time.perf_counter() - start
+
+    ticks = signal_stream(args.companies, args.ticks * args.signals_per_tick, seed=2)
+    signal_seconds = query_seconds = 0.0
+    for _ in range(args.ticks):
+        start = time.perf_counter()
+        for _, signal in zip(range(args.signals_per_tick), ticks):
+            engine.process_signal(signal)
+        signal_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        top = engine.get_top_companies(args.top)
+        hot = engine.get_companies_above_threshold(bit_engine.BIT_THRESHOLD_BURNING + 25)
+        engine.get_companies_by_state('HOT')
+        movers = engine.get_recent_movers(hours=1, min_signals=3)
+        query_seconds += time.perf_counter() - start
+
+    return load_seconds, signal_seconds, query_seconds, (len(top), len(hot), len(movers))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=500000)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--signals-per-tick", type=int, default=5000)
+    parser.add_argument("--top", type=int, default=50)
+    args = parser.parse_args()
+
+    results = {mode: run(cls(), args) for mode, cls in (("scan", ScanEngine), ("index", bit_engine.BITEngine))}
+    if results["scan"][3] != results["index"][3]:
+        raise RuntimeError(f"query results differ: {results['scan'][3]} vs {results['index'][3]}")
+
+    print(f"companies: {args.companies:,}  load signals: {args.companies * 2:,}  "
+          f"ticks: {args.ticks} x {args.signals_per_tick:,} signals")
+    print(f"{'mode':6s} {'load s':>8s} {'signals/s':>11s} {'query ms/tick':>14s}")
+    for mode, (load, signals, queries, _) in results.items():
+        rate = args.ticks * args.signals_per_tick / signals
+        print(f"{mode:6s} {load:8.2f} {rate:11,.0f} {queries / args.ticks * 1e3:14.2f}")
+    scan_q, index_q = results["scan"][2], results["index"][2]
+    print(f"query speedup: {scan_q / index_q:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
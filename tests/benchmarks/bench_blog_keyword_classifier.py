@@ -0,0 +1,117 @@
+"""
+Benchmark: blog keyword classification, per-pattern re.search vs compiled
+=========================================================================
+Classifies a synthetic outreach.blog.context_summary corpus (N rows of
+web-presence summaries, a minority mentioning funding, hiring, M&A,
+benefits, leadership or expansion) against the B-xx KEYWORD_PATTERNS:
+- naive: one re.search per pattern per row (the previous classify_text)
+- compiled: dumb_worker.classify_text over the KeywordClassifier
+
+Both must return identical (signal_code, confidence, matched_keywords)
+lists for every row. No database is needed.
+
+Usage:
+    python tests/benchmarks/bench_blog_keyword_classifier.py --rows 100000
+"""
+
+import argparse
+import importlib
+import random
+import re
+import sys
+import time
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+PACKAGE = "bench_blog_content_imo"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [
+    str(PROJECT_ROOT / "hubs" / "blog-content" / "imo")
+]
+dumb_worker = importlib.import_module(f"{PACKAGE}.middle.dumb_worker")
+
+BOILERPLATE = [
+    "{name} is a family-owned {industry} company headquartered in {city}.",
+    "Founded in {year}, {name} serves commercial and residential customers across the region.",
+    "The company emphasizes quality, safety and long-term client relationships.",
+    "{name} offers {industry} services including consulting, installation and maintenance.",
+    "Its leadership page lists the founder and an operations manager.",
+    "Customers describe responsive service and transparent pricing.",
+    "The about page highlights community involvement and local sponsorships.",
+]
+
+SIGNAL_SENTENCES = [
+    "{name} raised $12 million in a Series B led by regional investors.",
+    "The company is hiring and lists open positions for technicians; join our team.",
+    "{name} was acquired by a national competitor after a merger agreement was signed.",
+    "Employees receive a benefits package with medical coverage, an HSA and a wellness program.",
+    "{name} appointed a new CFO after the former chief financial officer stepped down.",
+    "The firm announced national expansion with a new office in {city}.",
+]
+
+INDUSTRIES = ["HVAC", "logistics", "dental", "software", "staffing", "manufacturing", "landscaping"]
+CITIES = ["Columbus", "Pittsburgh", "Charlotte", "Austin", "Tampa", "Denver"]
+
+
+def synthetic_corpus(rows, seed=2026):
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(rows):
+        fields = {
+            'name': f"Company {i}", 'industry': rng.choice(INDUSTRIES),
+            'city': rng.choice(CITIES), 'year': rng.randint(1950, 2020),
+        }
+        sentences = rng.sample(BOILERPLATE, rng.randint(3, 6))
+        if rng.random() < 0.3:
+            sentences.insert(rng.randint(0, len(sentences)), rng.choice(SIGNAL_SENTENCES))
+        corpus.append(" ".join(s.format(**fields) for s in sentences))
+    return corpus
+
+
+def naive_classify_text(text):
+    """classify_text before the compiled classifier."""
+    if not text or not text.strip():
+        return []
+    results = []
+    text_lower = text.lower()
+    for signal_code, patterns in dumb_worker.KEYWORD_PATTERNS.items():
+        matches = [p for p in patterns if re.search(p, text_lower, re.IGNORECASE)]
+        if not matches:
+            continue
+        confidence = min(0.90, 0.60 + len(matches) * 0.10)
+        if confidence >= dumb_worker.CONFIDENCE_THRESHOLD:
+            results.append((signal_code, confidence, matches))
+    return results
+
+
+def timed(classify, corpus):
+    start = time.perf_counter()
+    results = [classify(text) for text in corpus]
+    return time.perf_counter() - start, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.rows)
+    naive_s, naive_results = timed(naive_classify_text, corpus)
+    compiled_s, compiled_results = timed(dumb_worker.classify_text, corpus)
+
+    if naive_results != compiled_results:
+        raise RuntimeError("compiled classifier disagrees with per-pattern re.search")
+
+    signals = sum(len(r) for r in compiled_results)
+    print(f"rows: {args.rows:,}  avg chars: {sum(map(len, corpus)) / len(corpus):.0f}  signals: {signals:,}")
+    print(f"{'mode':9s} {'seconds':>8s} {'rows/s':>9s}")
+    for mode, seconds in (('naive', naive_s), ('compiled', compiled_s)):
+        print(f"{mode:9s} {seconds:8.2f} {args.rows / seconds:9.0f}")
+    print(f"speedup: {naive_s / compiled_s:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
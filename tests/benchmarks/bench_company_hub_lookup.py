@@ -0,0 +1,124 @@
+"""
+Benchmark: CompanyHub lookups, linear scan vs secondary indexes
+===============================================================
+Loads N synthetic companies into a CompanyHub (bulk add, as
+bootstrap_from_neon does) and times domain / EIN / name lookups:
+- scan: the previous loop over hub._companies.values()
+- index: find_company_by_domain / _by_ein / _by_name
+
+All queries hit in memory, so Neon is never contacted.
+
+Usage:
+    python tests/benchmarks/bench_company_hub_lookup.py --companies 200000 --lookups 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+import importlib.util
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+hub_spec = importlib.util.spec_from_file_location(
+    "company_target_company_hub",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "company_hub.py"
+)
+company_hub = importlib.util.module_from_spec(hub_spec)
+hub_spec.loader.exec_module(company_hub)
+
+
+class BenchHub:
+    """Minimal stand-in for the phantom wheel Hub base class."""
+
+    def __init__(self, **kwargs):
+        self.core_metric_name = kwargs.get("core_metric_name")
+        self.core_metric_value = kwargs.get("core_metric_value")
+        self._anchors = dict(kwargs.get("anchor_fields", {}))
+
+    def set_anchor(self, name, value):
+        self._anchors[name] = value
+
+    def get_anchor(self, name):
+        return self._anchors.get(name)
+
+
+company_hub.Hub = BenchHub
+
+
+def scan_domain(hub, domain):
+    for company in hub._companies.values():
+        if company.domain and company.domain.lower() == domain.lower():
+            return company
+    return None
+
+
+def scan_ein(hub, ein):
+    normalized = ''.join(c for c in ein if c.isdigit())
+    for company in hub._companies.values():
+        if company.ein and company.ein == normalized:
+            return company
+    return None
+
+
+def scan_name(hub, name):
+    normalized_input = company_hub.normalize_hub_company_name.__wrapped__(name)
+    for company in hub._companies.values():
+        if company.company_name.lower() == name.lower():
+            return company
+    for company in hub._companies.values():
+        if company_hub.normalize_hub_company_name.__wrapped__(company.company_name) == normalized_input:
+            return company
+    return None
+
+
+def timed(func, queries, limit=None):
+    queries = queries[:limit] if limit else queries
+    start = time.perf_counter()
+    for query in queries:
+        if func(query) is None:
+            raise RuntimeError(f"lookup missed: {query}")
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=200000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--scan-lookups", type=int, default=20,
+                        help="lookups for the linear-scan baseline (slow)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    records = [company_hub.CompanyHubRecord(
+        company_unique_id=f"04.04.01.01.{i:05d}.{i % 1000:03d}",
+        company_name=f"Company {i} Holdings, Inc.",
+        domain=f"company{i}.com",
+        ein=f"{i:09d}",
+    ) for i in range(args.companies)]
+
+    hub = company_hub.CompanyHub()
+    start = time.perf_counter()
+    hub.add_companies(records)
+    print(f"companies: {args.companies:,}  bulk load + index: {time.perf_counter() - start:.2f}s")
+
+    picks = [rng.randrange(args.companies) for _ in range(args.lookups)]
+    cases = [
+        ("domain", [f"COMPANY{i}.COM" for i in picks], scan_domain, hub.find_company_by_domain),
+        ("ein", [f"{i:09d}"[:2] + "-" + f"{i:09d}"[2:] for i in picks], scan_ein, hub.find_company_by_ein),
+        ("name", [f"company {i} holdings llc" for i in picks], scan_name, hub.find_company_by_name),
+    ]
+
+    print(f"{'lookup':8s} {'scan':>12s} {'index':>12s} {'speedup':>10s}")
+    for label, queries, scan, indexed in cases:
+        scan_seconds = timed(lambda q: scan(hub, q), queries, args.scan_lookups)
+        index_seconds = timed(indexed, queries)
+        print(f"{label:8s} {scan_seconds * 1e3:10.3f}ms {index_seconds * 1e6:10.2f}us "
+              f"{scan_seconds / index_seconds:9.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Benchmark: DOL CSV load, StringIO buffer vs streaming COPY source
+=================================================================
+Writes a synthetic Form 5500-shaped CSV (--rows x --cols) and feeds it to a
+stand-in for cursor.copy_expert that reads the source like psycopg2 does
+(fixed-size reads) and sleeps --mbps worth of "network" per read.
+Each mode runs in a fresh child process so peak RSS is per run:
+- buffered: the previous load_csv_to_table body, whole projection written
+  to a StringIO, then copied
+- streaming: copy_stream.project_csv + copy_rows, parsing and sending
+  overlap and only one chunk is held
+
+No database needed.
+
+Usage:
+    python tests/benchmarks/bench_dol_copy_stream.py --rows 200000 --cols 130
+"""
+
+import argparse
+import csv
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "hubs" / "dol-filings" / "imo" / "middle" / "importers"))
+
+import copy_stream
+
+
+class NullCursor:
+    """copy_expert that drains the source at a simulated link speed."""
+
+    def __init__(self, mbps: float):
+        self.seconds_per_byte = 1 / (mbps * 1024 * 1024 / 8) if mbps else 0.0
+        self.first_byte_at = None
+        self.bytes = 0
+        self.lines = 0
+
+    def copy_expert(self, sql, file, size=8192):
+        while True:
+            data = file.read(size)
+            if not data:
+                break
+            if self.first_byte_at is None:
+                self.first_byte_at = time.perf_counter()
+            self.bytes += len(data)
+            self.lines += data.count("\n")
+            if self.seconds_per_byte:
+                time.sleep(len(data) * self.seconds_per_byte)
+
+
+def write_csv(path: Path, rows: int, cols: int) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ACK_ID"] + [f"COL_{c}" for c in range(1, cols)])
+        for i in range(rows):
+            writer.writerow([f"20240101{i:010d}"] + [f"value {i % 997} / {c}" for c in range(1, cols)])
+
+
+def buffered(cur, path: Path, columns, width, year):
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            while len(row) < width:
+                row.append("")
+            out_row = [row[idx] for idx in columns]
+            out_row.append(year)
+            writer.writerow(out_row)
+    buffer.seek(0)
+    cur.copy_expert("COPY ...", buffer)
+
+
+def streaming(cur, path: Path, columns, width, year):
+    copy_stream.copy_rows(cur, "COPY ...", copy_stream.project_csv(path, columns, width, constants=[year]))
+
+
+def _child(mode, path, cols, mbps, results):
+    columns = list(range(0, cols, 2))           # about half the columns match the table
+    cur = NullCursor(mbps)
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    (buffered if mode == "buffered" else streaming)(cur, path, columns, cols, "2024")
+    elapsed = time.perf_counter() - start
+    peak_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss) / 1024
+    results.put((elapsed, cur.first_byte_at - start, peak_mb, cur.bytes, cur.lines))
+
+
+def run_isolated(mode, path, cols, mbps):
+    results = multiprocessing.Queue()
+    child = multiprocessing.Process(target=_child, args=(mode, path, cols, mbps, results))
+    child.start()
+    outcome = results.get()
+    child.join()
+    return outcome
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=130)
+    parser.add_argument("--mbps", type=float, default=0.0, help="simulated link speed (0 = unthrottled)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "f_5500_2024_latest.csv"
+        write_csv(path, args.rows, args.cols)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"rows: {args.rows:,}  cols: {args.cols}  csv: {size_mb:,.0f} MB  link: {args.mbps or 'unthrottled'} Mbps")
+        print(f"{'mode':10s} {'seconds':>8s} {'first byte s':>13s} {'peak RSS MB':>12s} {'sent MB':>8s}")
+        outcomes = {}
+        for mode in ("buffered", "streaming"):
+            elapsed, first_byte, peak_mb, sent, _ = outcomes[mode] = run_isolated(mode, path, args.cols, args.mbps)
+            print(f"{mode:10s} {elapsed:8.2f} {first_byte:13.3f} {peak_mb:12.1f} {sent / 1024 / 1024:8.0f}")
+
+    if outcomes["buffered"][4] != outcomes["streaming"][4]:
+        raise RuntimeError("modes sent different row counts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Microbenchmark: scalar vs batch fuzzy scoring
+=============================================
+Scores one query against N company names with the scalar reference
+functions and with the NumPy batch engine in matching/fuzzy.py.
+
+Usage:
+    python tests/benchmarks/bench_fuzzy_batch.py --candidates 50000 --threshold 0.85
+"""
+
+import argparse
+import random
+import sys
+import time
+import importlib.util
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+fuzzy_spec = importlib.util.spec_from_file_location(
+    "company_target_fuzzy",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "matching" / "fuzzy.py"
+)
+fuzzy = importlib.util.module_from_spec(fuzzy_spec)
+fuzzy_spec.loader.exec_module(fuzzy)
+
+SYLLABLES = ["ac", "me", "bet", "glo", "bal", "hea", "lth", "par", "tner", "sys",
+             "tem", "cap", "ital", "lo", "gis", "tic", "sum", "mit", "riv", "er"]
+SUFFIXES = ["", " group", " partners", " systems", " holdings", " services of america"]
+
+METHODS = [
+    ("jaro_winkler", fuzzy.jaro_winkler_similarity, fuzzy.jaro_winkler_batch),
+    ("levenshtein", fuzzy.levenshtein_similarity, fuzzy.levenshtein_similarity_batch),
+    ("token_sort", fuzzy.token_sort_ratio, fuzzy.token_sort_ratio_batch),
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=50000)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    candidates = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) + rng.choice(SUFFIXES)
+                  for _ in range(args.candidates)]
+    query = candidates[0][:-1] + "x"
+
+    print(f"candidates: {args.candidates:,}  threshold: {args.threshold}")
+    for name, scalar_fn, batch_fn in METHODS:
+        start = time.perf_counter()
+        reference = [scalar_fn(query, c) for c in candidates]
+        scalar_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = batch_fn(query, candidates, args.threshold)
+        batch_seconds = time.perf_counter() - start
+
+        mismatches = sum(1 for r, s in zip(reference, scores)
+                         if (r if r >= args.threshold else 0.0) != s)
+        print(f"{name:14s} scalar {scalar_seconds:7.3f}s  batch {batch_seconds:7.3f}s  "
+              f"speedup {scalar_seconds / batch_seconds:6.1f}x  mismatches {mismatches}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Benchmark: row-at-a-time vs bulk company upsert
+===============================================
+Upserts N synthetic companies into marketing.company_master on a LOCAL
+Postgres two ways:
+- legacy: one cursor.execute(UPSERT_COMPANY_SQL) per row
+- bulk: CompanyNeonWriter.write_companies_batch (multi-row pages)
+
+Each mode runs twice: a cold insert pass and an update pass over the same
+keys. The schema is created if missing - point --dsn at a scratch database,
+never at Neon.
+
+Usage:
+    createdb bench_outreach
+    python tests/benchmarks/bench_neon_bulk_upsert.py \\
+        --dsn postgresql://localhost/bench_outreach --rows 100000 --page-size 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+import importlib.util
+from pathlib import Path
+
+import psycopg2
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+writer_spec = importlib.util.spec_from_file_location(
+    "company_target_neon_writer",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "output" / "neon_writer.py"
+)
+neon_writer = importlib.util.module_from_spec(writer_spec)
+writer_spec.loader.exec_module(neon_writer)
+
+SCHEMA_SQL = """
+    CREATE SCHEMA IF NOT EXISTS marketing;
+    CREATE TABLE IF NOT EXISTS marketing.company_master (
+        company_unique_id TEXT PRIMARY KEY,
+        company_name TEXT,
+        domain TEXT,
+        email_pattern TEXT,
+        ein TEXT,
+        industry TEXT,
+        employee_count INTEGER,
+        address_state TEXT,
+        bit_score NUMERIC,
+        data_quality_score NUMERIC,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP
+    );
+"""
+
+
+def synthetic_companies(rows: int, prefix: str):
+    return [{
+        'company_unique_id': f"{prefix}.{i:08d}",
+        'company_name': f"Company {i} LLC",
+        'domain': f"company{i}.com",
+        'ein': f"{i:09d}",
+        'industry': "Manufacturing",
+        'employee_count': 50 + i % 500,
+        'address_state': "SC",
+        'bit_score': float(i % 100),
+    } for i in range(rows)]
+
+
+def legacy_upsert(conn, companies) -> float:
+    start = time.perf_counter()
+    with conn.cursor() as cursor:
+        now = neon_writer.datetime.now()
+        for company in companies:
+            params = dict(company, email_pattern=None, data_quality_score=0.0,
+                          created_at=now, updated_at=now)
+            cursor.execute(neon_writer.CompanyNeonWriter.UPSERT_COMPANY_SQL, params)
+    conn.commit()
+    return time.perf_counter() - start
+
+
+def bulk_upsert(writer, companies) -> float:
+    start = time.perf_counter()
+    result = writer.write_companies_batch(companies, str(uuid.uuid4()))
+    elapsed = time.perf_counter() - start
+    if not result.success:
+        raise RuntimeError(f"bulk upsert failed: {result.errors[:3]}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dsn", default=os.getenv("BENCH_PG_DSN", "postgresql://localhost/bench_outreach"))
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--legacy-rows", type=int, default=10000,
+                        help="rows for the row-at-a-time baseline (slow)")
+    parser.add_argument("--page-size", type=int, default=neon_writer.DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    with conn.cursor() as cursor:
+        cursor.execute(SCHEMA_SQL)
+        cursor.execute("DELETE FROM marketing.company_master WHERE company_unique_id LIKE 'BENCH.%'")
+    conn.commit()
+
+    writer = neon_writer.CompanyNeonWriter(neon_writer.NeonConfig(), page_size=args.page_size)
+    writer._connection = conn
+
+    legacy_rows = synthetic_companies(args.legacy_rows, "BENCH.L")
+    bulk_rows = synthetic_companies(args.rows, "BENCH.B")
+
+    print(f"rows: legacy {args.legacy_rows:,}  bulk {args.rows:,}  page size {args.page_size}")
+    for label in ("insert", "update"):
+        legacy_seconds = legacy_upsert(conn, legacy_rows)
+        bulk_seconds = bulk_upsert(writer, bulk_rows)
+        print(f"{label:7s} legacy {args.legacy_rows / legacy_seconds:10,.0f} rows/s   "
+              f"bulk {args.rows / bulk_seconds:10,.0f} rows/s")
+
+    with conn.cursor() as cursor:
+        cursor.execute("DELETE FROM marketing.company_master WHERE company_unique_id LIKE 'BENCH.%'")
+    conn.commit()
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Benchmark: Phase 1 fuzzy tier - full scan vs candidate blocking index
+=====================================================================
+Measures per-person latency of the BRONZE guardrail against a synthetic
+company master, with and without CompanyCandidateIndex.
+
+Usage:
+    python tests/benchmarks/bench_phase1_candidate_index.py --companies 100000 --people 200
+"""
+
+import argparse
+import random
+import sys
+import time
+import importlib.util
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MATCHING_DIR = PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "matching"
+
+
+def _load(name: str, filename: str):
+    spec = importlib.util.spec_from_file_location(name, MATCHING_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+fuzzy = _load("company_target_fuzzy", "fuzzy.py")
+candidate_index = _load("company_target_candidate_index", "candidate_index.py")
+
+SYLLABLES = ["ac", "me", "bet", "glo", "bal", "hea", "lth", "par", "tner", "sys",
+             "tem", "cap", "ital", "lo", "gis", "tic", "sum", "mit", "riv", "er"]
+SUFFIXES = ["", " group", " partners", " systems", " holdings", " services"]
+
+
+def synthetic_master(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    cities = [f"city{i}" for i in range(500)]
+    candidates = []
+    for i in range(count):
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        candidates.append({
+            'id': f"C{i:06d}",
+            'name': word + rng.choice(SUFFIXES),
+            'city': rng.choice(cities),
+            'state': "SC",
+        })
+    return candidates
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=100000)
+    parser.add_argument("--people", type=int, default=200)
+    parser.add_argument("--scan-people", type=int, default=20,
+                        help="People scored with the full scan (slow)")
+    args = parser.parse_args()
+
+    candidates = synthetic_master(args.companies)
+    rng = random.Random(7)
+    queries = []
+    for _ in range(args.people):
+        cand = rng.choice(candidates)
+        name = cand['name']
+        queries.append((name[:-1] + rng.choice("aeiou"), cand['city']))
+
+    start = time.perf_counter()
+    index = candidate_index.CompanyCandidateIndex(candidates)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    shortlist_sizes = []
+    indexed = []
+    for query, city in queries:
+        shortlist = index.shortlist(query, city)
+        shortlist_sizes.append(len(shortlist))
+        indexed.append(fuzzy.apply_city_guardrail(query, city, "SC", shortlist))
+    indexed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    scan_queries = queries[:args.scan_people]
+    start = time.perf_counter()
+    for position, (query, city) in enumerate(scan_queries):
+        full = fuzzy.apply_city_guardrail(query, city, "SC", candidates)
+        assert [(m.candidate_id, m.score) for m in full] == \
+               [(m.candidate_id, m.score) for m in indexed[position]], "parity failure"
+    scan_ms = (time.perf_counter() - start) * 1000 / max(len(scan_queries), 1)
+
+    print(f"companies:              {args.companies:,}")
+    print(f"index build:            {build_seconds:.2f}s  {index.stats()}")
+    print(f"avg shortlist size:     {sum(shortlist_sizes) / len(shortlist_sizes):.1f}")
+    print(f"full scan per person:   {scan_ms:.1f} ms  ({len(scan_queries)} people)")
+    print(f"indexed per person:     {indexed_ms:.2f} ms  ({len(queries)} people)")
+    print(f"speedup:                {scan_ms / indexed_ms:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
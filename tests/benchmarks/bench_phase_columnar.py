@@ -0,0 +1,119 @@
+"""
+Benchmark: iterrows vs columnar row access per Company phase
+============================================================
+Each Company phase walks a fixed set of columns. This benchmark times that
+walk on a synthetic frame two ways:
+- legacy: df.iterrows() + row.get(...) + list-of-dicts result frame
+- columnar: phases/columnar.py helpers + preallocated result columns
+
+Usage:
+    python tests/benchmarks/bench_phase_columnar.py --rows 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+columnar_spec = importlib.util.spec_from_file_location(
+    "company_target_columnar",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "phases" / "columnar.py"
+)
+columnar = importlib.util.module_from_spec(columnar_spec)
+columnar_spec.loader.exec_module(columnar)
+
+# Columns each phase reads per row (and the result columns it writes)
+PHASES = {
+    'phase1._build_indices': (
+        ['company_unique_id', 'company_name', 'address_city', 'address_state', 'website_url', 'domain'], 0),
+    'phase2.run': (
+        ['person_id', 'matched_company_id', 'company_domain', 'domain', 'input_domain'], 6),
+    'phase3._get_unique_domains': (
+        ['resolved_domain', 'domain', 'matched_company_id', 'email', 'first_name', 'last_name'], 0),
+    'phase3._build_result_dataframe': (
+        ['person_id', 'resolved_domain', 'domain'], 8),
+    'phase4._group_by_domain': (
+        ['resolved_domain', 'domain', 'email_pattern', 'matched_company_id',
+         'pattern_needs_verification', 'email', 'first_name', 'last_name'], 0),
+    'phase4._build_result_dataframe': (
+        ['person_id', 'resolved_domain', 'domain'], 9),
+}
+
+
+def synthetic_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = random.Random(seed)
+    domains = [f"company{i}.com" for i in range(rows // 20 + 1)]
+    return pd.DataFrame({
+        'person_id': [f"P{i:07d}" for i in range(rows)],
+        'company_unique_id': [f"C{i:07d}" for i in range(rows)],
+        'company_name': [f"Company {i % 50000} LLC" for i in range(rows)],
+        'address_city': [rng.choice(["charleston", "columbia", "raleigh"]) for _ in range(rows)],
+        'address_state': ["SC"] * rows,
+        'website_url': [rng.choice(domains) for _ in range(rows)],
+        'domain': [rng.choice(domains) for _ in range(rows)],
+        'matched_company_id': [f"C{rng.randrange(rows):07d}" for _ in range(rows)],
+        'company_domain': [rng.choice(domains) for _ in range(rows)],
+        'resolved_domain': [rng.choice(domains) for _ in range(rows)],
+        'email': [f"p{i}@{rng.choice(domains)}" for i in range(rows)],
+        'first_name': ["jane"] * rows,
+        'last_name': ["doe"] * rows,
+        'email_pattern': ["{f}.{l}"] * rows,
+        'pattern_needs_verification': [True] * rows,
+    })
+
+
+def legacy_walk(df: pd.DataFrame, columns, result_width: int) -> int:
+    touched = 0
+    result_data = []
+    for idx, row in df.iterrows():
+        values = [row.get(name, '') for name in columns]
+        touched += len(values)
+        if result_width:
+            result_data.append({f"out{i}": values[0] for i in range(result_width)})
+    if result_width:
+        pd.DataFrame(result_data)
+    return touched
+
+
+def columnar_walk(df: pd.DataFrame, columns, result_width: int) -> int:
+    touched = 0
+    lists = [columnar.column_values(df, name) for name in columns]
+    for values in zip(*lists):
+        touched += len(values)
+    if result_width:
+        size = len(df)
+        pd.DataFrame({f"out{i}": [None] * size for i in range(result_width)})
+    return touched
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    df = synthetic_frame(args.rows)
+    print(f"rows: {args.rows:,}")
+    print(f"{'phase step':34s} {'iterrows':>10s} {'columnar':>10s} {'speedup':>8s}")
+
+    for step, (columns, result_width) in PHASES.items():
+        start = time.perf_counter()
+        legacy_walk(df, columns, result_width)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar_walk(df, columns, result_width)
+        columnar_seconds = time.perf_counter() - start
+
+        print(f"{step:34s} {legacy_seconds:9.2f}s {columnar_seconds:9.2f}s "
+              f"{legacy_seconds / columnar_seconds:7.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Benchmark: send attempt audit, inline commit vs buffered sink
+=============================================================
+Writes N SendAttemptAuditRecords into outreach.send_attempt_audit on a
+LOCAL Postgres from T send threads, two ways:
+- inline: MarketingSafetyGate without a sink, one INSERT + commit per
+  record on a shared connection (the previous behaviour)
+- sink: SendAttemptAuditSink, fsync to a local write-ahead file per
+  record, multi-row INSERT per flush on the sink's own connection
+
+Reports send-path throughput (records/s seen by the send threads) and
+the time until every record is committed. The table is created if
+missing - point --dsn at a scratch database, never at Neon.
+
+Usage:
+    createdb bench_outreach
+    python tests/benchmarks/bench_send_audit.py \\
+        --dsn postgresql://localhost/bench_outreach --records 20000 --threads 8
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import psycopg2
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MIDDLE = PROJECT_ROOT / "hubs" / "outreach-execution" / "imo" / "middle"
+
+
+def _load(name, filename):
+    spec = importlib.util.spec_from_file_location(name, MIDDLE / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+audit_sink = _load("bench_audit_sink", "audit_sink.py")
+safety_gate = _load("bench_marketing_safety_gate", "marketing_safety_gate.py")
+
+SCHEMA_SQL = """
+    CREATE SCHEMA IF NOT EXISTS outreach;
+    CREATE TABLE IF NOT EXISTS outreach.send_attempt_audit (
+        audit_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        company_unique_id UUID NOT NULL,
+        campaign_id TEXT NOT NULL,
+        effective_tier INTEGER NOT NULL,
+        computed_tier INTEGER NOT NULL,
+        override_snapshot JSONB NOT NULL DEFAULT '{}'::JSONB,
+        status TEXT NOT NULL,
+        failure_reason TEXT,
+        correlation_id TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+"""
+
+
+def run_threads(records, threads, write):
+    """Split records over send threads; returns seconds until all returned."""
+    chunks = [records[i::threads] for i in range(threads)]
+    workers = [threading.Thread(target=lambda c=c: [write(r) for r in c]) for c in chunks]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def inline(dsn, records, threads):
+    conn = psycopg2.connect(dsn)
+    gate = safety_gate.MarketingSafetyGate(conn)
+    lock = threading.Lock()   # one psycopg2 connection, one transaction at a time
+
+    def write(record):
+        with lock:
+            gate._write_audit_record(record)
+
+    seconds = run_threads(records, threads, write)
+    conn.close()
+    return seconds, seconds
+
+
+def buffered(dsn, records, threads, batch_size):
+    with tempfile.TemporaryDirectory() as wal_dir:
+        sink = audit_sink.SendAttemptAuditSink(lambda: psycopg2.connect(dsn), wal_dir, batch_size=batch_size)
+        sink.start()
+        gate = safety_gate.MarketingSafetyGate(audit_sink=sink)
+        start = time.perf_counter()
+        send_path = run_threads(records, threads, gate._write_audit_record)
+        sink.close()
+        return send_path, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dsn", default=os.getenv("BENCH_PG_DSN", "postgresql://localhost/bench_outreach"))
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=audit_sink.DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    with conn.cursor() as cursor:
+        cursor.execute(SCHEMA_SQL)
+        cursor.execute("TRUNCATE outreach.send_attempt_audit")
+    conn.commit()
+
+    def records():
+        return [
+            safety_gate.SendAttemptAuditRecord(
+                company_unique_id=f"00000000-0000-0000-0000-{i:012d}",
+                campaign_id="bench", effective_tier=2, computed_tier=2, status="allowed",
+            )
+            for i in range(args.records)
+        ]
+
+    results = {
+        'inline': inline(args.dsn, records(), args.threads),
+        'sink': buffered(args.dsn, records(), args.threads, args.batch_size),
+    }
+
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM outreach.send_attempt_audit")
+        committed, = cursor.fetchone()
+    conn.close()
+    if committed != 2 * args.records:
+        raise RuntimeError(f"expected {2 * args.records} audit rows, found {committed}")
+
+    print(f"records: {args.records:,}  send threads: {args.threads}  batch size: {args.batch_size}")
+    print(f"{'mode':8s} {'send-path s':>12s} {'records/s':>10s} {'committed s':>12s}")
+    for mode, (send_path, committed_after) in results.items():
+        print(f"{mode:8s} {send_path:12.2f} {args.records / send_path:10.0f} {committed_after:12.2f}")
+    print(f"send-path speedup: {results['inline'][0] / results['sink'][0]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Benchmark: SMTP verification, session per address vs probe engine
+==================================================================
+Probes N addresses spread over D domains against a local stub SMTP server
+with simulated per-reply latency (no network):
+- per-address: the previous flow, one session (connect, HELO, MAIL FROM,
+  RCPT TO) per address plus a second session for the catch-all test,
+  run on a 10-thread pool as batch_verify_emails did
+- engine: SMTPProbeEngine.probe_many, one session per MX chunk and one
+  catch-all probe per domain, at most --sessions-per-mx sessions per host
+
+Usage:
+    python tests/benchmarks/bench_smtp_probe.py --addresses 400 --domains 20 --latency 0.002
+"""
+
+import argparse
+import random
+import smtplib
+import string
+import sys
+import time
+import types
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "tests" / "hub" / "company"))
+
+from smtp_stub import StubSMTPServer
+
+PACKAGE = "company_target_bench_smtp"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [
+    str(PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle")
+]
+smtp_probe = importlib.import_module(f"{PACKAGE}.verification.smtp_probe")
+
+
+def per_address_check(email, host, port):
+    """The previous _smtp_check + _detect_catch_all_smtp flow."""
+    smtp = smtplib.SMTP(timeout=10)
+    smtp.connect(host, port)
+    smtp.helo("verify.local")
+    smtp.mail("verify@verify.local")
+    code, _ = smtp.rcpt(email)
+    smtp.quit()
+    if code != 250:
+        return code
+
+    domain = email.split('@')[1]
+    local = ''.join(random.choices(string.ascii_lowercase + string.digits, k=20))
+    smtp = smtplib.SMTP(timeout=10)
+    smtp.connect(host, port)
+    smtp.helo("verify.local")
+    smtp.mail("verify@verify.local")
+    smtp.rcpt(f"{local}@{domain}")
+    smtp.quit()
+    return code
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--addresses", type=int, default=400)
+    parser.add_argument("--domains", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds per SMTP reply")
+    parser.add_argument("--sessions-per-mx", type=int, default=2)
+    args = parser.parse_args()
+
+    emails = [f"user{i}@domain{i % args.domains}.com" for i in range(args.addresses)]
+    mailboxes = {email for i, email in enumerate(emails) if i % 3}
+
+    with StubSMTPServer(mailboxes=mailboxes, latency=args.latency, bind="0.0.0.0") as server:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            codes = list(executor.map(lambda e: per_address_check(e, server.host, server.port), emails))
+        baseline = time.perf_counter() - start
+        baseline_sessions = server.sessions
+
+        # One MX host per domain, all served by the stub (127.0.0.x aliases)
+        engine = smtp_probe.SMTPProbeEngine(port=server.port, max_sessions_per_mx=args.sessions_per_mx)
+        mx_hosts = {f"domain{d}.com": f"127.0.0.{d % 250 + 1}" for d in range(args.domains)}
+        server.sessions = 0
+        start = time.perf_counter()
+        results = engine.probe_many(emails, mx_hosts=mx_hosts)
+        batched = time.perf_counter() - start
+
+    deliverable = sum(r.status.value == "deliverable" for r in results.values())
+    if deliverable != codes.count(250) or deliverable != len(mailboxes):
+        raise RuntimeError(f"verdicts differ: engine {deliverable}, per-address {codes.count(250)}")
+
+    print(f"addresses: {args.addresses:,}  domains: {args.domains}  reply latency: {args.latency * 1e3:.1f}ms")
+    print(f"{'mode':14s} {'seconds':>9s} {'sessions':>9s} {'addr/s':>9s}")
+    print(f"{'per-address':14s} {baseline:9.2f} {baseline_sessions:9d} {args.addresses / baseline:9.0f}")
+    print(f"{'engine':14s} {batched:9.2f} {server.sessions:9d} {args.addresses / batched:9.0f}")
+    print(f"speedup: {baseline / batched:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
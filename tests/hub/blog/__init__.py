@@ -0,0 +1 @@
+# Blog Content Hub Tests
@@ -0,0 +1,196 @@
+"""
+Test Suite: hub/blog/ - Batched Entity Extraction
+=================================================
+Doctrine: hubs/blog-content/PRD.md - Stage 3 (NER extraction)
+
+extract_entities_batch / BlogNodeSpoke.run_backlog against a fake spaCy
+model (spaCy itself is not required):
+- One nlp.pipe stream per backlog, configured batch_size / n_process
+- Syndicated duplicates and previously seen content are not re-parsed
+- Same ExtractionResult per article as extract_entities()
+- A failing pipe falls back to per-article extraction (FAIL CLOSED per article)
+- Regex fallback when no spaCy model is available
+"""
+
+import re
+import sys
+import types
+import asyncio
+import importlib
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+PACKAGE = "blog_content_hub_extract"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [
+    str(PROJECT_ROOT / "hubs" / "blog-content")
+]
+extract_entities = importlib.import_module(f"{PACKAGE}.imo.middle.extract_entities")
+ingest_article = importlib.import_module(f"{PACKAGE}.imo.input.ingest_article")
+parse_content = importlib.import_module(f"{PACKAGE}.imo.middle.parse_content")
+blog_node_spoke = importlib.import_module(f"{PACKAGE}.blog_node_spoke")
+
+KNOWN_ENTITIES = {"Acme Robotics": "ORG", "Jane Doe": "PERSON", "Columbus": "GPE", "Globex": "ORG"}
+
+
+class FakeDoc:
+
+    def __init__(self, text):
+        self.ents = [
+            types.SimpleNamespace(text=name, label_=label, start_char=m.start(), end_char=m.end())
+            for name, label in KNOWN_ENTITIES.items()
+            for m in re.finditer(re.escape(name), text)
+        ]
+
+
+class FakeNLP:
+
+    pipe_names = ["tok2vec", "ner"]
+
+    def __init__(self, fail_pipe=False):
+        self.fail_pipe = fail_pipe
+        self.pipe_calls = []
+        self.single_calls = 0
+
+    def __call__(self, text):
+        self.single_calls += 1
+        return FakeDoc(text)
+
+    def pipe(self, texts, batch_size, n_process):
+        texts = list(texts)
+        self.pipe_calls.append((len(texts), batch_size, n_process))
+        for i, text in enumerate(texts):
+            if self.fail_pipe and i == 1:
+                raise RuntimeError("worker died")
+            yield FakeDoc(text)
+
+
+@pytest.fixture
+def nlp(monkeypatch):
+    fake = FakeNLP()
+    monkeypatch.delenv("BLOG_SPACY_MODEL", raising=False)
+    monkeypatch.setattr(extract_entities, "_nlp_models", {extract_entities.SPACY_MODEL: fake})
+    monkeypatch.setattr(extract_entities, "_ner_cache", extract_entities._NERCache())
+    return fake
+
+
+def _raw(i, body=None):
+    body = body or (f"Acme Robotics raised $12 million in Series B funding led by Globex, "
+                    f"CEO Jane Doe said from Columbus. Story number {i}.")
+    return {
+        'title': f"Acme Robotics funding story {i}",
+        'content': body,
+        'source': 'rss',
+        'source_url': f"https://news.example.org/acme-{i}",
+        'published_at': '2026-03-01T12:00:00Z',
+        'correlation_id': f"corr-{i}",
+    }
+
+
+def _parsed(raw):
+    payload = ingest_article.ingest_article(raw).payload
+    return parse_content.parse_content(payload).parsed
+
+
+def _summary(result):
+    entities = result.entities
+    return (
+        result.success,
+        sorted(e.text for e in entities.companies),
+        sorted(e.text for e in entities.persons),
+        sorted(e.text for e in entities.locations),
+        entities.extraction_method,
+        entities.total_entities,
+    )
+
+
+class TestExtractEntitiesBatch:
+
+    def test_one_pipe_stream_and_duplicates_parsed_once(self, nlp):
+        syndicated = "Globex acquired Acme Robotics; Jane Doe will lead the combined company in Columbus."
+        items = [_parsed(_raw(i)) for i in range(5)] + [_parsed(_raw(10 + i, syndicated)) for i in range(3)]
+
+        results = extract_entities.extract_entities_batch(items, batch_size=16, n_process=2)
+
+        assert nlp.pipe_calls == [(6, 16, 2)]       # 5 distinct + 1 syndicated text
+        assert nlp.single_calls == 0
+        assert [r.entities.article_id for r in results] == [p.article_id for p in items]
+
+        again = extract_entities.extract_entities_batch(items[5:])
+        assert nlp.pipe_calls == [(6, 16, 2)]       # all cached: no second stream
+        assert [_summary(r) for r in again] == [_summary(r) for r in results[5:]]
+
+    def test_matches_single_article_extraction(self, nlp):
+        items = [_parsed(_raw(i)) for i in range(4)]
+        batch = extract_entities.extract_entities_batch(items)
+        extract_entities._ner_cache.clear()
+        single = [extract_entities.extract_entities(p) for p in items]
+
+        assert [_summary(r) for r in batch] == [_summary(r) for r in single]
+        assert _summary(batch[0])[1:4] == (["Acme Robotics", "Globex"], ["Jane Doe"], ["Columbus"])
+
+    def test_cached_entities_are_not_shared_between_articles(self, nlp):
+        items = [_parsed(_raw(1)), _parsed(_raw(1))]
+        first, second = extract_entities.extract_entities_batch(items)
+        first.entities.companies.clear()
+        assert len(second.entities.companies) == 2
+        assert extract_entities._extract_with_spacy(items[0].clean_text)[0]
+
+    def test_failing_pipe_falls_back_per_article(self, nlp):
+        nlp.fail_pipe = True
+        items = [_parsed(_raw(i)) for i in range(4)]
+        results = extract_entities.extract_entities_batch(items)
+
+        assert all(r.success for r in results)
+        assert nlp.single_calls == 3                  # 1 from the pipe, 3 one at a time
+        assert all(_summary(r)[2] == ["Jane Doe"] for r in results)
+
+    def test_regex_fallback_without_spacy(self, monkeypatch):
+        monkeypatch.setattr(extract_entities, "_nlp_models", {extract_entities.SPACY_MODEL: "FALLBACK"})
+        items = [_parsed(_raw(1, "Initech Holdings raised $5 million to expand its Columbus office this year."))]
+
+        result, = extract_entities.extract_entities_batch(items)
+
+        assert result.success and result.entities.extraction_method == "regex"
+        assert [c.text for c in result.entities.companies] == ["Initech Holdings"]
+
+    def test_light_model_opt_in(self, nlp, monkeypatch):
+        light = FakeNLP()
+        extract_entities._nlp_models[extract_entities.SPACY_LIGHT_MODEL] = light
+        monkeypatch.setenv("BLOG_SPACY_MODEL", extract_entities.SPACY_LIGHT_MODEL)
+
+        extract_entities.extract_entities_batch([_parsed(_raw(1))])
+
+        assert light.pipe_calls and not nlp.pipe_calls
+
+
+class TestRunBacklog:
+
+    def test_backlog_matches_run(self, nlp, monkeypatch):
+        monkeypatch.delenv("KILL_BLOG_SUBHUB", raising=False)
+        raws = [_raw(i) for i in range(4)] + [_raw(9, "too short"), dict(_raw(8), source="carrier_pigeon")]
+
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        backlog = asyncio.run(spoke.run_backlog(raws, batch_size=8))
+        assert nlp.pipe_calls == [(4, 8, 1)]
+
+        single_spoke = blog_node_spoke.BlogNodeSpoke()
+        single = [asyncio.run(single_spoke.run(raw)) for raw in raws]
+
+        def terminal(r):
+            return (r.correlation_id, r.terminal_state, r.failed_stage, r.fail_code, r.event_type)
+
+        assert [terminal(r) for r in backlog] == [terminal(r) for r in single]
+        assert [r.failed_stage for r in backlog[4:]] == ["parse", "ingest"]
+        assert spoke.stats == single_spoke.stats
+
+    def test_kill_switch_blocks_whole_backlog(self, nlp, monkeypatch):
+        monkeypatch.setenv("KILL_BLOG_SUBHUB", "true")
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        results = asyncio.run(spoke.run_backlog([_raw(i) for i in range(3)]))
+
+        assert [r.failed_stage for r in results] == ["kill_switch"] * 3
+        assert nlp.pipe_calls == []
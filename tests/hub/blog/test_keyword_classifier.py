@@ -0,0 +1,168 @@
+"""
+Test Suite: hub/blog/ - Compiled Keyword Classifier
+===================================================
+Doctrine: hubs/blog-content/PRD.md - Event detection (hard rules first)
+
+KeywordClassifier must return exactly what one re.search per pattern
+returned, in pattern order:
+- Literal anchor extraction (optional trailing characters, alternation)
+- Anchors that are prefixes of other anchors (m / merger / million)
+- dumb_worker.classify_text and classify_event._classify_by_keywords
+  against the per-pattern loop on a randomized corpus
+"""
+
+import re
+import sys
+import types
+import random
+import importlib
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+PACKAGE = "blog_content_imo_keywords"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [
+    str(PROJECT_ROOT / "hubs" / "blog-content" / "imo")
+]
+keyword_classifier = importlib.import_module(f"{PACKAGE}.middle.keyword_classifier")
+classify_event = importlib.import_module(f"{PACKAGE}.middle.classify_event")
+
+KeywordClassifier = keyword_classifier.KeywordClassifier
+literal_anchor = keyword_classifier.literal_anchor
+
+
+def _naive(pattern_sets, text):
+    """The previous per-pattern loop."""
+    text_lower = text.lower()
+    matches = {}
+    for label, patterns in pattern_sets.items():
+        found = [p for p in patterns if re.search(p, text_lower, re.IGNORECASE)]
+        if found:
+            matches[label] = found
+    return matches
+
+
+FILLER = [
+    "the", "company", "provides", "services", "to", "clients", "across", "ohio",
+    "our", "team", "mission", "customers", "quality", "since", "1998", "family-owned",
+    "Market", "region", "office", "$", "5", "&", "M", "A", "M&A", "m & a", "we're",
+    "Series", "B", "CEO", "President", "VP", "executive", "officer", "jobs", "funding",
+    "ſeries", "İstanbul", "benefits", "FSAs", "pre-seed", "self-funded", "stop loss",
+]
+
+
+def _corpus(vocabulary, size, seed=7):
+    rng = random.Random(seed)
+    words = vocabulary + FILLER
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(0, 40))) for _ in range(size)]
+
+
+def _pattern_words(pattern_sets):
+    """Words and short phrases drawn from the patterns themselves."""
+    words = []
+    for patterns in pattern_sets.values():
+        for pattern in patterns:
+            plain = re.sub(r"\\[bs]\??|[()?:*+$\\^]|\[.*?\]", " ", pattern)
+            words.extend(w for w in re.split(r"[\s|.]+", plain) if w)
+    return words
+
+
+class TestLiteralAnchor:
+
+    @pytest.mark.parametrize("pattern, anchor", [
+        (r'\bacquisition\s+of\b', 'acquisition'),
+        (r'\bhires?\b', 'hire'),
+        (r'\bstaff(?:ing)?\s+up\b', 'staff'),
+        (r'\bm\s*&\s*a\b', 'm'),
+        (r'\bwe.re\s+hiring\b', 'we'),
+        (r'\bnamed\b.*(?:CEO|CFO)', 'named'),
+        (r'\bCEO\b', 'ceo'),
+        (r'\bx{2}', None),
+        (r'\bfoo|bar', None),
+        (r'\b(?:foo|bar)', None),
+        (r'acquired', None),
+    ])
+    def test_anchor(self, pattern, anchor):
+        assert literal_anchor(pattern) == anchor
+
+    def test_alternation_inside_groups_and_classes_keeps_anchor(self):
+        assert literal_anchor(r'\bnew\s+(?:CEO|CFO)\b') == 'new'
+        assert literal_anchor(r'\bself[|-]funded') == 'self'
+
+
+class TestKeywordClassifier:
+
+    SETS = {
+        'B-03': [r'\bmerger\b', r'\bm\s*&\s*a\b', r'\bmerged\s+with\b'],
+        'B-01': [r'\bmillion\s+in\s+funding\b', r'\braised\b.*\$'],
+        'X': [r'(?:^|\s)cash\b', r'\bhires?\b'],
+    }
+
+    def test_prefix_anchors_are_all_candidates(self):
+        classifier = KeywordClassifier(self.SETS)
+        text = "Merger closed after the M&A review; merged with Acme, $5 million in funding raised"
+        assert classifier.match(text) == _naive(self.SETS, text)
+        assert classifier.match(text)['B-03'] == self.SETS['B-03']
+
+    def test_unanchored_patterns_always_confirmed(self):
+        classifier = KeywordClassifier(self.SETS)
+        assert classifier.match("cash on hand") == {'X': [r'(?:^|\s)cash\b']}
+        assert classifier.match("new hire") == {'X': [r'\bhires?\b']}
+
+    def test_non_ascii_words_fold_like_ignorecase(self):
+        sets = {'B-01': [r'\bseries\s+[a-z]\b', r'\bstop[- ]loss\b']}
+        classifier = KeywordClassifier(sets)
+        for text in ["ſeries B round", "Series C", "ſtop-loss carrier", "café series"]:
+            assert classifier.match(text) == _naive(sets, text)
+        assert classifier.match("ſeries B") == {'B-01': [r'\bseries\s+[a-z]\b']}
+
+    def test_word_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(keyword_classifier, "WORD_CACHE_SIZE", 4)
+        classifier = KeywordClassifier(self.SETS)
+        for text in _corpus(["merger", "raised", "$"], 50):
+            assert classifier.match(text) == _naive(self.SETS, text)
+            assert len(classifier._word_cache) <= 4
+
+    def test_empty_text(self):
+        assert KeywordClassifier(self.SETS).match("") == {}
+
+    def test_label_and_pattern_order(self):
+        classifier = KeywordClassifier(self.SETS)
+        assert classifier.labels == ['B-03', 'B-01', 'X']
+        text = "raised $2 ... merged with Beta; merger"
+        assert list(classifier.match(text)['B-03']) == [r'\bmerger\b', r'\bmerged\s+with\b']
+
+
+class TestEquivalence:
+
+    def test_event_keyword_sets(self):
+        sets = {
+            event_type: patterns
+            for event_type, patterns in zip(classify_event._KEYWORD_CLASSIFIER.labels, [
+                classify_event.FUNDING_KEYWORDS, classify_event.ACQUISITION_KEYWORDS,
+                classify_event.LEADERSHIP_KEYWORDS, classify_event.EXPANSION_KEYWORDS,
+                classify_event.PRODUCT_LAUNCH_KEYWORDS, classify_event.PARTNERSHIP_KEYWORDS,
+                classify_event.LAYOFF_KEYWORDS, classify_event.NEGATIVE_NEWS_KEYWORDS,
+            ])
+        }
+        for text in _corpus(_pattern_words(sets), 3000):
+            expected = _naive(sets, text)
+            candidates = classify_event._classify_by_keywords(text)
+            assert {c.event_type: c.evidence for c in candidates} == expected
+            assert [c.event_type for c in candidates] == list(expected)
+            for c in candidates:
+                assert c.confidence == min(0.90, 0.60 + len(c.evidence) * 0.10)
+
+    def test_dumb_worker_classify_text(self):
+        pytest.importorskip("psycopg2")
+        dumb_worker = importlib.import_module(f"{PACKAGE}.middle.dumb_worker")
+        sets = dumb_worker.KEYWORD_PATTERNS
+        for text in _corpus(_pattern_words(sets), 3000, seed=11):
+            expected = [
+                (code, min(0.90, 0.60 + len(found) * 0.10), found)
+                for code, found in _naive(sets, text).items()
+            ]
+            assert dumb_worker.classify_text(text) == expected
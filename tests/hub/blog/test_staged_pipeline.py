@@ -0,0 +1,298 @@
+"""
+Test Suite: hub/blog/ - Staged Concurrent Pipeline
+==================================================
+Doctrine: hubs/blog-content/PRD.md - Pipeline orchestration (FAIL CLOSED)
+
+BlogNodeSpoke.run_concurrent / StagedPipelineRunner:
+- Same terminal state per article as run() (EMITTED / QUEUED / DROPPED)
+- Bounded queues: a stalled stage stops upstream intake (backpressure)
+- Per-stage concurrency knobs and latency histograms in get_stats()
+- An exception in one article's stage fails that article only, even if
+  the exception handler raises too
+- The process pool is owned by the runner and reused across runs; a dead
+  worker costs only the article that killed it (retried once on a new pool)
+"""
+
+import os
+import sys
+import types
+import asyncio
+import importlib
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+PACKAGE = "blog_content_hub_staged"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [
+    str(PROJECT_ROOT / "hubs" / "blog-content")
+]
+blog_node_spoke = importlib.import_module(f"{PACKAGE}.blog_node_spoke")
+staged_pipeline = importlib.import_module(f"{PACKAGE}.staged_pipeline")
+match_company = importlib.import_module(f"{PACKAGE}.imo.middle.match_company")
+validate_signal = importlib.import_module(f"{PACKAGE}.imo.middle.validate_signal")
+extract_entities = importlib.import_module(f"{PACKAGE}.imo.middle.extract_entities")
+
+StagedPipelineConfig = staged_pipeline.StagedPipelineConfig
+TerminalState = blog_node_spoke.TerminalState
+
+FUNDING = "{name} raised $12 million in Series B funding led by Globex Ventures to expand its platform nationwide."
+NO_EVENT = "{name} published a blog post about their favourite recipes and weekend hiking trails in the area."
+
+
+CPU_STAGES = staged_pipeline.run_cpu_stages
+CRASH_MARKER = None     # path set by a test; inherited by forked workers
+
+
+def crashing_cpu_stages(ctx, article_payload):
+    """Kills its worker for corr-crash; once only if CRASH_MARKER exists then."""
+    if ctx.correlation_id == "corr-crash":
+        if CRASH_MARKER is None or os.path.exists(CRASH_MARKER):
+            if CRASH_MARKER is not None:
+                os.unlink(CRASH_MARKER)
+            os._exit(1)
+    return CPU_STAGES(ctx, article_payload)
+
+
+def _raw(i, body=FUNDING, **overrides):
+    raw = {
+        'title': f"Story {i} about company number {i}",
+        'content': body.format(name="Acme Robotics" if i % 3 else "Initech LLC"),
+        'source': 'rss',
+        'source_url': f"https://news.example.org/story-{i}",
+        'published_at': '2026-03-01T12:00:00Z',
+        'correlation_id': f"corr-{i:03d}",
+        'article_id': f"rss_story_{i:03d}",
+    }
+    raw.update(overrides)
+    return raw
+
+
+def _backlog():
+    raws = [_raw(i) for i in range(12)]
+    raws += [_raw(20, NO_EVENT), _raw(21, "too short"), _raw(22, source="carrier_pigeon")]
+    return raws
+
+
+async def _fake_match(classified):
+    """Acme articles match, the rest go to identity resolution"""
+    if "Acme" not in classified.entities.parsed_content.clean_text:
+        return match_company.MatchResult(
+            success=False, fail_code="BLOG-201", fail_reason="No match",
+            queued_for_resolution=True, queue_payload={'article_id': classified.article_id}
+        )
+    return match_company.MatchResult(success=True, matched=match_company.MatchedEvent(
+        correlation_id=classified.correlation_id,
+        article_id=classified.article_id,
+        company_sov_id="04.04.01.01.00001.001",
+        company_name="Acme Robotics",
+        company_domain="acmerobotics.com",
+        match_method="domain",
+        match_confidence=1.0,
+        match_source="test",
+        classified_event=classified,
+    ))
+
+
+@pytest.fixture(autouse=True)
+def pipeline_env(monkeypatch):
+    for switch in blog_node_spoke.KILL_SWITCHES:
+        monkeypatch.delenv(switch, raising=False)
+    monkeypatch.setattr(blog_node_spoke, "match_company", _fake_match)
+    monkeypatch.setattr(validate_signal, "_signal_cache", {})
+    monkeypatch.setattr(extract_entities, "_nlp_models", {extract_entities.SPACY_MODEL: "FALLBACK"})
+
+
+def _terminal(result):
+    return (result.correlation_id, result.article_id, result.terminal_state,
+            result.failed_stage, result.fail_code, result.event_type)
+
+
+def _sequential(raws):
+    spoke = blog_node_spoke.BlogNodeSpoke()
+
+    async def run_all():
+        return [await spoke.run(raw) for raw in raws]
+
+    return spoke, asyncio.run(run_all())
+
+
+class TestStagedPipelineRunner:
+
+    def test_same_terminal_states_as_run(self, monkeypatch):
+        raws = _backlog()
+        spoke, sequential = _sequential(raws)
+        monkeypatch.setattr(validate_signal, "_signal_cache", {})
+
+        concurrent_spoke = blog_node_spoke.BlogNodeSpoke()
+        config = StagedPipelineConfig(cpu_workers=3, process_pool=False, match_concurrency=2, queue_size=2)
+        concurrent = asyncio.run(concurrent_spoke.run_concurrent(raws, config))
+
+        assert [_terminal(r) for r in concurrent] == [_terminal(r) for r in sequential]
+        states = [r.terminal_state for r in concurrent]
+        assert states.count(TerminalState.EMITTED) == 8
+        assert states.count(TerminalState.QUEUED) == 4
+        assert [r.failed_stage for r in concurrent[-3:]] == ["classify", "parse", "ingest"]
+        assert concurrent_spoke.stats == spoke.stats
+
+    def test_backpressure_bounds_intake(self, monkeypatch):
+        gate = asyncio.Event()
+        started = []
+        cpu_stages = staged_pipeline.run_cpu_stages
+
+        def counting_cpu_stages(ctx, article_payload):
+            started.append(ctx.correlation_id)
+            return cpu_stages(ctx, article_payload)
+
+        async def stalled_match(classified):
+            await gate.wait()
+            return await _fake_match(classified)
+
+        monkeypatch.setattr(staged_pipeline, "run_cpu_stages", counting_cpu_stages)
+        monkeypatch.setattr(blog_node_spoke, "match_company", stalled_match)
+        config = StagedPipelineConfig(cpu_workers=2, process_pool=False, match_concurrency=1, queue_size=3)
+
+        async def scenario():
+            spoke = blog_node_spoke.BlogNodeSpoke()
+            task = asyncio.create_task(spoke.run_concurrent([_raw(i) for i in range(40)], config))
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+            # 1 in match + 3 queued for match + 2 cpu workers blocked on put
+            in_flight = len(started)
+            gate.set()
+            return in_flight, await task, spoke
+
+        in_flight, results, spoke = asyncio.run(scenario())
+
+        assert in_flight == 1 + 3 + 2
+        assert len(results) == 40 and all(r.terminal_state != TerminalState.DROPPED for r in results)
+        assert spoke.stats['total_processed'] == 40
+
+    def test_stage_exception_fails_closed_per_article(self, monkeypatch):
+        async def flaky_match(classified):
+            if classified.correlation_id == "corr-004":
+                raise RuntimeError("lookup exploded")
+            return await _fake_match(classified)
+
+        monkeypatch.setattr(blog_node_spoke, "match_company", flaky_match)
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        config = StagedPipelineConfig(cpu_workers=2, process_pool=False)
+        results = asyncio.run(spoke.run_concurrent([_raw(i) for i in range(6)], config))
+
+        failed = [r for r in results if r.failed_stage == "exception"]
+        assert [(r.correlation_id, r.fail_code) for r in failed] == [("corr-004", "BLOG-999")]
+        assert [r.correlation_id for r in results] == [f"corr-{i:03d}" for i in range(6)]
+
+    def test_stage_latency_in_stats(self):
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        config = StagedPipelineConfig(cpu_workers=2, process_pool=False)
+        asyncio.run(spoke.run_concurrent(_backlog(), config))
+
+        latency = spoke.get_stats()['stage_latency_ms']
+        assert list(latency) == list(staged_pipeline.PIPELINE_STAGES)
+        assert latency['cpu']['count'] == 15            # ingest failure still ran the CPU stage
+        assert latency['match']['count'] == 12
+        assert latency['emit']['count'] == 8
+        assert sum(latency['cpu']['buckets'].values()) == 15
+
+    def test_failing_exception_handler_still_fails_closed(self, monkeypatch):
+        async def flaky_match(classified):
+            if classified.correlation_id == "corr-004":
+                raise RuntimeError("lookup exploded")
+            return await _fake_match(classified)
+
+        async def broken_handler(ctx, e):
+            raise ConnectionError("AIR log unavailable")
+
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        monkeypatch.setattr(blog_node_spoke, "match_company", flaky_match)
+        monkeypatch.setattr(spoke, "_handle_exception", broken_handler)
+        config = StagedPipelineConfig(cpu_workers=2, process_pool=False)
+        results = asyncio.run(spoke.run_concurrent([_raw(i) for i in range(6)], config))
+
+        assert len(results) == 6
+        failed = results[4]
+        assert (failed.correlation_id, failed.terminal_state, failed.failed_stage, failed.fail_code) == (
+            "corr-004", TerminalState.DROPPED, "exception", "BLOG-999"
+        )
+
+    def test_default_cpu_workers_is_conservative(self):
+        assert 1 <= StagedPipelineConfig().cpu_workers <= 2
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="worker processes must inherit the test package")
+    def test_process_pool(self):
+        raws = _backlog()[:6]
+        _, sequential = _sequential(raws)
+        validate_signal._signal_cache.clear()
+
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        config = StagedPipelineConfig(cpu_workers=2)
+        try:
+            concurrent = asyncio.run(spoke.run_concurrent(raws, config))
+            pool = spoke._staged_runner._executor
+            validate_signal._signal_cache.clear()
+            again = asyncio.run(spoke.run_concurrent(raws))
+            assert spoke._staged_runner._executor is pool
+        finally:
+            spoke.close()
+
+        assert [_terminal(r) for r in concurrent] == [_terminal(r) for r in sequential]
+        assert [_terminal(r) for r in again] == [_terminal(r) for r in sequential]
+        assert spoke._staged_runner is None
+
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="worker processes must inherit the test package")
+    def test_dead_worker_fails_only_its_article(self, monkeypatch):
+        monkeypatch.setattr(staged_pipeline, "run_cpu_stages", crashing_cpu_stages)
+        raws = [_raw(0), _raw(1, correlation_id="corr-crash"), _raw(2), _raw(3)]
+
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        try:
+            results = asyncio.run(spoke.run_concurrent(raws, StagedPipelineConfig(cpu_workers=1)))
+        finally:
+            spoke.close()
+
+        failed = [(r.correlation_id, r.fail_code) for r in results if r.terminal_state == TerminalState.DROPPED]
+        assert failed == [("corr-crash", "BLOG-999")]
+        assert [r.correlation_id for r in results] == ["corr-000", "corr-crash", "corr-002", "corr-003"]
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="worker processes must inherit the test package")
+    def test_article_retried_on_fresh_pool(self, monkeypatch, tmp_path):
+        marker = tmp_path / "crash-once"
+        marker.touch()
+        monkeypatch.setattr(sys.modules[__name__], "CRASH_MARKER", str(marker))
+        monkeypatch.setattr(staged_pipeline, "run_cpu_stages", crashing_cpu_stages)
+        raws = [_raw(i) for i in range(4)] + [_raw(5, correlation_id="corr-crash")]
+
+        spoke = blog_node_spoke.BlogNodeSpoke()
+        try:
+            results = asyncio.run(spoke.run_concurrent(raws, StagedPipelineConfig(cpu_workers=2)))
+        finally:
+            spoke.close()
+
+        assert not marker.exists()                  # the worker did die once
+        assert all(r.terminal_state != TerminalState.DROPPED for r in results)
+
+
+class TestLatencyHistogram:
+
+    def test_buckets_and_quantiles(self):
+        histogram = staged_pipeline.LatencyHistogram(bounds_ms=(1, 10, 100))
+        for ms in [0.5] * 50 + [5] * 45 + [50] * 4 + [500]:
+            histogram.observe(ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot['count'] == 100
+        assert snapshot['buckets'] == {'<=1': 50, '<=10': 45, '<=100': 4, '>100': 1}
+        assert (snapshot['p50'], snapshot['p95'], snapshot['p99']) == (1.0, 10.0, 100.0)
+        assert histogram.quantile(1.0) == snapshot['max'] == 500
+
+    def test_empty(self):
+        snapshot = staged_pipeline.LatencyHistogram().snapshot()
+        assert snapshot['count'] == 0 and snapshot['p99'] == 0.0 and snapshot['buckets'] == {}
@@ -0,0 +1,114 @@
+"""
+Local stub SMTP server for verification tests and benchmarks
+============================================================
+Speaks just enough SMTP for RCPT TO probing (HELO/EHLO, MAIL, RCPT, RSET,
+NOOP, QUIT) and records what it was asked:
+- mailboxes: addresses that get 250
+- catch_all_domains: domains where every address gets 250
+- greylist: addresses that get 451
+- everything else gets 550
+- latency: seconds slept before each reply (simulated round trip)
+- bind: listen address ("0.0.0.0" also answers on 127.0.0.2, ... so each
+  domain can have its own MX host)
+
+Usage:
+    with StubSMTPServer(mailboxes={"jane@acme.com"}) as server:
+        engine = SMTPProbeEngine(port=server.port, mx_lookup=lambda d: [server.host])
+"""
+
+import time
+import threading
+import socketserver
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, line: str) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.wfile.write(f"{line}\r\n".encode())
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        server = self.server
+        with server.lock:
+            server.sessions += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        self.open = True
+        try:
+            self.reply("220 stub.local ESMTP")
+            for raw in self.rfile:
+                line = raw.decode(errors='replace').strip()
+                verb = line[:4].upper()
+                if verb in ("HELO", "EHLO"):
+                    self.reply("250 stub.local")
+                elif verb == "MAIL":
+                    with server.lock:
+                        server.mail_from += 1
+                    self.reply("250 OK")
+                elif verb == "RCPT":
+                    address = line.split(':', 1)[1].strip().strip('<>').lower()
+                    with server.lock:
+                        server.rcpts.append(address)
+                    self.reply(server.rcpt_reply(address))
+                elif verb in ("RSET", "NOOP"):
+                    self.reply("250 OK")
+                elif verb == "QUIT":
+                    self.close_session()   # before the reply, as the client sees it
+                    self.reply("221 Bye")
+                    return
+                else:
+                    self.reply("502 Command not implemented")
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.close_session()
+
+    def close_session(self) -> None:
+        if self.open:
+            self.open = False
+            with self.server.lock:
+                self.server.active -= 1
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, mailboxes=(), catch_all_domains=(), greylist=(), latency=0.0,
+                 bind="127.0.0.1"):
+        super().__init__((bind, 0), _SMTPHandler)
+        self.mailboxes = {m.lower() for m in mailboxes}
+        self.catch_all_domains = {d.lower() for d in catch_all_domains}
+        self.greylist = {g.lower() for g in greylist}
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.sessions = 0
+        self.active = 0
+        self.max_active = 0
+        self.mail_from = 0
+        self.rcpts = []
+
+    @property
+    def host(self) -> str:
+        return "127.0.0.1" if self.server_address[0] == "0.0.0.0" else self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def rcpt_reply(self, address: str) -> str:
+        if address in self.greylist:
+            return "451 Greylisted, try again later"
+        if address in self.mailboxes or address.rsplit('@', 1)[-1] in self.catch_all_domains:
+            return "250 OK"
+        return "550 No such user"
+
+    def __enter__(self) -> "StubSMTPServer":
+        threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,160 @@
+"""
+Test Suite: hub/company/ - BITEngine Score and Recency Indexes
+==============================================================
+PRD Reference: PRD_COMPANY_HUB.md - BIT Engine (Core Metric)
+
+Top-N, threshold, lifecycle-state and recent-mover queries answer from
+indexes maintained by process_signal:
+- Same companies as the previous scans and sorts, highest score first,
+  equal scores in the order companies reached them
+- Indexes follow score drops (negative impacts) and Neon hydration
+- _BucketIndex keeps buckets ordered as they appear and empty out
+"""
+
+import sys
+import random
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+engine_spec = importlib.util.spec_from_file_location(
+    "company_target_bit_engine",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "bit_engine.py"
+)
+bit_engine = importlib.util.module_from_spec(engine_spec)
+engine_spec.loader.exec_module(bit_engine)
+
+BITEngine = bit_engine.BITEngine
+BITSignal = bit_engine.BITSignal
+SignalType = bit_engine.SignalType
+
+IMPACTS = [10.0, 5.0, 15.0, 8.0, -5.0, -3.0, 3.0]
+
+
+def _signal(company_id, impact, timestamp=None):
+    return BITSignal(
+        signal_type=SignalType.FORM_5500_FILED,
+        company_id=company_id,
+        source_spoke='dol_node',
+        impact=impact,
+        timestamp=timestamp or datetime.now(),
+    )
+
+
+@pytest.fixture
+def engine():
+    rng = random.Random(7)
+    engine = BITEngine()
+    engine.logger.disabled = True
+    now = datetime.now()
+    for _ in range(3000):
+        company_id = f"C{rng.randrange(400):04d}"
+        engine.process_signal(_signal(company_id, rng.choice(IMPACTS), now - timedelta(hours=rng.randrange(72))))
+    return engine
+
+
+def ids(scores):
+    return [s.company_id for s in scores]
+
+
+class TestScoreIndex:
+
+    def test_top_companies_match_sort(self, engine):
+        expected = sorted(engine._scores.values(), key=lambda x: x.score, reverse=True)
+        top = engine.get_top_companies(25)
+        assert [s.score for s in top] == [s.score for s in expected[:25]]
+
+        exported = engine.export_scores()
+        assert [e['score'] for e in exported] == [s.score for s in expected]
+        assert sorted(e['company_id'] for e in exported) == sorted(engine._scores)
+
+    @pytest.mark.parametrize("threshold", [-10, 0, 25, 50, 75, 1000])
+    def test_threshold_matches_scan(self, engine, threshold):
+        expected = [s for s in engine._scores.values() if s.score >= threshold]
+        result = engine.get_companies_above_threshold(threshold)
+
+        assert sorted(ids(result)) == sorted(ids(expected))
+        assert [s.score for s in result] == sorted((s.score for s in result), reverse=True)
+
+    def test_states_partition_companies(self, engine):
+        states = {state: engine.get_companies_by_state(state) for state in ('SUSPECT', 'WARM', 'HOT', 'BURNING')}
+
+        assert sum(len(v) for v in states.values()) == len(engine._scores)
+        for state, companies in states.items():
+            assert all(engine.get_lifecycle_state(s.company_id) == state for s in companies)
+
+    def test_score_drop_moves_company_down(self):
+        engine = BITEngine()
+        engine.process_signal(_signal('A', 60.0))
+        engine.process_signal(_signal('B', 30.0))
+        engine.process_signal(_signal('A', -40.0))
+
+        assert ids(engine.get_top_companies(2)) == ['B', 'A']
+        assert ids(engine.get_companies_by_state('HOT')) == []
+        assert ids(engine.get_companies_by_state('SUSPECT')) == ['A']
+
+    def test_equal_scores_in_order_reached(self):
+        engine = BITEngine()
+        for company_id in ('X', 'Y', 'Z'):
+            engine.process_signal(_signal(company_id, 10.0))
+        engine.process_signal(_signal('X', 5.0))
+        engine.process_signal(_signal('X', -5.0))
+        assert ids(engine.get_top_companies()) == ['Y', 'Z', 'X']
+
+    def test_neon_hydration_is_indexed(self):
+        class Writer:
+            def load_all_companies(self):
+                return [{'company_unique_id': 'N1', 'bit_score': 80.0},
+                        {'company_unique_id': 'N2', 'bit_score': 30.0}]
+
+        engine = BITEngine()
+        engine._neon_writer = Writer()
+        assert engine.load_scores_from_neon() == 2
+        assert ids(engine.get_companies_by_state('BURNING')) == ['N1']
+
+
+class TestRecencyIndex:
+
+    def test_recent_movers_match_scan(self, engine):
+        cutoff = datetime.now().timestamp() - 24 * 3600
+        expected = [
+            s for s in engine._scores.values()
+            if s.last_signal_at and s.last_signal_at.timestamp() > cutoff and s.signal_count >= 3
+        ]
+        assert sorted(ids(engine.get_recent_movers(hours=24, min_signals=3))) == sorted(ids(expected))
+
+    def test_new_signal_refreshes_recency(self):
+        engine = BITEngine()
+        old = datetime.now() - timedelta(days=3)
+        engine.process_signal(_signal('A', 5.0, old))
+        assert engine.get_recent_movers(min_signals=1) == []
+
+        engine.process_signal(_signal('A', 5.0))
+        assert ids(engine.get_recent_movers(min_signals=1)) == ['A']
+
+
+class TestBucketIndex:
+
+    def test_buckets_stay_ordered_and_empty_out(self):
+        rng = random.Random(3)
+        index = bit_engine._BucketIndex()
+        placed = {}
+        for _ in range(20000):
+            company_id = f"C{rng.randrange(500)}"
+            if company_id in placed:
+                index.remove(placed.pop(company_id), company_id)
+            else:
+                placed[company_id] = rng.randrange(-50, 150)
+                index.add(placed[company_id], company_id)
+
+        ascending = list(index.ascending())
+        assert [key for key, _ in ascending] == sorted(placed.values())
+        assert {company_id: key for key, company_id in ascending} == placed
+        assert index._keys == sorted(set(placed.values()))
+        assert [key for key, _ in index.descending(25)] == sorted((v for v in placed.values() if v < 25), reverse=True)
+        assert list(index.ascending(10 ** 6)) == []
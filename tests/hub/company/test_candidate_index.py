@@ -0,0 +1,112 @@
+"""
+Test Suite: hub/company/ - Fuzzy Tier Candidate Index
+=====================================================
+PRD Reference: PRD_COMPANY_HUB.md - Section 3.1 Company Identity Matching
+
+The blocking index must never change what apply_city_guardrail() returns:
+- Same candidates, same scores, same order
+- Same behaviour in the 0.85-0.92 city-guardrail band
+"""
+
+import random
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+MATCHING_DIR = PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "matching"
+
+
+def _load(name: str, filename: str):
+    """Load a matching module by path (avoiding hyphenated directory issues)."""
+    spec = importlib.util.spec_from_file_location(name, MATCHING_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+fuzzy = _load("company_target_fuzzy", "fuzzy.py")
+candidate_index = _load("company_target_candidate_index", "candidate_index.py")
+
+CompanyCandidateIndex = candidate_index.CompanyCandidateIndex
+apply_city_guardrail = fuzzy.apply_city_guardrail
+
+
+WORDS = ["acme", "beta", "global", "health", "partners", "systems", "capital",
+         "logistics", "tech", "solutions", "group", "summit", "river", "north"]
+CITIES = ["charleston", "columbia", "greenville", "raleigh", "durham", ""]
+
+
+def _synthetic_candidates(count: int, seed: int):
+    rng = random.Random(seed)
+    candidates = []
+    for i in range(count):
+        name = " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+        if rng.random() < 0.2:
+            name = name.title() + " Inc"
+        candidates.append({
+            'id': f"C{i:05d}",
+            'name': name,
+            'city': rng.choice(CITIES),
+            'state': rng.choice(["SC", "NC"]),
+        })
+    return candidates
+
+
+def _signature(matches):
+    return [(m.candidate_id, m.score, m.match_method, m.city_match, m.state_match)
+            for m in matches]
+
+
+class TestCompanyCandidateIndex:
+    """Shortlist + guardrail must equal full-scan guardrail."""
+
+    @pytest.fixture
+    def candidates(self):
+        return _synthetic_candidates(1000, seed=7)
+
+    @pytest.mark.parametrize("thresholds", [(0.85, 0.92), (0.80, 0.90), (0.90, 0.95)])
+    def test_shortlist_parity_with_full_scan(self, candidates, thresholds):
+        low, high = thresholds
+        index = CompanyCandidateIndex(candidates, name_threshold=low, high_threshold=high)
+        rng = random.Random(11)
+
+        for _ in range(60):
+            base = rng.choice(candidates)['name'].lower()
+            query = base if rng.random() < 0.5 else base[:-1] + rng.choice("aeiou")
+            city = rng.choice(CITIES)
+
+            full = apply_city_guardrail(query, city, "SC", candidates,
+                                        name_threshold=low, high_threshold=high)
+            short = apply_city_guardrail(query, city, "SC", index.shortlist(query, city),
+                                         name_threshold=low, high_threshold=high)
+
+            assert _signature(short) == _signature(full)
+
+    def test_upper_bound_never_below_score(self, candidates):
+        index = CompanyCandidateIndex(candidates)
+        query = "acme global partners"
+        bounds = index.upper_bounds(query)
+
+        for position, candidate in enumerate(candidates):
+            score = fuzzy.jaro_winkler_similarity(query, candidate['name'])
+            assert bounds[position] + 1e-9 >= score
+
+    def test_medium_band_requires_city_block(self):
+        candidates = [
+            {'id': 'C1', 'name': 'acme partnrs', 'city': 'Charleston', 'state': 'SC'},
+            {'id': 'C2', 'name': 'acme partnrs', 'city': 'Columbia', 'state': 'SC'},
+        ]
+        index = CompanyCandidateIndex(candidates, name_threshold=0.85, high_threshold=0.99)
+
+        shortlist = index.shortlist("acme partners", "charleston")
+
+        assert [c['id'] for c in shortlist] == ['C1']
+
+    def test_empty_query_returns_nothing(self, candidates):
+        index = CompanyCandidateIndex(candidates)
+        assert index.shortlist("", "charleston") == []
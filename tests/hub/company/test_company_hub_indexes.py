@@ -0,0 +1,190 @@
+"""
+Test Suite: hub/company/ - CompanyHub Secondary Indexes
+=======================================================
+PRD Reference: PRD_COMPANY_HUB.md - Section 3.1 Company Identity Matching
+
+find_company_by_domain / _by_ein / _by_name answer from maintained indexes:
+- Same result as the previous linear scans (earliest-added match wins)
+- Indexes follow add_company / update_company / add_companies
+- Neon misses are cached for negative_cache_ttl seconds; failed Neon
+  queries are not
+"""
+
+import sys
+import types
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# company_hub imports ..output.neon_writer lazily for Neon fallbacks; load it
+# inside a throwaway package whose output.neon_writer is a recording stub.
+PACKAGE = "company_hub_index_tests"
+for name in (PACKAGE, f"{PACKAGE}.middle", f"{PACKAGE}.output"):
+    sys.modules.setdefault(name, types.ModuleType(name)).__path__ = []
+
+
+class StubNeonWriter:
+    """Records Neon lookups; misses except for name_rows candidates."""
+    calls = []
+    name_rows = []
+    fail = False
+
+    def _lookup(self, kind, value, raise_errors):
+        StubNeonWriter.calls.append((kind, value))
+        if StubNeonWriter.fail and raise_errors:
+            raise ConnectionError("pool exhausted")
+
+    def find_company_by_domain(self, domain, raise_errors=False):
+        self._lookup("domain", domain, raise_errors)
+        return None
+
+    def find_company_by_ein(self, ein, raise_errors=False):
+        self._lookup("ein", ein, raise_errors)
+        return None
+
+    def find_companies_by_name(self, name, raise_errors=False):
+        self._lookup("name", name, raise_errors)
+        return [] if StubNeonWriter.fail else list(StubNeonWriter.name_rows)
+
+    def close(self):
+        pass
+
+
+neon_stub = types.ModuleType(f"{PACKAGE}.output.neon_writer")
+neon_stub.CompanyNeonWriter = StubNeonWriter
+sys.modules[neon_stub.__name__] = neon_stub
+
+hub_spec = importlib.util.spec_from_file_location(
+    f"{PACKAGE}.middle.company_hub",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "company_hub.py"
+)
+company_hub = importlib.util.module_from_spec(hub_spec)
+hub_spec.loader.exec_module(company_hub)
+
+
+class StubHub:
+    """Stands in for the phantom wheel Hub base (ctb.* does not exist)."""
+
+    def __init__(self, **kwargs):
+        self.core_metric_name = kwargs.get("core_metric_name")
+        self.core_metric_value = kwargs.get("core_metric_value")
+        self._anchors = dict(kwargs.get("anchor_fields", {}))
+
+    def set_anchor(self, name, value):
+        self._anchors[name] = value
+
+    def get_anchor(self, name):
+        return self._anchors.get(name)
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    monkeypatch.setattr(company_hub, "Hub", StubHub)
+    StubNeonWriter.calls = []
+    StubNeonWriter.name_rows = []
+    StubNeonWriter.fail = False
+    instance = company_hub.CompanyHub(negative_cache_ttl=60)
+    clock = [0.0]
+    instance._clock = lambda: clock[0]
+    instance.advance = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+    return instance
+
+
+def _record(company_id, name, domain=None, ein=None):
+    return company_hub.CompanyHubRecord(
+        company_unique_id=company_id, company_name=name, domain=domain, ein=ein
+    )
+
+
+class TestIndexes:
+
+    def test_lookups_match_earliest_added(self, hub):
+        hub.add_companies([
+            _record("C1", "Acme Corporation", domain="Acme.com", ein="123456789"),
+            _record("C2", "acme corporation", domain="acme.com", ein="123456789"),
+            _record("C3", "Gamma, Inc.", domain="gamma.com"),
+        ])
+
+        assert hub.find_company_by_domain("ACME.COM").company_unique_id == "C1"
+        assert hub.find_company_by_ein("12-3456789").company_unique_id == "C1"
+        assert hub.find_company_by_name("ACME CORPORATION").company_unique_id == "C1"
+        # Normalized match (suffix stripped)
+        assert hub.find_company_by_name("Acme LLC").company_unique_id == "C1"
+        assert hub.find_company_by_name("Gamma LLC").company_unique_id == "C3"
+        assert StubNeonWriter.calls == []
+
+    def test_update_company_reindexes(self, hub):
+        hub.add_company(_record("C1", "Acme Corporation", domain="acme.com"))
+        hub.update_company(_record("C1", "Beta Industries", domain="beta.com"))
+
+        assert hub.find_company_by_domain("beta.com").company_unique_id == "C1"
+        assert hub.find_company_by_name("beta industries").company_unique_id == "C1"
+        assert hub.find_company_by_domain("acme.com") is None
+        assert hub.find_company_by_name("Acme Corporation") is None
+
+    def test_in_place_mutation_then_update(self, hub):
+        record = _record("C1", "Acme", domain="acme.com")
+        hub.add_company(record)
+        record.domain = "acme.io"
+        hub.update_company(record)
+
+        assert hub.find_company_by_domain("acme.io") is record
+        assert hub.find_company_by_domain("acme.com") is None
+
+    def test_duplicate_add_is_rejected(self, hub):
+        assert hub.add_companies([_record("C1", "Acme"), _record("C1", "Beta")]) == 1
+        assert hub.find_company_by_name("Beta") is None
+
+
+class TestNegativeCache:
+
+    def test_repeated_miss_skips_neon_until_ttl(self, hub):
+        assert hub.find_company_by_domain("missing.com") is None
+        assert hub.find_company_by_domain("missing.com") is None
+        assert StubNeonWriter.calls == [("domain", "missing.com")]
+
+        hub.advance(61)
+        assert hub.find_company_by_domain("missing.com") is None
+        assert len(StubNeonWriter.calls) == 2
+
+    def test_miss_cleared_when_company_added(self, hub):
+        assert hub.find_company_by_ein("987654321") is None
+        assert hub.find_company_by_name("Gamma Systems") is None
+
+        hub.add_company(_record("C9", "Gamma Systems Inc", ein="987654321"))
+
+        assert hub.find_company_by_ein("987654321").company_unique_id == "C9"
+        assert hub.find_company_by_name("Gamma Systems").company_unique_id == "C9"
+
+    def test_name_miss_does_not_hide_other_spelling(self, hub):
+        # Neon holds "Acme Inc"; its name search returns it for both spellings
+        StubNeonWriter.name_rows = [{'company_unique_id': 'C7', 'company_name': 'Acme Inc'}]
+
+        assert hub.find_company_by_name("Acme, Inc.") is None
+        assert hub.find_company_by_name("Acme, Inc.") is None
+        assert hub.find_company_by_name("Acme Inc").company_unique_id == "C7"
+        assert StubNeonWriter.calls == [("name", "Acme, Inc."), ("name", "Acme Inc")]
+
+    def test_failed_query_is_not_cached_as_miss(self, hub):
+        StubNeonWriter.fail = True
+        assert hub.find_company_by_domain("acme.com") is None
+        assert hub.find_company_by_ein("123456789") is None
+        assert hub.find_company_by_name("Acme Inc") is None
+
+        # Neon is back: every key is queried again
+        StubNeonWriter.fail = False
+        StubNeonWriter.name_rows = [{'company_unique_id': 'C7', 'company_name': 'Acme Inc'}]
+        hub.find_company_by_domain("acme.com")
+        hub.find_company_by_ein("123456789")
+        assert hub.find_company_by_name("Acme Inc").company_unique_id == "C7"
+        assert len(StubNeonWriter.calls) == 6
+
+    def test_zero_ttl_disables_cache(self, hub):
+        hub.negative_cache_ttl = 0
+        hub.find_company_by_ein("111111111")
+        hub.find_company_by_ein("111111111")
+        assert len(StubNeonWriter.calls) == 2
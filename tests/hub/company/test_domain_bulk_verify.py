@@ -0,0 +1,221 @@
+"""
+Test Suite: hub/company/ - Bulk Async Domain Health Verification
+================================================================
+PRD Reference: PRD_COMPANY_HUB.md - Phase 2 Domain Resolution
+
+stream_domain_health / verify_domains_bulk against a stub async resolver:
+- A and MX queries for a domain are in flight together
+- Concurrency cap is respected and results stream in completion order
+- Same statuses as verify_domain_health (VALID, VALID_NO_MX, UNREACHABLE, TIMEOUT)
+- Phase2DomainResolution.run validates each unique domain once, in bulk
+"""
+
+import sys
+import time
+import types
+import uuid
+import asyncio
+import importlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+dns_resolver = pytest.importorskip("dns.resolver")
+pd = pytest.importorskip("pandas")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.caching import dns_cache as dns_cache_module
+from ops.caching.dns_cache import configure_dns_cache
+
+# Load the hub's middle package under a throwaway name (hyphenated directory);
+# middle/__init__ and phases/__init__ are skipped so only the needed modules load.
+PACKAGE = "company_target_bulk_verify_tests"
+MIDDLE_DIR = PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle"
+for name, path in ((PACKAGE, MIDDLE_DIR), (f"{PACKAGE}.phases", MIDDLE_DIR / "phases")):
+    sys.modules.setdefault(name, types.ModuleType(name)).__path__ = [str(path)]
+
+verification = importlib.import_module(f"{PACKAGE}.verification.verification")
+phase2 = importlib.import_module(f"{PACKAGE}.phases.phase2_domain_resolution")
+
+DomainHealthStatus = verification.DomainHealthStatus
+
+
+class Answer(list):
+    def __init__(self, rdata, ttl=300):
+        super().__init__(rdata)
+        self.rrset = SimpleNamespace(ttl=ttl)
+
+
+class StubAsyncResolver:
+    """
+    Async resolver over a zone {(name, rdtype): records}; per-name delays,
+    names in timeout raise Timeout, names absent from the zone raise NXDOMAIN.
+    """
+
+    def __init__(self, zone, delays=None, timeout=(), default_delay=0.02):
+        self.zone = zone
+        self.delays = delays or {}
+        self.timeout = set(timeout)
+        self.default_delay = default_delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def resolve(self, name, rdtype, lifetime=None):
+        self.calls.append((name, rdtype))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(name, self.default_delay))
+        finally:
+            self.in_flight -= 1
+        if name in self.timeout:
+            raise dns_resolver.Timeout()
+        if not any(key[0] == name for key in self.zone):
+            raise dns_resolver.NXDOMAIN()
+        if (name, rdtype) not in self.zone:
+            raise dns_resolver.NoAnswer()
+        records = self.zone[(name, rdtype)]
+        if rdtype == 'MX':
+            records = [SimpleNamespace(preference=p, exchange=f"{host}.") for p, host in records]
+        return Answer(records)
+
+
+def _zone(count):
+    zone = {}
+    for i in range(count):
+        zone[(f"company{i}.com", 'A')] = [f"192.0.2.{i % 250}"]
+        zone[(f"company{i}.com", 'MX')] = [(10, f"mx.company{i}.com")]
+    zone[('nomail.com', 'A')] = ['198.51.100.1']
+    return zone
+
+
+@pytest.fixture
+def resolver():
+    stub = StubAsyncResolver(_zone(50), timeout={'slow.com'})
+    previous = dns_cache_module._cache
+    configure_dns_cache(resolver=object(), async_resolver=stub)
+    yield stub
+    dns_cache_module._cache = previous
+
+
+class TestVerifyDomainHealthAsync:
+
+    def test_statuses_match_blocking_verifier(self, resolver):
+        domains = ['company1.com', 'nomail.com', 'gone.com', 'slow.com', 'not a domain']
+        results = {r.domain: r for r in verification.verify_domains_bulk(domains)}
+
+        assert results['company1.com'].status == DomainHealthStatus.VALID
+        assert results['company1.com'].mx_records == ['mx.company1.com']
+        assert results['nomail.com'].status == DomainHealthStatus.VALID_NO_MX
+        assert results['gone.com'].status == DomainHealthStatus.UNREACHABLE
+        assert results['slow.com'].status == DomainHealthStatus.TIMEOUT
+        assert results['not a domain'].status == DomainHealthStatus.INVALID
+
+    def test_a_and_mx_in_flight_together(self, resolver):
+        resolver.default_delay = 0.1
+        start = time.perf_counter()
+        health = asyncio.run(verification.verify_domain_health_async('company1.com'))
+
+        assert health.status == DomainHealthStatus.VALID
+        assert resolver.max_in_flight == 2
+        assert time.perf_counter() - start < 0.18
+
+
+class TestStreamDomainHealth:
+
+    def test_concurrency_cap(self, resolver):
+        domains = [f"company{i}.com" for i in range(50)]
+        results = verification.verify_domains_bulk(domains, concurrency=5)
+
+        assert len(results) == 50
+        assert resolver.max_in_flight == 10          # 5 domains x (A + MX)
+        assert len(resolver.calls) == 100
+
+    def test_results_stream_as_they_finish(self, resolver):
+        resolver.delays = {'company0.com': 0.3}
+        seen = []
+
+        verification.verify_domains_bulk(
+            ['company0.com', 'company1.com', 'company2.com'], concurrency=3,
+            on_result=lambda health: seen.append(health.domain)
+        )
+
+        assert seen[-1] == 'company0.com'
+
+    def test_closing_stream_cancels_in_flight(self, resolver):
+        resolver.delays = {'company1.com': 5.0}
+
+        async def first_result():
+            stream = verification.stream_domain_health(['company0.com', 'company1.com'], concurrency=2)
+            health = await stream.__anext__()
+            await stream.aclose()
+            return health
+
+        start = time.perf_counter()
+        assert asyncio.run(first_result()).domain == 'company0.com'
+        assert time.perf_counter() - start < 1.0
+
+    def test_batch_verify_domains_uses_async_verifier(self, resolver):
+        results = verification.batch_verify_domains(['company1.com', 'company2.com'], max_workers=1)
+        assert sorted(r.domain for r in results) == ['company1.com', 'company2.com']
+        assert resolver.max_in_flight == 2
+
+
+class RecordingLogger:
+    """
+    Accepts Phase 2's logger calls (log_event, log_domain_failed, debug, ...),
+    which predate logging_config.PipelineLogger's current API.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append(name)
+
+
+class TestPhase2BulkValidation:
+
+    @pytest.fixture
+    def phase(self, monkeypatch):
+        # Phase 2 also logs through log_phase_start/complete signatures and
+        # EventType members that logging_config no longer has; they only log
+        monkeypatch.setattr(phase2, "log_phase_start", lambda *args, **kwargs: None)
+        monkeypatch.setattr(phase2, "log_phase_complete", lambda *args, **kwargs: None)
+        monkeypatch.setattr(phase2, "EventType", SimpleNamespace(
+            DOMAIN_RESOLVED="domain_resolved",
+            DOMAIN_DNS_LOOKUP="domain_dns_lookup",
+            DOMAIN_PARKED="domain_parked",
+        ))
+        instance = phase2.Phase2DomainResolution(config={'dns_concurrency': 8}, logger=RecordingLogger())
+        return instance, str(uuid.uuid4())
+
+    def test_run_validates_each_unique_domain_once(self, resolver, phase):
+        instance, correlation_id = phase
+        matched_df = pd.DataFrame([
+            {'person_id': f"P{i:03d}", 'matched_company_id': '',
+             'company_domain': ['company1.com', 'https://www.company2.com/about', 'gone.com', 'nomail.com'][i % 4]}
+            for i in range(40)
+        ] + [{'person_id': 'P999', 'matched_company_id': '', 'company_domain': ''}])
+
+        result_df, stats = instance.run(matched_df, correlation_id)
+
+        assert sorted(resolver.calls) == sorted(
+            (domain, rdtype)
+            for domain in ('company1.com', 'company2.com', 'gone.com', 'nomail.com')
+            for rdtype in ('A', 'MX')
+        )
+        assert len(result_df) == 41
+        assert stats.valid_domains == 30        # VALID + VALID_NO_MX
+        assert stats.invalid_domains == 10
+        assert stats.missing_domains == 1
+        assert stats.queued_for_enrichment == 11
+
+    def test_validate_dns_disabled_skips_lookups(self, resolver):
+        instance = phase2.Phase2DomainResolution(config={'validate_dns': False}, logger=RecordingLogger())
+        assert instance.validate_domain_batch(['company1.com']) == {'company1.com': None}
+        assert resolver.calls == []
@@ -0,0 +1,98 @@
+"""
+Test Suite: hub/company/ - Batch Fuzzy Scoring Parity
+=====================================================
+PRD Reference: PRD_COMPANY_HUB.md - Section 3.1 Company Identity Matching
+
+The *_batch functions in matching/fuzzy.py must return exactly the scores
+of the scalar reference functions:
+- Bit-identical for every candidate at or above threshold
+- 0.0 for every candidate below threshold
+"""
+
+import random
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+fuzzy_spec = importlib.util.spec_from_file_location(
+    "company_target_fuzzy",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "matching" / "fuzzy.py"
+)
+fuzzy = importlib.util.module_from_spec(fuzzy_spec)
+fuzzy_spec.loader.exec_module(fuzzy)
+
+
+PAIRS = [
+    (fuzzy.jaro_batch, fuzzy.jaro_similarity),
+    (fuzzy.jaro_winkler_batch, fuzzy.jaro_winkler_similarity),
+    (fuzzy.levenshtein_similarity_batch, fuzzy.levenshtein_similarity),
+    (fuzzy.token_sort_ratio_batch, fuzzy.token_sort_ratio),
+    (fuzzy.token_set_ratio_batch, fuzzy.token_set_ratio),
+]
+
+
+def _random_strings(rng, count, alphabet="abcde fgAé", max_len=14):
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+            for _ in range(count)]
+
+
+class TestBatchParity:
+    """Batch engine vs scalar reference implementation."""
+
+    @pytest.mark.parametrize("batch_fn,scalar_fn", PAIRS)
+    @pytest.mark.parametrize("threshold", [0.0, 0.7, 0.9])
+    def test_scores_match_reference(self, batch_fn, scalar_fn, threshold):
+        rng = random.Random(3)
+        for _ in range(40):
+            query = _random_strings(rng, 1)[0]
+            candidates = _random_strings(rng, 40)
+
+            scores = batch_fn(query, candidates, threshold)
+
+            for candidate, score in zip(candidates, scores):
+                expected = scalar_fn(query, candidate)
+                if expected < threshold:
+                    expected = 0.0
+                assert score == expected, (query, candidate)
+
+    def test_levenshtein_distance_matches_reference(self):
+        rng = random.Random(5)
+        for _ in range(40):
+            query = _random_strings(rng, 1)[0]
+            candidates = _random_strings(rng, 40)
+
+            distances = fuzzy.levenshtein_distance_batch(query, candidates)
+
+            assert list(distances) == [fuzzy.levenshtein_distance(query, c) for c in candidates]
+
+    def test_company_names(self):
+        names = ["acme corporation", "acme corp", "Acme Corporation", "beta industries",
+                 "acme", "", "the acme group", "amce corporation"]
+        for query in names:
+            scores = fuzzy.jaro_winkler_batch(query, names)
+            assert list(scores) == [fuzzy.jaro_winkler_similarity(query, n) for n in names]
+
+
+class TestMatchFunctions:
+    """find_best_match / find_all_matches keep their scalar semantics."""
+
+    @pytest.mark.parametrize("method", ["jaro_winkler", "levenshtein", "token_sort", "token_set"])
+    def test_find_all_matches(self, method):
+        rng = random.Random(9)
+        candidates = _random_strings(rng, 200, alphabet="abcd ")
+        for query in _random_strings(rng, 20, alphabet="abcd "):
+            expected = [(c, fuzzy.fuzzy_match_score(query, c, method)) for c in candidates]
+            expected = [m for m in expected if m[1] >= 0.8]
+            expected.sort(key=lambda x: x[1], reverse=True)
+
+            assert fuzzy.find_all_matches(query, candidates, 0.8, method, limit=10) == expected[:10]
+
+    def test_find_best_match_first_of_ties(self):
+        candidates = ["acme corp", "beta", "acme corp"]
+        assert fuzzy.find_best_match("acme corp", candidates) == ("acme corp", 1.0)
+        assert fuzzy.find_best_match("zzz", candidates) is None
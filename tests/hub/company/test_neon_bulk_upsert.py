@@ -0,0 +1,124 @@
+"""
+Test Suite: hub/company/ - Neon Writer Bulk Upsert
+==================================================
+PRD Reference: PRD_COMPANY_HUB.md
+
+CompanyNeonWriter batch writers send one multi-row statement per page:
+- Pages honour page_size and never repeat a conflict key
+- A failing page is replayed row by row; only bad rows are failed
+- The bulk statement shares the single-row ON CONFLICT clause
+"""
+
+import sys
+import uuid
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+writer_spec = importlib.util.spec_from_file_location(
+    "company_target_neon_writer",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "output" / "neon_writer.py"
+)
+neon_writer = importlib.util.module_from_spec(writer_spec)
+writer_spec.loader.exec_module(neon_writer)
+
+
+class FakeConnection:
+    """Stands in for a psycopg2 connection; rows containing BAD fail."""
+
+    encoding = "UTF8"
+    closed = False
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def mogrify(self, template, args):
+        return repr(sorted(args.items(), key=str)).encode()
+
+    def execute(self, sql, params=None):
+        text = sql.decode() if isinstance(sql, bytes) else sql
+        if "BAD" in text or (params and "BAD" in repr(params)):
+            raise ValueError("invalid row")
+        self.connection.statements.append(text)
+
+
+@pytest.fixture
+def writer():
+    instance = neon_writer.CompanyNeonWriter(neon_writer.NeonConfig(), page_size=4)
+    instance._connection = FakeConnection()
+    return instance
+
+
+def _companies(count, bad=()):
+    return [{'company_unique_id': f"BAD{i}" if i in bad else f"C{i}", 'company_name': f"Company {i}"}
+            for i in range(count)]
+
+
+class TestBulkUpsert:
+
+    def test_one_statement_per_page(self, writer):
+        result = writer.write_companies_batch(_companies(10), str(uuid.uuid4()))
+
+        inserts = [s for s in writer._connection.statements if "INSERT" in s]
+        assert len(inserts) == 3  # 4 + 4 + 2
+        assert result.success
+        assert result.records_written == 10
+        assert result.records_failed == 0
+
+    def test_failing_rows_are_isolated(self, writer):
+        result = writer.write_companies_batch(_companies(10, bad={1, 6}), str(uuid.uuid4()))
+
+        assert not result.success
+        assert result.records_written == 8
+        assert result.records_failed == 2
+        assert len(result.errors) == 2
+        assert "BAD1" in result.errors[0]
+        assert writer._connection.commits == 1
+
+    def test_page_size_override(self, writer):
+        writer.write_slots_batch(
+            [{'company_unique_id': f"C{i}", 'slot_type': 'CEO'} for i in range(6)],
+            str(uuid.uuid4()), page_size=6
+        )
+        inserts = [s for s in writer._connection.statements if "INSERT" in s]
+        assert len(inserts) == 1
+
+    def test_repeated_conflict_key_starts_new_page(self):
+        rows = [{'person_unique_id': key} for key in ["a", "b", "a", "c"]]
+        pages = list(neon_writer._pages(rows, ('person_unique_id',), 10))
+        assert [[r['person_unique_id'] for r in page] for page in pages] == [["a", "b"], ["a", "c"]]
+
+    def test_bulk_statement_keeps_conflict_clause(self):
+        sql = neon_writer.CompanyNeonWriter.UPSERT_PERSON_SQL
+        bulk_sql, template = neon_writer._values_statement(sql)
+        assert "VALUES %s" in bulk_sql
+        assert bulk_sql.split("ON CONFLICT")[1] == sql.split("ON CONFLICT")[1]
+        assert template.split()[:2] == ["(", "%(person_unique_id)s,"]
@@ -12,12 +12,63 @@ Tests all 4 phases of the Company Identity Pipeline:
 - BIT Engine: Signal Aggregation
 """
 
+import sys
+import types
+import dataclasses
+import importlib
+import importlib.util
+from pathlib import Path
+
 import pytest
 import pandas as pd
 from datetime import datetime
 from unittest.mock import Mock, patch
 import uuid
 
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+MIDDLE_DIR = PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle"
+
+
+def _load_phase1_module():
+    """
+    Load phase1_company_matching by path (hyphenated directory).
+
+    Its ..utils.logging / ..utils.config imports point at modules that are not
+    in the tree, and its fuzzy-tier names (MatchTier, apply_city_guardrail,
+    create_arbitrator, ...) lost their imports; both are supplied here from
+    no-op stubs and the hub's matching package.
+    """
+    package = "company_target_phase1_tests"
+    if f"{package}.phases.phase1_company_matching" in sys.modules:
+        return sys.modules[f"{package}.phases.phase1_company_matching"]
+    sys.path.insert(0, str(PROJECT_ROOT))
+    for name, path in ((package, MIDDLE_DIR), (f"{package}.phases", MIDDLE_DIR / "phases")):
+        sys.modules.setdefault(name, types.ModuleType(name)).__path__ = [str(path)]
+
+    class StubPipelineLogger:
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+    utils = types.ModuleType(f"{package}.utils")
+    utils.__path__ = []
+    logging_stub = types.ModuleType(f"{package}.utils.logging")
+    logging_stub.PipelineLogger = StubPipelineLogger
+    logging_stub.EventType = None
+    logging_stub.log_phase_start = logging_stub.log_phase_complete = lambda *args, **kwargs: None
+    config_stub = types.ModuleType(f"{package}.utils.config")
+    config_stub.MatchingConfig = dict
+    sys.modules.update({m.__name__: m for m in (utils, logging_stub, config_stub)})
+
+    name = f"{package}.phases.phase1_company_matching"
+    spec = importlib.util.spec_from_file_location(name, MIDDLE_DIR / "phases" / "phase1_company_matching.py")
+    module = importlib.util.module_from_spec(spec)
+    for source in ("fuzzy", "fuzzy_arbitration"):
+        matching = importlib.import_module(f"{package}.matching.{source}")
+        module.__dict__.update({k: v for k, v in vars(matching).items() if not k.startswith("_")})
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
 
 # ============================================================================
 # PHASE 1: Company Matching Tests
@@ -132,6 +183,45 @@ class TestPhase1CompanyMatching:
         matched = result_df[result_df['matched_company_id'].notna()]
         assert len(matched) == 0, "Empty company name should not match"
 
+    def test_parallel_run_matches_serial(self):
+        """
+        workers=N must produce the same output frame and stats as the serial run
+        (timing and normalization cache counters excepted).
+        """
+        phase1 = _load_phase1_module()
+        instance = phase1.Phase1CompanyMatching(config={'chunk_size': 3})
+        names = [
+            ('Acme Corp', 'acme.com', 'Charleston'), ('Beta Industries Inc', None, 'Columbia'),
+            ('Beta Industrie', None, 'Columbia'), ('Gamma Systems', None, 'Raleigh'),
+            ('Acme', None, 'Charleston'), ('Delta Partners LLC', None, 'Durham'),
+        ]
+        people_df = pd.DataFrame([
+            {'person_id': f"P{i:03d}", 'first_name': 'Jane', 'last_name': 'Doe',
+             'company_name': name, 'company_domain': domain, 'city': city, 'state': 'SC'}
+            for i, (name, domain, city) in enumerate(names * 4)
+        ])
+        company_df = pd.DataFrame([
+            {'company_unique_id': 'C001', 'company_name': 'Acme Corporation',
+             'website_url': 'acme.com', 'address_city': 'Charleston', 'address_state': 'SC'},
+            {'company_unique_id': 'C002', 'company_name': 'Beta Industries Inc',
+             'website_url': 'beta.io', 'address_city': 'Columbia', 'address_state': 'SC'},
+            {'company_unique_id': 'C003', 'company_name': 'Gamma Systems',
+             'website_url': None, 'address_city': 'Raleigh', 'address_state': 'NC'},
+        ])
+        correlation_id = str(uuid.uuid4())
+
+        serial_df, serial_stats = instance.run(people_df, company_df, correlation_id)
+        parallel_df, parallel_stats = instance.run(people_df, company_df, correlation_id, workers=2)
+
+        pd.testing.assert_frame_equal(serial_df, parallel_df)
+        unstable = ('duration_seconds', 'normalization_cache_hits', 'normalization_cache_misses')
+        serial, parallel = dataclasses.asdict(serial_stats), dataclasses.asdict(parallel_stats)
+        for field_name in unstable:
+            serial.pop(field_name)
+            parallel.pop(field_name)
+        assert serial == parallel
+        assert serial['total_input'] == len(people_df)
+
 
 class TestPhase1bUnmatchedHold:
     """
@@ -0,0 +1,202 @@
+"""
+Test Suite: hub/company/ - SMTP Probe Engine
+============================================
+PRD Reference: PRD_COMPANY_HUB.md - Phase 4 Pattern Verification
+
+SMTPProbeEngine against a local stub SMTP server:
+- Same statuses as the single-address check (deliverable, undeliverable,
+  greylisted, catch-all)
+- Addresses on one MX host share sessions (one HELO / MAIL FROM each)
+- Catch-all is probed once per domain and cached
+- Concurrent sessions per MX host stay under the cap
+- batch_verify_emails routes SMTP checks through the engine
+- A dropped session still yields a result for every address
+"""
+
+import sys
+import types
+import smtplib
+import importlib
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("dns.resolver")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from smtp_stub import StubSMTPServer
+
+PACKAGE = "company_target_smtp_probe_tests"
+MIDDLE_DIR = PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [str(MIDDLE_DIR)]
+
+verification = importlib.import_module(f"{PACKAGE}.verification.verification")
+smtp_probe = importlib.import_module(f"{PACKAGE}.verification.smtp_probe")
+
+SMTPStatus = verification.SMTPStatus
+SMTPProbeEngine = smtp_probe.SMTPProbeEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    with StubSMTPServer(
+        mailboxes={f"user{i}@acme.com" for i in range(100)} | {"jane@globex.com"},
+        catch_all_domains={"catchall.com"},
+        greylist={"slow@acme.com"},
+    ) as stub:
+        yield stub
+
+
+class DroppingSMTP:
+    """Accepts a@example.com, then drops the session on the catch-all probe."""
+
+    def __init__(self, timeout=None):
+        pass
+
+    def connect(self, host, port):
+        return 220, b"ready"
+
+    def helo(self, name):
+        return 250, b"ok"
+
+    def mail(self, sender):
+        return 250, b"ok"
+
+    def rcpt(self, address):
+        if address == "a@example.com":
+            return 250, b"OK"
+        raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    def quit(self):
+        raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+
+    def close(self):
+        pass
+
+
+def _engine(server, **options):
+    return SMTPProbeEngine(port=server.port, mx_lookup=lambda domain: [server.host], timeout=5, **options)
+
+
+class TestStatuses:
+
+    def test_statuses_match_single_address_check(self, server):
+        engine = _engine(server)
+        results = engine.probe_many([
+            "user1@acme.com", "nobody@acme.com", "slow@acme.com", "anyone@catchall.com"
+        ])
+
+        assert results["user1@acme.com"].status == SMTPStatus.DELIVERABLE
+        assert results["nobody@acme.com"].status == SMTPStatus.UNDELIVERABLE
+        assert results["slow@acme.com"].status == SMTPStatus.GREYLISTED
+        assert results["anyone@catchall.com"].status == SMTPStatus.CATCH_ALL
+
+    def test_no_mx_and_refused_connection(self, server):
+        engine = SMTPProbeEngine(port=server.port, mx_lookup=lambda domain: [], timeout=5)
+        assert engine.probe("a@nomx.com").status == SMTPStatus.ERROR
+
+        server_port = server.port
+        server.shutdown()
+        server.server_close()
+        closed = SMTPProbeEngine(port=server_port, mx_lookup=lambda domain: ["127.0.0.1"], timeout=5)
+        assert closed.probe("a@acme.com").status == SMTPStatus.BLOCKED
+        assert closed.stats()['connect_failures'] == 1
+
+
+    def test_disconnect_during_pending_catch_all_probe(self):
+        engine = SMTPProbeEngine(mx_lookup=lambda domain: ["mx.example.com"], smtp_factory=DroppingSMTP)
+        # Another session is testing example.com, so the accepted address is deferred
+        engine._catch_all_probing.add("example.com")
+
+        results = engine.probe_many(["a@example.com"])
+
+        assert results["a@example.com"].status == SMTPStatus.ERROR
+        assert engine.probe("a@example.com").status == SMTPStatus.ERROR
+
+
+class TestSessionReuse:
+
+    def test_one_session_per_chunk_per_mx(self, server):
+        engine = _engine(server, max_rcpt_per_session=50)
+        emails = [f"user{i}@acme.com" for i in range(100)]
+        results = engine.probe_many(emails)
+
+        assert all(r.status == SMTPStatus.DELIVERABLE for r in results.values())
+        assert server.sessions == 2
+        assert server.mail_from == 2
+        # 100 real probes + 1 catch-all probe for acme.com
+        assert len(server.rcpts) == 101
+
+    def test_catch_all_cached_per_domain(self, server):
+        clock = FakeClock()
+        engine = _engine(server, catch_all_ttl=60, clock=clock)
+        engine.probe_many(["user1@acme.com", "user2@acme.com"])
+        engine.probe_many(["user3@acme.com"])
+        assert engine.stats()['catch_all_probes'] == 1
+
+        clock.now = 61
+        engine.probe_many(["user4@acme.com"])
+        assert engine.stats()['catch_all_probes'] == 2
+
+    def test_check_catch_all_shares_cache(self, server):
+        engine = _engine(server)
+        assert engine.check_catch_all("catchall.com") is True
+        assert engine.check_catch_all("acme.com") is False
+        sessions = server.sessions
+        assert engine.probe("anyone@catchall.com").status == SMTPStatus.CATCH_ALL
+        assert engine.stats()['catch_all_probes'] == 2
+        assert server.sessions == sessions + 1
+
+
+class TestConcurrency:
+
+    def test_sessions_per_mx_capped(self, server):
+        server.latency = 0.002
+        engine = _engine(server, max_sessions_per_mx=2, max_rcpt_per_session=5, max_workers=16)
+        emails = [f"user{i}@acme.com" for i in range(60)] + ["jane@globex.com"]
+        results = engine.probe_many(emails)
+
+        assert len(results) == 61
+        assert server.max_active == 2
+        assert server.sessions == 13        # 60 / 5 acme chunks + 1 globex
+
+
+class TestVerificationIntegration:
+
+    @pytest.fixture
+    def configured(self, server, monkeypatch):
+        previous = smtp_probe._engine
+        smtp_probe.configure_smtp_probe_engine(port=server.port, mx_lookup=lambda d: [server.host], timeout=5)
+
+        def dns_check(email):
+            result = verification.EmailVerificationResult(email=email, status=verification.VerificationStatus.UNKNOWN)
+            result.mx_host = server.host
+            return result, email.lower()
+
+        monkeypatch.setattr(verification, "_verify_email_dns", dns_check)
+        yield server
+        smtp_probe._engine = previous
+
+    def test_batch_verify_emails_shares_sessions(self, configured):
+        emails = [f"user{i}@acme.com" for i in range(20)] + ["ghost@acme.com"]
+        results = {r.email: r for r in verification.batch_verify_emails(emails)}
+
+        assert results["user3@acme.com"].status == verification.VerificationStatus.VALID
+        assert results["ghost@acme.com"].status == verification.VerificationStatus.INVALID
+        assert configured.sessions == 1
+
+    def test_single_check_uses_engine(self, configured):
+        assert verification._smtp_check("user1@acme.com", configured.host)[0] == SMTPStatus.DELIVERABLE
+        assert verification.check_catch_all("acme.com", configured.host) is False
+        assert smtp_probe.get_smtp_probe_engine().stats()['catch_all_probes'] == 1
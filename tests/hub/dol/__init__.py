@@ -0,0 +1 @@
+# DOL Filings Hub Tests
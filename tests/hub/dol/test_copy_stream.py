@@ -0,0 +1,238 @@
+"""
+Test Suite: hub/dol/ - Streaming COPY Loader
+============================================
+copy_stream.CopyRowStream and the DOL year importer built on it:
+- The stream yields exactly the CSV the old StringIO buffer held, for
+  any read size, while holding at most one chunk of formatted rows
+- project_csv pads short rows and appends per-year constants
+- passthrough_csv keeps each record as written (quoted "" stays the empty
+  string under NULL ''), pads short records, rejects extra columns
+- load_csv_to_table projects matched columns, aliases and form_year
+  into COPY without materialising the file
+- load_tables with workers > 1 loads each table on its own connection
+"""
+
+import csv
+import sys
+import multiprocessing
+import importlib.util
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+IMPORTERS = PROJECT_ROOT / "hubs" / "dol-filings" / "imo" / "middle" / "importers"
+sys.path.insert(0, str(IMPORTERS))
+
+import copy_stream
+
+dol_year_spec = importlib.util.spec_from_file_location("dol_import_dol_year", IMPORTERS / "import_dol_year.py")
+import_dol_year = importlib.util.module_from_spec(dol_year_spec)
+sys.modules["dol_import_dol_year"] = import_dol_year
+dol_year_spec.loader.exec_module(import_dol_year)
+
+schedules_spec = importlib.util.spec_from_file_location(
+    "dol_import_schedules_cdhgi", IMPORTERS / "import_schedules_cdhgi.py"
+)
+import_schedules_cdhgi = importlib.util.module_from_spec(schedules_spec)
+sys.modules["dol_import_schedules_cdhgi"] = import_schedules_cdhgi
+schedules_spec.loader.exec_module(import_schedules_cdhgi)
+
+
+def _rows(n):
+    return [[f"ACK{i}", f'Plan "{i}", Inc', "" if i % 3 else None, str(i * 1.5)] for i in range(n)]
+
+
+def _as_csv(rows):
+    buffer = StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+class TestCopyRowStream:
+
+    @pytest.mark.parametrize("size", [1, 7, 8192, -1])
+    def test_matches_buffered_csv(self, size):
+        rows = _rows(1234)
+        stream = copy_stream.CopyRowStream(iter(rows), chunk_rows=100)
+        parts = []
+        while True:
+            data = stream.read(size)
+            if not data:
+                break
+            parts.append(data)
+        assert "".join(parts) == _as_csv(rows)
+        assert stream.rows_sent == 1234
+
+    def test_memory_bounded_by_chunk(self):
+        consumed = []
+
+        def rows():
+            for i, row in enumerate(_rows(10_000)):
+                consumed.append(i)
+                yield row
+
+        stream = copy_stream.CopyRowStream(rows(), chunk_rows=50)
+        first = stream.read(64)
+        assert first == _as_csv(_rows(50))[:64]
+        assert len(consumed) == 50                 # nothing parsed past the first chunk
+        assert len(stream._pending) < 50 * 40
+
+    def test_readline(self):
+        stream = copy_stream.CopyRowStream(iter(_rows(3)), chunk_rows=2)
+        lines = [stream.readline() for _ in range(4)]
+        assert "".join(lines) == _as_csv(_rows(3))
+        assert lines[-1] == ""
+
+
+def test_project_csv_pads_and_appends(tmp_path):
+    path = tmp_path / "f.csv"
+    path.write_text("ACK_ID,NAME,EIN\nA1,Acme,12\nA2\n")
+    assert list(copy_stream.project_csv(path, [2, 0], width=3, constants=["2024"])) == [
+        ("12", "A1", "2024"),
+        ("", "A2", "2024"),
+    ]
+    assert list(copy_stream.project_csv(path, [1], width=3)) == [("Acme",), ("",)]
+
+
+class TestPassthroughCsv:
+
+    def test_records_pass_through_unchanged(self, tmp_path):
+        path = tmp_path / "sch_c.csv"
+        path.write_bytes(b'ACK_ID,NAME,AMT\r\nA1,"",\r\nA2,"Line one\r\nline two",5\r\nA3\r\n\r\nA4,x,1')
+        assert list(copy_stream.passthrough_csv(path, width=3)) == [
+            'A1,"",\n',
+            'A2,"Line one\r\nline two",5\n',
+            'A3,,\n',
+            ',,\n',
+            'A4,x,1\n',
+        ]
+
+    def test_extra_columns_rejected(self, tmp_path):
+        path = tmp_path / "sch_c.csv"
+        path.write_text("ACK_ID,NAME\nA1,Acme\nA2,Acme,overflow\n")
+        records = copy_stream.passthrough_csv(path, width=2)
+        assert next(records) == "A1,Acme\n"
+        with pytest.raises(ValueError, match="record 3 has 3 fields, expected 2"):
+            next(records)
+
+    def test_copy_records_chunks(self):
+        records = [f"A{i},\"\"\n" for i in range(25)]
+        stream = copy_stream.CopyRecordStream(iter(records), chunk_rows=10)
+        assert stream.read() == "".join(records)
+        assert stream.rows_sent == 25
+
+
+class FakeCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        if "information_schema.columns" in sql:
+            self._rows = [(c,) for c in self.connection.table_columns]
+        elif "SELECT COUNT(*)" in sql:
+            self._rows = [(self.connection.copied_rows,)]
+        else:
+            self.connection.statements.append(sql)
+            self.rowcount = 0
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0]
+
+    def copy_expert(self, sql, file, size=8192):
+        reads = []
+        while True:
+            data = file.read(size)
+            if not data:
+                break
+            reads.append(data)
+        self.connection.copies.append((sql, "".join(reads), size))
+        self.connection.copied_rows += len(list(csv.reader(StringIO("".join(reads)))))
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    table_columns = ["id", "ack_id", "spons_dfe_ein", "sponsor_dfe_ein", "plan_name", "form_year", "created_at"]
+
+    def __init__(self):
+        self.statements = []
+        self.copies = []
+        self.copied_rows = 0
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def form_5500_csv(tmp_path):
+    path = tmp_path / "f_5500_2024_latest.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ACK_ID", "UNKNOWN_COL", "SPONS_DFE_EIN", "PLAN_NAME"])
+        for i in range(500):
+            writer.writerow([f"A{i}", "x", f"{i:09d}", f"Plan {i}, LLC"])
+        writer.writerow(["SHORT"])
+    return path
+
+
+def test_load_csv_streams_projection(form_5500_csv):
+    conn = FakeConnection()
+    count = import_dol_year.load_csv_to_table(conn, "form_5500", form_5500_csv, "2024")
+
+    (sql, body, size), = conn.copies
+    assert "COPY dol.form_5500 (ack_id, spons_dfe_ein, plan_name, sponsor_dfe_ein, form_year)" in sql
+    assert size == copy_stream.COPY_READ_SIZE
+    rows = list(csv.reader(StringIO(body)))
+    assert rows[0] == ["A0", "000000000", "Plan 0, LLC", "000000000", "2024"]
+    assert rows[-1] == ["SHORT", "", "", "", "2024"]
+    assert count == 501
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="workers inherit the patched get_connection only when forked")
+def test_load_tables_parallel_uses_own_connections(form_5500_csv, monkeypatch):
+    opened = FakeConnection()
+    monkeypatch.setattr(import_dol_year, "get_connection", lambda: FakeConnection())
+
+    jobs = [("form_5500", form_5500_csv), ("schedule_a", form_5500_csv)]
+    manifest = import_dol_year.load_tables(opened, jobs, "2024", workers=2)
+
+    assert list(manifest) == ["form_5500", "schedule_a"]
+    assert all(entry["status"] == "OK" and entry["rows"] == 501 for entry in manifest.values())
+    assert opened.copies == []                     # parent connection untouched
+
+
+def test_schedules_load_keeps_empty_strings(tmp_path):
+    path = tmp_path / "F_SCH_C_2023_latest.csv"
+    path.write_text('ACK_ID,PROVIDER_NAME,PROVIDER_DIRECT_COMP_AMT\nA1,"",\nA2,Acme,12\n')
+    conn = FakeConnection()
+    import_schedules_cdhgi.load_csv_to_table(conn, "schedule_c", path)
+
+    (sql, body, _), = conn.copies
+    assert "COPY dol.schedule_c (ack_id, provider_name, provider_direct_comp_amt)" in sql
+    assert body == 'A1,"",\nA2,Acme,12\n'
+
+
+def test_schedules_load_rejects_extra_columns(tmp_path):
+    path = tmp_path / "F_SCH_C_2023_latest.csv"
+    path.write_text("ACK_ID,PROVIDER_NAME\nA1,Acme,12\n")
+    with pytest.raises(ValueError):
+        import_schedules_cdhgi.load_csv_to_table(FakeConnection(), "schedule_c", path)
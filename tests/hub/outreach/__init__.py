@@ -0,0 +1 @@
+# Outreach Execution Hub Tests
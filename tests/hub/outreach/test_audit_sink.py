@@ -0,0 +1,309 @@
+"""
+Test Suite: hub/outreach/ - Buffered Send Attempt Audit Sink
+============================================================
+Doctrine: CL Parent-Child v1.1 - Send attempt audit (append-only)
+
+SendAttemptAuditSink against a recording connection (no database):
+- append() is on disk before it returns; the INSERT happens later
+- Flushes by size or interval, one multi-row INSERT and one commit each
+- A failed flush keeps the rows (memory and disk) for the next flush
+- Segments left by a crashed process are replayed idempotently on start;
+  segments still locked by a live sink are left alone
+- Rows the database rejects are bisected out to a dead-letter file
+- append() blocks once max_pending records wait for a commit
+- MarketingSafetyGate routes audit records to the sink, and
+  flush_audit_buffer sends the whole buffer in one INSERT without
+  duplicating records on failure
+"""
+
+import json
+import threading
+import time
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+MIDDLE = PROJECT_ROOT / "hubs" / "outreach-execution" / "imo" / "middle"
+
+
+def _load(name, filename):
+    spec = importlib.util.spec_from_file_location(name, MIDDLE / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+audit_sink = _load("outreach_execution_audit_sink", "audit_sink.py")
+safety_gate = _load("outreach_execution_marketing_safety_gate_audit", "marketing_safety_gate.py")
+
+SendAttemptAuditSink = audit_sink.SendAttemptAuditSink
+SendAttemptAuditRecord = safety_gate.SendAttemptAuditRecord
+
+
+class RecordingCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        conn = self.connection
+        if conn.fail_next:
+            conn.fail_next -= 1
+            raise RuntimeError("connection reset")
+        conn.inserts.append((" ".join(sql.split()), params))
+
+
+class RecordingConnection:
+
+    def __init__(self):
+        self.inserts = []
+        self.batches = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_next = 0
+        self.poison = set()
+
+    def cursor(self):
+        return RecordingCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    @property
+    def audit_ids(self):
+        return [row[0] for batch in self.batches for row in batch]
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    connection = RecordingConnection()
+
+    def execute_values(cursor, sql, rows, page_size):
+        cursor.execute(sql, None)
+        assert page_size >= len(rows)
+        if connection.poison & {row[0] for row in rows}:
+            raise psycopg2.IntegrityError("violates check constraint")
+        connection.batches.append([list(r) for r in rows])
+
+    monkeypatch.setattr(audit_sink, "execute_values", execute_values)
+    return connection
+
+
+def _record(i, status="allowed"):
+    return SendAttemptAuditRecord(
+        company_unique_id=f"C{i:05d}",
+        campaign_id="camp-1",
+        effective_tier=2,
+        computed_tier=2,
+        override_snapshot={'tier_cap': None},
+        status=status,
+    )
+
+
+def _wal_rows(wal_dir):
+    return [json.loads(line) for seg in sorted(wal_dir.glob("*.wal")) for line in seg.read_text().splitlines()]
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+class TestDurability:
+
+    def test_append_is_on_disk_before_insert(self, conn, tmp_path):
+        sink = SendAttemptAuditSink(lambda: conn, tmp_path, batch_size=100, flush_interval=60).start()
+        record = _record(1)
+        sink.append(record)
+
+        rows = _wal_rows(tmp_path)
+        assert [r[0] for r in rows] == [record.audit_id]
+        assert dict(zip(audit_sink.AUDIT_COLUMNS, rows[0]))['override_snapshot'] == '{"tier_cap": null}'
+        assert conn.batches == []
+        assert sink.pending == 1
+
+        sink.close()
+        assert conn.audit_ids == [record.audit_id]
+        assert list(tmp_path.glob("*.wal")) == []
+
+    def test_crashed_segments_are_replayed_on_start(self, conn, tmp_path):
+        crashed = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        records = [_record(i) for i in range(3)]
+        for record in records:
+            crashed.append(record)
+        # Process dies: no close(), and the last append was torn mid-line
+        segment, = tmp_path.glob("*.wal")
+        with open(segment, "a") as f:
+            f.write('["half-written"')
+        crashed._segment.release()          # the dead process's lock goes with it
+
+        sink = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        assert sink.stats['replayed'] == 3
+        _wait_for(lambda: conn.batches)
+        sink.close()
+
+        assert conn.audit_ids == [r.audit_id for r in records]
+        assert "ON CONFLICT (audit_id) DO NOTHING" in conn.inserts[0][0]
+        assert list(tmp_path.glob("*.wal")) == []
+
+
+    def test_live_sink_segments_are_not_recovered(self, conn, tmp_path):
+        live = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        record = _record(1)
+        live.append(record)
+
+        other = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        assert other.stats['replayed'] == 0
+        other.close()
+
+        assert len(_wal_rows(tmp_path)) == 1
+        live.close()
+        assert conn.audit_ids == [record.audit_id]
+
+
+class TestBatching:
+
+    def test_size_triggers_one_insert_per_batch(self, conn, tmp_path):
+        with SendAttemptAuditSink(lambda: conn, tmp_path, batch_size=50, flush_interval=60) as sink:
+            for i in range(50):
+                sink.append(_record(i))
+            _wait_for(lambda: conn.batches)
+            assert len(conn.batches) == 1 and len(conn.batches[0]) == 50
+            assert conn.commits == 1
+
+    def test_interval_flushes_partial_batch(self, conn, tmp_path):
+        with SendAttemptAuditSink(lambda: conn, tmp_path, batch_size=1000, flush_interval=0.05) as sink:
+            for i in range(7):
+                sink.append(_record(i))
+            _wait_for(lambda: conn.batches)
+        assert [len(b) for b in conn.batches] == [7]
+
+    def test_failed_flush_is_retried_without_loss(self, conn, tmp_path):
+        sink = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        records = [_record(i) for i in range(5)]
+        for record in records[:3]:
+            sink.append(record)
+
+        conn.fail_next = 1
+        assert sink.flush() == 0
+        assert sink.stats['failed_flushes'] == 1
+        assert sink.pending == 3
+        assert len(_wal_rows(tmp_path)) == 3
+
+        for record in records[3:]:
+            sink.append(record)
+        assert sink.flush() == 5
+        sink.close()
+
+        assert conn.audit_ids == [r.audit_id for r in records]
+        assert sink.pending == 0
+
+
+    def test_poison_row_is_dead_lettered(self, conn, tmp_path):
+        sink = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        records = [_record(i) for i in range(9)]
+        conn.poison = {records[4].audit_id}
+        for record in records:
+            sink.append(record)
+
+        assert sink.flush() == 8
+        assert sorted(conn.audit_ids) == sorted(r.audit_id for r in records if r is not records[4])
+        assert sink.pending == 0
+        assert sink.stats['dead_lettered'] == 1
+
+        dead = [json.loads(line) for line in (tmp_path / audit_sink.DEAD_LETTER_FILE).read_text().splitlines()]
+        assert [d['row'][0] for d in dead] == [records[4].audit_id]
+        assert "constraint" in dead[0]['error']
+
+        # Later writes are not blocked by the bad row
+        later = _record(99)
+        sink.append(later)
+        assert sink.flush() == 1
+        sink.close()
+        assert later.audit_id in conn.audit_ids
+
+    def test_outage_during_isolation_keeps_segment(self, conn, tmp_path):
+        sink = SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60).start()
+        records = [_record(i) for i in range(4)]
+        conn.poison = {records[0].audit_id}
+        for record in records:
+            sink.append(record)
+
+        conn.fail_next = 2                  # connection drops while bisecting
+        sink.flush()
+        conn.fail_next = 0
+        assert sink.pending == 4
+        assert sink.stats['dead_lettered'] == 0
+
+        assert sink.flush() == 3
+        sink.close()
+
+    def test_append_blocks_at_max_pending(self, conn, tmp_path):
+        sink = SendAttemptAuditSink(lambda: conn, tmp_path, batch_size=1000,
+                                    flush_interval=0.01, max_pending=3).start()
+        conn.fail_next = 10 ** 6            # database down: nothing drains
+        appender = threading.Thread(target=lambda: [sink.append(_record(i)) for i in range(5)])
+        appender.start()
+
+        _wait_for(lambda: sink.stats['backpressure_waits'] == 1)
+        assert appender.is_alive()
+        assert sink.pending == 3
+
+        conn.fail_next = 0
+        appender.join(2)
+        assert not appender.is_alive()
+        sink.close()
+        assert len(conn.audit_ids) == 5
+
+
+class TestSafetyGateIntegration:
+
+    def test_gate_writes_through_sink_not_its_connection(self, conn, tmp_path):
+        gate_conn = RecordingConnection()
+        with SendAttemptAuditSink(lambda: conn, tmp_path, flush_interval=60) as sink:
+            gate = safety_gate.MarketingSafetyGate(gate_conn, audit_sink=sink)
+            gate.record_send_result('C00001', 'camp-1', success=True)
+            gate.record_send_result('C00002', 'camp-1', success=False, error_message="bounce")
+            assert sink.pending == 2
+
+        assert gate_conn.inserts == [] and gate_conn.commits == 0
+        statuses = [dict(zip(audit_sink.AUDIT_COLUMNS, row))['status'] for row in conn.batches[0]]
+        assert statuses == ['sent', 'send_failed']
+
+    def test_flush_audit_buffer_single_insert(self):
+        gate = safety_gate.MarketingSafetyGate()
+        for i in range(4):
+            gate.record_send_result(f"C{i:05d}", 'camp-1', success=True)
+        assert len(gate._audit_buffer) == 4
+
+        gate_conn = RecordingConnection()
+        gate.set_connection(gate_conn)
+        gate_conn.fail_next = 1
+        assert gate.flush_audit_buffer() == 0
+        assert len(gate._audit_buffer) == 4          # kept once, not duplicated
+        assert gate_conn.rollbacks == 1
+
+        assert gate.flush_audit_buffer() == 4
+        assert gate._audit_buffer == []
+        (sql, params), = gate_conn.inserts
+        assert sql.count("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)") == 4
+        assert len(params) == 40
+        assert gate_conn.commits == 1
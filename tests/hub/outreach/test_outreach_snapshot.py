@@ -0,0 +1,235 @@
+"""
+Test Suite: hub/outreach/ - Set-Based Candidate Generation
+==========================================================
+Doctrine: CL Parent-Child v1.1 - Outreach Spoke
+
+OutreachSpoke candidate evaluation from a CandidateSnapshot:
+- One safety gate batch query and one people_master query for the whole
+  hot set (no per-company or per-contact round trips)
+- Same outcomes as the per-company rules: gate first, Golden Rule,
+  BIT threshold, HR > CEO > CFO primary contact
+- get_priority_candidates and create_campaign_targets share a snapshot
+  without re-evaluating (stats and daily count move once per company)
+"""
+
+import sys
+import types
+import importlib
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+PACKAGE = "outreach_execution_middle_snapshot"
+sys.modules.setdefault(PACKAGE, types.ModuleType(PACKAGE)).__path__ = [
+    str(PROJECT_ROOT / "hubs" / "outreach-execution" / "imo" / "middle")
+]
+outreach_hub = importlib.import_module(f"{PACKAGE}.outreach_hub")
+
+VIEW_COLUMNS = ['company_unique_id', 'effective_tier', 'computed_tier', 'has_active_override',
+                'override_types', 'override_reasons', 'tier_cap', 'overall_status', 'bit_score']
+PEOPLE_COLUMNS = ['person_unique_id', 'full_name', 'email', 'title', 'linkedin_url']
+
+
+class _SpokeBase:
+    """Stands in for the wheel Spoke base (name, hub)."""
+
+    def __init__(self, name, hub):
+        self.name = name
+        self.hub = hub
+
+
+class TestSpoke(outreach_hub.OutreachSpoke, _SpokeBase):
+    __test__ = False
+
+
+class ScriptedCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = []
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        conn = self.connection
+        if "send_attempt_audit" in sql:
+            conn.audits.append(params[6])
+            return
+        if "vw_marketing_eligibility_with_overrides" in sql:
+            conn.view_queries += 1
+            ids = params[0].strip('{}').replace('"', '').split(',') if "ANY" in sql else [params[0]]
+            self.description = [(c,) for c in VIEW_COLUMNS]
+            self._rows = [conn.view[i] for i in ids if i in conn.view]
+        elif "marketing.people_master" in sql:
+            conn.people_queries += 1
+            self.description = [(c,) for c in PEOPLE_COLUMNS]
+            self._rows = [conn.people[p] for p in params['person_ids'] if p in conn.people]
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class ScriptedConnection:
+
+    def __init__(self, view, people):
+        self.view = view
+        self.people = people
+        self.audits = []
+        self.view_queries = 0
+        self.people_queries = 0
+
+    def cursor(self):
+        return ScriptedCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def _view_row(company_id, tier=2, bit_score=60.0):
+    return (company_id, tier, max(tier, 0), False, None, None, None, 'READY', bit_score)
+
+
+def _company(company_id, slots=(), domain="acme.com", pattern="{f}.{l}"):
+    return SimpleNamespace(
+        company_unique_id=company_id,
+        company_name=f"Company {company_id}",
+        domain=domain,
+        email_pattern=pattern,
+        slots={
+            slot: SimpleNamespace(is_filled=True, person_id=f"{company_id}-{slot}")
+            for slot in slots
+        },
+    )
+
+
+class FakePipeline:
+
+    def __init__(self, companies):
+        self.hub = object()
+        self.companies = {c.company_unique_id: c for c in companies}
+
+    def get_company(self, company_id):
+        return self.companies.get(company_id)
+
+    def validate_company_anchor(self, company_id):
+        company = self.companies.get(company_id)
+        missing = [f for f in ('domain', 'email_pattern') if not company or not getattr(company, f)]
+        return not missing, missing
+
+
+class FakeBITEngine:
+
+    def __init__(self, scores):
+        self.scores = {
+            cid: SimpleNamespace(company_id=cid, score=s, last_signal_at=datetime(2026, 3, 1), signal_count=3)
+            for cid, s in scores.items()
+        }
+
+    def get_companies_above_threshold(self, threshold):
+        above = [s for s in self.scores.values() if s.score >= threshold]
+        return sorted(above, key=lambda s: s.score, reverse=True)
+
+    def get_score(self, company_id):
+        return self.scores.get(company_id)
+
+    def get_score_value(self, company_id):
+        return self.scores[company_id].score if company_id in self.scores else 0.0
+
+
+@pytest.fixture
+def spoke():
+    companies = [_company(f"C{i:03d}", slots=('CEO', 'HR') if i % 2 else ('CFO',)) for i in range(40)]
+    companies[3].email_pattern = None                       # Golden Rule violation
+    view = {c.company_unique_id: _view_row(c.company_unique_id, bit_score=90 - i) for i, c in enumerate(companies)}
+    view['C001'] = _view_row('C001', tier=-1)              # HARD FAIL
+    view['C002'] = _view_row('C002', bit_score=10.0)       # below min_bit_score
+    people = {
+        f"{c.company_unique_id}-{slot}": (f"{c.company_unique_id}-{slot}", f"{slot} of {c.company_unique_id}",
+                                          f"{slot.lower()}@{c.domain}", None, None)
+        for c in companies for slot in c.slots
+    }
+    conn = ScriptedConnection(view, people)
+    bit_engine = FakeBITEngine({c.company_unique_id: 90 - i for i, c in enumerate(companies)})
+    return TestSpoke(hub=None, bit_engine=bit_engine, config=outreach_hub.OutreachConfig(),
+                     company_pipeline=FakePipeline(companies), db_connection=conn)
+
+
+CORRELATION_ID = "1f6f0c1e-8a53-4c47-9d0e-5b8b6d3e2a10"
+
+
+class TestSnapshotLoad:
+
+    def test_hot_set_loads_in_bulk(self, spoke):
+        conn = spoke._db_connection
+        snapshot = spoke.load_candidate_snapshot(
+            [s.company_id for s in spoke.bit_engine.get_companies_above_threshold(50)], CORRELATION_ID
+        )
+        candidates = spoke._evaluate_snapshot(snapshot)
+
+        assert conn.view_queries == 1
+        assert conn.people_queries == 1
+        assert 'C001' not in snapshot.companies              # gate first: nothing loaded for blocked
+        assert [c.company_id for c in candidates] == [
+            cid for cid in snapshot.company_ids if cid not in ('C001', 'C002', 'C003')
+        ]
+        assert spoke.stats['failed_safety_gate'] == 1
+        assert spoke.stats['failed_anchor'] == 1
+        assert spoke.stats['failed_bit_score'] == 1
+
+    def test_primary_contact_priority(self, spoke):
+        snapshot = spoke.load_candidate_snapshot(['C004', 'C005'], CORRELATION_ID)
+        c4, c5 = spoke._evaluate_snapshot(snapshot)
+
+        assert (c4.primary_contact_id, c4.primary_contact_title) == ('C004-CFO', 'CFO')
+        assert (c5.primary_contact_id, c5.primary_contact_email) == ('C005-HR', 'hr@acme.com')
+        assert c5.ceo_slot_filled and c5.hr_slot_filled and not c5.cfo_slot_filled
+        assert c5.company_name == "Company C005" and c5.signal_count == 3
+
+    def test_single_company_matches_batch(self, spoke):
+        single = spoke._evaluate_company('C005', CORRELATION_ID)
+        assert single.primary_contact_id == 'C005-HR'
+        assert spoke._evaluate_company('C001', CORRELATION_ID) is None
+
+
+class TestSharedSnapshot:
+
+    def test_priority_then_targets_reuse_snapshot(self, spoke):
+        conn = spoke._db_connection
+        hot = [s.company_id for s in spoke.bit_engine.get_companies_above_threshold(50)]
+        snapshot = spoke.load_candidate_snapshot(hot, CORRELATION_ID)
+
+        top = spoke.get_priority_candidates(limit=5, correlation_id=CORRELATION_ID, snapshot=snapshot)
+        assert [c.company_id for c in top] == ['C000', 'C004', 'C005', 'C006', 'C007']
+        evaluated = spoke.stats['total_evaluated']
+        daily = spoke._daily_count
+
+        targets = spoke.create_campaign_targets('camp-1', correlation_id=CORRELATION_ID, snapshot=snapshot)
+
+        assert [t.candidate.company_id for t in targets] == [c.company_id for c in top]
+        assert spoke.stats['total_evaluated'] == evaluated
+        assert spoke._daily_count == daily
+        assert conn.people_queries == 1
+        assert conn.view_queries == 2                        # load + mandatory re-check
+
+    def test_priority_without_snapshot_loads_top_of_hot_set(self, spoke):
+        conn = spoke._db_connection
+        top = spoke.get_priority_candidates(limit=3, correlation_id=CORRELATION_ID)
+
+        assert [c.company_id for c in top] == ['C000', 'C004', 'C005']
+        assert conn.view_queries == 1 and conn.people_queries == 1
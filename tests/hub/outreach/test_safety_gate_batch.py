@@ -0,0 +1,231 @@
+"""
+Test Suite: hub/outreach/ - Batched Marketing Safety Gate Checks
+================================================================
+Doctrine: CL Parent-Child v1.1 - Marketing Safety Gate (HARD FAIL)
+
+check_eligibility_batch against a scripted view connection:
+- Same per-company outcome, error type and audit status as
+  check_eligibility_or_fail
+- One "= ANY(...)" query per ELIGIBILITY_BATCH_SIZE companies
+- A failed chunk is re-read from the view one company at a time; only
+  companies whose own query fails HARD FAIL
+- Campaign snapshots expire after snapshot_ttl and are dropped when the
+  override version changes or invalidate_snapshots() is called
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+gate_spec = importlib.util.spec_from_file_location(
+    "outreach_execution_marketing_safety_gate",
+    PROJECT_ROOT / "hubs" / "outreach-execution" / "imo" / "middle" / "marketing_safety_gate.py"
+)
+safety_gate = importlib.util.module_from_spec(gate_spec)
+gate_spec.loader.exec_module(safety_gate)
+
+MarketingSafetyGate = safety_gate.MarketingSafetyGate
+
+COLUMNS = ['company_unique_id', 'effective_tier', 'computed_tier', 'has_active_override',
+           'override_types', 'override_reasons', 'tier_cap', 'overall_status', 'bit_score']
+
+
+def _row(company_id, tier=2, override_types=None):
+    return (company_id, tier, max(tier, 0), bool(override_types), override_types,
+            ['opt-out'] if override_types else None, None, 'READY', 60.0)
+
+
+class ScriptedCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = [(c,) for c in COLUMNS]
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        conn = self.connection
+        if "send_attempt_audit" in sql:
+            conn.audits.append(params[6])
+            return
+        conn.queries.append(sql)
+        if "= ANY(%s)" in sql:
+            ids = [i.strip('"') for i in params[0].strip('{}').split(',')]
+            conn.batch_ids.append(ids)
+        else:
+            ids = [params[0]]
+        if conn.fail_next:
+            conn.fail_next -= 1
+            raise RuntimeError("view timeout")
+        if conn.malformed.intersection(ids):
+            raise ValueError("invalid input syntax for type uuid")
+        self._rows = [conn.view[i] for i in ids if i in conn.view]
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class ScriptedConnection:
+
+    def __init__(self, view):
+        self.view = view
+        self.queries = []
+        self.audits = []
+        self.batch_ids = []
+        self.fail_next = 0
+        self.malformed = set()
+
+    def cursor(self):
+        return ScriptedCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    @property
+    def batch_queries(self):
+        return [q for q in self.queries if "= ANY(%s)" in q]
+
+
+@pytest.fixture
+def conn():
+    view = {f"C{i:05d}": _row(f"C{i:05d}") for i in range(12000)}
+    view['C00001'] = _row('C00001', tier=-1)
+    view['C00002'] = _row('C00002', override_types=['legal_hold'])
+    view['C00003'] = _row('C00003', tier=1, override_types=['tier_cap'])
+    return ScriptedConnection(view)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBatchMatchesSingleCheck:
+
+    def test_same_outcomes_and_audits(self, conn):
+        ids = ['C00000', 'C00001', 'C00002', 'C00003', 'MISSING']
+        single_gate = MarketingSafetyGate(conn)
+        expected = {}
+        for company_id in ids:
+            try:
+                single_gate.check_eligibility_or_fail(company_id, 'camp-1')
+                expected[company_id] = None
+            except safety_gate.MarketingSafetyError as e:
+                expected[company_id] = type(e)
+        single_audits, conn.audits = conn.audits, []
+
+        result = MarketingSafetyGate(conn).check_eligibility_batch(ids, 'camp-1')
+
+        assert set(result.eligible) == {c for c, err in expected.items() if err is None}
+        assert {c: type(e) for c, e in result.blocked.items()} == {
+            c: err for c, err in expected.items() if err is not None
+        }
+        assert result.blocked['C00001'].error_code == "SAFETY_GATE_TIER_INELIGIBLE"
+        assert conn.audits == single_audits
+        assert len(conn.batch_queries) == 1
+
+    def test_chunked_queries_and_duplicates(self, conn):
+        ids = [f"C{i:05d}" for i in range(12000)] + ['C00004']
+        result = MarketingSafetyGate(conn).check_eligibility_batch(ids, 'camp-1')
+
+        assert len(conn.batch_queries) == 3             # 5000 + 5000 + 2000
+        assert len(result.eligible) + len(result.blocked) == 12000
+        assert len(conn.audits) == 12000
+
+    def test_malformed_id_fails_only_itself(self, conn, monkeypatch):
+        monkeypatch.setattr(safety_gate, "ELIGIBILITY_BATCH_SIZE", 3)
+        conn.malformed = {'not-a-uuid'}
+        result = MarketingSafetyGate(conn).check_eligibility_batch(
+            ['C00010', 'not-a-uuid', 'C00011', 'C00012'], 'camp-1'
+        )
+
+        assert set(result.blocked) == {'not-a-uuid'}
+        assert isinstance(result.blocked['not-a-uuid'], safety_gate.EligibilityCheckError)
+        assert set(result.eligible) == {'C00010', 'C00011', 'C00012'}
+        assert len(conn.batch_queries) == 2
+        assert len(conn.queries) == 5                   # 2 batches + 3 single re-reads
+
+    def test_failed_chunk_hard_fails_its_companies(self, conn, monkeypatch):
+        monkeypatch.setattr(safety_gate, "ELIGIBILITY_BATCH_SIZE", 2)
+        conn.fail_next = 3                              # the chunk and both re-reads
+        result = MarketingSafetyGate(conn).check_eligibility_batch(
+            ['C00010', 'C00011', 'C00012'], 'camp-1'
+        )
+
+        assert set(result.blocked) == {'C00010', 'C00011'}
+        assert all(isinstance(e, safety_gate.EligibilityCheckError) for e in result.blocked.values())
+        assert set(result.eligible) == {'C00012'}
+
+    def test_no_connection_blocks_everything(self):
+        result = MarketingSafetyGate().check_eligibility_batch(['C00000'], 'camp-1')
+        assert isinstance(result.blocked['C00000'], safety_gate.EligibilityCheckError)
+
+
+class TestSnapshotCache:
+
+    def test_snapshot_reused_within_ttl(self, conn):
+        clock = FakeClock()
+        gate = MarketingSafetyGate(conn, snapshot_ttl=30, clock=clock)
+        gate.check_eligibility_batch(['C00000', 'C00005'], 'camp-1')
+        gate.check_eligibility_batch(['C00005', 'C00006'], 'camp-1')
+
+        # Second call only fetched the company it had not seen
+        assert conn.batch_ids == [['C00000', 'C00005'], ['C00006']]
+
+        conn.view['C00000'] = _row('C00000', override_types=['marketing_disabled'])
+        assert gate.check_eligibility_batch(['C00000'], 'camp-1').is_eligible('C00000')
+
+        clock.now = 31
+        assert not gate.check_eligibility_batch(['C00000'], 'camp-1').is_eligible('C00000')
+
+    def test_snapshots_are_per_campaign(self, conn):
+        gate = MarketingSafetyGate(conn, snapshot_ttl=30, clock=FakeClock())
+        gate.check_eligibility_batch(['C00000'], 'camp-1')
+        gate.check_eligibility_batch(['C00000'], 'camp-2')
+        assert len(conn.batch_queries) == 2
+
+    def test_override_change_drops_snapshots(self, conn):
+        version = {'value': 1}
+        gate = MarketingSafetyGate(conn, snapshot_ttl=300, clock=FakeClock(),
+                                   override_version=lambda: version['value'])
+        assert gate.check_eligibility_batch(['C00000'], 'camp-1').is_eligible('C00000')
+
+        conn.view['C00000'] = _row('C00000', override_types=['cooldown'])
+        version['value'] = 2
+        result = gate.check_eligibility_batch(['C00000'], 'camp-1')
+        assert isinstance(result.blocked['C00000'], safety_gate.ActiveOverrideError)
+
+    def test_invalidate_snapshots(self, conn):
+        gate = MarketingSafetyGate(conn, snapshot_ttl=300, clock=FakeClock())
+        gate.check_eligibility_batch(['C00000'], 'camp-1')
+        conn.view['C00000'] = _row('C00000', tier=-1)
+
+        gate.invalidate_snapshots('camp-1')
+        assert not gate.check_eligibility_batch(['C00000'], 'camp-1').is_eligible('C00000')
+
+    def test_failed_lookups_are_not_cached(self, conn):
+        gate = MarketingSafetyGate(conn, snapshot_ttl=300, clock=FakeClock())
+        conn.fail_next = 2                              # the chunk and its re-read
+        assert not gate.check_eligibility_batch(['C00000'], 'camp-1').is_eligible('C00000')
+        assert gate.check_eligibility_batch(['C00000'], 'camp-1').is_eligible('C00000')
+
+
+def test_array_literal_quotes_values():
+    assert safety_gate._pg_array_literal(['a', 'b"c', 'd\\e']) == '{"a","b\\"c","d\\\\e"}'
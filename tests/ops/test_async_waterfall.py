@@ -0,0 +1,270 @@
+"""
+Test Suite: ops/providers/ - Async Provider Waterfall
+=====================================================
+Runs real providers against a local stub HTTP server that simulates
+provider latency and 429 responses:
+- Same providers, results and cost_credits as execute_tier_waterfall()
+- Free-tier race cancels lower-priority in-flight requests
+- Per-provider concurrency and rate caps
+- 429 backoff through the async transport
+- Keep-alive connection reuse
+- Blocking entry point works from inside a running event loop
+"""
+
+import sys
+import json
+import time
+import asyncio
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+pytest.importorskip("httpx")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.providers.providers import (
+    FirecrawlProvider,
+    HunterProvider,
+    ProspeoProvider,
+    ProviderRegistry,
+    ProviderTier,
+    ProviderTransport,
+    execute_tier_waterfall,
+)
+from ops.providers.async_waterfall import (
+    AsyncProviderTransport,
+    execute_waterfall_many,
+    run_waterfall_many,
+)
+
+
+class StubProviderAPI(BaseHTTPRequestHandler):
+    """
+    /scrape/<delay>   Firecrawl-style scrape; hit0.* pages list two staff emails
+    /hunter           Hunter domain-search; hit1.* has a pattern, throttled.* 429s once
+    /prospeo          Prospeo domain-search; never finds anything
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _handle(self):
+        server = self.server
+        url = urlparse(self.path)
+        route = url.path.split('/')[1]
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.in_flight[route] = server.in_flight.get(route, 0) + 1
+            server.max_in_flight[route] = max(server.max_in_flight.get(route, 0), server.in_flight[route])
+            server.hits[route] = server.hits.get(route, 0) + 1
+        try:
+            status, payload = self._respond(route, url, body)
+        finally:
+            with server.lock:
+                server.in_flight[route] -= 1
+
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _respond(self, route, url, body):
+        server = self.server
+        if route == 'scrape':
+            time.sleep(float(url.path.split('/')[2]))
+            domain = urlparse(body['url']).hostname.replace('www.', '')
+            text = f"john.smith@{domain} jane.doe@{domain}" if domain.startswith('hit0') else ""
+            return 200, {'data': {'markdown': text}}
+
+        query = parse_qs(url.query)
+        domain = query.get('domain', [''])[0]
+        time.sleep(server.api_latency)
+        if route == 'hunter':
+            if domain.startswith('throttled'):
+                with server.lock:
+                    server.throttled += 1
+                    if server.throttled == 1:
+                        return 429, {}
+            pattern = '{first}.{last}' if domain.startswith(('hit1', 'throttled')) else None
+            return 200, {'data': {'pattern': pattern, 'emails': []}}
+        return 200, {'response': {'email_list': []}}
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubProviderAPI)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.connections = set()
+    httpd.in_flight, httpd.max_in_flight, httpd.hits = {}, {}, {}
+    httpd.throttled = 0
+    httpd.api_latency = 0.0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _registry(server, scrape_delay=0.0, slow_delay=0.05, **config):
+    """Tier 0: scrape, slowscrape; Tier 1: hunter; Tier 2: prospeo."""
+    config = dict({'retry_delay': 0.01, 'rate_limit': 100000}, **config)
+
+    class ScrapeProvider(FirecrawlProvider):
+        BASE_URL = f"{server.url}/scrape/{scrape_delay}"
+
+    class SlowScrapeProvider(FirecrawlProvider):
+        BASE_URL = f"{server.url}/scrape/{slow_delay}"
+
+    class StubHunterProvider(HunterProvider):
+        BASE_URL = f"{server.url}/hunter"
+
+        @property
+        def name(self):
+            return "hunter"
+
+    class StubProspeoProvider(ProspeoProvider):
+        BASE_URL = f"{server.url}/prospeo"
+
+    registry = ProviderRegistry()
+    providers = [
+        ScrapeProvider(api_key='k', config=config),
+        SlowScrapeProvider(api_key='k', config=config),
+        StubHunterProvider(api_key='k', config=config),
+        StubProspeoProvider(api_key='k', config=config),
+    ]
+    registry._providers = {provider.name: provider for provider in providers}
+    return registry
+
+
+def _summary(results):
+    return [(r.provider_name, r.pattern, r.cost_credits) for r in results]
+
+
+class TestWaterfallEquivalence:
+
+    def test_same_providers_results_and_cost_as_blocking(self, server):
+        domains = ['hit0.com', 'hit1.com', 'miss.com']
+
+        blocking = {d: execute_tier_waterfall(_registry(server, slow_delay=0), d) for d in domains}
+        concurrent = execute_waterfall_many(_registry(server), domains)
+
+        for domain in domains:
+            assert _summary(concurrent[domain]) == _summary(blocking[domain])
+        assert [r.provider_name for r in concurrent['hit0.com']] == ['scrape']
+        assert [r.provider_name for r in concurrent['hit1.com']] == ['scrape', 'slowscrape', 'hunter']
+        assert sum(r.cost_credits for r in concurrent['miss.com']) == 6.0  # hunter 1 + prospeo 5
+
+    def test_accept_predicate_escalates_low_confidence(self, server):
+        results = execute_waterfall_many(
+            _registry(server), ['hit0.com'],
+            accept=lambda r: r.has_pattern() and r.confidence >= 0.8
+        )
+        # Scrape pattern (0.7) is not accepted; Hunter is tried next
+        assert [r.provider_name for r in results['hit0.com']][:3] == ['scrape', 'slowscrape', 'hunter']
+
+
+class TestRaceCancellation:
+
+    def test_resolved_domain_cancels_lower_priority_requests(self, server):
+        async def run():
+            async with AsyncProviderTransport() as transport:
+                start = time.perf_counter()
+                results = await run_waterfall_many(
+                    _registry(server, slow_delay=2.0), ['hit0.com'], transport=transport
+                )
+                return results, transport.stats, time.perf_counter() - start
+
+        results, stats, elapsed = asyncio.run(run())
+
+        assert [r.provider_name for r in results['hit0.com']] == ['scrape']
+        assert stats.cancelled >= 1
+        assert elapsed < 1.5
+
+
+class TestCaps:
+
+    def test_domains_run_concurrently_under_provider_cap(self, server):
+        server.api_latency = 0.05
+        domains = [f"miss{i}.com" for i in range(16)]
+
+        async def run():
+            async with AsyncProviderTransport(provider_concurrency={'hunter': 2}) as transport:
+                start = time.perf_counter()
+                results = await run_waterfall_many(
+                    _registry(server), domains, transport=transport,
+                    tiers=[ProviderTier.TIER_1], max_concurrent_domains=16
+                )
+                return results, transport.stats, time.perf_counter() - start
+
+        results, stats, elapsed = asyncio.run(run())
+
+        assert len(results) == 16
+        assert stats.max_in_flight['hunter'] == 2
+        assert server.max_in_flight['hunter'] == 2
+        # 16 calls, 2 at a time, 50ms each: ~0.4s (sequential would be 0.8s)
+        assert elapsed < 0.75
+
+    def test_rate_cap_paces_requests(self, server):
+        registry = _registry(server, rate_limit=1200)  # 20 requests/second
+        domains = [f"miss{i}.com" for i in range(11)]
+
+        start = time.perf_counter()
+        execute_waterfall_many(registry, domains, tiers=[ProviderTier.TIER_1])
+        elapsed = time.perf_counter() - start
+
+        assert server.hits['hunter'] == 11
+        assert elapsed >= 0.45
+
+    def test_connections_are_kept_alive(self, server):
+        domains = [f"miss{i}.com" for i in range(30)]
+        execute_waterfall_many(_registry(server), domains, tiers=[ProviderTier.TIER_1],
+                               provider_concurrency={'hunter': 2})
+        assert server.hits['hunter'] == 30
+        assert len(server.connections) <= 2
+
+
+class TestRateLimitResponses:
+
+    def test_429_backs_off_and_retries(self, server):
+        registry = _registry(server)
+        results = execute_waterfall_many(registry, ['throttled.com'], tiers=[ProviderTier.TIER_1])
+
+        assert results['throttled.com'][0].pattern == '{first}.{last}'
+        assert registry.get_provider('hunter').stats.rate_limit_hits == 1
+        assert server.hits['hunter'] == 2
+
+
+
+class TestEntryPoints:
+
+    def test_blocking_entry_point_inside_running_loop(self, server):
+        async def run():
+            return execute_waterfall_many(_registry(server), ['hit0.com'])
+
+        results = asyncio.run(run())
+
+        assert [r.provider_name for r in results['hit0.com']] == ['scrape']
+
+    def test_transport_is_abstract(self):
+        with pytest.raises(TypeError):
+            ProviderTransport()
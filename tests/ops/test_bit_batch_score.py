@@ -0,0 +1,274 @@
+"""
+Test Suite: ops/schedulers/ - BIT Batch Scoring
+===============================================
+Drives batch_score_companies against a scripted connection (no database)
+and checks the SQL it issues:
+- One aggregation query, read from a server-side cursor page by page,
+  scored rows COPYed to a stage and merged with a single upsert
+- Incremental runs stage only outreach_ids at or past each source's mark
+  and scope the aggregation and the snapshot refresh to them
+- Marks are held an overlap behind the clock (writers stamp transaction
+  start, not commit time)
+- No stored watermarks falls back to a full rebuild
+- A run with no changes skips aggregation but still advances the marks
+- Snapshots are only rewritten where the score changed
+- Dry runs neither commit nor move the marks
+"""
+
+import csv
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.schedulers import bit_batch_score
+
+OLD_MARK = datetime(2026, 3, 1)
+NEW_MARKS = {
+    'outreach.dol': datetime(2026, 3, 2, 8),
+    'outreach.blog': datetime(2026, 3, 2, 9),
+    'outreach.people': None,      # no people rows yet
+}
+
+
+class ScriptedCursor:
+    """Answers the scheduler's queries from canned rows and records every statement."""
+
+    def __init__(self, connection, name=None):
+        self.connection = connection
+        self.name = name
+        self.statements = connection.statements
+        self.rowcount = 0
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        conn = self.connection
+        self.statements.append((" ".join(sql.split()), params))
+        if "FROM outreach.bit_score_watermarks" in sql:
+            self._rows = [{'source': s, 'high_water_mark': m} for s, m in conn.watermarks.items()]
+        elif "AS high_water_mark FROM" in sql:
+            table = sql.split("AS high_water_mark FROM")[1].split()[0]
+            self._rows = [{'high_water_mark': NEW_MARKS[table]}]
+        elif "AS changed" in sql:
+            self._rows = [{'changed': conn.changed}]
+        elif "FROM outreach.company_target ct" in sql and sql.lstrip().startswith("SELECT"):
+            assert self.name, "score query must run on a named (server-side) cursor"
+            self._rows = list(conn.score_rows)
+        elif sql.lstrip().startswith("UPDATE outreach.company_target"):
+            self.rowcount = conn.snapshot_rowcount
+        else:
+            self._rows = []
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0]
+
+    def fetchmany(self, size):
+        page, self._rows = self._rows[:size], self._rows[size:]
+        self.connection.pages += bool(page)
+        return page
+
+    def copy_expert(self, sql, buffer):
+        self.connection.copies.append((sql, list(csv.reader(buffer))))
+
+    def close(self):
+        pass
+
+
+class ScriptedConnection:
+
+    def __init__(self, watermarks=None, changed=0, score_rows=(), snapshot_rowcount=0):
+        self.watermarks = watermarks or {}
+        self.changed = changed
+        self.score_rows = list(score_rows)
+        self.snapshot_rowcount = snapshot_rowcount
+        self.statements = []
+        self.copies = []
+        self.pages = 0
+        self.commits = 0
+
+    def cursor(self, name=None, cursor_factory=None):
+        return ScriptedCursor(self, name)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sql(self, fragment):
+        return [(sql, params) for sql, params in self.statements if fragment in sql]
+
+
+def _score_row(outreach_id, filings, blogs=0):
+    return {
+        'outreach_id': outreach_id,
+        'dol_signal_count': filings,
+        'dol_score': Decimal('5.0') * filings,
+        'dol_last_signal_at': datetime(2026, 3, 2),
+        'blog_signal_count': blogs,
+        'blog_score': Decimal('5.0') * blogs,
+        'blog_last_signal_at': datetime(2026, 3, 3) if blogs else None,
+        'people_signal_count': 0,
+        'people_score': Decimal('0'),
+        'people_last_signal_at': None,
+    }
+
+
+@pytest.fixture
+def run(monkeypatch):
+    batches = []
+    monkeypatch.setattr(bit_batch_score, "execute_batch",
+                        lambda cur, sql, rows, **kw: batches.append((" ".join(sql.split()), list(rows))))
+
+    def _run(connection, **kwargs):
+        monkeypatch.setattr(bit_batch_score, "get_db_connection", lambda: connection)
+        stats = bit_batch_score.batch_score_companies(**kwargs)
+        return stats, batches
+
+    return _run
+
+
+def _saved_marks(batches):
+    return {
+        row['source']: row['high_water_mark']
+        for sql, rows in batches if "bit_score_watermarks" in sql
+        for row in rows
+    }
+
+
+class TestIncremental:
+
+    def test_scopes_aggregation_to_changed_ids(self, run):
+        conn = ScriptedConnection(
+            watermarks={'dol': OLD_MARK, 'blog': OLD_MARK},
+            changed=2,
+            score_rows=[_score_row('a', 3), _score_row('b', 10)],
+            snapshot_rowcount=1,
+        )
+        stats, batches = run(conn)
+
+        staged = conn.sql("CREATE TEMP TABLE bit_changed_ids")
+        assert len(staged) == 1
+        sql, params = staged[0]
+        assert "outreach.dol WHERE updated_at >= %s" in sql
+        assert "outreach.blog WHERE created_at >= %s" in sql
+        assert params == [OLD_MARK, OLD_MARK]        # people has no mark: scanned whole
+
+        aggregations = conn.sql("FROM outreach.company_target ct LEFT JOIN")
+        assert len(aggregations) == 1
+        assert bit_batch_score.INCREMENTAL_SCOPE in aggregations[0][0]
+        assert aggregations[0][0].count(bit_batch_score.SOURCE_SCOPE) == 3
+
+        snapshot_sql, _ = conn.sql("UPDATE outreach.company_target")[0]
+        assert "IS DISTINCT FROM bs.score::integer" in snapshot_sql
+        assert bit_batch_score.INCREMENTAL_SCOPE in snapshot_sql
+
+        assert stats['mode'] == 'incremental'
+        assert stats['changed_companies'] == 2
+        assert stats['companies_processed'] == 2
+        assert stats['tier_distribution'] == {'COLD': 1, 'WARM': 0, 'HOT': 1, 'BURNING': 0}
+        assert stats['snapshots_updated'] == 1
+        assert _saved_marks(batches) == {'dol': NEW_MARKS['outreach.dol'], 'blog': NEW_MARKS['outreach.blog']}
+        assert conn.commits == 1
+
+    def test_marks_held_behind_clock(self, run):
+        conn = ScriptedConnection(watermarks={'dol': OLD_MARK, 'blog': OLD_MARK})
+        run(conn)
+
+        captures = conn.sql("AS high_water_mark FROM")
+        assert len(captures) == len(bit_batch_score.WATERMARK_SOURCES)
+        for sql, params in captures:
+            assert "LEAST(MAX(" in sql and "clock_timestamp() - make_interval(mins => %s)" in sql
+            assert "WHEN MAX(" in sql                      # empty source stays unset
+            assert params == (bit_batch_score.WATERMARK_OVERLAP_MINUTES,)
+
+    def test_no_changes_skips_aggregation(self, run):
+        conn = ScriptedConnection(watermarks={'dol': OLD_MARK, 'blog': OLD_MARK}, changed=0)
+        stats, batches = run(conn)
+
+        assert conn.sql("LEFT JOIN") == []
+        assert conn.sql("UPDATE outreach.company_target") == []
+        assert stats['companies_processed'] == 0
+        assert _saved_marks(batches)['dol'] == NEW_MARKS['outreach.dol']
+        assert conn.commits == 1
+
+    def test_dry_run_keeps_watermarks(self, run):
+        conn = ScriptedConnection(watermarks={'dol': OLD_MARK}, changed=1, score_rows=[_score_row('a', 1)])
+        stats, batches = run(conn, dry_run=True)
+
+        assert stats['companies_processed'] == 1
+        assert batches == []
+        assert conn.copies == []
+        assert conn.sql("bit_scores_stage") == []
+        assert conn.commits == 0
+
+
+class TestFullRebuild:
+
+    @pytest.mark.parametrize("kwargs, watermarks", [
+        ({'full': True}, {'dol': OLD_MARK, 'blog': OLD_MARK}),
+        ({}, {}),                                   # first run: nothing recorded yet
+    ])
+    def test_full_scores_everything_and_records_marks(self, run, kwargs, watermarks):
+        conn = ScriptedConnection(watermarks=watermarks, score_rows=[_score_row('a', 1)])
+        stats, batches = run(conn, **kwargs)
+
+        assert stats['mode'] == 'full'
+        assert stats['changed_companies'] is None
+        assert conn.sql("bit_changed_ids") == []
+        score_sql, = [sql for sql, _ in conn.sql("FROM outreach.company_target ct LEFT JOIN")]
+        assert "bit_changed_ids" not in score_sql
+        assert "IS DISTINCT FROM" in conn.sql("UPDATE outreach.company_target")[0][0]
+        assert set(_saved_marks(batches)) == {'dol', 'blog'}
+
+
+class TestStreamingMerge:
+
+    def test_pages_are_scored_and_copied_then_merged_once(self, run):
+        rows = [_score_row(f"id-{i}", i % 4, blogs=i % 3) for i in range(25)]
+        conn = ScriptedConnection(score_rows=rows)
+        stats, _ = run(conn, full=True, page_size=10)
+
+        assert conn.pages == 3
+        # Companies whose every source scored zero are not staged
+        scored = [r for r in rows if r['dol_score'] + r['blog_score'] > 0]
+        assert len(conn.copies) == 3
+        copied = [line for _, lines in conn.copies for line in lines]
+        assert [line[0] for line in copied] == [r['outreach_id'] for r in scored]
+        assert all("FROM STDIN WITH (FORMAT csv, NULL '')" in sql for sql, _ in conn.copies)
+
+        first = copied[0]
+        columns = dict(zip(bit_batch_score.STAGE_COLUMNS, first))
+        assert columns['score'] == '10.0' and columns['score_tier'] == 'COLD'
+        assert columns['signal_count'] == '2'
+        assert columns['last_signal_at'] == '2026-03-03 00:00:00'
+
+        assert len(conn.sql("INSERT INTO outreach.bit_scores")) == 1
+        assert stats['companies_processed'] == stats['companies_updated'] == len(scored)
+        assert stats['source_companies'] == {
+            'dol': sum(r['dol_score'] > 0 for r in rows),
+            'blog': sum(r['blog_score'] > 0 for r in rows),
+            'people': 0,
+        }
+
+    def test_signal_impacts_bound_as_parameters(self, run):
+        conn = ScriptedConnection(score_rows=[_score_row('a', 1)])
+        run(conn, full=True)
+
+        sql, params = conn.sql("FROM outreach.company_target ct LEFT JOIN")[0]
+        assert params['form_5500_filed'] == Decimal('5.0')
+        assert params['content_signal'] == Decimal('5.0')
+        assert params['slot_filled'] == Decimal('10.0')
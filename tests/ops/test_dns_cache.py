@@ -0,0 +1,335 @@
+"""
+Test Suite: ops/caching/ - DNS Resolution Cache
+===============================================
+Tests the shared DNS/MX cache against a stub resolver and a fake clock:
+- Answers are served from cache until their TTL expires
+- NXDOMAIN / NoAnswer are cached and re-raised; timeouts are not cached
+- Concurrent lookups of one name share a single query (threads and asyncio)
+- LRU eviction, stats and snapshot round-trip
+- verify_email_deliverable resolves each record type once
+"""
+
+import sys
+import asyncio
+import threading
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+dns_resolver = pytest.importorskip("dns.resolver")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.caching import dns_cache as dns_cache_module
+from ops.caching.dns_cache import DNSCache, configure_dns_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Answer(list):
+    """dnspython-style answer: iterable rdata plus rrset.ttl."""
+
+    def __init__(self, rdata, ttl):
+        super().__init__(rdata)
+        self.rrset = SimpleNamespace(ttl=ttl)
+
+
+class StubResolver:
+    """
+    Answers from a zone dict: {(name, rdtype): (records, ttl)}.
+    Names in nxdomain raise NXDOMAIN, names in timeout raise Timeout;
+    with delay set, every query blocks until the event is set.
+    """
+
+    def __init__(self, zone, nxdomain=(), timeout=(), delay=None):
+        self.zone = dict(zone)
+        self.nxdomain = set(nxdomain)
+        self.timeout = set(timeout)
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def resolve(self, name, rdtype, lifetime=None):
+        with self.lock:
+            self.calls.append((name, rdtype))
+        if self.delay is not None:
+            self.delay.wait(5)
+        if name in self.timeout:
+            raise dns_resolver.Timeout()
+        if name in self.nxdomain:
+            raise dns_resolver.NXDOMAIN()
+        if (name, rdtype) not in self.zone:
+            raise dns_resolver.NoAnswer()
+        records, ttl = self.zone[(name, rdtype)]
+        if rdtype == 'MX':
+            records = [SimpleNamespace(preference=p, exchange=f"{host}.") for p, host in records]
+        return Answer(records, ttl)
+
+
+ZONE = {
+    ('acme.com', 'A'): (['192.0.2.10'], 600),
+    ('acme.com', 'MX'): ([(20, 'mx2.acme.com'), (10, 'mx1.acme.com')], 3600),
+    ('nomail.com', 'A'): (['192.0.2.20'], 600),
+}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def resolver():
+    return StubResolver(ZONE, nxdomain={'gone.com'}, timeout={'slow.com'})
+
+
+@pytest.fixture
+def cache(resolver, clock):
+    return DNSCache(resolver=resolver, clock=clock, negative_ttl=300, min_ttl=30)
+
+
+class TestPositiveCaching:
+
+    def test_answer_cached_until_ttl(self, cache, resolver, clock):
+        assert cache.resolve('acme.com', 'A') == ['192.0.2.10']
+        clock.now += 599
+        assert cache.resolve('ACME.com.', 'A') == ['192.0.2.10']
+        assert resolver.calls == [('acme.com', 'A')]
+
+        clock.now += 1
+        cache.resolve('acme.com', 'A')
+        assert len(resolver.calls) == 2
+        assert cache.stats()['expired'] == 1
+
+    def test_mx_records_are_preference_tuples(self, cache):
+        assert cache.resolve('acme.com', 'MX') == [(20, 'mx2.acme.com'), (10, 'mx1.acme.com')]
+
+    def test_ttl_is_clamped(self, resolver, clock):
+        resolver.zone[('short.com', 'A')] = (['192.0.2.30'], 1)
+        cache = DNSCache(resolver=resolver, clock=clock, min_ttl=30, max_ttl=60)
+        cache.resolve('short.com', 'A')
+        clock.now += 29
+        cache.resolve('short.com', 'A')
+        assert len(resolver.calls) == 1
+
+        cache.resolve('acme.com', 'MX')   # 3600s TTL capped at 60s
+        clock.now += 61
+        cache.resolve('acme.com', 'MX')
+        assert resolver.calls.count(('acme.com', 'MX')) == 2
+
+
+class TestNegativeCaching:
+
+    def test_nxdomain_cached_for_every_type(self, cache, resolver, clock):
+        with pytest.raises(dns_resolver.NXDOMAIN):
+            cache.resolve('gone.com', 'A')
+        with pytest.raises(dns_resolver.NXDOMAIN):
+            cache.resolve('gone.com', 'MX')
+        assert resolver.calls == [('gone.com', 'A')]
+        assert cache.stats()['negative_hits'] == 1
+
+        clock.now += 300
+        with pytest.raises(dns_resolver.NXDOMAIN):
+            cache.resolve('gone.com', 'MX')
+        assert len(resolver.calls) == 2
+
+    def test_no_answer_cached_per_type(self, cache, resolver):
+        with pytest.raises(dns_resolver.NoAnswer):
+            cache.resolve('nomail.com', 'MX')
+        with pytest.raises(dns_resolver.NoAnswer):
+            cache.resolve('nomail.com', 'MX')
+        assert cache.resolve('nomail.com', 'A') == ['192.0.2.20']
+        assert resolver.calls == [('nomail.com', 'MX'), ('nomail.com', 'A')]
+
+    def test_timeouts_are_not_cached(self, cache, resolver):
+        for _ in range(2):
+            with pytest.raises(dns_resolver.Timeout):
+                cache.resolve('slow.com', 'MX')
+        assert len(resolver.calls) == 2
+        assert cache.stats()['errors'] == 2
+        assert cache.stats()['size'] == 0
+
+
+class TestCoalescing:
+
+    def test_concurrent_lookups_share_one_query(self, clock):
+        release = threading.Event()
+        resolver = StubResolver(ZONE, delay=release)
+        cache = DNSCache(resolver=resolver, clock=clock)
+        results, threads = [], []
+        lock = threading.Lock()
+
+        def worker():
+            records = cache.resolve('acme.com', 'MX')
+            with lock:
+                results.append(records)
+
+        for _ in range(16):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            threads.append(thread)
+        while cache.stats()['coalesced'] < 15:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert resolver.calls == [('acme.com', 'MX')]
+        assert len(results) == 16 and all(r == results[0] for r in results)
+
+    def test_waiters_see_owner_failure(self, clock):
+        release = threading.Event()
+        resolver = StubResolver(ZONE, timeout={'slow.com'}, delay=release)
+        cache = DNSCache(resolver=resolver, clock=clock)
+        errors = []
+
+        def worker():
+            try:
+                cache.resolve('slow.com', 'A')
+            except dns_resolver.Timeout as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while cache.stats()['coalesced'] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(errors) == 4
+        assert len(resolver.calls) == 1
+
+
+class AsyncStubResolver(StubResolver):
+    """StubResolver with a coroutine resolve(), as dns.asyncresolver has."""
+
+    async def resolve(self, name, rdtype, lifetime=None):
+        await asyncio.sleep(0.01)
+        return super().resolve(name, rdtype, lifetime)
+
+
+class TestAsyncResolve:
+
+    def test_tasks_share_one_query_and_entries(self, resolver, clock):
+        async_resolver = AsyncStubResolver(ZONE, nxdomain={'gone.com'})
+        cache = DNSCache(resolver=resolver, async_resolver=async_resolver, clock=clock)
+
+        async def run():
+            answers = await asyncio.gather(*(cache.resolve_async('acme.com', 'MX') for _ in range(20)))
+            missing = await asyncio.gather(cache.resolve_async('gone.com', 'A'), return_exceptions=True)
+            return answers, missing
+
+        answers, missing = asyncio.run(run())
+
+        assert all(a == [(20, 'mx2.acme.com'), (10, 'mx1.acme.com')] for a in answers)
+        assert isinstance(missing[0], dns_resolver.NXDOMAIN)
+        assert async_resolver.calls == [('acme.com', 'MX'), ('gone.com', 'A')]
+        assert cache.stats()['coalesced'] == 19
+        # Blocking callers are answered from the same entries
+        assert cache.resolve('acme.com', 'MX')[0] == (20, 'mx2.acme.com')
+        assert resolver.calls == []
+
+    def test_cancelled_waiter_does_not_cancel_query(self, resolver, clock):
+        cache = DNSCache(resolver=resolver, async_resolver=AsyncStubResolver(ZONE), clock=clock)
+
+        async def run():
+            first = asyncio.ensure_future(cache.resolve_async('acme.com', 'A'))
+            second = asyncio.ensure_future(cache.resolve_async('acme.com', 'A'))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == ['192.0.2.10']
+
+
+class TestManagement:
+
+    def test_lru_eviction(self, resolver, clock):
+        cache = DNSCache(resolver=resolver, clock=clock, maxsize=2)
+        cache.resolve('acme.com', 'A')
+        cache.resolve('acme.com', 'MX')
+        cache.resolve('acme.com', 'A')          # refresh A
+        cache.resolve('nomail.com', 'A')        # evicts MX
+        cache.resolve('acme.com', 'A')
+        cache.resolve('acme.com', 'MX')
+        assert resolver.calls.count(('acme.com', 'A')) == 1
+        assert resolver.calls.count(('acme.com', 'MX')) == 2
+        assert cache.stats()['evictions'] == 2
+
+    def test_stats(self, cache):
+        cache.resolve('acme.com', 'A')
+        cache.resolve('acme.com', 'A')
+        stats = cache.stats()
+        assert (stats['misses'], stats['hits'], stats['queries']) == (1, 1, 1)
+        assert stats['hit_rate'] == 0.5
+
+    def test_snapshot_round_trip(self, cache, resolver, clock, tmp_path):
+        path = str(tmp_path / 'dns.json')
+        cache.resolve('acme.com', 'MX')
+        cache.resolve('acme.com', 'A')
+        with pytest.raises(dns_resolver.NXDOMAIN):
+            cache.resolve('gone.com', 'A')
+        assert cache.save_snapshot(path) == 3
+
+        clock.now += 400     # A (600s) still fresh, NXDOMAIN (300s) expired
+        fresh = StubResolver(ZONE, nxdomain={'gone.com'})
+        restored = DNSCache(resolver=fresh, clock=clock)
+        assert restored.load_snapshot(path) == 2
+        assert restored.resolve('acme.com', 'MX') == [(20, 'mx2.acme.com'), (10, 'mx1.acme.com')]
+        assert restored.resolve('acme.com', 'A') == ['192.0.2.10']
+        assert fresh.calls == []
+
+    def test_missing_snapshot_is_ignored(self, cache, tmp_path):
+        assert cache.load_snapshot(str(tmp_path / 'missing.json')) == 0
+
+
+# =============================================================================
+# VERIFICATION INTEGRATION
+# =============================================================================
+
+@pytest.fixture
+def verification(resolver, clock):
+    spec = importlib.util.spec_from_file_location(
+        "company_target_verification",
+        PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "verification" / "verification.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    previous = dns_cache_module._cache
+    configure_dns_cache(resolver=resolver, clock=clock)
+    yield module
+    dns_cache_module._cache = previous
+
+
+class TestVerificationUsesCache:
+
+    def test_email_verification_resolves_each_type_once(self, verification, resolver):
+        result = verification.verify_email_deliverable('jane@acme.com', check_smtp=False)
+        verification.verify_email_deliverable('john@acme.com', check_smtp=False)
+
+        assert result.mx_host == 'mx1.acme.com'
+        assert sorted(resolver.calls) == [('acme.com', 'A'), ('acme.com', 'MX')]
+
+    def test_check_mx_records_sorted_by_preference(self, verification):
+        assert verification.check_mx_records('acme.com') == ['mx1.acme.com', 'mx2.acme.com']
+        assert verification.check_mx_records('gone.com') == []
+
+    def test_domain_health_from_cache(self, verification, resolver):
+        health = verification.verify_domain_health('acme.com')
+        again = verification.verify_domain_health('acme.com')
+
+        assert health.status == verification.DomainHealthStatus.VALID
+        assert again.mx_records == ['mx1.acme.com', 'mx2.acme.com']
+        assert len(resolver.calls) == 2
@@ -0,0 +1,365 @@
+"""
+Test Suite: ops/master_error_log/ - Buffered Master Error Emitter
+==================================================================
+PRD Reference: PRD_MASTER_ERROR_LOG.md
+
+BufferedMasterErrorEmitter against a recording connection (no database):
+- Validation still FAILS HARD in the caller, before anything is queued
+- Rows are written as multi-row INSERTs of up to batch_size
+- DB unavailable → rows spill to an append-only file, replayed once the
+  DB accepts writes again (each error_id exactly once), even if no new
+  errors arrive: on an idle timer and on close()
+- Memory bounded by max_buffer; overflow spills instead of queueing
+- Torn spill lines are quarantined; replays never lose spilled rows, even
+  with another process appending to the same spill file
+- Replays stream batch_size rows at a time and resume a crashed replay
+  from its recorded offset
+- emit() racing close() is either written or raises; flush() after close() returns
+- Optional aggregation of (process_id, error_code) bursts
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.master_error_log.master_error_emitter import (
+    MASTER_ERROR_COLUMNS,
+    BufferedMasterErrorEmitter,
+    EntityType,
+    Hub,
+    OperatingMode,
+    Severity,
+    ValidationError,
+)
+
+
+class RecordingConnection:
+    """execute() stores INSERTed rows by error_id; can be failed or held."""
+
+    def __init__(self):
+        self.rows = {}
+        self.statements = []
+        self.fail = False
+        self.fail_after = None          # statements that succeed before failing
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def execute(self, query, params):
+        self.gate.wait()
+        if self.fail or (self.fail_after is not None and len(self.statements) >= self.fail_after):
+            raise ConnectionError("database unavailable")
+        width = len(MASTER_ERROR_COLUMNS)
+        rows = [tuple(params[i:i + width]) for i in range(0, len(params), width)]
+        self.statements.append((query, len(rows)))
+        for row in rows:
+            self.rows.setdefault(row[0], row)
+
+
+def _params(**overrides):
+    params = {
+        'correlation_id': str(uuid.uuid4()),
+        'hub': Hub.PEOPLE,
+        'process_id': 'people.lifecycle.email.phase5',
+        'pipeline_phase': 'phase5',
+        'entity_type': EntityType.PERSON,
+        'severity': Severity.MEDIUM,
+        'error_code': 'PSH-P5-001',
+        'error_message': 'Provider timeout',
+        'unique_id': 'outreach-core-001-20260205143022-a1b2c3d4',
+    }
+    params.update(overrides)
+    return params
+
+
+@pytest.fixture
+def conn():
+    return RecordingConnection()
+
+
+@pytest.fixture
+def make_emitter(conn, tmp_path):
+    emitters = []
+
+    def make(**kwargs):
+        kwargs.setdefault('flush_interval', 30.0)
+        kwargs.setdefault('spill_path', tmp_path / "spill.jsonl")
+        emitter = BufferedMasterErrorEmitter(conn, OperatingMode.STEADY_STATE, **kwargs)
+        emitters.append(emitter)
+        return emitter
+
+    yield make
+    conn.gate.set()
+    for emitter in emitters:
+        emitter.close()
+
+
+class TestSynchronousValidation:
+
+    def test_invalid_event_raises_in_caller(self, make_emitter, conn):
+        emitter = make_emitter()
+
+        with pytest.raises(ValidationError):
+            emitter.emit(**_params(correlation_id=None))
+        with pytest.raises(ValidationError):
+            emitter.emit(**_params(process_id="not-a-process"))
+
+        emitter.flush()
+        assert emitter.get_stats()['emitted'] == 0
+        assert conn.statements == []
+
+    def test_emit_after_close_raises(self, make_emitter):
+        emitter = make_emitter()
+        emitter.close()
+        with pytest.raises(RuntimeError):
+            emitter.emit(**_params())
+
+    def test_flush_after_close_returns(self, make_emitter):
+        emitter = make_emitter()
+        emitter.close()
+        done = threading.Event()
+        threading.Thread(target=lambda: (emitter.flush(), done.set()), daemon=True).start()
+        assert done.wait(2)
+
+    def test_emit_racing_close_is_written_or_raises(self, make_emitter, conn):
+        emitter = make_emitter()
+        accepted = []
+        start = threading.Barrier(5)
+
+        def emit_until_closed():
+            start.wait()
+            while True:
+                try:
+                    accepted.append(emitter.emit(**_params()))
+                except RuntimeError:
+                    return
+
+        threads = [threading.Thread(target=emit_until_closed) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        time.sleep(0.05)
+        emitter.close()
+        for thread in threads:
+            thread.join(5)
+
+        assert accepted
+        assert set(accepted) == set(conn.rows)
+
+
+class TestBatching:
+
+    def test_multi_row_inserts(self, make_emitter, conn):
+        emitter = make_emitter(batch_size=500)
+        error_ids = [emitter.emit(**_params(entity_id=str(i))) for i in range(1200)]
+        emitter.flush()
+
+        assert [n for _, n in conn.statements] == [500, 500, 200]
+        assert "ON CONFLICT (error_id) DO NOTHING" in conn.statements[0][0]
+        assert set(conn.rows) == set(error_ids)
+        assert emitter.get_stats()['batches_written'] == 3
+
+    def test_close_flushes(self, make_emitter, conn):
+        emitter = make_emitter()
+        error_id = emitter.emit(**_params())
+        emitter.close()
+
+        assert list(conn.rows) == [error_id]
+
+
+class TestSpill:
+
+    def test_outage_spills_then_replays(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=100, retry_interval=0.0)
+        conn.fail = True
+        during = [emitter.emit(**_params(entity_id=str(i))) for i in range(250)]
+        emitter.flush()
+
+        spill = tmp_path / "spill.jsonl"
+        lines = spill.read_text().splitlines()
+        assert len(lines) == 250
+        assert json.loads(lines[0])['error_id'] == during[0]
+        assert conn.rows == {}
+
+        conn.fail = False
+        after = emitter.emit(**_params())
+        emitter.flush()
+
+        assert set(conn.rows) == set(during) | {after}
+        assert not spill.exists()
+        stats = emitter.get_stats()
+        assert stats['rows_spilled'] == 250 and stats['rows_replayed'] == 250
+        assert conn.rows[during[0]][MASTER_ERROR_COLUMNS.index('operating_mode')] == 'STEADY_STATE'
+
+    def test_close_replays_spill_after_recovery(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=10, retry_interval=3600)
+        conn.fail = True
+        spilled = [emitter.emit(**_params()) for _ in range(3)]
+        emitter.flush()
+
+        conn.fail = False
+        emitter.close()
+
+        assert set(conn.rows) == set(spilled)
+        assert not (tmp_path / "spill.jsonl").exists()
+
+    def test_idle_writer_replays_spill_on_timer(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=10, retry_interval=0.2, flush_interval=0.05)
+        conn.fail = True
+        spilled = [emitter.emit(**_params()) for _ in range(3)]
+        emitter.flush()
+        conn.fail = False
+
+        deadline = time.monotonic() + 5
+        while set(conn.rows) != set(spilled) and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert set(conn.rows) == set(spilled)
+        assert emitter.get_stats()['rows_replayed'] == 3
+
+    def test_torn_line_quarantined_and_rows_survive_replays(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=10, retry_interval=0.0)
+        conn.fail = True
+        spilled = [emitter.emit(**_params(entity_id=str(i))) for i in range(3)]
+        emitter.flush()
+
+        spill = tmp_path / "spill.jsonl"
+        with open(spill, "a") as f:
+            f.write('{"error_id": "torn')                  # crash mid-append
+
+        # Replay fails, then a later spill lands after the torn line
+        assert emitter.replay_spill() == 0
+        later = emitter.emit(**_params())
+        emitter.flush()
+
+        conn.fail = False
+        emitter.replay_spill()
+
+        assert set(conn.rows) == set(spilled) | {later}
+        assert not spill.exists()
+        assert list(tmp_path.glob("*.replay")) == []
+        assert emitter.quarantine_path.read_text() == '{"error_id": "torn\n'
+        assert emitter.get_stats()['rows_quarantined'] == 1
+
+    def test_orphaned_replay_file_adopted(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=10, retry_interval=0.0)
+        conn.fail = True
+        error_id = emitter.emit(**_params())
+        emitter.flush()
+
+        spill = tmp_path / "spill.jsonl"
+        # Left behind by a process that crashed mid-replay (pid far above pid_max)
+        spill.rename(tmp_path / "spill.jsonl.999999999.replay")
+        conn.fail = False
+        assert emitter.replay_spill() == 1
+
+        assert error_id in conn.rows
+        assert list(tmp_path.glob("*.replay")) == []
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="the child appends through the parent's emitter")
+    def test_other_process_appends_survive_replays(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=7)
+        optional = dict(sub_hub=None, source_tool=None, retryable=False, cost_impact_usd=None, metadata=None)
+        rows = [emitter._prepare_row(**_params(entity_id=str(i)), **optional) for i in range(400)]
+
+        pid = os.fork()
+        if pid == 0:                        # child: another process on the same spill file
+            try:
+                for _, row in rows:
+                    emitter._spill([row])
+            finally:
+                os._exit(0)
+
+        while os.waitpid(pid, os.WNOHANG) == (0, 0):
+            emitter.replay_spill()
+        emitter.replay_spill()
+
+        assert set(conn.rows) == {error_id for error_id, _ in rows}
+        assert list(tmp_path.glob("*.replay")) == []
+
+    def test_replay_streams_batches_and_requeues_rest(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=10, retry_interval=3600)
+        conn.fail = True
+        spilled = [emitter.emit(**_params(entity_id=str(i))) for i in range(25)]
+        emitter.flush()
+
+        conn.fail = False
+        conn.fail_after = 1
+        assert emitter.replay_spill() == 10
+        assert set(conn.rows) == set(spilled[:10])
+        lines = (tmp_path / "spill.jsonl").read_text().splitlines()
+        assert [json.loads(line)['error_id'] for line in lines] == spilled[10:]
+
+        conn.fail_after = None
+        assert emitter.replay_spill() == 15
+        assert [n for _, n in conn.statements] == [10, 10, 5]
+        assert list(tmp_path.glob("*.done")) == []
+
+    def test_crashed_replay_resumes_from_offset(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=10, retry_interval=0.0)
+        conn.fail = True
+        spilled = [emitter.emit(**_params(entity_id=str(i))) for i in range(5)]
+        emitter.flush()
+
+        # A process died after inserting the first two lines of its replay
+        spill = tmp_path / "spill.jsonl"
+        replay = tmp_path / "spill.jsonl.999999999.abc.replay"
+        spill.rename(replay)
+        done = sum(len(line) for line in replay.read_bytes().splitlines(keepends=True)[:2])
+        (tmp_path / f"{replay.name}.done").write_text(str(done))
+
+        conn.fail = False
+        assert emitter.replay_spill() == 3
+        assert set(conn.rows) == set(spilled[2:])
+        assert list(tmp_path.glob("*.replay*")) == []
+
+    def test_retry_interval_skips_db(self, make_emitter, conn):
+        emitter = make_emitter(batch_size=10, retry_interval=3600)
+        conn.fail = True
+        emitter.emit(**_params())
+        emitter.flush()
+        conn.fail = False
+        emitter.emit(**_params())
+        emitter.flush()
+
+        assert conn.rows == {}
+        assert emitter.get_stats()['rows_spilled'] == 2
+
+    def test_full_buffer_spills_instead_of_growing(self, make_emitter, conn, tmp_path):
+        emitter = make_emitter(batch_size=5, max_buffer=5)
+        conn.gate.clear()                                    # writer stuck in execute()
+        error_ids = [emitter.emit(**_params(entity_id=str(i))) for i in range(40)]
+
+        assert emitter.get_stats()['queued'] <= 5
+        assert emitter.get_stats()['rows_spilled'] > 0
+
+        conn.gate.set()
+        emitter.flush()
+        assert set(conn.rows) == set(error_ids)
+
+
+class TestAggregation:
+
+    def test_burst_folds_into_one_row(self, make_emitter, conn):
+        emitter = make_emitter(aggregate=True)
+        burst = [emitter.emit(**_params(metadata={'provider': 'hunter'})) for _ in range(50)]
+        other = emitter.emit(**_params(error_code='PSH-P5-002'))
+        emitter.flush()
+
+        assert set(conn.rows) == {burst[0], other}
+        metadata = json.loads(conn.rows[burst[0]][MASTER_ERROR_COLUMNS.index('metadata')])
+        assert metadata['provider'] == 'hunter'
+        assert metadata['aggregated_count'] == 50
+        assert metadata['aggregated_error_ids'] == burst[1:]
+        assert len(metadata['aggregated_correlation_ids']) == 49
+        assert emitter.get_stats()['rows_aggregated'] == 49
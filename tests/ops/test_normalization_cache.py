@@ -0,0 +1,114 @@
+"""
+Test Suite: ops/caching/ - Normalization Cache
+==============================================
+Tests the shared memo cache behind the company/DOL normalizers:
+- Cached results equal the uncached normalizer
+- LRU bound and resize
+- Hit/miss counters per namespace
+- Interned string results
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.caching import NormalizationCache, cached_normalizer, get_normalization_cache
+
+normalization_spec = importlib.util.spec_from_file_location(
+    "company_target_normalization",
+    PROJECT_ROOT / "hubs" / "company-target" / "imo" / "middle" / "matching" / "normalization.py"
+)
+normalization = importlib.util.module_from_spec(normalization_spec)
+normalization_spec.loader.exec_module(normalization)
+
+
+class TestNormalizationCache:
+    """NormalizationCache LRU behaviour."""
+
+    def test_hits_and_misses(self):
+        cache = NormalizationCache(maxsize=10)
+        calls = []
+
+        def upper(value):
+            calls.append(value)
+            return value.upper()
+
+        assert cache.get_or_compute("ns", upper, ("acme",)) == "ACME"
+        assert cache.get_or_compute("ns", upper, ("acme",)) == "ACME"
+        assert calls == ["acme"]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["namespaces"]["ns"] == {"hits": 1, "misses": 1}
+
+    def test_lru_eviction(self):
+        cache = NormalizationCache(maxsize=2)
+        cache.get_or_compute("ns", str.upper, ("a",))
+        cache.get_or_compute("ns", str.upper, ("b",))
+        cache.get_or_compute("ns", str.upper, ("a",))  # a is now most recent
+        cache.get_or_compute("ns", str.upper, ("c",))  # evicts b
+
+        assert cache.stats()["size"] == 2
+        cache.get_or_compute("ns", str.upper, ("a",))
+        assert cache.stats()["hits"] == 2
+
+        cache.resize(1)
+        assert cache.stats()["size"] == 1
+
+    def test_zero_size_disables_caching(self):
+        cache = NormalizationCache(maxsize=0)
+        cache.get_or_compute("ns", str.upper, ("a",))
+        cache.get_or_compute("ns", str.upper, ("a",))
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["hits"] == 0
+
+    def test_unhashable_arguments_bypass_cache(self):
+        cache = NormalizationCache(maxsize=10)
+        assert cache.get_or_compute("ns", len, (["a", "b"],)) == 2
+        assert cache.stats()["size"] == 0
+
+    def test_results_are_interned(self):
+        cache = NormalizationCache(maxsize=10)
+        first = cache.get_or_compute("ns", lambda v: v.strip().lower(), (" Acme ",))
+        second = cache.get_or_compute("ns2", lambda v: v.strip().lower(), ("ACME",))
+        assert first is second
+
+
+class TestCachedNormalizers:
+    """Decorated normalizers return exactly the uncached result."""
+
+    @pytest.mark.parametrize("func", [
+        normalization.normalize_company_name,
+        normalization.normalize_domain,
+        normalization.normalize_city,
+        normalization.normalize_state,
+    ])
+    def test_matches_uncached(self, func):
+        inputs = ["Acme Corporation", "The Acme Group, LLC", "https://www.Acme.com/about",
+                  "Mt. Pleasant", "south carolina", "", None, 42]
+        for value in inputs:
+            assert func(value) == func.__wrapped__(value)
+            assert func(value) == func.__wrapped__(value)
+
+    def test_keyword_arguments_are_part_of_key(self):
+        name = "Acme Holdings Inc"
+        assert (normalization.normalize_company_name(name, remove_suffixes=False)
+                == normalization.normalize_company_name.__wrapped__(name, remove_suffixes=False))
+        assert (normalization.normalize_company_name(name)
+                == normalization.normalize_company_name.__wrapped__(name))
+
+    def test_shared_cache_counts_namespace(self):
+        @cached_normalizer("tests.shared_namespace")
+        def lower(value):
+            return value.lower()
+
+        cache = get_normalization_cache()
+        lower("ACME")
+        lower("ACME")
+        assert cache.stats()["namespaces"]["tests.shared_namespace"]["hits"] >= 1
@@ -0,0 +1,206 @@
+"""
+Test Suite: ops/providers/ - Token-Bucket Rate Limiter
+======================================================
+Tests the shared provider rate limiter with a frozen clock, so every
+caller's reserved slot is exactly the wait it was handed:
+- Per-provider slots are spaced at least 1/rate apart
+- No 1-second window holds more than global_limit calls
+- 64 concurrent callers (threads and asyncio) get distinct slots
+- try_acquire never waits
+- Circuit breaker still delays calls until cooldown ends
+"""
+
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.providers.rate_limiter import RateLimiter, TokenBucket
+
+CALLERS = 64
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    sleeps = []
+
+    async def async_sleep(seconds):
+        sleeps.append(seconds)
+
+    instance = RateLimiter(clock=clock, sleep=sleeps.append, async_sleep=async_sleep)
+    instance.sleeps = sleeps
+    return instance
+
+
+def _acquire_threaded(limiter, provider):
+    waits = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(CALLERS)
+
+    def worker():
+        barrier.wait()
+        waited = limiter.acquire(provider)
+        with lock:
+            waits.append(waited)
+
+    threads = [threading.Thread(target=worker) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return sorted(waits)
+
+
+class TestTokenBucket:
+
+    def test_burst_then_steady_rate(self):
+        bucket = TokenBucket(rate=5, capacity=5)
+        starts = []
+        for _ in range(10):
+            start = bucket.earliest(0.0)
+            bucket.consume(start)
+            starts.append(start)
+        assert starts[:5] == [0.0] * 5
+        assert starts[5:] == pytest.approx([0.2, 0.4, 0.6, 0.8, 1.0])
+
+
+class TestRateLimits:
+
+    def test_provider_spacing_under_concurrency(self, limiter):
+        starts = _acquire_threaded(limiter, "serpapi")  # 1 call/second
+
+        assert len(starts) == CALLERS
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert min(gaps) >= 1.0 - 1e-9
+        # Achieved rate is the configured rate, not slower
+        assert starts[-1] == pytest.approx(CALLERS - 1)
+
+    def test_global_window_under_concurrency(self, limiter):
+        limiter.set_provider_limit("fast", 1000.0)
+        starts = _acquire_threaded(limiter, "fast")
+
+        for start in starts:
+            in_window = [s for s in starts if start <= s < start + 1.0 - 1e-9]
+            assert len(in_window) <= limiter.global_limit
+        # Paced at exactly global_limit calls/second
+        assert starts[-1] == pytest.approx((CALLERS - 1) / limiter.global_limit)
+
+    def test_async_callers_share_limits(self, limiter):
+        async def run():
+            return await asyncio.gather(*(limiter.acquire_async("clay") for _ in range(CALLERS)))
+
+        starts = sorted(asyncio.run(run()))
+
+        assert starts == pytest.approx([float(i) for i in range(CALLERS)])
+        assert limiter.total_calls == CALLERS
+        assert limiter.total_waits == CALLERS - 1
+
+    def test_providers_limited_independently(self, limiter):
+        assert limiter.acquire("serpapi") == 0.0
+        # clay only waits for the global pacing, not for serpapi's 1s interval
+        assert limiter.acquire("clay") == pytest.approx(0.2)
+        assert limiter.acquire("serpapi") == pytest.approx(1.0)
+
+    def test_throttled_provider_does_not_delay_others(self, clock):
+        other_waits = []
+
+        def sleep(seconds):
+            clock.now += 0.5
+            if not other_waits:
+                # While firecrawl waits for its next slot, another caller uses google_cse
+                other_waits.append(limiter.acquire("google_cse"))
+            clock.now += seconds - 0.5
+
+        limiter = RateLimiter(clock=clock, sleep=sleep)
+        assert limiter.acquire("firecrawl") == 0.0
+        firecrawl_wait = limiter.acquire("firecrawl")
+
+        assert firecrawl_wait == pytest.approx(1 / 0.083)
+        # google_cse is free at t=0.5; firecrawl's queued slot does not block it
+        assert other_waits == [0.0]
+
+    def test_global_pacing_delays_provider_next_call(self, limiter):
+        limiter.set_provider_limit("fast", 1000.0)
+        limiter.acquire("clay")
+        first = limiter.acquire("fast")
+        second = limiter.acquire("fast")
+        assert first == pytest.approx(0.2)
+        assert second == pytest.approx(0.4)
+
+    def test_sleeps_once_for_reserved_slot(self, limiter):
+        limiter.acquire("pdl")
+        limiter.acquire("pdl")
+        assert limiter.sleeps == [pytest.approx(2.0)]
+
+    def test_limit_change_applies(self, limiter, clock):
+        limiter.acquire("clay")
+        limiter.set_provider_limit("clay", 4.0)
+        clock.now = 1.0
+        assert limiter.acquire("clay") == 0.0
+        assert limiter.acquire("clay") == pytest.approx(0.25)
+
+        with pytest.raises(ValueError):
+            limiter.set_provider_limit("clay", 0)
+
+
+class TestTryAcquire:
+
+    def test_try_acquire_never_waits(self, limiter, clock):
+        assert limiter.try_acquire("serpapi") is True
+        assert limiter.try_acquire("serpapi") is False
+        assert limiter.sleeps == []
+        assert limiter.total_calls == 1
+
+        clock.now = 1.0
+        assert limiter.try_acquire("serpapi") is True
+
+    def test_try_acquire_respects_open_circuit(self, limiter):
+        for _ in range(limiter.circuit_breaker_threshold):
+            limiter.record_failure("apify")
+        assert limiter.try_acquire("apify") is False
+
+
+class TestCircuitBreaker:
+
+    def test_acquire_waits_out_cooldown(self, limiter, clock):
+        for _ in range(limiter.circuit_breaker_threshold):
+            limiter.record_failure("zenrows")
+        assert limiter.is_circuit_open("zenrows")
+
+        clock.now = 10.0
+        assert limiter.acquire("zenrows") == pytest.approx(50.0)
+
+        clock.now = 60.0
+        limiter._close_expired_breaker("zenrows")
+        assert not limiter.is_circuit_open("zenrows")
+        assert limiter.provider_failures["zenrows"] == 0
+
+    def test_success_closes_circuit(self, limiter):
+        for _ in range(limiter.circuit_breaker_threshold):
+            limiter.record_failure("zenrows")
+        limiter.record_success("zenrows")
+        assert limiter.acquire("zenrows") == 0.0
+
+    def test_reset_clears_buckets(self, limiter):
+        limiter.acquire("serpapi")
+        limiter.reset()
+        assert limiter.acquire("serpapi") == 0.0
+        assert "nominal" in limiter.get_status()
@@ -0,0 +1,230 @@
+"""
+Test Suite: ops/enforcement/ - Signal Deduplication Store
+=========================================================
+SignalDeduplicator storage and bulk API:
+- Bucketed front cache drops whole closed windows, no cleanup call needed
+- should_emit_many matches repeated should_emit calls, in input order
+- SQLite store persists keys across deduplicator instances / processes
+- Postgres store checks and records a whole batch in one statement
+- Keys the front cache already knows never reach the store
+"""
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from ops.enforcement.signal_dedup import (
+    BucketedKeyCache,
+    PostgresDedupStore,
+    SignalDeduplicator,
+    SQLiteDedupStore,
+)
+
+
+class Clock:
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock(datetime(2026, 3, 10, 12, 0))
+
+
+class TestBucketedKeyCache:
+
+    def test_expire_drops_whole_buckets(self):
+        cache = BucketedKeyCache()
+        today, next_year = datetime(2026, 3, 11), datetime(2027, 1, 1)
+        for i in range(100):
+            cache.add(f"op{i}", today)
+        cache.add("st", next_year)
+        cache.add("op0", today)
+
+        assert len(cache) == 101
+        assert cache.expire(datetime(2026, 3, 10, 23)) == 0
+        assert cache.expire(today) == 100
+        assert "op0" not in cache and "st" in cache
+        assert len(cache) == 1
+
+
+class TestMemoryMode:
+
+    def test_window_rollover_without_cleanup(self, clock):
+        dedup = SignalDeduplicator(clock=clock)
+
+        assert dedup.should_emit("SLOT_FILLED", "C001")
+        assert not dedup.should_emit("SLOT_FILLED", "C001")
+        assert dedup.should_emit("FORM_5500_FILED", "C001")
+
+        clock.now += timedelta(days=1)
+        assert dedup.should_emit("SLOT_FILLED", "C001")          # new 24h window
+        assert not dedup.should_emit("FORM_5500_FILED", "C001")  # same year
+        assert dedup.get_stats()['cache_size'] == 2
+
+    def test_leap_year_window_covers_dec_31(self):
+        clock = Clock(datetime(2028, 12, 31, 10, 0))
+        dedup = SignalDeduplicator(clock=clock)
+
+        assert dedup.should_emit_many([("FORM_5500_FILED", "C1")] * 3) == [True, False, False]
+        assert dedup._entry("FORM_5500_FILED", "C1", clock.now).window_end == datetime(2029, 1, 1)
+
+        clock.now = datetime(2029, 1, 1, 0, 0)
+        assert dedup.should_emit("FORM_5500_FILED", "C1")
+
+    def test_leap_year_window_in_store(self, tmp_path):
+        clock = Clock(datetime(2028, 12, 31, 10, 0))
+        dedup = SignalDeduplicator(store=SQLiteDedupStore(tmp_path / "dedup.db"), clock=clock)
+        assert dedup.should_emit("FORM_5500_FILED", "C1")
+
+        fresh = SignalDeduplicator(store=SQLiteDedupStore(tmp_path / "dedup.db"), clock=clock)
+        assert not fresh.should_emit("FORM_5500_FILED", "C1")
+
+    def test_many_matches_single_calls(self, clock):
+        signals = [("SLOT_FILLED", f"C{i % 7}") for i in range(20)] + [("LARGE_PLAN", "C1")] * 2
+        single = SignalDeduplicator(clock=clock)
+        bulk = SignalDeduplicator(clock=clock)
+
+        expected = [single.should_emit(t, e) for t, e in signals]
+
+        assert bulk.should_emit_many(signals) == expected
+        assert bulk.should_emit_many(signals) == [False] * len(signals)
+        assert bulk.get_stats()['signals_allowed'] == single.get_stats()['signals_allowed'] == 8
+
+    def test_check_only_records_nothing(self, clock):
+        dedup = SignalDeduplicator(clock=clock)
+
+        assert dedup.should_emit_many([("SLOT_FILLED", "C1")] * 2, check_only=True) == [True, True]
+        dedup.record_emissions([("SLOT_FILLED", "C1")])
+        assert dedup.should_emit_many([("SLOT_FILLED", "C1")], check_only=True) == [False]
+
+
+class TestSQLiteStore:
+
+    def test_keys_survive_new_instance(self, clock, tmp_path):
+        path = tmp_path / "signal_dedup.db"
+        first = SignalDeduplicator(store=SQLiteDedupStore(path), clock=clock)
+        assert first.should_emit_many([("SLOT_FILLED", "C1"), ("LARGE_PLAN", "C2")]) == [True, True]
+
+        second = SignalDeduplicator(store=SQLiteDedupStore(path), clock=clock)
+        assert second.should_emit_many(
+            [("SLOT_FILLED", "C1"), ("LARGE_PLAN", "C2"), ("SLOT_FILLED", "C3")]
+        ) == [False, False, True]
+
+        clock.now += timedelta(days=1)
+        assert second.should_emit("SLOT_FILLED", "C1")
+
+    def test_use_persistence_with_sqlite_connection(self, clock):
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        dedup = SignalDeduplicator(use_persistence=True, db_connection=conn, clock=clock)
+
+        assert dedup.should_emit("EXECUTIVE_JOINED", "C9")
+        assert conn.execute("SELECT signal_type, entity_id FROM signal_dedup").fetchall() == [
+            ("EXECUTIVE_JOINED", "C9")
+        ]
+
+    def test_cleanup_purges_closed_windows(self, clock):
+        store = SQLiteDedupStore()
+        dedup = SignalDeduplicator(store=store, clock=clock)
+        dedup.should_emit_many([("SLOT_FILLED", f"C{i}") for i in range(5)] + [("LARGE_PLAN", "C1")])
+
+        clock.now += timedelta(days=1)
+        assert dedup.cleanup_expired() == 5
+        assert store.existing([dedup._entry("LARGE_PLAN", "C1", clock.now).dedup_key], clock.now)
+
+    def test_large_batch_chunks(self, clock):
+        dedup = SignalDeduplicator(store=SQLiteDedupStore(), clock=clock)
+        signals = [("SLOT_FILLED", f"C{i}") for i in range(2500)]
+
+        assert all(dedup.should_emit_many(signals))
+        dedup._cache.clear()                                     # force the store lookup
+        assert not any(dedup.should_emit_many(signals))
+
+
+class ScriptedCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._rows = []
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        conn = self.connection
+        conn.statements.append(sql)
+        if sql.lstrip().startswith("INSERT"):
+            keys, types, entities, first_seen, window_end = params
+            assert window_end[0].tzinfo is not None
+            new = [k for k in keys if k not in conn.rows]
+            conn.rows.update(dict.fromkeys(new, window_end[0]))
+            self._rows = [(k,) for k in new]
+        elif sql.lstrip().startswith("SELECT"):
+            keys, now = params
+            self._rows = [(k,) for k in keys if k in conn.rows and conn.rows[k] > now]
+
+    def fetchall(self):
+        return self._rows
+
+
+class ScriptedConnection:
+
+    def __init__(self):
+        self.rows = {}
+        self.statements = []
+        self.commits = 0
+
+    def cursor(self):
+        return ScriptedCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class TestPostgresStore:
+
+    def test_batch_is_one_statement(self, clock):
+        conn = ScriptedConnection()
+        dedup = SignalDeduplicator(use_persistence=True, db_connection=conn, clock=clock)
+        signals = [("FORM_5500_FILED", f"C{i % 3000}") for i in range(5000)]
+
+        results = dedup.should_emit_many(signals)
+
+        assert sum(results) == 3000
+        assert len(conn.statements) == 1 and "ON CONFLICT (dedup_key) DO NOTHING" in conn.statements[0]
+        assert isinstance(dedup._store, PostgresDedupStore)
+
+    def test_front_cache_skips_store(self, clock):
+        conn = ScriptedConnection()
+        dedup = SignalDeduplicator(use_persistence=True, db_connection=conn, clock=clock)
+
+        dedup.should_emit_many([("SLOT_FILLED", "C1"), ("SLOT_FILLED", "C2")])
+        assert dedup.should_emit_many([("SLOT_FILLED", "C1"), ("SLOT_FILLED", "C2")]) == [False, False]
+        assert len(conn.statements) == 1
+        assert dedup.get_stats()['store_round_trips'] == 1
+
+    def test_other_worker_keys_are_duplicates(self, clock):
+        conn = ScriptedConnection()
+        SignalDeduplicator(use_persistence=True, db_connection=conn, clock=clock).should_emit("SLOT_FILLED", "C1")
+        other = SignalDeduplicator(use_persistence=True, db_connection=conn, clock=clock)
+
+        assert other.should_emit("SLOT_FILLED", "C1", check_only=True) is False
+        assert "SELECT" in conn.statements[-1]
+        assert other.should_emit_many([("SLOT_FILLED", "C1"), ("SLOT_FILLED", "C2")]) == [False, True]
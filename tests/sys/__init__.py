@@ -0,0 +1 @@
+# Sys Tests
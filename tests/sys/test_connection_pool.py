@@ -0,0 +1,178 @@
+"""
+Test Suite: src/sys/db/ - Shared Connection Pool
+================================================
+Tests the pool behind NeonConfig.get_pool() and get_guarded_connection():
+- Connections are reused instead of reopened
+- max_size bounds open connections; exhausted checkout times out
+- Health check on checkout discards broken connections
+- Idle eviction down to min_size
+- Released connections are rolled back
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.sys.db.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.connection.broken:
+            raise RuntimeError("server closed the connection unexpectedly")
+        self.connection.queries.append(sql)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.autocommit = False
+        self.broken = False
+        self.rollbacks = 0
+        self.queries = []
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def rollback(self):
+        if self.broken:
+            raise RuntimeError("connection lost")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(**options):
+    opened = []
+
+    def connect(dsn):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    options.setdefault("clock", FakeClock())
+    return ConnectionPool("postgresql://test/db", connect=connect, **options), opened
+
+
+class TestConnectionPool:
+
+    def test_connections_are_reused(self):
+        pool, opened = _pool()
+        for _ in range(5):
+            conn = pool.getconn()
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.close()
+
+        assert len(opened) == 1
+        stats = pool.stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 4
+        assert stats["in_use"] == 0
+        assert stats["idle"] == 1
+
+    def test_release_rolls_back_and_marks_proxy_closed(self):
+        pool, opened = _pool()
+        conn = pool.getconn()
+        conn.autocommit = True
+        conn.close()
+
+        assert conn.closed
+        assert opened[0].rollbacks == 1
+        assert opened[0].autocommit is False
+        with pytest.raises(AttributeError):
+            conn.cursor()
+
+    def test_max_size_and_timeout(self):
+        pool, opened = _pool(max_size=2, timeout=0)
+        first, second = pool.getconn(), pool.getconn()
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn()
+        first.close()
+        assert pool.getconn(timeout=0) is not None
+        assert len(opened) == 2
+        second.close()
+
+    def test_waiting_thread_gets_released_connection(self):
+        pool, opened = _pool(max_size=1, clock=time.monotonic)
+        held = pool.getconn()
+        acquired = []
+
+        worker = threading.Thread(target=lambda: acquired.append(pool.getconn(timeout=5)))
+        worker.start()
+        held.close()
+        worker.join(5)
+
+        assert len(acquired) == 1
+        assert len(opened) == 1
+
+    def test_health_check_discards_broken_connection(self):
+        clock = FakeClock()
+        pool, opened = _pool(clock=clock, ping_after=10)
+        pool.getconn().close()
+        opened[0].broken = True
+        clock.now = 11
+
+        conn = pool.getconn()
+
+        assert len(opened) == 2
+        assert pool.stats()["health_check_failures"] == 1
+        conn.close()
+
+    def test_recently_used_connection_skips_ping(self):
+        pool, opened = _pool(ping_after=10)
+        pool.getconn().close()
+        pool.getconn().close()
+        assert opened[0].queries == []
+
+    def test_idle_eviction_keeps_min_size(self):
+        clock = FakeClock()
+        pool, opened = _pool(clock=clock, min_size=1, idle_timeout=60)
+        connections = [pool.getconn() for _ in range(3)]
+        for conn in connections:
+            conn.close()
+        clock.now = 61
+
+        pool.getconn().close()
+
+        stats = pool.stats()
+        assert stats["evicted"] == 2
+        assert stats["idle"] == 1
+        assert sum(1 for c in opened if c.closed) == 2
+
+    def test_context_manager_rolls_back_on_error(self):
+        pool, opened = _pool()
+        with pytest.raises(ValueError):
+            with pool.connection():
+                raise ValueError("boom")
+        assert opened[0].rollbacks == 2  # explicit rollback + release
+        assert pool.stats()["in_use"] == 0
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            ConnectionPool("dsn", min_size=3, max_size=2)